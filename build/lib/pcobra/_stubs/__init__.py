@@ -0,0 +1,2 @@
+"""Stubs internos para dependencias opcionales de pcobra."""
+
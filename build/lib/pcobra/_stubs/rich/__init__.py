@@ -0,0 +1,25 @@
+"""Stub liviano de :mod:`rich` para el entorno de pruebas."""
+
+from .console import Console, Group, RenderableType
+from .columns import Columns
+from .json import JSON
+from .markdown import Markdown
+from .panel import Panel
+from .pretty import Pretty
+from .syntax import Syntax
+from .table import Table
+from .tree import Tree
+
+__all__ = [
+    "Columns",
+    "Console",
+    "Group",
+    "JSON",
+    "Markdown",
+    "Panel",
+    "Pretty",
+    "RenderableType",
+    "Syntax",
+    "Table",
+    "Tree",
+]
@@ -0,0 +1,5 @@
+"""Backends internos para unificar la compilación por artefacto."""
+
+from pcobra.cobra.backends.resolver import compile, resolve_backend
+
+__all__ = ["compile", "resolve_backend"]
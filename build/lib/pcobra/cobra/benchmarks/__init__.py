@@ -0,0 +1 @@
+"""Utilidades de benchmarks para CLI y scripts de pCobra."""
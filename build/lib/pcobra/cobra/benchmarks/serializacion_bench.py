@@ -0,0 +1,54 @@
+"""Comparativa de backends de serialización ejecutable desde el paquete instalable.
+
+Nota de contrato: ``scripts/`` solo contiene wrappers de tooling y **no** es una
+ruta de import soportada en distribución.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from pcobra.corelibs.serializadores import comparar_backends
+
+
+def formatear_tabla(filas: list[dict]) -> str:
+    """Devuelve ``filas`` de :func:`comparar_backends` como tabla de texto."""
+    cabecera = (
+        f"{'carga':<10} {'backend':<8} {'bytes':>10} {'cod MB/s':>9} {'dec MB/s':>9}"
+    )
+    lineas = [cabecera, "-" * len(cabecera)]
+    for fila in filas:
+        lineas.append(
+            f"{fila['carga']:<10} {fila['backend']:<8} {fila['bytes']:>10} "
+            f"{fila['codificar_mb_s']:>9.1f} {fila['decodificar_mb_s']:>9.1f}"
+        )
+    return "\n".join(lineas)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Punto de entrada CLI para comparar backends de serialización."""
+    parser = argparse.ArgumentParser(
+        description="Rendimiento de codificación y decodificación por backend"
+    )
+    parser.add_argument(
+        "--tamano", type=int, default=1000, help="Elementos por carga de prueba."
+    )
+    parser.add_argument(
+        "--repeticiones", type=int, default=5, help="Se toma el mejor intento."
+    )
+    parser.add_argument(
+        "--output", type=Path, help="Guarda además los resultados como JSON."
+    )
+    args = parser.parse_args(argv)
+
+    filas = comparar_backends(tamano=args.tamano, repeticiones=args.repeticiones)
+    if args.output is not None:
+        args.output.write_text(json.dumps(filas, indent=2), encoding="utf-8")
+    print(formatear_tabla(filas))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,32 @@
+"""Superficie pública de contrato de bindings Cobra."""
+
+from pcobra.cobra.bindings.contract import (
+    BINDINGS_BY_LANGUAGE,
+    BindingCapabilities,
+    BindingRoute,
+    JAVASCRIPT_BINDING,
+    PYTHON_BINDING,
+    RUST_BINDING,
+    resolve_binding,
+)
+
+from pcobra.cobra.bindings.runtime_manager import (
+    DEFAULT_ABI_VERSION,
+    SUPPORTED_ABI_VERSIONS,
+    RuntimeBridgeDescriptor,
+    RuntimeManager,
+)
+
+__all__ = [
+    "BindingCapabilities",
+    "BindingRoute",
+    "BINDINGS_BY_LANGUAGE",
+    "PYTHON_BINDING",
+    "JAVASCRIPT_BINDING",
+    "RUST_BINDING",
+    "resolve_binding",
+    "DEFAULT_ABI_VERSION",
+    "SUPPORTED_ABI_VERSIONS",
+    "RuntimeBridgeDescriptor",
+    "RuntimeManager",
+]
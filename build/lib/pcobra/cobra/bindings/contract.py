@@ -0,0 +1,45 @@
+"""Fachada de compatibilidad del contrato de bindings dentro del namespace ``pcobra``."""
+
+from pcobra.cobra.bindings._contract_impl import (
+    ABI_POLICY_BY_ROUTE,
+    BINDINGS_BY_LANGUAGE,
+    COMMAND_EVENT_SCHEMA,
+    EVENT_VALIDATION_FIELDS,
+    OFFICIAL_PUBLIC_LANGUAGES,
+    OFFICIAL_PUBLIC_ROUTE_MATRIX,
+    PUBLIC_RUNTIME_COMMANDS,
+    ROUTE_OPERATIONAL_LIMITS,
+    AbiCompatibilityPolicy,
+    BindingCapabilities,
+    BindingRoute,
+    JAVASCRIPT_BINDING,
+    PYTHON_BINDING,
+    RUST_BINDING,
+    RouteOperationalLimits,
+    resolve_binding,
+    resolve_command_event,
+    route_matrix_markdown,
+    validate_public_language,
+)
+
+__all__ = [
+    "AbiCompatibilityPolicy",
+    "BindingCapabilities",
+    "BindingRoute",
+    "BINDINGS_BY_LANGUAGE",
+    "COMMAND_EVENT_SCHEMA",
+    "EVENT_VALIDATION_FIELDS",
+    "OFFICIAL_PUBLIC_LANGUAGES",
+    "OFFICIAL_PUBLIC_ROUTE_MATRIX",
+    "PUBLIC_RUNTIME_COMMANDS",
+    "ABI_POLICY_BY_ROUTE",
+    "ROUTE_OPERATIONAL_LIMITS",
+    "RouteOperationalLimits",
+    "PYTHON_BINDING",
+    "JAVASCRIPT_BINDING",
+    "RUST_BINDING",
+    "resolve_command_event",
+    "route_matrix_markdown",
+    "validate_public_language",
+    "resolve_binding",
+]
@@ -0,0 +1,6 @@
+"""Build orchestration utilities."""
+
+from pcobra.cobra.build.backend_pipeline import build, resolve_backend, transpile
+from pcobra.cobra.build.orchestrator import BackendResolution, BuildOrchestrator
+
+__all__ = ["BackendResolution", "BuildOrchestrator", "build", "resolve_backend", "transpile"]
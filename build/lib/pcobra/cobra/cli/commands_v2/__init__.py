@@ -0,0 +1,13 @@
+from pcobra.cobra.cli.commands_v2.build_cmd import BuildCommandV2
+from pcobra.cobra.cli.commands_v2.mod_cmd import ModCommandV2
+from pcobra.cobra.cli.commands_v2.run_cmd import RunCommandV2
+from pcobra.cobra.cli.commands_v2.repl_cmd import ReplCommandV2
+from pcobra.cobra.cli.commands_v2.test_cmd import TestCommandV2
+
+__all__ = [
+    "RunCommandV2",
+    "BuildCommandV2",
+    "TestCommandV2",
+    "ModCommandV2",
+    "ReplCommandV2",
+]
@@ -0,0 +1,413 @@
+"""Pipeline compartido de análisis/ejecución para CLI Cobra.
+
+Contrato arquitectónico relacionado:
+- docs/architecture/repl-script-parity-contract.md
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from pcobra.cobra.core import Lexer, Parser
+from pcobra.cobra.cli.i18n import _
+from pcobra.cobra.cli.utils.unicode_sanitize import sanitize_source_for_tokenizer
+from pcobra.cobra.cli.utils.validators import normalizar_validadores_extra
+from pcobra.cobra.core.runtime import ValidadorBase, construir_cadena
+from pcobra.cobra.usar_policy import REPL_COBRA_MODULE_MAP
+from pcobra.cobra.core.usar_symbol_policy import (
+    normalizar_metadata_simbolo_usar,
+    validate_usar_symbol_metadata,
+)
+import logging
+
+
+@dataclass(frozen=True)
+class PipelineResult:
+    """Resultado canónico del pipeline analizar+validar+ejecutar."""
+
+    ast: Any
+    resultado: Any
+    validadores_extra: Any
+
+
+@dataclass(frozen=True)
+class PipelineInput:
+    """Entrada explícita para ejecutar el pipeline canónico completo."""
+
+    codigo: str
+    interpretador_cls: Any
+    safe_mode: bool
+    extra_validators: Any = None
+    interpretador: Any | None = None
+    main_file: Any | None = None
+
+
+@dataclass(frozen=True)
+class InterpreterSetup:
+    """Configuración derivada y componentes del intérprete para ejecución."""
+
+    interpretador_cls: Any
+    safe_mode: bool
+    validadores_extra: Any
+    interpretador: Any
+
+
+@dataclass(frozen=True)
+class NormalizedPipelineOptions:
+    """Opciones de ejecución normalizadas para el pipeline canónico."""
+
+    safe_mode: bool
+    validadores_extra: Any
+
+
+def construir_script_sandbox_canonico(
+    codigo: str,
+    *,
+    safe_mode: bool | None = None,
+    extra_validators: Any = None,
+    imprimir_resultado: bool = False,
+    main_file: Any | None = None,
+) -> str:
+    """Genera un script sandbox con imports canónicos del runtime Cobra."""
+
+    extra_repr = repr(extra_validators if extra_validators is not None else None)
+    safe_mode_repr = True if safe_mode is None else safe_mode
+    main_file_fragment = "" if main_file is None else f", main_file={str(main_file)!r}"
+    kwargs_fragment = (
+        f", safe_mode={safe_mode_repr!r}, "
+        f"extra_validators={extra_repr}{main_file_fragment}"
+    )
+    script = (
+        "from pcobra.cobra.cli.execution_pipeline import prevalidar_y_parsear_codigo\n"
+        "from pcobra.cobra.cli.execution_pipeline import construir_interprete_seguro_canonico\n"
+        "from pcobra.cobra.core.runtime import InterpretadorCobra\n"
+        f"cobra_ast = prevalidar_y_parsear_codigo({codigo!r})\n"
+        f"cobra_interp = construir_interprete_seguro_canonico(interpretador_cls=InterpretadorCobra{kwargs_fragment})\n"
+        "cobra_resultado = cobra_interp.ejecutar_ast(cobra_ast)\n"
+    )
+    if imprimir_resultado:
+        script += (
+            "if cobra_resultado is not None:\n"
+            "    if isinstance(cobra_resultado, bool):\n"
+            "        print('verdadero' if cobra_resultado else 'falso')\n"
+            "    else:\n"
+            "        print(cobra_resultado)\n"
+        )
+    return script
+
+
+def analizar_codigo(codigo: str) -> Any:
+    """Analiza código fuente con el pipeline canónico Lexer+Parser."""
+
+    return prevalidar_y_parsear_codigo(codigo)
+
+
+def prevalidar_y_parsear_codigo(codigo: str) -> Any:
+    """Normaliza/sanea código y centraliza el parseo para script y REPL."""
+
+    if not isinstance(codigo, str):
+        raise TypeError(_("El código fuente debe ser una cadena de texto"))
+    # Nota de compatibilidad:
+    # - El BOM de archivos (`\ufeff` al inicio) se normaliza en la frontera de
+    #   lectura de `run_service`.
+    # - Aquí sólo aplicamos saneamiento Unicode compatible para tokenización,
+    #   sin alterar reglas de Lexer/Parser.
+    codigo_saneado = sanitize_source_for_tokenizer(codigo)
+    tokens = Lexer(codigo_saneado).tokenizar()
+    return Parser(tokens).parsear()
+
+
+def ejecutar_ast(ast: Any, interpreter: Any) -> Any:
+    """Ejecuta un AST usando una instancia explícita de intérprete."""
+
+    asegurar_estado_runtime = getattr(interpreter, "asegurar_estado_runtime_inicial", None)
+    if callable(asegurar_estado_runtime):
+        asegurar_estado_runtime()
+    return interpreter.ejecutar_ast(ast)
+
+
+def resolver_validadores_seguridad(
+    extra_validators: Any,
+    *,
+    interpretador_cls: Any,
+) -> Any:
+    """Normaliza validadores extra usando la misma política en run y REPL."""
+
+    if extra_validators is None:
+        return None
+    if isinstance(extra_validators, str):
+        return interpretador_cls._cargar_validadores(extra_validators)
+    if isinstance(extra_validators, list) and all(
+        isinstance(ruta, str) for ruta in extra_validators
+    ):
+        acumulado: list[Any] = []
+        for ruta in extra_validators:
+            try:
+                acumulado.extend(interpretador_cls._cargar_validadores(ruta))
+            except Exception as exc:
+                raise ValueError(
+                    _("No se pudieron cargar los validadores extra desde '{path}': {error}").format(
+                        path=ruta,
+                        error=exc,
+                    )
+                ) from exc
+        return acumulado
+    return extra_validators
+
+
+def validar_ast_seguro(
+    ast: Any,
+    *,
+    validadores_extra: Any,
+    interpretador: Any | None = None,
+    validar_metadata_usar: bool = True,
+    construir_cadena_fn: Callable[[Any], Any] = construir_cadena,
+) -> None:
+    """Aplica la cadena de validadores de seguridad sobre el AST."""
+
+    if interpretador is not None:
+        asegurar_estado_runtime = getattr(interpretador, "asegurar_estado_runtime_inicial", None)
+        if callable(asegurar_estado_runtime):
+            asegurar_estado_runtime()
+
+    if validadores_extra is not None:
+        if not isinstance(validadores_extra, list) or not all(
+            isinstance(validador, ValidadorBase) for validador in validadores_extra
+        ):
+            raise TypeError(
+                _("Los validadores extra deben ser una lista de instancias de validadores")
+            )
+    validador = construir_cadena_fn(validadores_extra)
+    if interpretador is not None:
+        metadata_usar = getattr(interpretador, "_usar_symbol_metadata", {}) or {}
+        validadores_registrables = []
+        cursor = validador
+        while cursor is not None:
+            if hasattr(cursor, "registrar_simbolo_publico_usar"):
+                validadores_registrables.append(cursor)
+            cursor = getattr(cursor, "siguiente", None)
+        for nombre, metadata in metadata_usar.items():
+            if not isinstance(metadata, dict):
+                continue
+            metadata_normalizada = dict(metadata)
+            modulo_ctx = ""
+            if isinstance(metadata_normalizada.get("module"), str):
+                modulo_ctx = str(metadata_normalizada["module"])
+            metadata_normalizada = normalizar_metadata_simbolo_usar(
+                metadata_normalizada,
+                modulo_ctx,
+                nombre,
+            )
+            metadata_normalizada = validate_usar_symbol_metadata(
+                nombre,
+                metadata_normalizada,
+            )
+            if validar_metadata_usar:
+                logging.debug(
+                    "USAR_METADATA_PIPELINE route=legacy-normalized module=%s symbol=%s",
+                    metadata_normalizada.get("module"),
+                    nombre,
+                )
+            modulo = metadata_normalizada.get("module")
+            if not isinstance(modulo, str):
+                continue
+            for validador_registrable in validadores_registrables:
+                validador_registrable.registrar_simbolo_publico_usar(
+                    nombre,
+                    modulo,
+                    metadata=dict(metadata_normalizada),
+                )
+    for nodo in ast:
+        nodo.aceptar(validador)
+
+
+def construir_interprete_seguro_canonico(
+    *,
+    interpretador_cls: Any,
+    safe_mode: bool,
+    extra_validators: Any,
+    main_file: Any | None = None,
+) -> Any:
+    """Factory canónico de runtime para intérprete CLI.
+
+    CONTRATO_RUNTIME_METADATA_USAR_INICIAL:
+    Toda creación/rehidratación de intérprete debe pasar por este factory para
+    garantizar inicialización mínima del runtime y consistencia de metadata
+    ``usar`` entre intérprete y validador.
+    """
+
+    interpretador = interpretador_cls(
+        safe_mode=safe_mode,
+        extra_validators=extra_validators,
+        main_file=main_file,
+    )
+    asegurar_estado_runtime = getattr(interpretador, "asegurar_estado_runtime_inicial", None)
+    if callable(asegurar_estado_runtime):
+        asegurar_estado_runtime()
+
+    if not isinstance(getattr(interpretador, "_usar_symbol_metadata", None), dict):
+        raise TypeError(
+            "Invariante runtime violada: interpreter._usar_symbol_metadata debe ser dict."
+        )
+    if safe_mode and not hasattr(interpretador, "_validador"):
+        raise TypeError(
+            "Invariante runtime violada: en safe_mode=True debe existir interpreter._validador."
+        )
+    validador = getattr(interpretador, "_validador", None)
+    if safe_mode and validador is None:
+        raise TypeError(
+            "Invariante runtime violada: en safe_mode=True debe existir interpreter._validador."
+        )
+    if safe_mode and not isinstance(
+        getattr(validador, "_metadata_simbolos_usar", None), dict
+    ):
+        raise TypeError(
+            "Invariante runtime violada: interpreter._validador._metadata_simbolos_usar debe ser dict."
+        )
+
+    # Ruta única de resolución segura para `usar` en CLI (run/repl):
+    # solo alias/módulos canónicos del catálogo público.
+    configurar_restriccion = getattr(interpretador, "configurar_restriccion_usar_repl", None)
+    if callable(configurar_restriccion):
+        configurar_restriccion(REPL_COBRA_MODULE_MAP)
+    return interpretador
+
+
+def resolver_interpretador_cls(
+    *,
+    module_name: str,
+    default_cls: Any,
+) -> Any:
+    """Obtiene la clase de intérprete desde globals del módulo (amigable a tests)."""
+
+    module = sys.modules.get(module_name)
+    if module is None:
+        return default_cls
+    return getattr(module, "InterpretadorCobra", default_cls)
+
+
+def preparar_interpretador(
+    *,
+    interpretador_cls: Any,
+    safe_mode: bool,
+    extra_validators: Any,
+    main_file: Any | None = None,
+) -> InterpreterSetup:
+    """Centraliza normalización de validadores, flags de seguridad e intérprete."""
+    opciones = normalizar_opciones_pipeline(
+        safe_mode=safe_mode,
+        extra_validators=extra_validators,
+        interpretador_cls=interpretador_cls,
+    )
+    interpretador = construir_interprete_seguro_canonico(
+        interpretador_cls=interpretador_cls,
+        safe_mode=opciones.safe_mode,
+        extra_validators=opciones.validadores_extra,
+        main_file=main_file,
+    )
+    return InterpreterSetup(
+        interpretador_cls=interpretador_cls,
+        safe_mode=opciones.safe_mode,
+        validadores_extra=opciones.validadores_extra,
+        interpretador=interpretador,
+    )
+
+
+def normalizar_opciones_pipeline(
+    *,
+    safe_mode: bool,
+    extra_validators: Any,
+    interpretador_cls: Any,
+) -> NormalizedPipelineOptions:
+    """Punto único para normalizar safe_mode y extra_validators del pipeline."""
+
+    safe_mode_normalizado = bool(safe_mode)
+    extra_validators_normalizados = normalizar_validadores_extra(extra_validators)
+    validadores_resueltos = resolver_validadores_seguridad(
+        extra_validators_normalizados,
+        interpretador_cls=interpretador_cls,
+    )
+    return NormalizedPipelineOptions(
+        safe_mode=safe_mode_normalizado,
+        validadores_extra=validadores_resueltos,
+    )
+
+
+def ejecutar_codigo_canonico(
+    codigo: str,
+    *,
+    interpretador: Any,
+    seguro: bool,
+    extra_validators: Any,
+    construir_cadena_fn: Callable[[Any], Any] = construir_cadena,
+    analizar_codigo_fn: Callable[[str], Any] = analizar_codigo,
+) -> PipelineResult:
+    """Función canónica para analizar+validar+ejecutar código Cobra."""
+
+    ast = analizar_codigo_fn(codigo)
+    if seguro:
+        nodos_usar = [
+            nodo for nodo in ast if getattr(nodo, "__class__", type("", (), {})).__name__ == "NodoUsar"
+        ]
+        if nodos_usar:
+            ejecutar_ast(nodos_usar, interpretador)
+        validar_ast_seguro(
+            ast,
+            validadores_extra=extra_validators,
+            interpretador=interpretador,
+            construir_cadena_fn=construir_cadena_fn,
+        )
+    resultado = ejecutar_ast(ast, interpretador)
+    return PipelineResult(
+        ast=ast,
+        resultado=resultado,
+        validadores_extra=extra_validators,
+    )
+
+
+def ejecutar_pipeline_explicito(
+    pipeline_input: PipelineInput,
+    *,
+    construir_cadena_fn: Callable[[Any], Any] = construir_cadena,
+    analizar_codigo_fn: Callable[[str], Any] = analizar_codigo,
+) -> tuple[InterpreterSetup, PipelineResult]:
+    """API única y explícita para análisis, validación, preparación y ejecución.
+
+    Flujo:
+    1) Analizar ``codigo``.
+    2) Validar AST si ``safe_mode`` está activo.
+    3) Preparar intérprete (o reutilizar uno provisto para estado persistente).
+    4) Ejecutar AST.
+    """
+
+    setup = preparar_interpretador(
+        interpretador_cls=pipeline_input.interpretador_cls,
+        safe_mode=pipeline_input.safe_mode,
+        extra_validators=pipeline_input.extra_validators,
+        main_file=pipeline_input.main_file,
+    )
+    interpretador = (
+        pipeline_input.interpretador
+        if pipeline_input.interpretador is not None
+        else setup.interpretador
+    )
+    configurar_archivo = getattr(interpretador, "configurar_archivo_principal", None)
+    if pipeline_input.main_file is not None and callable(configurar_archivo):
+        configurar_archivo(pipeline_input.main_file)
+    resultado = ejecutar_codigo_canonico(
+        pipeline_input.codigo,
+        interpretador=interpretador,
+        seguro=setup.safe_mode,
+        extra_validators=setup.validadores_extra,
+        construir_cadena_fn=construir_cadena_fn,
+        analizar_codigo_fn=analizar_codigo_fn,
+    )
+    setup_final = InterpreterSetup(
+        interpretador_cls=setup.interpretador_cls,
+        safe_mode=setup.safe_mode,
+        validadores_extra=setup.validadores_extra,
+        interpretador=interpretador,
+    )
+    return setup_final, resultado
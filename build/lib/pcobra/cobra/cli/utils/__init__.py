@@ -0,0 +1,5 @@
+"""Utilidades varias para la CLI de Cobra."""
+
+from pcobra.cobra.cli.utils import config
+
+__all__ = ["messages", "semver", "config"]
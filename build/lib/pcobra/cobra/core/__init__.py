@@ -0,0 +1,34 @@
+"""Componentes principales del núcleo de Cobra.
+
+Este paquete reúne el analizador léxico, el analizador sintáctico y
+utilidades relacionadas con el núcleo del lenguaje. La importación del
+AST se realiza de forma explícita en los módulos que lo necesitan para
+evitar dependencias circulares durante la inicialización del paquete.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from pcobra.cobra.core import ast_nodes as _ast_nodes
+from pcobra.cobra.core.errors import InvalidTokenError, LexerError, UnclosedStringError
+from .lexer import Lexer, TipoToken, Token
+from pcobra.cobra.core.parser import Parser, ParserError
+
+# Reexportar los nodos del AST directamente desde ``pcobra.core``.
+_AST_NODE_NAMES = list(_ast_nodes.__all__)
+globals().update({name: getattr(_ast_nodes, name) for name in _AST_NODE_NAMES})
+
+__all__ = [
+    "Lexer",
+    "Parser",
+    "ParserError",
+    "LexerError",
+    "InvalidTokenError",
+    "UnclosedStringError",
+    "Token",
+    "TipoToken",
+    *_AST_NODE_NAMES,
+]
+
+sys.modules["cobra.core"] = sys.modules[__name__]
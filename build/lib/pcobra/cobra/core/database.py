@@ -0,0 +1,6 @@
+"""Adaptador canónico de helpers de base de datos."""
+
+from ...core.database import *  # noqa: F403
+from ...core import database as _database
+
+__all__ = [name for name in dir(_database) if not name.startswith("_")]
@@ -0,0 +1,6 @@
+"""Adaptador canónico de sandbox."""
+
+from ...core.sandbox import *  # noqa: F403
+from ...core import sandbox as _sandbox
+
+__all__ = [name for name in dir(_sandbox) if not name.startswith("_")]
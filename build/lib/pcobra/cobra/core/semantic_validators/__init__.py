@@ -0,0 +1,6 @@
+"""Adaptador canónico de validadores semánticos."""
+
+from ....core.semantic_validators import *  # noqa: F403
+from ....core import semantic_validators as _semantic_validators
+
+__all__ = [name for name in dir(_semantic_validators) if not name.startswith("_")]
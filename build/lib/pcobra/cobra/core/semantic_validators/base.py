@@ -0,0 +1,6 @@
+"""Adaptador canónico de base de validadores semánticos."""
+
+from ....core.semantic_validators.base import *  # noqa: F403
+from ....core.semantic_validators import base as _base
+
+__all__ = [name for name in dir(_base) if not name.startswith("_")]
@@ -0,0 +1 @@
+"""Espacio para APIs internas o experimentales de Cobra."""
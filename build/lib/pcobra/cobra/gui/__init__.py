@@ -0,0 +1,2 @@
+"""Módulos neutrales para integración GUI de Cobra."""
+
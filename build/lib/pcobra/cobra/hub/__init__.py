@@ -0,0 +1,70 @@
+"""Infraestructura de repositorios CobraHub."""
+
+from pcobra.cobra.hub.errors import (
+    CobraHubError,
+    PackageCompatibilityError,
+    PackageIntegrityError,
+    PackageNotFoundError,
+    PackageProviderError,
+    PackageResolutionError,
+)
+from pcobra.cobra.hub.models import (
+    ARCHITECTURES,
+    DISTRIBUTION_TYPES,
+    PACKAGE_FORMATS,
+    PLATFORMS,
+    CobraHubResolution,
+    DeclaredDependency,
+    DependencyResolutionResult,
+    LockedDependency,
+    PackageDistribution,
+    PackageExtension,
+    PackageManifestV2,
+    manifest_v2_from_dict,
+    manifest_v2_to_dict,
+)
+from pcobra.cobra.hub.repository import (
+    ArtifactProvider,
+    DownloadedPackage,
+    HttpCobraHubRepository,
+    PackageIndex,
+    PackageRepository,
+)
+from pcobra.cobra.hub.providers import (
+    GitHubReleaseProvider,
+    LocalArtifactProvider,
+    PyPIProvider,
+)
+from pcobra.cobra.hub.transport import CobraHubTransport, HttpSession
+
+__all__ = [
+    "ArtifactProvider",
+    "ARCHITECTURES",
+    "CobraHubError",
+    "CobraHubResolution",
+    "DeclaredDependency",
+    "DISTRIBUTION_TYPES",
+    "DependencyResolutionResult",
+    "LockedDependency",
+    "CobraHubTransport",
+    "DownloadedPackage",
+    "GitHubReleaseProvider",
+    "HttpCobraHubRepository",
+    "HttpSession",
+    "LocalArtifactProvider",
+    "PACKAGE_FORMATS",
+    "PackageCompatibilityError",
+    "PackageIntegrityError",
+    "PackageNotFoundError",
+    "PackageProviderError",
+    "PackageIndex",
+    "PackageDistribution",
+    "PackageExtension",
+    "PackageManifestV2",
+    "PackageRepository",
+    "PyPIProvider",
+    "PLATFORMS",
+    "PackageResolutionError",
+    "manifest_v2_from_dict",
+    "manifest_v2_to_dict",
+]
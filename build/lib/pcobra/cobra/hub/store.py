@@ -0,0 +1,331 @@
+"""Almacén de artefactos direccionado por contenido para CobraHub.
+
+Cada artefacto ``.co`` se guarda una sola vez como ``blobs/<aa>/<sha256>`` y un
+índice SQLite relaciona ``(nombre, versión)`` con su hash, tamaño y fecha de
+último uso. Consultar un paquete es una búsqueda por clave que no vuelve a
+hashear el archivo; el índice también recuerda el digest de rutas externas
+mientras su ``stat`` no cambie. Las instalaciones se materializan de forma
+atómica con enlaces duros (o *reflinks* y copia como respaldo) y :meth:`gc`
+expulsa los blobs usados hace más tiempo hasta respetar un presupuesto de
+bytes. Varios procesos pueden compartir el mismo directorio.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from pcobra.cobra.hub.integrity import normalize_sha256, sha256_file
+
+__all__ = ["ContentAddressedStore", "StoredArtifact"]
+
+_CHUNK_SIZE = 1024 * 1024
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS packages (
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (name, version)
+);
+CREATE INDEX IF NOT EXISTS packages_sha256 ON packages (sha256);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    sha256 TEXT NOT NULL
+);
+"""
+# ``FICLONE`` de Linux: clona el archivo compartiendo bloques en Btrfs/XFS.
+_FICLONE = 0x40049409
+
+
+@dataclass(frozen=True)
+class StoredArtifact:
+    """Artefacto indexado en el almacén."""
+
+    name: str
+    version: str
+    sha256: str
+    path: Path
+    size: int
+
+
+class ContentAddressedStore:
+    """Blobs por SHA-256 con índice ``(nombre, versión)`` y expulsión LRU."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root).expanduser()
+        self.blobs_dir = self.root / "blobs"
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.root / "index.sqlite3"
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Una conexión por operación: el almacén se usa desde varios hilos del
+        # resolvedor y desde varios procesos que comparten la caché.
+        with closing(sqlite3.connect(self.index_path, timeout=30)) as conn:
+            with conn:
+                yield conn
+
+    def blob_path(self, sha256: str) -> Path:
+        """Ruta del blob con contenido ``sha256``."""
+
+        digest = normalize_sha256(sha256, validate=True)
+        assert digest is not None
+        return self.blobs_dir / digest[:2] / digest
+
+    # -- escritura -----------------------------------------------------------
+    def add(
+        self,
+        name: str,
+        version: str,
+        artifact: str | Path,
+        *,
+        expected_sha256: str | None = None,
+    ) -> StoredArtifact:
+        """Copia ``artifact`` al almacén hasheándolo en la misma pasada.
+
+        Si el contenido ya existía solo se actualiza el índice. Lanza
+        ``ValueError`` si el hash no coincide con ``expected_sha256``.
+        """
+
+        expected = normalize_sha256(expected_sha256)
+        descriptor, temporary = tempfile.mkstemp(dir=self.blobs_dir, suffix=".tmp")
+        try:
+            sha = hashlib.sha256()
+            size = 0
+            with Path(artifact).open("rb") as source, os.fdopen(
+                descriptor, "wb"
+            ) as target:
+                for chunk in iter(lambda: source.read(_CHUNK_SIZE), b""):
+                    sha.update(chunk)
+                    target.write(chunk)
+                    size += len(chunk)
+            digest = sha.hexdigest()
+            if expected and digest != expected:
+                raise ValueError(
+                    f"Hash inválido para {name}=={version}: se esperaba {expected}, "
+                    f"se obtuvo {digest}."
+                )
+            blob = self.blob_path(digest)
+            if blob.is_file() and blob.stat().st_size == size:
+                Path(temporary).unlink()
+            else:
+                blob.parent.mkdir(exist_ok=True)
+                # Los blobs se comparten mediante enlaces duros: se dejan de
+                # solo lectura para que nadie los modifique en el sitio.
+                os.chmod(temporary, 0o444)
+                os.replace(temporary, blob)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO packages VALUES (?, ?, ?, ?, ?, ?)",
+                (name, version, digest, size, now, now),
+            )
+        return StoredArtifact(name, version, digest, blob, size)
+
+    def remember(self, path: str | Path, sha256: str) -> None:
+        """Registra el digest ya conocido de ``path`` sin volver a leerlo."""
+
+        file_path = Path(path)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?)",
+                (str(file_path), self._fingerprint(file_path), sha256),
+            )
+
+    def install(self, sha256: str, destination: str | Path) -> Path:
+        """Materializa el blob ``sha256`` en ``destination`` de forma atómica.
+
+        Prueba un enlace duro, después un *reflink* y por último una copia; el
+        archivo aparece en ``destination`` de una sola vez mediante
+        ``os.replace``.
+        """
+
+        blob = self.blob_path(sha256)
+        target = Path(destination)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temporary = target.with_name(f".{target.name}.{os.getpid()}.{time.time_ns()}")
+        try:
+            try:
+                os.link(blob, temporary)
+            except OSError:
+                if not _reflink(blob, temporary):
+                    shutil.copyfile(blob, temporary)
+            os.replace(temporary, target)
+        except BaseException:
+            temporary.unlink(missing_ok=True)
+            raise
+        self.remember(target, normalize_sha256(sha256) or sha256)
+        return target
+
+    # -- lectura -------------------------------------------------------------
+    def get(
+        self,
+        name: str,
+        version: str,
+        *,
+        expected_sha256: str | None = None,
+        verify: bool = False,
+    ) -> StoredArtifact | None:
+        """Busca ``name==version`` en el índice sin hashear el blob.
+
+        Solo se comprueba que el blob exista con el tamaño indexado; con
+        ``verify=True`` se recalcula además su SHA-256 y se descarta si no
+        coincide.
+        """
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT sha256, size FROM packages WHERE name = ? AND version = ?",
+                (name, version),
+            ).fetchone()
+        if row is None:
+            return None
+        digest, size = row
+        expected = normalize_sha256(expected_sha256)
+        if expected and expected != digest:
+            return None
+        blob = self.blob_path(digest)
+        try:
+            intact = blob.stat().st_size == size
+        except OSError:
+            intact = False
+        if intact and verify:
+            intact = sha256_file(blob) == digest
+        if not intact:
+            self._drop_blob(digest)
+            return None
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE packages SET last_used = ? WHERE sha256 = ?",
+                (time.time(), digest),
+            )
+        return StoredArtifact(name, version, digest, blob, size)
+
+    def digest(self, path: str | Path) -> str:
+        """SHA-256 de ``path``, reutilizando el índice si su ``stat`` no cambió."""
+
+        file_path = Path(path)
+        fingerprint = self._fingerprint(file_path)
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT fingerprint, sha256 FROM files WHERE path = ?",
+                (str(file_path),),
+            ).fetchone()
+        if row is not None and row[0] == fingerprint:
+            return row[1]
+        digest = sha256_file(file_path)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?)",
+                (str(file_path), fingerprint, digest),
+            )
+        return digest
+
+    def size(self) -> int:
+        """Bytes ocupados por los blobs indexados."""
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM "
+                "(SELECT size FROM packages GROUP BY sha256)"
+            ).fetchone()
+        return int(row[0])
+
+    # -- limpieza ------------------------------------------------------------
+    def remove(self, name: str | None = None, version: str | None = None) -> int:
+        """Quita entradas del índice y los blobs que queden sin referencias."""
+
+        query = "SELECT name, version, sha256 FROM packages"
+        params: tuple[str, ...] = ()
+        if name is not None and version is not None:
+            query += " WHERE name = ? AND version = ?"
+            params = (name, version)
+        elif name is not None:
+            query += " WHERE name = ?"
+            params = (name,)
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+            conn.executemany(
+                "DELETE FROM packages WHERE name = ? AND version = ?",
+                [(row[0], row[1]) for row in rows],
+            )
+            referenced = {
+                row[0] for row in conn.execute("SELECT DISTINCT sha256 FROM packages")
+            }
+        for digest in {row[2] for row in rows} - referenced:
+            self.blob_path(digest).unlink(missing_ok=True)
+        return len(rows)
+
+    def gc(self, max_bytes: int) -> list[StoredArtifact]:
+        """Expulsa los blobs usados hace más tiempo hasta ocupar ``max_bytes``.
+
+        Devuelve las entradas del índice eliminadas.
+        """
+
+        if max_bytes < 0:
+            raise ValueError("max_bytes no puede ser negativo")
+        with self._connect() as conn:
+            blobs = conn.execute(
+                "SELECT sha256, MAX(size), MAX(last_used) FROM packages "
+                "GROUP BY sha256 ORDER BY MAX(last_used)"
+            ).fetchall()
+        total = sum(size for _digest, size, _used in blobs)
+        evicted: list[StoredArtifact] = []
+        for digest, size, _used in blobs:
+            if total <= max_bytes:
+                break
+            evicted.extend(self._drop_blob(digest))
+            total -= size
+        return evicted
+
+    def _drop_blob(self, digest: str) -> list[StoredArtifact]:
+        blob = self.blob_path(digest)
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT name, version, size FROM packages WHERE sha256 = ?",
+                (digest,),
+            ).fetchall()
+            conn.execute("DELETE FROM packages WHERE sha256 = ?", (digest,))
+        blob.unlink(missing_ok=True)
+        return [
+            StoredArtifact(name, version, digest, blob, size)
+            for name, version, size in rows
+        ]
+
+    @staticmethod
+    def _fingerprint(path: Path) -> str:
+        stat = path.stat()
+        return f"{stat.st_size}:{stat.st_mtime_ns}:{stat.st_ctime_ns}:{stat.st_ino}"
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover - Windows
+        return False
+    try:
+        with source.open("rb") as src, target.open("wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        target.unlink(missing_ok=True)
+        return False
+    return True
@@ -0,0 +1,15 @@
+"""Utilidades de resolución de imports para Cobra."""
+
+from pcobra.cobra.imports.resolver import (
+    CobraImportResolver,
+    HybridModuleSpec,
+    ImportResolutionError,
+    ResolutionResult,
+)
+
+__all__ = [
+    "CobraImportResolver",
+    "HybridModuleSpec",
+    "ImportResolutionError",
+    "ResolutionResult",
+]
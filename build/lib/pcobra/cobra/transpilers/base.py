@@ -0,0 +1,8 @@
+"""Compatibilidad retrocompatible para :mod:`cobra.transpilers`.
+
+El contenido real se encuentra en ``cobra.transpilers.common.utils``.
+"""
+
+from pcobra.cobra.transpilers.common.utils import BaseTranspiler, save_file
+
+__all__ = ["BaseTranspiler", "save_file"]
@@ -0,0 +1,17 @@
+"""Módulo con utilidades compartidas por los transpiladores."""
+
+from pcobra.cobra.transpilers.common.utils import (
+    BaseTranspiler,
+    get_standard_imports,
+    load_mapped_module,
+    save_file,
+    STANDARD_IMPORTS,
+)
+
+__all__ = [
+    "BaseTranspiler",
+    "get_standard_imports",
+    "load_mapped_module",
+    "save_file",
+    "STANDARD_IMPORTS",
+]
@@ -0,0 +1,322 @@
+import os
+import logging
+from typing import Any, Dict
+
+try:
+    import tomllib  # Python ≥3.11
+except ModuleNotFoundError:  # pragma: no cover
+    import tomli as tomllib
+
+from pcobra.cobra.architecture.backend_policy import PUBLIC_BACKENDS
+from pcobra.cobra.transpilers.target_utils import normalize_target_name
+from pcobra.cobra.transpilers.targets import OFFICIAL_TARGETS
+from pcobra.cobra.stdlib_contract import get_contract_manifests
+
+logger = logging.getLogger(__name__)
+
+
+
+
+def _build_policy_error(
+    *,
+    category: str,
+    module: str,
+    symbol: str,
+    key: str,
+    detail: str,
+) -> ValueError:
+    """Construye errores de validación con UX amigable + trazabilidad en logs."""
+    logger.debug(
+        "module_map_policy_error category=%s module=%s symbol=%s key=%s detail=%s",
+        category,
+        module,
+        symbol,
+        key,
+        detail,
+    )
+    return ValueError(
+        "Configuración de módulos inválida. "
+        f"[categoria={category}] [modulo={module}] [simbolo={symbol}] [clave={key}]"
+    )
+
+
+if OFFICIAL_TARGETS != PUBLIC_BACKENDS:
+    raise RuntimeError(
+        "OFFICIAL_TARGETS y PUBLIC_BACKENDS deben coincidir en module_map para evitar rutas legacy. "
+        f"official={OFFICIAL_TARGETS}; public={PUBLIC_BACKENDS}"
+    )
+
+MODULE_MAP_PATH = os.environ.get(
+    'COBRA_MODULE_MAP',
+    os.path.abspath(
+        os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', 'cobra.mod')
+    ),
+)
+
+COBRA_TOML_PATH = os.environ.get(
+    'COBRA_TOML',
+    os.path.abspath(
+        os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', 'cobra.toml')
+    ),
+)
+
+_toml_cache = None
+
+STDLIB_CONTRACTS_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', 'stdlib_contract')
+)
+
+_stdlib_contract_cache: dict[str, Dict[str, Any]] | None = None
+
+
+def _load_stdlib_contracts() -> dict[str, Dict[str, Any]]:
+    """Carga manifiestos contractuales de ``stdlib_contract``."""
+    global _stdlib_contract_cache
+    if _stdlib_contract_cache is not None:
+        return _stdlib_contract_cache
+
+    loaded: dict[str, Dict[str, Any]] = get_contract_manifests()
+    if not os.path.isdir(STDLIB_CONTRACTS_DIR):
+        _stdlib_contract_cache = loaded
+        return loaded
+
+    for entry in sorted(os.listdir(STDLIB_CONTRACTS_DIR)):
+        if not entry.startswith("cobra."):
+            continue
+        contract_path = os.path.join(STDLIB_CONTRACTS_DIR, entry)
+        if not os.path.isfile(contract_path):
+            continue
+        try:
+            with open(contract_path, 'rb') as handle:
+                parsed = tomllib.load(handle)
+        except (OSError, tomllib.TOMLDecodeError):
+            logger.warning('No se pudo cargar manifest contractual: %s', contract_path)
+            continue
+        if isinstance(parsed, dict) and entry not in loaded:
+            loaded[entry] = parsed
+
+    _stdlib_contract_cache = loaded
+    return loaded
+
+
+def get_stdlib_contracts() -> Dict[str, Dict[str, Any]]:
+    """Devuelve todos los manifiestos contractuales cargados."""
+    return dict(_load_stdlib_contracts())
+
+
+def get_stdlib_contract(module: str) -> Dict[str, Any]:
+    """Devuelve el manifiesto contractual declarado para ``module``."""
+    contracts = _load_stdlib_contracts()
+    contract = contracts.get(module)
+    if isinstance(contract, dict):
+        return contract
+    return {}
+
+
+def resolve_backend_for_module(module: str, backend: str) -> str:
+    """Resuelve backend efectivo por contrato sin exponer transpilers internos."""
+    canonical_backend = normalize_target_name(backend)
+    if canonical_backend not in OFFICIAL_TARGETS:
+        raise ValueError(
+            "CONTRACT_ERROR: backend no oficial en resolve_backend_for_module: "
+            f"{backend!r}. Permitidos: {', '.join(OFFICIAL_TARGETS)}"
+        )
+
+    contract = get_stdlib_contract(module)
+    if not contract:
+        return canonical_backend
+
+    preferred_backend = contract.get('backend_preferido')
+    if not isinstance(preferred_backend, str):
+        return canonical_backend
+    preferred = normalize_target_name(preferred_backend)
+
+    fallback = contract.get('fallback_permitido', [])
+    if not isinstance(fallback, list):
+        fallback = []
+    allowed_fallbacks = {
+        normalize_target_name(item)
+        for item in fallback
+        if isinstance(item, str)
+    }
+
+    if preferred not in OFFICIAL_TARGETS:
+        raise ValueError(
+            "CONTRACT_ERROR: backend_preferido no oficial en contrato de módulo "
+            f"{module!r}: {preferred!r}. Permitidos: {', '.join(OFFICIAL_TARGETS)}"
+        )
+
+    invalid_fallbacks = sorted(item for item in allowed_fallbacks if item not in OFFICIAL_TARGETS)
+    if invalid_fallbacks:
+        raise ValueError(
+            "CONTRACT_ERROR: fallback_permitido contiene backends no oficiales en módulo "
+            f"{module!r}: {', '.join(invalid_fallbacks)}. Permitidos: {', '.join(OFFICIAL_TARGETS)}"
+        )
+
+    if canonical_backend == preferred or canonical_backend in allowed_fallbacks:
+        return canonical_backend
+
+    raise ValueError(
+        "CONTRACT_ERROR: backend no permitido por contrato de módulo "
+        f"{module!r} para target {canonical_backend!r}; preferido={preferred!r}; "
+        f"fallback_permitido={sorted(allowed_fallbacks)!r}"
+    )
+
+_RUNTIME_PATH_FORBIDDEN_SEGMENTS = (
+    "core/nativos",
+    "corelibs",
+    "standard_library",
+    "pcobra/core",
+    "pcobra/corelibs",
+    "pcobra/standard_library",
+    "cobra/core",
+    "cobra/corelibs",
+    "cobra/standard_library",
+    "nativos/",
+)
+
+
+def _is_runtime_path_forbidden(mapped_path: str) -> bool:
+    """Indica si ``mapped_path`` intenta inyectar rutas de runtime reservadas."""
+    canonical = mapped_path.replace("\\", "/").strip().lower()
+    if not canonical:
+        return False
+    return any(segment in canonical for segment in _RUNTIME_PATH_FORBIDDEN_SEGMENTS)
+
+
+
+
+def _validate_public_backend_policy(data: Dict[str, Any]) -> None:
+    """Valida que ``cobra.toml`` solo declare backends públicos en secciones de runtime."""
+    allowed = set(PUBLIC_BACKENDS)
+    allowed_text = ", ".join(PUBLIC_BACKENDS)
+
+    project_cfg = data.get("project")
+    if isinstance(project_cfg, dict):
+        raw_targets = project_cfg.get("required_targets")
+        if raw_targets is None:
+            raw_targets = project_cfg.get("targets_requeridos")
+
+        if raw_targets is not None:
+            if not isinstance(raw_targets, list):
+                raise _build_policy_error(
+                    category="missing_required_field",
+                    module="project",
+                    symbol="required_targets",
+                    key="required_targets",
+                    detail="[project].required_targets debe ser lista de strings",
+                )
+            invalid_targets: list[str] = []
+            for raw_target in raw_targets:
+                if not isinstance(raw_target, str):
+                    invalid_targets.append(repr(raw_target))
+                    continue
+                canonical = normalize_target_name(raw_target)
+                if canonical not in allowed:
+                    invalid_targets.append(raw_target)
+
+            if invalid_targets:
+                raise _build_policy_error(
+                    category="unknown_critical_key",
+                    module="project",
+                    symbol="required_targets",
+                    key=",".join(invalid_targets),
+                    detail=f"Targets fuera de PUBLIC_BACKENDS. Permitidos: {allowed_text}",
+                )
+
+    modulos = data.get("modulos")
+    if not isinstance(modulos, dict):
+        return
+
+    invalid_by_module: dict[str, list[str]] = {}
+    for module_name, module_mapping in modulos.items():
+        if not isinstance(module_mapping, dict):
+            continue
+
+        invalid_keys: list[str] = []
+        for key in module_mapping:
+            if not isinstance(key, str):
+                invalid_keys.append((repr(key), "unknown_critical_key"))
+                continue
+            canonical = normalize_target_name(key)
+            if canonical not in allowed:
+                if canonical in allowed and canonical != key:
+                    invalid_keys.append((key, "semantic_contradiction"))
+                else:
+                    invalid_keys.append((key, "unknown_critical_key"))
+
+        if invalid_keys:
+            invalid_by_module[str(module_name)] = invalid_keys
+
+    if invalid_by_module:
+        first_module, entries = sorted(invalid_by_module.items())[0]
+        first_key, first_category = entries[0]
+        raise _build_policy_error(
+            category=first_category,
+            module=first_module,
+            symbol="[modulos.<nombre>]",
+            key=first_key,
+            detail=f"Clave inválida en mapeo de módulo. Permitidos: {allowed_text}",
+        )
+
+
+def get_toml_map() -> Dict[str, Any]:
+    """Devuelve la configuración del archivo ``cobra.toml``."""
+    global _toml_cache
+    if _toml_cache is None:
+        try:
+            if os.path.exists(COBRA_TOML_PATH):
+                with open(COBRA_TOML_PATH, 'rb') as f:
+                    data = tomllib.load(f) or {}
+            else:
+                data = {}
+            if isinstance(data, dict):
+                _validate_public_backend_policy(data)
+            _toml_cache = data
+        except (tomllib.TOMLDecodeError, OSError) as e:
+            logger.error(f"Error al cargar cobra.toml: {e}")
+            _toml_cache = {}
+    return _toml_cache
+
+
+def get_mapped_path(module: str, backend: str) -> str:
+    """Return the mapped path for *module* under canonical ``[modulos]`` config.
+
+    Solo acepta nombres canónicos incluidos en ``OFFICIAL_TARGETS`` y resuelve
+    exclusivamente desde ``cobra.toml`` usando la estructura
+    ``[modulos."<module>"]``. Si no hay mapeo válido, devuelve ``module``.
+    """
+    try:
+        canonical_backend = resolve_backend_for_module(module, backend)
+    except ValueError:
+        return module
+    if canonical_backend not in OFFICIAL_TARGETS:
+        raise ValueError(
+            "CONTRACT_ERROR: backend no oficial en get_mapped_path: "
+            f"{backend!r}. Permitidos: {', '.join(OFFICIAL_TARGETS)}"
+        )
+
+    mapa = get_toml_map()
+    if not isinstance(mapa, dict):
+        return module
+
+    modulos = mapa.get("modulos", {})
+    if not isinstance(modulos, dict):
+        return module
+
+    module_mapping = modulos.get(module, {})
+    if not isinstance(module_mapping, dict):
+        return module
+
+    mapped = module_mapping.get(canonical_backend)
+    if not isinstance(mapped, str):
+        return module
+    if _is_runtime_path_forbidden(mapped):
+        logger.warning(
+            "Mapping de módulo ignorado por política de runtime: módulo=%s backend=%s destino=%s",
+            module,
+            canonical_backend,
+            mapped,
+        )
+        return module
+    return mapped
@@ -0,0 +1,3 @@
+"""Herramientas para convertir el AST de Cobra a otros lenguajes."""
+
+# Este módulo define herramientas de transpilación a diferentes lenguajes.
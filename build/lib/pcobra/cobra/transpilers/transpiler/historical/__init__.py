@@ -0,0 +1,6 @@
+"""Artefactos históricos de transpiladores retirados.
+
+Este paquete no forma parte del backend activo oficial ni se importa en el
+runtime normal de pCobra. Sus módulos se conservan solo para auditoría,
+migración y regresiones históricas.
+"""
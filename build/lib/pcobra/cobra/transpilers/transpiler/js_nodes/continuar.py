@@ -0,0 +1,2 @@
+def visit_continuar(self, nodo):
+    self.agregar_linea("continue;")
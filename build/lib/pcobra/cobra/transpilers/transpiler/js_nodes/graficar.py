@@ -0,0 +1,3 @@
+def visit_graficar(self, nodo):
+    hb = self.obtener_valor(nodo.holobit)
+    self.agregar_linea(f"cobra_graficar({hb});")
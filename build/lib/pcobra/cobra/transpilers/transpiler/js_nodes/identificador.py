@@ -0,0 +1,2 @@
+def visit_identificador(self, nodo):
+    self.agregar_linea(self.obtener_valor(nodo))
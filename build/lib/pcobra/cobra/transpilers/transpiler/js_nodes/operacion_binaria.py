@@ -0,0 +1,2 @@
+def visit_operacion_binaria(self, nodo):
+    self.agregar_linea(self.obtener_valor(nodo))
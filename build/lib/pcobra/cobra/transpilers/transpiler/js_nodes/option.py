@@ -0,0 +1,3 @@
+def visit_option(self, nodo):
+    valor = self.obtener_valor(nodo)
+    self.agregar_linea(f"{valor};")
@@ -0,0 +1,3 @@
+def visit_pattern(self, nodo):
+    patron = self.obtener_valor(nodo)
+    self.agregar_linea(f"{patron};")
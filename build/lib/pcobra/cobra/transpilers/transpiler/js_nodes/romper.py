@@ -0,0 +1,2 @@
+def visit_romper(self, nodo):
+    self.agregar_linea("break;")
@@ -0,0 +1,2 @@
+def visit_atributo(self, nodo):
+    self.codigo += f"{self.obtener_valor(nodo)}\n"
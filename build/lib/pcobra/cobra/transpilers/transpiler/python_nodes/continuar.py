@@ -0,0 +1,2 @@
+def visit_continuar(self, nodo):
+    self.codigo += f"{self.obtener_indentacion()}continue\n"
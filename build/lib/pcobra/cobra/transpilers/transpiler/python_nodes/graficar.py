@@ -0,0 +1,3 @@
+def visit_graficar(self, nodo):
+    hb = self.obtener_valor(nodo.holobit)
+    self.codigo += f"{self.obtener_indentacion()}cobra_graficar({hb})\n"
@@ -0,0 +1,2 @@
+def visit_pasar(self, nodo):
+    self.agregar_linea(";")
@@ -0,0 +1,783 @@
+"""Definiciones de los nodos del árbol de sintaxis abstracta de Cobra."""
+
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional, TYPE_CHECKING
+from collections.abc import Mapping
+import warnings
+
+if TYPE_CHECKING:  # pragma: no cover - solo para verificación estática
+    from pcobra.core.lexer import Token, TipoToken
+
+
+@dataclass(repr=False)
+class NodoAST:
+    """Clase base para todos los nodos del AST.
+
+    Contrato:
+    - ``__repr__`` y ``__str__`` deben ser no recursivos y sin evaluación.
+    - Toda ``property`` en nodos AST debe ser O(1), no recursiva y sin evaluación.
+    """
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} id={id(self)}>"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def aceptar(self, visitante):
+        """Acepta un visitante y delega la operación a éste."""
+        return visitante.visit(self)
+
+
+@dataclass(repr=False)
+class NodoBloque(NodoAST):
+    """Representa un bloque homogéneo de sentencias del AST."""
+
+    instrucciones: List[NodoAST] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.instrucciones = list(self.instrucciones or [])
+
+    def __iter__(self) -> Iterator[NodoAST]:
+        """Itera las instrucciones en el mismo orden en que se declararon."""
+        return iter(self.instrucciones)
+
+    def __len__(self):
+        return len(self.instrucciones)
+
+    def __getitem__(self, index):
+        return self.instrucciones[index]
+
+    def append(self, instruccion: NodoAST) -> None:
+        self.instrucciones.append(instruccion)
+
+
+def _asegurar_bloque(valor: Any) -> NodoBloque:
+    if isinstance(valor, NodoBloque):
+        return valor
+    if isinstance(valor, list):
+        return NodoBloque(valor)
+    raise TypeError(f"Se esperaba NodoBloque o list, se recibió {type(valor).__name__}")
+
+
+@dataclass(repr=False)
+class NodoAsignacion(NodoAST):
+    variable: Any
+    expresion: Any
+    inferencia: bool = False
+    declaracion: bool = False
+
+    """Representa la asignación de una expresión a una variable."""
+
+    def __post_init__(self):
+        from pcobra.core.lexer import Token
+
+        if isinstance(self.variable, Token):
+            nombre = self.variable.valor
+            self.identificador = str(nombre)
+            self.variable = self.identificador
+        else:
+            nombre = self.variable
+            self.identificador = nombre
+            self.variable = nombre
+        # Compatibilidad con pruebas antiguas
+        self.nombre = self.identificador
+        self.valor = self.expresion
+
+
+@dataclass(repr=False)
+class NodoHolobit(NodoAST):
+    nombre: Optional[str] = None
+    valores: Optional[List[Any]] = None
+
+    """Define un holobit, una colección de valores numéricos."""
+
+    def __post_init__(self):
+        if self.valores is None and isinstance(self.nombre, list):
+            self.valores = self.nombre
+            self.nombre = None
+        if self.valores is None:
+            self.valores = []
+
+
+@dataclass(repr=False)
+class NodoCondicional(NodoAST):
+    condicion: Any
+    bloque_si: NodoBloque
+    bloque_sino: NodoBloque = field(default_factory=NodoBloque)
+
+    """Bloque ``si`` opcionalmente acompañado de un bloque ``sino``."""
+
+    def __post_init__(self) -> None:
+        self.bloque_si = _asegurar_bloque(self.bloque_si)
+        self.bloque_sino = _asegurar_bloque(self.bloque_sino)
+
+
+@dataclass(repr=False)
+class NodoGarantia(NodoAST):
+    condicion: Any
+    bloque_continuacion: NodoBloque
+    bloque_escape: NodoBloque
+
+    """Sentencia ``garantia`` con bloque normal y de escape."""
+
+    def __post_init__(self) -> None:
+        self.bloque_continuacion = _asegurar_bloque(self.bloque_continuacion)
+        self.bloque_escape = _asegurar_bloque(self.bloque_escape)
+
+
+@dataclass(repr=False)
+class NodoBucleMientras(NodoAST):
+    condicion: Any
+    cuerpo: NodoBloque
+
+    """Representa un bucle ``mientras`` con su condición y cuerpo."""
+
+    def __post_init__(self) -> None:
+        self.cuerpo = _asegurar_bloque(self.cuerpo)
+
+
+@dataclass(repr=False)
+class NodoFor(NodoAST):
+    variable: Any
+    iterable: Any
+    cuerpo: List[Any]
+
+    """Estructura de control ``para`` que itera sobre un iterable."""
+
+
+@dataclass(repr=False)
+class NodoLista(NodoAST):
+    elementos: List[Any]
+
+    """Literal de lista de expresiones."""
+
+
+@dataclass(repr=False)
+class NodoDiccionario(NodoAST):
+    elementos: Any
+
+    """Literal de diccionario ``clave: valor``."""
+
+
+@dataclass(repr=False)
+class NodoListaComprehension(NodoAST):
+    expresion: Any
+    variable: str
+    iterable: Any
+    condicion: Optional[Any] = None
+
+    """Comprensión de listas ``[expresion para x en iterable si condicion]``."""
+
+
+@dataclass(repr=False)
+class NodoDiccionarioComprehension(NodoAST):
+    clave: Any
+    valor: Any
+    variable: str
+    iterable: Any
+    condicion: Optional[Any] = None
+
+    """Comprensión de diccionarios ``{clave: valor para x en iterable si condicion}``."""
+
+
+@dataclass(repr=False)
+class NodoListaTipo(NodoAST):
+    nombre: str
+    tipo: str
+    elementos: List[Any] = field(default_factory=list)
+
+    """Declaración de una lista con tipo explícito."""
+
+
+@dataclass(repr=False)
+class NodoDiccionarioTipo(NodoAST):
+    nombre: str
+    tipo_clave: str
+    tipo_valor: str
+    elementos: List[tuple[Any, Any]] = field(default_factory=list)
+
+    """Declaración de un diccionario con tipos para clave y valor."""
+
+
+@dataclass(repr=False)
+class NodoTipo(NodoAST):
+    """Representa una referencia a un tipo con soporte para genéricos."""
+
+    nombre: Any
+    genericos: List[Any] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        from pcobra.core.lexer import Token
+
+        if isinstance(self.nombre, NodoTipo):  # Compatibilidad con construcciones anidadas
+            self.genericos = list(self.nombre.genericos)
+            self.nombre = self.nombre.nombre
+        if isinstance(self.nombre, Token):
+            self.nombre = self.nombre.valor
+        self.nombre = str(self.nombre)
+        self.genericos = list(self.genericos)
+
+    def __repr__(self) -> str:
+        return f"<NodoTipo id={id(self)}>"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+
+@dataclass(repr=False)
+class NodoDecorador(NodoAST):
+    expresion: Any
+
+    """Representa una línea de decorador previa a una función."""
+
+
+@dataclass(repr=False)
+class NodoFuncion(NodoAST):
+    nombre: str
+    parametros: List[str]
+    cuerpo: NodoBloque
+    decoradores: List[Any] = field(default_factory=list)
+    asincronica: bool = False
+    type_params: List[str] = field(default_factory=list)
+    nombre_original: Optional[str] = None
+
+    """Declaración de una función definida por el usuario."""
+
+    def __post_init__(self) -> None:
+        self.cuerpo = _asegurar_bloque(self.cuerpo)
+
+@dataclass(repr=False)
+class NodoMetodoAbstracto(NodoAST):
+    nombre: str
+    parametros: List[str] = field(default_factory=list)
+
+    """Firma de un método sin implementación."""
+
+
+@dataclass(repr=False)
+class NodoInterface(NodoAST):
+    nombre: str
+    metodos: List[NodoMetodoAbstracto] = field(default_factory=list)
+
+    """Declaración de una interfaz con métodos abstractos."""
+
+
+@dataclass(repr=False)
+class NodoClase(NodoAST):
+    nombre: str
+    metodos: List[Any]
+    bases: List[str] = field(default_factory=list)
+    type_params: List[str] = field(default_factory=list)
+
+    """Definición de una clase y sus métodos."""
+
+
+@dataclass(repr=False)
+class NodoEnum(NodoAST):
+    nombre: str
+    miembros: List[str]
+
+    """Declaración de un ``enum`` con sus miembros."""
+
+
+@dataclass(repr=False)
+class NodoMetodo(NodoAST):
+    nombre: str
+    parametros: List[str]
+    cuerpo: NodoBloque
+    asincronica: bool = False
+    type_params: List[str] = field(default_factory=list)
+    nombre_original: Optional[str] = None
+
+    """Método perteneciente a una clase."""
+
+    def __post_init__(self) -> None:
+        self.cuerpo = _asegurar_bloque(self.cuerpo)
+
+
+@dataclass(repr=False)
+class NodoInstancia(NodoAST):
+    nombre_clase: str
+    argumentos: List[Any] = field(default_factory=list)
+
+    """Instanciación de una clase."""
+
+
+@dataclass(repr=False)
+class NodoAtributo(NodoAST):
+    objeto: Any
+    nombre: str
+
+    """Acceso a un atributo de un objeto."""
+
+
+@dataclass(repr=False)
+class NodoLlamadaMetodo(NodoAST):
+    objeto: Any
+    nombre_metodo: str
+    argumentos: List[Any] = field(default_factory=list)
+
+    """Invocación de un método de un objeto."""
+
+
+@dataclass(repr=False)
+class NodoOperacionBinaria(NodoAST):
+    izquierda: Any
+    operador: 'Token'
+    derecha: Any
+
+    """Operación que combina dos expresiones mediante un operador."""
+
+    def __repr__(self):
+        return f"<NodoOperacionBinaria id={id(self)}>"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@dataclass(repr=False)
+class NodoOperacionUnaria(NodoAST):
+    operador: 'Token'
+    operando: Any
+
+    """Operación aplicada a un único operando."""
+
+    def __repr__(self):
+        return f"<NodoOperacionUnaria id={id(self)}>"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@dataclass(repr=False)
+class NodoValor(NodoAST):
+    valor: Any
+
+    """Representa un valor literal ya evaluado."""
+
+
+@dataclass(repr=False)
+class NodoIdentificador(NodoAST):
+    nombre: str
+
+    """Uso de una variable o identificador.
+
+    Nota:
+        La ruta oficial de evaluación es ``InterpretadorCobra.evaluar_expresion``.
+        ``evaluar`` se conserva únicamente por compatibilidad retroactiva.
+    """
+
+    def __post_init__(self):
+        from pcobra.core.lexer import Token
+
+        if isinstance(self.nombre, Token):
+            self.nombre = self.nombre.valor
+        elif isinstance(self.nombre, NodoIdentificador):
+            self.nombre = self.nombre.nombre
+        self.valor = self.nombre
+
+    def __repr__(self):
+        return f"<NodoIdentificador id={id(self)}>"
+
+    def __str__(self):
+        return self.__repr__()
+
+    def evaluar(self, contexto):
+        warnings.warn(
+            "NodoIdentificador.evaluar está deprecado; use "
+            "InterpretadorCobra.evaluar_expresion.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        resolvedor = getattr(contexto, "_resolver_identificador", None)
+        if callable(resolvedor):
+            return resolvedor(self.nombre)
+
+        if not isinstance(contexto, Mapping):
+            raise TypeError(
+                "NodoIdentificador.evaluar requiere un contexto con "
+                "_resolver_identificador o un mapeo plano (Mapping)."
+            )
+
+        if self.nombre not in contexto:
+            raise NameError(f"Identificador no definido: '{self.nombre}'")
+        return contexto[self.nombre]
+
+
+@dataclass(repr=False)
+class NodoLlamadaFuncion(NodoAST):
+    nombre: str
+    argumentos: List[Any]
+
+    """Invocación de una función existente."""
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} id={id(self)}>"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@dataclass(repr=False)
+class NodoHilo(NodoAST):
+    llamada: NodoLlamadaFuncion
+
+    """Ejecución de una llamada en un hilo separado."""
+
+    def __repr__(self):
+        return f"<NodoHilo id={id(self)}>"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@dataclass(repr=False)
+class NodoRetorno(NodoAST):
+    expresion: Any
+
+    """Valor devuelto por una función."""
+
+    def __repr__(self):
+        return f"<NodoRetorno id={id(self)}>"
+
+
+@dataclass(repr=False)
+class NodoDefer(NodoAST):
+    expresion: Any
+    linea: Optional[int] = None
+    columna: Optional[int] = None
+
+    """Sentencia que difiere la ejecución de una expresión."""
+
+    def __repr__(self):
+        return f"<NodoDefer id={id(self)}>"
+
+
+@dataclass(repr=False)
+class NodoYield(NodoAST):
+    expresion: Any
+
+    """Expresión yield dentro de una función generadora."""
+
+    def __repr__(self):
+        return f"<NodoYield id={id(self)}>"
+
+
+@dataclass(repr=False)
+class NodoEsperar(NodoAST):
+    expresion: Any
+
+    """Expresión await utilizada en funciones asíncronas."""
+
+    def __repr__(self):
+        return f"<NodoEsperar id={id(self)}>"
+
+
+@dataclass(repr=False)
+class NodoOption(NodoAST):
+    valor: Any | None = None
+
+    """Representa un valor opcional, equivalente a ``Some`` o ``None``."""
+
+    def __repr__(self):
+        return f"<NodoOption id={id(self)}>"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@dataclass(repr=False)
+class NodoRomper(NodoAST):
+    """Sentencia para romper un bucle."""
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} id={id(self)}>"
+
+
+@dataclass(repr=False)
+class NodoContinuar(NodoAST):
+    """Sentencia para continuar con la siguiente iteración de un bucle."""
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} id={id(self)}>"
+
+
+@dataclass(repr=False)
+class NodoPasar(NodoAST):
+    """Sentencia vacía que no realiza ninguna acción."""
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} id={id(self)}>"
+
+
+@dataclass(repr=False)
+class NodoAssert(NodoAST):
+    condicion: Any
+    mensaje: Any | None = None
+
+
+@dataclass(repr=False)
+class NodoDel(NodoAST):
+    objetivo: Any
+
+
+@dataclass(repr=False)
+class NodoGlobal(NodoAST):
+    nombres: List[str]
+
+
+@dataclass(repr=False)
+class NodoNoLocal(NodoAST):
+    nombres: List[str]
+
+
+@dataclass(repr=False)
+class NodoLambda(NodoAST):
+    parametros: List[str]
+    cuerpo: Any
+
+
+@dataclass(repr=False)
+class NodoWith(NodoAST):
+    contexto: Any
+    alias: str | None
+    cuerpo: NodoBloque
+    asincronico: bool = False
+
+    def __post_init__(self) -> None:
+        self.cuerpo = _asegurar_bloque(self.cuerpo)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} id={id(self)}>"
+
+
+@dataclass(repr=False)
+class NodoThrow(NodoAST):
+    expresion: Any
+
+    """Lanza una excepción durante la ejecución."""
+
+    def __repr__(self):
+        return f"<NodoThrow id={id(self)}>"
+
+
+@dataclass(repr=False)
+class NodoTryCatch(NodoAST):
+    bloque_try: NodoBloque
+    nombre_excepcion: Optional[str] = None
+    bloque_catch: NodoBloque = field(default_factory=NodoBloque)
+    bloque_finally: NodoBloque = field(default_factory=NodoBloque)
+
+    """Bloque ``try`` con manejo opcional de excepciones."""
+
+    def __post_init__(self) -> None:
+        self.bloque_try = _asegurar_bloque(self.bloque_try)
+        self.bloque_catch = _asegurar_bloque(self.bloque_catch)
+        self.bloque_finally = _asegurar_bloque(self.bloque_finally)
+
+
+@dataclass(repr=False)
+class NodoImport(NodoAST):
+    ruta: str
+
+    """Importación de un módulo externo."""
+
+
+@dataclass(repr=False)
+class NodoUsar(NodoAST):
+    modulo: str
+
+    """Instrucción para usar un módulo especificado."""
+
+
+@dataclass(repr=False)
+class NodoImportDesde(NodoAST):
+    modulo: str
+    nombre: str
+    alias: str | None = None
+
+
+@dataclass(repr=False)
+class NodoExport(NodoAST):
+    nombre: str
+
+    """Indica que un identificador debe exportarse en el módulo generado."""
+
+    def __repr__(self):
+        return f"<NodoExport id={id(self)}>"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@dataclass(repr=False)
+class NodoPara(NodoAST):
+    variable: Any
+    iterable: Any
+    cuerpo: NodoBloque
+    asincronico: bool = False
+
+    """Bucle ``para`` que itera sobre un iterable."""
+
+    def __post_init__(self) -> None:
+        self.cuerpo = _asegurar_bloque(self.cuerpo)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} id={id(self)}>"
+
+
+@dataclass(repr=False)
+class NodoProyectar(NodoAST):
+    holobit: Any
+    modo: Any
+
+    """Proyección de un ``holobit`` en un modo específico."""
+
+
+@dataclass(repr=False)
+class NodoTransformar(NodoAST):
+    holobit: Any
+    operacion: Any
+    parametros: List[Any] = field(default_factory=list)
+
+    """Transformación aplicada a un ``holobit``."""
+
+
+@dataclass(repr=False)
+class NodoGraficar(NodoAST):
+    holobit: Any
+
+    """Visualización de un ``holobit``."""
+
+
+@dataclass(repr=False)
+class NodoImprimir(NodoAST):
+    expresion: Any
+
+    """Impresión de una expresión en la salida estándar."""
+
+    def __repr__(self):
+        return f"<NodoImprimir id={id(self)}>"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+@dataclass(repr=False)
+class NodoMacro(NodoAST):
+    nombre: str
+    cuerpo: NodoBloque
+
+    """Representa una macro que almacena un conjunto de nodos a expandir."""
+
+    def __post_init__(self) -> None:
+        self.cuerpo = _asegurar_bloque(self.cuerpo)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} id={id(self)}>"
+
+
+@dataclass(repr=False)
+class NodoPattern(NodoAST):
+    valor: Any
+
+
+@dataclass(repr=False)
+class NodoGuard(NodoAST):
+    patron: NodoPattern
+    condicion: Any
+
+
+@dataclass(repr=False)
+class NodoCase(NodoAST):
+    valor: Any
+    cuerpo: NodoBloque
+
+    def __post_init__(self) -> None:
+        self.cuerpo = _asegurar_bloque(self.cuerpo)
+
+
+@dataclass(repr=False)
+class NodoSwitch(NodoAST):
+    expresion: Any
+    casos: List[NodoCase]
+    por_defecto: NodoBloque = field(default_factory=NodoBloque)
+
+    def __post_init__(self) -> None:
+        self.por_defecto = _asegurar_bloque(self.por_defecto)
+
+
+__all__ = [
+    "NodoAST",
+    "NodoBloque",
+    "NodoAsignacion",
+    "NodoHolobit",
+    "NodoCondicional",
+    "NodoGarantia",
+    "NodoBucleMientras",
+    "NodoFor",
+    "NodoLista",
+    "NodoDiccionario",
+    "NodoListaTipo",
+    "NodoDiccionarioTipo",
+    "NodoTipo",
+    "NodoDecorador",
+    "NodoFuncion",
+    "NodoMetodoAbstracto",
+    "NodoInterface",
+    "NodoClase",
+    "NodoEnum",
+    "NodoMetodo",
+    "NodoInstancia",
+    "NodoAtributo",
+    "NodoLlamadaMetodo",
+    "NodoOperacionBinaria",
+    "NodoOperacionUnaria",
+    "NodoValor",
+    "NodoIdentificador",
+    "NodoLlamadaFuncion",
+    "NodoHilo",
+    "NodoRetorno",
+    "NodoDefer",
+    "NodoYield",
+    "NodoEsperar",
+    "NodoOption",
+    "NodoRomper",
+    "NodoContinuar",
+    "NodoPasar",
+    "NodoAssert",
+    "NodoDel",
+    "NodoGlobal",
+    "NodoNoLocal",
+    "NodoLambda",
+    "NodoWith",
+    "NodoThrow",
+    "NodoTryCatch",
+    "NodoImportDesde",
+    "NodoExport",
+    "NodoImport",
+    "NodoUsar",
+    "NodoPara",
+    "NodoProyectar",
+    "NodoTransformar",
+    "NodoGraficar",
+    "NodoImprimir",
+    "NodoMacro",
+    "NodoPattern",
+    "NodoGuard",
+    "NodoCase",
+    "NodoSwitch",
+]
+
+
+class NodoDeclaracion:
+    pass
+
+
+class NodoModulo:
+    pass
+
+
+class NodoExpresion:
+    pass
@@ -0,0 +1 @@
+"""Paquete de utilidades CLI reexportadas para ``pcobra.core``."""
@@ -0,0 +1,2856 @@
+"""Implementación del intérprete del lenguaje Cobra."""
+
+import logging
+import os
+import hashlib
+import inspect
+import math
+import threading
+import warnings
+from pathlib import Path
+from typing import Mapping, Optional
+from pcobra.cobra.usar_loader import ModuloFueraCatalogoPublicoError, usar_modulo
+from pcobra.cobra.usar_policy import USAR_COBRA_PUBLIC_MODULES
+
+from .lexer import (
+    Token,
+    TipoToken,
+)
+from .optimizations import (
+    optimize_constants,
+    remove_dead_code,
+    inline_functions,
+    eliminate_common_subexpressions,
+)
+from .type_utils import (
+    verificar_sumables,
+    verificar_numeros,
+    verificar_comparables,
+    verificar_booleanos,
+    verificar_booleano,
+)
+from .ast_nodes import (
+    NodoAsignacion,
+    NodoBloque,
+    NodoCondicional,
+    NodoBucleMientras,
+    NodoPara,
+    NodoFuncion,
+    NodoLlamadaFuncion,
+    NodoLlamadaMetodo,
+    NodoHolobit,
+    NodoHilo,
+    NodoClase,
+    NodoInstancia,
+    NodoAtributo,
+    NodoIdentificador,
+    NodoValor,
+    NodoImprimir,
+    NodoLista,
+    NodoRetorno,
+    NodoYield,
+    NodoEsperar,
+    NodoOperacionBinaria,
+    NodoOperacionUnaria,
+    NodoTryCatch,
+    NodoThrow,
+    NodoImport,
+    NodoUsar,
+    NodoAssert,
+    NodoDel,
+    NodoGlobal,
+    NodoNoLocal,
+    NodoWith,
+    NodoImportDesde,
+    NodoExport,
+    NodoAST,
+    NodoRomper,
+    NodoContinuar,
+)
+from .memoria.gestor_memoria import GestorMemoriaGenetico
+from .internal_ir import InternalIRModule, build_internal_ir
+from .semantic_validators import (
+    construir_cadena,
+    PrimitivaPeligrosaError,
+)
+from .semantico import AnalizadorSemantico
+from .cobra_config import limite_nodos
+from .import_utils import (
+    MODULES_PATH as _DEFAULT_MODULES_PATH,
+    IMPORT_WHITELIST,
+    ruta_import_permitida,
+    cargar_ast_modulo,
+)
+from .utils import validar_ast_estructural, ErrorEstructuraAST
+from .errors import CondicionNoBooleanaError
+from .usar_symbol_policy import (
+    build_and_validate_usar_symbol_metadata,
+    normalizar_metadata_simbolo_usar,
+    validate_usar_symbol_metadata,
+)
+from .environment import Environment
+from .planificador import PlanificadorHilos, obtener_planificador
+from pcobra.cobra.usar_loader import descubrir_raiz_proyecto
+
+MODULES_PATH = _DEFAULT_MODULES_PATH
+REPL_USAR_EXTERNAL_MODULE_ERROR = (
+    "usar_error[modulo_no_permitido]: módulo externo no permitido en REPL estricto (solo alias oficiales Cobra)"
+)
+
+
+def _usar_modulo_con_estado_aislado(
+    nombre: str,
+    *,
+    project_root: Path,
+    current_file: Path | None,
+    module_cache: dict[Path, dict[str, object]],
+    loading_stack: list[Path],
+    contexto_proyecto_verificado: bool,
+) -> Mapping[str, object]:
+    """Llama a ``usar_modulo`` pasando estado aislado si la función lo soporta."""
+
+    parametros = inspect.signature(usar_modulo).parameters
+    kwargs = {
+        "project_root": project_root,
+        "current_file": current_file,
+    }
+    if any(param.kind == inspect.Parameter.VAR_KEYWORD for param in parametros.values()) or (
+        "module_cache" in parametros and "loading_stack" in parametros
+    ):
+        kwargs["module_cache"] = module_cache
+        kwargs["loading_stack"] = loading_stack
+    if any(param.kind == inspect.Parameter.VAR_KEYWORD for param in parametros.values()) or (
+        "contexto_proyecto_verificado" in parametros
+    ):
+        kwargs["contexto_proyecto_verificado"] = contexto_proyecto_verificado
+    return usar_modulo(nombre, **kwargs)
+USAR_DIRECT_BACKEND_IMPORT_ERROR = (
+    "usar_error[backend_import_directo]: import directo de backend no permitido en usar"
+)
+USAR_NON_CANONICAL_MODULE_ERROR = (
+    "usar_error[modulo_no_canonico]: el módulo solicitado no es canónico; use el alias oficial Cobra"
+)
+USAR_NON_PUBLIC_MODULE_ERROR = (
+    "usar_error[modulo_fuera_catalogo_publico]: el módulo solicitado está fuera de USAR_COBRA_PUBLIC_MODULES"
+)
+USAR_NON_FACING_MODULE_ERROR = (
+    "usar_error[modulo_no_cobra_facing]: el módulo solicitado no está marcado como Cobra-facing"
+)
+USAR_INVALID_EXPORT_ERROR = "usar_error[export_invalido]"
+USAR_SYMBOL_CONFLICT_ERROR = "usar_error[conflicto_simbolo]"
+USAR_COLLISION_STRICT_ERROR = "strict_error"
+USAR_COLLISION_WARN_ALIAS_REQUIRED = "warn_alias_required"
+_USAR_COLLISION_POLICIES = frozenset({USAR_COLLISION_STRICT_ERROR, USAR_COLLISION_WARN_ALIAS_REQUIRED})
+def formatear_error_usar_usuario(codigo: str, modulo: str, contexto_minimo: str | None = None) -> str:
+    """Devuelve errores cortos y legibles para la salida de usuario en `usar`."""
+    mensajes = {
+        "modulo_fuera_catalogo": f"No se puede usar '{modulo}': módulo fuera del catálogo público.",
+        "conflicto_simbolo": f"No se puede usar '{modulo}': hay conflicto de símbolos en el contexto actual.",
+        "export_invalido": f"No se puede usar '{modulo}': no hay símbolos exportables válidos.",
+        "carga_modulo_error": f"No se puede usar '{modulo}': error al cargar el módulo.",
+    }
+    base = mensajes.get(codigo, f"No se puede usar '{modulo}'.")
+    if contexto_minimo:
+        return f"{base} {contexto_minimo}"
+    return base
+
+
+def _usar_error_esperado(exc: Exception) -> bool:
+    """Identifica errores esperados del contrato de `usar`."""
+    return isinstance(exc, (PermissionError, NameError, ImportError, ValueError))
+
+
+_ERRORES_USUARIO_ELEMENTO: dict[type[Exception], set[str]] = {
+    IndexError: {"índice fuera de rango"},
+    TypeError: {"índice debe ser entero", "objeto no indexable"},
+}
+
+
+def _usar_detalle_habilitado() -> bool:
+    """Determina si `usar` puede exponer detalles extendidos en salida de error."""
+    return _runtime_debug_enabled() or InterpretadorCobra._debug_trazas_habilitadas()
+
+
+def _resumir_modulos_permitidos_usar(limite: int = 10) -> str:
+    """Devuelve una lista corta de módulos públicos para errores de usuario."""
+
+    return ", ".join(USAR_COBRA_PUBLIC_MODULES[:limite])
+
+
+def _error_usuario_modulo_fuera_catalogo(
+    modulo: str,
+    detalle: Exception,
+    *,
+    repl_estricto: bool,
+    incluir_detalle: bool,
+) -> PermissionError:
+    """Crea un PermissionError corto y conserva el detalle técnico como nota."""
+
+    if repl_estricto:
+        mensaje = (
+            f"Importación no permitida en 'usar': '{modulo}'. "
+            "Es un módulo backend/no canónico y no forma parte de la API pública. "
+            f"Módulos permitidos: {_resumir_modulos_permitidos_usar()}."
+        )
+    else:
+        mensaje = formatear_error_usar_usuario("modulo_fuera_catalogo", modulo)
+
+    if incluir_detalle:
+        mensaje = f"{mensaje} {USAR_NON_PUBLIC_MODULE_ERROR}. Detalle: {detalle}"
+
+    error = PermissionError(mensaje)
+    if not incluir_detalle:
+        error.add_note(str(detalle))
+    return error
+
+
+def _runtime_debug_enabled() -> bool:
+    """Habilita diagnóstico puntual de runtime vía entorno."""
+    return os.getenv("PCOBRA_DEBUG_RUNTIME", "").strip() == "1"
+
+
+def _resumen_conflictos_usar(conflictos: list[object]) -> str:
+    """Devuelve un resumen compacto de conflictos para logs no verbosos."""
+    if not conflictos:
+        return "count=0"
+    muestra = ",".join(str(conflicto) for conflicto in conflictos[:3])
+    resto = len(conflictos) - 3
+    sufijo = f",+{resto}" if resto > 0 else ""
+    return f"count={len(conflictos)} sample=[{muestra}{sufijo}]"
+
+
+def _ruta_import_permitida(ruta: str) -> bool:
+    """Indica si una ruta está autorizada para importarse."""
+
+    _sincronizar_config_import()
+    return ruta_import_permitida(ruta, MODULES_PATH, IMPORT_WHITELIST)
+
+
+def _sincronizar_config_import() -> None:
+    """Mantiene sincronizados los valores compartidos con :mod:`import_utils`."""
+
+    from . import import_utils as _import_utils
+
+    _import_utils.MODULES_PATH = MODULES_PATH
+    _import_utils.IMPORT_WHITELIST = IMPORT_WHITELIST
+
+class ExcepcionCobra(Exception):
+    def __init__(self, valor):
+        super().__init__(valor)
+        self.valor = valor
+
+
+class _ControlRomper(Exception):
+    """Señal interna para cortar la ejecución del bucle actual."""
+
+
+class _ControlContinuar(Exception):
+    """Señal interna para avanzar a la siguiente iteración del bucle."""
+
+
+class _ControlRetorno(Exception):
+    """Señal interna que transporta el valor devuelto por una función."""
+
+    def __init__(self, valor):
+        super().__init__()
+        self.valor = valor
+
+
+_SIN_VALOR = object()
+
+
+class _EstadoPorHilo:
+    """Atributo del intérprete que cada tarea de ``hilo`` puede aislar.
+
+    Fuera de una tarea se usa el valor raíz de la instancia. Dentro de una
+    tarea planificada, el valor se lee y escribe en ``InterpretadorCobra._marcos``
+    (un ``threading.local``), de modo que la pila de marcos de la tarea no
+    compite con la del hilo que la lanzó.
+    """
+
+    def __set_name__(self, owner, nombre):
+        self.nombre = nombre
+        self.raiz = f"_{nombre}_raiz"
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        marcos = obj.__dict__.get("_marcos")
+        if marcos is not None:
+            valor = getattr(marcos, self.nombre, _SIN_VALOR)
+            if valor is not _SIN_VALOR:
+                return valor
+        try:
+            return obj.__dict__[self.raiz]
+        except KeyError:
+            raise AttributeError(self.nombre) from None
+
+    def __set__(self, obj, valor):
+        marcos = obj.__dict__.get("_marcos")
+        if marcos is not None and hasattr(marcos, self.nombre):
+            setattr(marcos, self.nombre, valor)
+            return
+        obj.__dict__[self.raiz] = valor
+
+
+class InterpretadorCobra:
+    """Interpreta y ejecuta nodos del lenguaje Cobra."""
+
+    # Estado de ejecución propio de cada tarea de ``hilo``.
+    contextos = _EstadoPorHilo()
+    mem_contextos = _EstadoPorHilo()
+    _eval_stack = _EstadoPorHilo()
+    _call_depth = _EstadoPorHilo()
+
+    @staticmethod
+    def _debug_trazas_habilitadas() -> bool:
+        """Indica si las trazas internas de depuración están activadas."""
+        return os.getenv("PCOBRA_DEBUG_TRACES", "").strip().lower() in {
+            "1",
+            "true",
+            "yes",
+            "on",
+        }
+
+    def _trace_debug(self, mensaje: str) -> None:
+        """Imprime trazas internas solo cuando el modo debug está activo."""
+        if self.in_execution() and self._debug_trazas_habilitadas():
+            print(mensaje)
+
+    @staticmethod
+    def _registrar_auditoria_validador(
+        ruta_real: str,
+        resultado: str,
+        razon: str | None = None,
+        *,
+        hash_corto: str | None = None,
+        fase: str | None = None,
+    ) -> None:
+        """Registra eventos de auditoría durante la carga de validadores extra."""
+        payload = {
+            "evento": "validador_extra",
+            "ruta_real": ruta_real,
+            "resultado": resultado,
+        }
+        if razon:
+            payload["razon"] = razon
+        if hash_corto:
+            payload["hash_corto"] = hash_corto
+        if fase:
+            payload["fase"] = fase
+        logging.warning("Auditoria validador extra: %s", payload)
+
+    @staticmethod
+    def _cargar_validadores(ruta):
+        """Carga una lista de validadores desde un archivo Python."""
+        import ast
+
+        ruta_abs = os.path.abspath(ruta)
+        if not _ruta_import_permitida(ruta_abs):
+            InterpretadorCobra._registrar_auditoria_validador(
+                ruta_abs, "rechazado", "fuera_whitelist"
+            )
+            raise ImportError(f"Módulo fuera de la lista blanca: {ruta}")
+        ruta_real = os.path.realpath(ruta_abs)
+
+        try:
+            with open(ruta_real, "r", encoding="utf-8") as f:
+                source = f.read()
+        except FileNotFoundError as e:
+            InterpretadorCobra._registrar_auditoria_validador(
+                ruta_real, "rechazado", "archivo_no_encontrado"
+            )
+            raise FileNotFoundError(
+                f"No se encontró el archivo de validadores: {ruta}"
+            ) from e
+        hash_corto = hashlib.sha256(source.encode("utf-8")).hexdigest()[:12]
+
+        try:
+            tree = ast.parse(source, filename=ruta_real)
+        except SyntaxError as e:
+            InterpretadorCobra._registrar_auditoria_validador(
+                ruta_real,
+                "rechazado",
+                "sintaxis_invalida",
+                hash_corto=hash_corto,
+                fase="parse",
+            )
+            raise ImportError(
+                "El archivo de validadores tiene sintaxis inválida."
+            ) from e
+
+        magia_permitida = {"__name__"}
+        tokens_sensibles = {
+            "__subclasses__",
+            "__globals__",
+            "__dict__",
+            "__mro__",
+            "__bases__",
+            "__getattribute__",
+            "__setattr__",
+            "__delattr__",
+            "__code__",
+            "__closure__",
+            "__func__",
+            "__self__",
+        }
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                InterpretadorCobra._registrar_auditoria_validador(
+                    ruta_real,
+                    "rechazado",
+                    "import_no_permitido",
+                    hash_corto=hash_corto,
+                    fase="policy_check",
+                )
+                raise ImportError(
+                    "ImportError: no se permiten importaciones en validadores adicionales."
+                )
+            if isinstance(node, ast.Attribute):
+                if (
+                    node.attr.startswith("__")
+                    and node.attr.endswith("__")
+                    and node.attr not in magia_permitida
+                ):
+                    InterpretadorCobra._registrar_auditoria_validador(
+                        ruta_real,
+                        "rechazado",
+                        "atributo_magico_no_permitido",
+                        hash_corto=hash_corto,
+                        fase="policy_check",
+                    )
+                    raise ImportError(
+                        "ImportError: se detectó acceso a atributo mágico no permitido en el validador adicional."
+                    )
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                if any(token in node.value for token in tokens_sensibles):
+                    InterpretadorCobra._registrar_auditoria_validador(
+                        ruta_real,
+                        "rechazado",
+                        "cadena_introspeccion_sensible",
+                        hash_corto=hash_corto,
+                        fase="policy_check",
+                    )
+                    raise ImportError(
+                        "ImportError: se detectó un patrón de introspección no permitido en el validador adicional."
+                    )
+            if isinstance(node, ast.Call):
+                func = node.func
+                if isinstance(func, ast.Name) and func.id == "__import__":
+                    InterpretadorCobra._registrar_auditoria_validador(
+                        ruta_real,
+                        "rechazado",
+                        "dunder_import_bloqueado",
+                        hash_corto=hash_corto,
+                        fase="policy_check",
+                    )
+                    raise ImportError(
+                        "ImportError: el uso de __import__ está bloqueado en validadores adicionales."
+                    )
+                if isinstance(func, ast.Name) and func.id == "getattr":
+                    primer_arg = node.args[0] if node.args else None
+                    objetivo_sensible = isinstance(primer_arg, ast.Name) and primer_arg.id in {
+                        "__builtins__",
+                        "builtins",
+                        "object",
+                        "type",
+                    }
+                    atributo_sensible = (
+                        len(node.args) > 1
+                        and isinstance(node.args[1], ast.Constant)
+                        and isinstance(node.args[1].value, str)
+                        and any(token in node.args[1].value for token in tokens_sensibles)
+                    )
+                    if objetivo_sensible or atributo_sensible:
+                        InterpretadorCobra._registrar_auditoria_validador(
+                            ruta_real,
+                            "rechazado",
+                            "getattr_introspeccion_bloqueado",
+                            hash_corto=hash_corto,
+                            fase="policy_check",
+                        )
+                        raise ImportError(
+                            "ImportError: uso de introspección dinámica no permitido en el validador adicional."
+                        )
+
+        from .sandbox import cargar_simbolos_restrictedpython
+        from .semantic_validators.base import ValidadorBase
+
+        import builtins
+
+        rp_symbols, has_restricted_python = cargar_simbolos_restrictedpython()
+        if not has_restricted_python:
+            raise ImportError(
+                "Los validadores adicionales requieren RestrictedPython instalado "
+                "y compatible con la API de seguridad de Cobra."
+            )
+
+        rp_safe_builtins = rp_symbols["safe_builtins"]
+        safe_builtins = {
+            nombre: rp_safe_builtins[nombre]
+            for nombre in (
+                "len",
+                "range",
+                "__build_class__",
+                "Exception",
+                "object",
+            )
+            if nombre in rp_safe_builtins
+        }
+        safe_builtins.setdefault("len", builtins.len)
+        safe_builtins.setdefault("range", builtins.range)
+        safe_builtins.setdefault("__build_class__", builtins.__build_class__)
+        safe_builtins.setdefault("Exception", builtins.Exception)
+        safe_builtins.setdefault("object", builtins.object)
+
+        namespace = {
+            "__builtins__": safe_builtins,
+            "ValidadorBase": ValidadorBase,
+            "__name__": "validators",
+            "__metaclass__": builtins.type,
+            "_print_": rp_symbols["PrintCollector"],
+            "_getattr_": rp_symbols["default_guarded_getattr"],
+            "_getitem_": rp_symbols["default_guarded_getitem"],
+            "_iter_unpack_sequence_": rp_symbols["guarded_iter_unpack_sequence"],
+            "_unpack_sequence_": rp_symbols["guarded_unpack_sequence"],
+        }
+        compile_restricted = rp_symbols["compile_restricted"]
+        try:
+            byte_code = compile_restricted(source, ruta_abs, "exec")
+        except TimeoutError as e:
+            InterpretadorCobra._registrar_auditoria_validador(
+                ruta_real,
+                "rechazado",
+                "timeout",
+                hash_corto=hash_corto,
+                fase="compile",
+            )
+            raise ImportError(
+                "El validador adicional superó el tiempo permitido."
+            ) from e
+        except (MemoryError, OverflowError) as e:
+            InterpretadorCobra._registrar_auditoria_validador(
+                ruta_real,
+                "rechazado",
+                "memoria_excedida",
+                hash_corto=hash_corto,
+                fase="compile",
+            )
+            raise ImportError(
+                "El validador adicional excede los límites de memoria permitidos."
+            ) from e
+        try:
+            exec(byte_code, namespace)
+        except TimeoutError as e:
+            InterpretadorCobra._registrar_auditoria_validador(
+                ruta_real,
+                "rechazado",
+                "timeout",
+                hash_corto=hash_corto,
+                fase="exec",
+            )
+            raise ImportError(
+                "El validador adicional superó el tiempo permitido."
+            ) from e
+        except (MemoryError, OverflowError) as e:
+            InterpretadorCobra._registrar_auditoria_validador(
+                ruta_real,
+                "rechazado",
+                "memoria_excedida",
+                hash_corto=hash_corto,
+                fase="exec",
+            )
+            raise ImportError(
+                "El validador adicional excede los límites de memoria permitidos."
+            ) from e
+        except Exception as e:
+            InterpretadorCobra._registrar_auditoria_validador(
+                ruta_real,
+                "rechazado",
+                "error_en_ejecucion",
+                hash_corto=hash_corto,
+                fase="exec",
+            )
+            raise ImportError(
+                "No se pudo cargar el validador adicional de forma segura."
+            ) from e
+        InterpretadorCobra._registrar_auditoria_validador(
+            ruta_real,
+            "permitido",
+            hash_corto=hash_corto,
+            fase="exec",
+        )
+        return namespace.get("VALIDADORES_EXTRA", [])
+
+    def __init__(
+        self,
+        safe_mode: bool = True,
+        extra_validators=None,
+        main_file: Path | str | None = None,
+    ):
+        """Crea un nuevo interpretador.
+
+        Parameters
+        ----------
+        safe_mode: bool, optional
+            Indica si el intérprete debe ejecutarse en modo seguro. Está
+            activado por defecto y valida cada nodo utilizando la cadena
+            devuelta por :func:`construir_cadena`, restringiendo primitivas
+            como ``import`` o ``hilo``.
+        extra_validators: list | str, optional
+            Lista de instancias adicionales o ruta a un módulo que defina
+            ``VALIDADORES_EXTRA``.
+        main_file: Path | str, optional
+            Archivo principal conocido por CLI/runtime para resolver módulos de
+            proyecto con ``usar`` desde la raíz canonicalizada.
+        """
+        extra = extra_validators
+        if isinstance(extra, str):
+            extra = self._cargar_validadores(extra)
+
+        self.safe_mode = safe_mode
+        # Regla de fases: analysis = sin efectos, execution = con efectos.
+        # Por defecto iniciamos en ejecución para preservar compatibilidad fuera del REPL.
+        self.mode = "execution"
+        self._validador = (
+            construir_cadena(extra, emitir_side_effects=True) if safe_mode else None
+        )
+        # Analizador semántico persistente para mantener contexto entre ejecuciones
+        self.analizador = AnalizadorSemantico()
+        # Conjunto para evitar validar el mismo nodo varias veces
+        self._validados = set()
+        # Marcos por hilo de las tareas lanzadas con ``hilo``
+        self._marcos = threading.local()
+        self._planificador: PlanificadorHilos | None = None
+        # Pila de entornos para mantener variables locales en cada llamada
+        self.contextos = [Environment()]
+        # Mapa paralelo para gestionar bloques de memoria por contexto
+        self.mem_contextos = [{}]
+        # Gestor genético de estrategias de memoria
+        self.gestor_memoria = GestorMemoriaGenetico()
+        self.estrategia = self.gestor_memoria.poblacion[0]
+        self.op_memoria = 0
+        self._eval_stack = set()
+        self._call_depth = 0
+        # Funciones Cobra declaradas en el AST fuente. Se mantiene separada del
+        # entorno de variables para que los optimizadores puedan eliminar nodos
+        # ``NodoFuncion`` sin impedir que sus nombres sigan siendo resolubles
+        # como valores/callbacks en expresiones.
+        self._funciones_declaradas_valor: dict[str, dict[str, object]] = {}
+        # Último IR generado a partir del AST ejecutado
+        self.ultimo_ir: Optional[InternalIRModule] = None
+        # Restricción opcional para `usar` en REPL/evaluador incremental.
+        self._repl_usar_alias_map: dict[str, str] | None = None
+        self._usar_collision_policy = USAR_COLLISION_STRICT_ERROR
+        # Metadatos de símbolos inyectados por `usar` para soportar reimport idempotente.
+        # nombre_simbolo -> {"module": str, "exported_name": str, "callable_id": int}
+        self._usar_symbol_metadata: dict[str, dict[str, object]] = {}
+        self._main_file: Path | None = None
+        self._project_root: Path = Path.cwd().resolve()
+        self._contexto_proyecto_verificado = False
+        self.configurar_archivo_principal(main_file)
+        self._current_module_stack: list[Path] = []
+        self._usar_module_cache: dict[Path, dict[str, object]] = {}
+        self._usar_loading_stack: list[Path] = []
+        self._import_ast_cache: dict[Path, list[object]] = {}
+        self._import_execution_stack: list[Path] = []
+        self._imported_module_paths: set[Path] = set()
+        # Debe ejecutarse siempre después de crear _validador y _usar_symbol_metadata.
+        self.asegurar_estado_runtime_inicial()
+
+    def asegurar_estado_runtime_inicial(self) -> None:
+        """Garantiza estado mínimo de runtime para metadata de `usar`.
+
+        Este método es idempotente: solo crea contenedores cuando faltan o
+        cuando están en ``None``, sin reescribir diccionarios ya poblados.
+        """
+        self._normalizar_metadata_usar_en_inicializacion()
+
+    def _normalizar_metadata_usar_en_inicializacion(self) -> None:
+        """Normaliza contenedores mínimos de metadata para etapa='inicialización'.
+
+        Reglas:
+        - Si falta ``_usar_symbol_metadata`` o está en ``None``, crear ``{}``.
+        - Si falta ``_metadata_simbolos_usar`` en validador o está en ``None``,
+          crear ``{}``.
+        - Si ``_metadata_simbolos_usar`` existe y no es ``dict``, no corregir de
+          forma silenciosa aquí; la validación estricta en etapa='pre-auditoría'
+          debe fallar con ``invalid_container``.
+        """
+        if (not hasattr(self, "_usar_symbol_metadata")) or self._usar_symbol_metadata is None:
+            self._usar_symbol_metadata = {}
+
+        validador = getattr(self, "_validador", None)
+        if validador is not None:
+            if not hasattr(validador, "_metadata_simbolos_usar"):
+                validador._metadata_simbolos_usar = {}
+            elif validador._metadata_simbolos_usar is None:
+                validador._metadata_simbolos_usar = {}
+
+    def configurar_restriccion_usar_repl(self, alias_map: dict[str, str] | None) -> None:
+        """Configura whitelist explícita de módulos `usar` para flujo REPL.
+
+        Cuando ``alias_map`` es ``None``, no se aplica restricción adicional.
+        """
+        self._repl_usar_alias_map = alias_map.copy() if alias_map is not None else None
+
+    def configurar_politica_colision_usar(self, policy: str) -> None:
+        """Configura la política de colisión para ``usar`` en runtime."""
+        if policy not in _USAR_COLLISION_POLICIES:
+            raise ValueError(f"Política de colisión inválida: {policy}")
+        self._usar_collision_policy = policy
+
+    def in_execution(self) -> bool:
+        """Indica si el intérprete se encuentra en fase de ejecución."""
+        return self.mode == "execution"
+
+    def _set_mode(self, mode: str) -> str:
+        """Actualiza la fase del intérprete y retorna el modo previo."""
+        if mode not in {"analysis", "execution"}:
+            raise ValueError(f"Modo inválido: {mode}")
+        previo = self.mode
+        self.mode = mode
+        if self._validador is not None and hasattr(self._validador, "emitir_side_effects"):
+            self._validador.emitir_side_effects = mode == "execution"
+            if hasattr(self._validador, "mode"):
+                self._validador.mode = mode
+        return previo
+
+    @property
+    def variables(self):
+        """Devuelve el mapeo local del entorno activo (compatibilidad)."""
+        return self.contextos[-1].values
+
+    def reset_context_values(self, mapping: Mapping[str, object]) -> None:
+        """Reemplaza de forma controlada los valores del contexto activo.
+
+        Se copia explícitamente ``mapping`` para evitar aliasing accidental
+        de diccionarios externos y se valida cada entrada antes de aplicarla.
+        """
+        if not isinstance(mapping, Mapping):
+            raise TypeError("mapping debe implementar Mapping[str, object]")
+
+        nuevos_valores: dict[str, object] = {}
+        for clave, valor in mapping.items():
+            if not isinstance(clave, str):
+                raise TypeError("Las claves del contexto deben ser str")
+            self._verificar_valor_contexto(valor)
+            nuevos_valores[clave] = valor
+
+        contexto_activo = self.contextos[-1]
+        contexto_activo.values.clear()
+        contexto_activo.values.update(nuevos_valores)
+
+    def _indice_entorno_variable(self, nombre: str) -> int | None:
+        """Retorna el índice del primer entorno (de adentro hacia afuera) con ``nombre``."""
+        for indice in range(len(self.contextos) - 1, -1, -1):
+            if nombre in self.contextos[indice].values:
+                return indice
+        return None
+
+    def _liberar_memoria_variable_en_contexto(self, nombre: str, indice_contexto: int) -> None:
+        """Libera el bloque de memoria asociado a ``nombre`` en un contexto concreto."""
+        if indice_contexto < 0 or indice_contexto >= len(self.mem_contextos):
+            return
+        mem_ctx = self.mem_contextos[indice_contexto]
+        if nombre not in mem_ctx:
+            return
+        idx, tam = mem_ctx.pop(nombre)
+        self.liberar_memoria(idx, tam)
+
+    def obtener_variable(self, nombre, visitados=None):
+        """Busca una variable en la pila de contextos.
+
+        Evita seguir referencias encadenadas para prevenir bucles
+        innecesarios y devuelve el valor almacenado directamente.
+        """
+        return self._resolver_identificador(nombre, visitados)
+
+    def _asignacion_referencia_identificador(
+        self,
+        expresion,
+        nombre,
+        visitados_ids: set[int] | None = None,
+    ):
+        """Detecta si una expresión contiene una referencia al identificador."""
+        if visitados_ids is None:
+            visitados_ids = set()
+        if isinstance(expresion, NodoIdentificador):
+            return expresion.nombre == nombre
+        if isinstance(expresion, Token):
+            return False
+        if hasattr(expresion, "__dict__"):
+            expresion_id = id(expresion)
+            if expresion_id in visitados_ids:
+                return False
+            visitados_ids.add(expresion_id)
+        for valor in getattr(expresion, "__dict__", {}).values():
+            if isinstance(valor, list):
+                for elem in valor:
+                    if self._asignacion_referencia_identificador(
+                        elem,
+                        nombre,
+                        visitados_ids,
+                    ):
+                        return True
+            elif self._asignacion_referencia_identificador(
+                valor,
+                nombre,
+                visitados_ids,
+            ):
+                return True
+        return False
+
+    def _validar_asignacion_autorreferente(self, nombre, valor):
+        """Valida que una variable no apunte a una asignación autorreferente."""
+        if not isinstance(valor, NodoAsignacion):
+            return
+        expresion = getattr(valor, "expresion", getattr(valor, "valor", None))
+        if self._asignacion_referencia_identificador(expresion, nombre):
+            raise RuntimeError(f"Ciclo de variables detectado en '{nombre}'")
+
+    def _resolver_identificador(self, nombre, visitados=None):
+        """Resuelve un identificador usando el entorno léxico activo."""
+        visitados = set() if visitados is None else visitados
+        if nombre in visitados:
+            raise RuntimeError(f"Ciclo de variables detectado en '{nombre}'")
+        visitados.add(nombre)
+        try:
+            try:
+                valor = self.contextos[-1].get(nombre)
+            except NameError:
+                if nombre in self._funciones_declaradas_valor:
+                    return self._funciones_declaradas_valor[nombre]
+                raise
+            self._validar_asignacion_autorreferente(nombre, valor)
+            valor_resuelto = self._materializar_valor(
+                valor,
+                visitados,
+                origen="resolucion_variable",
+                nombre_variable=nombre,
+            )
+            if isinstance(valor_resuelto, NodoAST):
+                raise RuntimeError(
+                    "Resolución inválida de variable: "
+                    f"'{nombre}' quedó en nodo AST "
+                    f"({type(valor_resuelto).__name__})"
+                )
+            # Persistimos siempre el valor ya materializado para consolidar
+            # el contrato de contexto -> materialización.
+            self.contextos[-1].set(nombre, valor_resuelto)
+            return valor_resuelto
+        finally:
+            visitados.discard(nombre)
+
+    def _verificar_valor_contexto(self, valor):
+        """Valida que el contexto sólo guarde tipos simples o contenedores.
+
+        Se detectan referencias circulares utilizando una pila iterativa para
+        evitar recursión profunda.
+        """
+
+        permitidos = (int, float, bool, str, type(None))
+        contenedores = (dict, list, tuple, set)
+        if isinstance(valor, permitidos):
+            return
+        if not isinstance(valor, contenedores):
+            raise TypeError(
+                "Solo se permiten tipos primitivos o diccionarios en el contexto"
+            )
+
+        pila = [(valor, set())]
+        while pila:
+            actual, ancestros = pila.pop()
+            if id(actual) in ancestros:
+                raise RuntimeError("Referencia circular detectada en el contexto")
+            nuevos_ancestros = ancestros | {id(actual)}
+
+            if isinstance(actual, dict):
+                elementos = actual.values()
+            elif isinstance(actual, (list, tuple, set)):
+                elementos = actual
+            else:
+                continue
+
+            for elem in elementos:
+                if isinstance(elem, permitidos):
+                    continue
+                if isinstance(elem, contenedores):
+                    pila.append((elem, nuevos_ancestros))
+                else:
+                    continue
+
+    def _construir_funcion(self, nodo):
+        return {
+            "tipo": "funcion",
+            "nombre": nodo.nombre,
+            "parametros": list(nodo.parametros),
+            "cuerpo": list(nodo.cuerpo),
+            "scope_lexico": self.contextos[-1],
+        }
+
+    def _registrar_funciones_declaradas_como_valores(self, ast) -> None:
+        """Registra funciones top-level para resolución por identificador.
+
+        Las llamadas directas pueden sobrevivir gracias a la ruta de llamada o
+        al inlining, pero cuando una función aparece como expresión
+        (``f = doble`` o ``filtrar(xs, predicado)``), el identificador debe
+        poder resolverse incluso si ``inline_functions`` eliminó el
+        ``NodoFuncion`` original del AST ejecutable. Esta tabla actúa como
+        fallback de solo funciones; las variables/imports del entorno activo
+        mantienen prioridad.
+        """
+        if not isinstance(ast, list):
+            return
+        for nodo in ast:
+            if isinstance(nodo, NodoFuncion):
+                self._funciones_declaradas_valor[nodo.nombre] = (
+                    self._construir_funcion(nodo)
+                )
+
+    def _construir_clase(self, nodo, bases):
+        return {
+            "tipo": "clase",
+            "nombre": nodo.nombre,
+            "bases": bases,
+            "metodos": [self._construir_funcion(m) for m in nodo.metodos],
+        }
+
+    def _materializar_valor(
+        self,
+        valor,
+        visitados=None,
+        origen="general",
+        *,
+        nombre_variable=None,
+        operando=None,
+    ):
+        """Convierte nodos/valores a un valor inmediato y materializado.
+
+        Contrato:
+        - si el valor es resoluble, devuelve un valor utilizable por capas
+          superiores (primitivos, contenedores normalizados o entidades runtime);
+        - nunca debe permitir que se propague un ``NodoAST`` residual;
+        - en ``origen='resolucion_variable'`` preserva el flujo
+          ``contexto -> materialización -> persistencia`` para mantener el
+          contexto con valores ya materializados.
+        """
+        visitados = set() if visitados is None else visitados
+        primitivos = (int, float, bool, str, type(None), Environment)
+        contenedores = (list, tuple, dict, set)
+
+        def _normalizar_contenedor(contenedor):
+            if isinstance(contenedor, list):
+                return [
+                    self._materializar_valor(
+                        elem,
+                        visitados,
+                        origen,
+                        nombre_variable=nombre_variable,
+                        operando=operando,
+                    )
+                    for elem in contenedor
+                ]
+            if isinstance(contenedor, tuple):
+                return tuple(
+                    self._materializar_valor(
+                        elem,
+                        visitados,
+                        origen,
+                        nombre_variable=nombre_variable,
+                        operando=operando,
+                    )
+                    for elem in contenedor
+                )
+            if isinstance(contenedor, set):
+                return {
+                    self._materializar_valor(
+                        elem,
+                        visitados,
+                        origen,
+                        nombre_variable=nombre_variable,
+                        operando=operando,
+                    )
+                    for elem in contenedor
+                }
+            if isinstance(contenedor, dict):
+                return {
+                    clave: self._materializar_valor(
+                        elem,
+                        visitados,
+                        origen,
+                        nombre_variable=nombre_variable,
+                        operando=operando,
+                    )
+                    for clave, elem in contenedor.items()
+                }
+            return contenedor
+
+        actual = valor
+        guardia = 0
+        limite_guardia = 128
+
+        while True:
+            guardia += 1
+            if guardia > limite_guardia:
+                raise RuntimeError(
+                    "No se pudo materializar el valor: límite de normalización excedido"
+                )
+
+            if isinstance(actual, primitivos):
+                return actual
+
+            if isinstance(actual, NodoValor):
+                actual = actual.valor
+                continue
+
+            if isinstance(actual, Token) and actual.tipo in {
+                TipoToken.ENTERO,
+                TipoToken.FLOTANTE,
+                TipoToken.CADENA,
+                TipoToken.BOOLEANO,
+            }:
+                actual = actual.valor
+                continue
+
+            if isinstance(actual, dict) and (
+                actual.get("tipo") in {"funcion", "clase", "instancia"}
+                or "__clase__" in actual
+            ):
+                return actual
+
+            if isinstance(actual, contenedores):
+                actual = _normalizar_contenedor(actual)
+                self._verificar_valor_contexto(actual)
+                return actual
+
+            if origen == "resolucion_variable":
+                if isinstance(actual, NodoIdentificador):
+                    actual = self._resolver_identificador(actual.nombre, visitados)
+                    if isinstance(actual, NodoAST):
+                        nombre_ref = getattr(actual, "nombre", "<desconocido>")
+                        raise RuntimeError(
+                            "Resolución inválida de variable durante materialización: "
+                            f"variable '{nombre_variable or nombre_ref}', "
+                            f"operando '{operando or 'valor'}', "
+                            f"nodo {type(actual).__name__}"
+                        )
+                    continue
+                if isinstance(actual, NodoAST):
+                    raise RuntimeError(
+                        "No se pudo materializar un nodo AST durante la resolución "
+                        f"de variable '{nombre_variable or '<desconocida>'}' "
+                        f"(operando: '{operando or 'valor'}', "
+                        f"nodo: {type(actual).__name__})"
+                    )
+
+            elif origen == "operacion_binaria":
+                if isinstance(actual, NodoIdentificador):
+                    actual = self._resolver_identificador(actual.nombre, visitados)
+                if isinstance(actual, NodoAST):
+                    raise RuntimeError(
+                        "No se pudo materializar el operando de operación binaria: "
+                        f"nodo AST residual ({type(actual).__name__})"
+                    )
+                if actual is not valor:
+                    continue
+
+            else:
+                expresiones_soportadas = (
+                    NodoAsignacion,
+                    NodoIdentificador,
+                    NodoInstancia,
+                    NodoAtributo,
+                    NodoHolobit,
+                    NodoEsperar,
+                    NodoOperacionBinaria,
+                    NodoOperacionUnaria,
+                    NodoLlamadaMetodo,
+                    NodoLlamadaFuncion,
+                )
+                if isinstance(actual, expresiones_soportadas):
+                    actual = self.evaluar_expresion(actual, visitados)
+                    continue
+
+            if isinstance(actual, NodoAST):
+                raise RuntimeError(
+                    "No se pudo materializar el valor: "
+                    f"nodo AST no resoluble ({type(actual).__name__})"
+                )
+
+            return actual
+
+    # -- Gestión de memoria -------------------------------------------------
+    def solicitar_memoria(self, tam):
+        """Solicita un bloque a la estrategia actual."""
+        index = self.estrategia.asignar(tam)
+        if index == -1:
+            self.gestor_memoria.evolucionar(verbose=False)
+            self.estrategia = self.gestor_memoria.poblacion[0]
+            index = self.estrategia.asignar(tam)
+        self.op_memoria += 1
+        if self.op_memoria >= 1000:
+            self.gestor_memoria.evolucionar(verbose=False)
+            self.estrategia = self.gestor_memoria.poblacion[0]
+            self.op_memoria = 0
+        return index
+
+    def liberar_memoria(self, index, tam):
+        """Libera un bloque de memoria."""
+        self.estrategia.liberar(index, tam)
+
+    # -- Utilidades ---------------------------------------------------------
+    def _validar(self, nodo):
+        """Valida un nodo en fase de análisis si el modo seguro está activo."""
+        if self.mode != "analysis":
+            return
+        if self.safe_mode and id(nodo) not in self._validados:
+            nodo.aceptar(self._validador)
+            self._validados.add(id(nodo))
+
+    def _auditar_en_ejecucion(self, nodo) -> None:
+        """Ejecuta la auditoría funcional únicamente durante la fase de ejecución."""
+        if not self.in_execution() or not self.safe_mode or self._validador is None:
+            return
+        self._sincronizar_metadata_usar_no_destructiva()
+        validadores_registrables = []
+        cursor = self._validador
+        while cursor is not None:
+            if hasattr(cursor, "registrar_simbolo_publico_usar"):
+                validadores_registrables.append(cursor)
+            cursor = getattr(cursor, "siguiente", None)
+        self._asegurar_metadata_usar_sincronizada(etapa="pre-auditoría")
+        hash_interp = self._hash_estructural_metadata(self._usar_symbol_metadata)
+        hash_validador = self._hash_estructural_metadata(getattr(self._validador, "_metadata_simbolos_usar", {}))
+        if hash_interp != hash_validador:
+            raise PrimitivaPeligrosaError(
+                "Desincronización de metadata usar detectada antes de auditoría: "
+                f"hash intérprete='{hash_interp}' hash validador='{hash_validador}' "
+                "(codigo_interno='metadata_hash_mismatch', política='strict')."
+            )
+        for nombre, metadata in (self._usar_symbol_metadata or {}).items():
+            if not isinstance(metadata, dict):
+                continue
+            metadata = self._canonicalizar_metadata_usar(nombre, metadata)
+            self._usar_symbol_metadata[nombre] = dict(metadata)
+            modulo = metadata.get("module")
+            if isinstance(modulo, str):
+                for validador_registrable in validadores_registrables:
+                    validador_registrable.registrar_simbolo_publico_usar(nombre, modulo, metadata=dict(metadata))
+        # En ejecución permitimos side effects de auditoría visibles al usuario.
+        nodo.aceptar(self._validador)
+
+    def _validar_metadata_usar_o_fallar(self, nombre: str, metadata: object) -> None:
+        try:
+            metadata_normalizada = self._canonicalizar_metadata_usar(nombre, metadata)
+            validate_usar_symbol_metadata(nombre, metadata_normalizada)
+        except ValueError as exc:
+            # Preserva el motivo original para diagnóstico en REPL sin exponer internals sensibles.
+            raise PrimitivaPeligrosaError(
+                f"validation_reason='{exc}'"
+            ) from exc
+
+    def _canonicalizar_metadata_usar(
+        self,
+        nombre: str,
+        metadata: object,
+        *,
+        module_name: str | None = None,
+    ) -> dict[str, object]:
+        """Canonicaliza metadata de `usar` por la ruta única normalizar+validar."""
+        modulo = module_name if isinstance(module_name, str) else ""
+        if not modulo and isinstance(metadata, dict):
+            modulo_metadata = metadata.get("module")
+            if isinstance(modulo_metadata, str):
+                modulo = modulo_metadata
+        metadata_normalizada = normalizar_metadata_simbolo_usar(metadata, modulo, nombre)
+        metadata_validada = validate_usar_symbol_metadata(nombre, metadata_normalizada)
+        logging.debug(
+            "USAR_METADATA_PIPELINE route=legacy-normalized module=%s symbol=%s",
+            metadata_validada.get("module"),
+            nombre,
+        )
+        return metadata_validada
+
+    @staticmethod
+    def _metadata_usar_equivalente_idempotente(
+        previo: dict[str, object] | None,
+        actual: dict[str, object] | None,
+    ) -> bool:
+        if not isinstance(previo, dict) or not isinstance(actual, dict):
+            return False
+        claves_ignorar = {"callable_id"}
+        previo_cmp = {k: v for k, v in previo.items() if k not in claves_ignorar}
+        actual_cmp = {k: v for k, v in actual.items() if k not in claves_ignorar}
+        return previo_cmp == actual_cmp
+
+    @staticmethod
+    def _detalle_debug_metadata_usar(
+        *,
+        symbol: str | None = None,
+        expected_keys: set[str] | None = None,
+        received_keys: set[str] | None = None,
+    ) -> str:
+        if not _usar_detalle_habilitado():
+            return ""
+        payload = {
+            "symbol": symbol,
+            "expected_keys": sorted(expected_keys) if expected_keys is not None else None,
+            "received_keys": sorted(received_keys) if received_keys is not None else None,
+            "validator_type": "validate_usar_symbol_metadata",
+        }
+        return f" detalle_debug={payload}"
+
+    @staticmethod
+    def _hash_estructural_metadata(metadata: object) -> str:
+        """Calcula hash estable y acotado para metadata canónica de ``usar``.
+
+        La metadata esperada solo contiene escalares pequeños; aun así evitamos
+        serializar objetos arbitrarios con ``default=repr`` para no disparar
+        ``repr`` costosos de dependencias opcionales durante la auditoría.
+        """
+        if not isinstance(metadata, dict):
+            return f"tipo-invalido:{type(metadata).__name__}"
+
+        partes: list[str] = []
+        for nombre in sorted(str(clave) for clave in metadata):
+            valor = metadata.get(nombre)
+            if isinstance(valor, dict):
+                campos = []
+                for clave_meta in sorted(str(clave) for clave in valor):
+                    dato = valor.get(clave_meta)
+                    if isinstance(dato, (str, int, bool, type(None))):
+                        dato_seguro = dato
+                    else:
+                        dato_seguro = f"<{type(dato).__name__}>"
+                    campos.append(f"{clave_meta}={dato_seguro!r}")
+                partes.append(f"{nombre}:" + ";".join(campos))
+            else:
+                partes.append(f"{nombre}=<{type(valor).__name__}>")
+        digest = hashlib.sha256()
+        for parte in partes:
+            digest.update(parte.encode("utf-8", errors="replace"))
+            digest.update(b"\n")
+        return digest.hexdigest()
+
+    def _sincronizar_metadata_usar_no_destructiva(self) -> None:
+        """Sincroniza metadata de `usar` sin borrar contenedores existentes.
+
+        Estrategia:
+        - No recrear/limpiar diccionarios durante ciclos por sentencia.
+        - En ejecución, aplicar *merge* no destructivo símbolo a símbolo.
+        - Insertar símbolos faltantes del intérprete en el validador.
+        - Actualizar un símbolo únicamente si pertenece al mismo módulo
+          y cambió su payload.
+        """
+        if not self.safe_mode or self._validador is None:
+            return
+        self.asegurar_estado_runtime_inicial()
+        metadata_validador = getattr(self._validador, "_metadata_simbolos_usar", None)
+        if not isinstance(metadata_validador, dict):
+            return
+        if not isinstance(self._usar_symbol_metadata, dict):
+            return
+
+        # Eliminar del validador los símbolos que ya no están en el intérprete.
+        claves_a_eliminar = [nombre for nombre in metadata_validador if nombre not in self._usar_symbol_metadata]
+        for nombre in claves_a_eliminar:
+            del metadata_validador[nombre]
+
+        for nombre, metadata_interp in self._usar_symbol_metadata.items():
+            if not isinstance(metadata_interp, dict):
+                continue
+            metadata_interp = self._canonicalizar_metadata_usar(nombre, metadata_interp)
+            self._usar_symbol_metadata[nombre] = dict(metadata_interp)
+            metadata_val_actual = metadata_validador.get(nombre)
+            if metadata_val_actual is None:
+                metadata_validador[nombre] = dict(metadata_interp)
+                continue
+            if not isinstance(metadata_val_actual, dict):
+                continue
+            metadata_val_actual = self._canonicalizar_metadata_usar(nombre, metadata_val_actual)
+            mismo_modulo = metadata_val_actual.get("module") == metadata_interp.get("module")
+            payload_cambio = metadata_val_actual != metadata_interp
+            if mismo_modulo and payload_cambio:
+                metadata_validador[nombre] = dict(metadata_interp)
+
+    def _asegurar_metadata_usar_sincronizada(self, *, etapa: str | None = None) -> None:
+        """Valida sincronización estricta para etapa='pre-auditoría'.
+
+        Contrato en pre-auditoría:
+        - Debe ejecutarse antes de auditar nodos en ejecución.
+        - No muta estructura ni normaliza payload; solo valida.
+        - Política fail-closed: cualquier contenedor inválido dispara
+          ``invalid_container`` y aborta la ejecución segura.
+        """
+        if not self.safe_mode or self._validador is None:
+            return
+        if etapa == "pre-auditoría":
+            self._normalizar_metadata_usar_pre_auditoria()
+        self._validar_metadata_usar_en_ejecucion(etapa=etapa)
+
+    def _normalizar_metadata_usar_pre_auditoria(self) -> None:
+        """Normaliza metadata `usar` de intérprete/validador antes de pre-auditoría."""
+        self.asegurar_estado_runtime_inicial()
+        metadata_validador = getattr(self._validador, "_metadata_simbolos_usar", None)
+        if isinstance(self._usar_symbol_metadata, dict):
+            for nombre, metadata in list(self._usar_symbol_metadata.items()):
+                self._usar_symbol_metadata[nombre] = self._canonicalizar_metadata_usar(nombre, metadata)
+        if isinstance(metadata_validador, dict):
+            for nombre, metadata in list(metadata_validador.items()):
+                metadata_validador[nombre] = self._canonicalizar_metadata_usar(nombre, metadata)
+
+    def _validar_metadata_usar_en_ejecucion(self, *, etapa: str | None = None) -> None:
+        """Valida metadata de `usar` en etapa='pre-auditoría' de forma estricta.
+
+        Nota de contrato:
+        - En esta fase no se realizan coerciones ni normalizaciones de contenedor.
+        - Solo se acepta ``dict`` como contenedor de ``_metadata_simbolos_usar``.
+        - La validación por símbolo se delega en ``validate_usar_symbol_metadata``.
+        """
+        self.asegurar_estado_runtime_inicial()
+        metadata_validador = getattr(self._validador, "_metadata_simbolos_usar", None)
+        detalle_etapa = f" etapa='{etapa}'" if etapa else ""
+        if not isinstance(self._usar_symbol_metadata, dict):
+            tipo_recibido = type(self._usar_symbol_metadata).__name__
+            raise PrimitivaPeligrosaError(
+                "Metadata de intérprete inválida para símbolos usar: "
+                f"tipo inválido en _usar_symbol_metadata (tipo='{tipo_recibido}', codigo_interno='invalid_container', troubleshooting='container_metadata_debe_ser_dict')."
+                f"{self._detalle_debug_metadata_usar(received_keys=set())}{detalle_etapa}"
+            )
+        if not isinstance(metadata_validador, dict):
+            tipo_recibido = type(metadata_validador).__name__
+            raise PrimitivaPeligrosaError(
+                "Metadata de validador inválida para símbolos usar: "
+                f"tipo inválido en _metadata_simbolos_usar (tipo='{tipo_recibido}', codigo_interno='invalid_container', troubleshooting='container_metadata_debe_ser_dict')."
+                f"{self._detalle_debug_metadata_usar(received_keys=set())}{detalle_etapa}"
+            )
+        claves_interp = set(self._usar_symbol_metadata.keys())
+        claves_validador = set(metadata_validador.keys())
+        if claves_validador != claves_interp:
+            faltantes_en_validador = sorted(claves_interp - claves_validador)
+            extras_en_validador = sorted(claves_validador - claves_interp)
+            raise PrimitivaPeligrosaError(
+                "Divergencia de metadata usar entre intérprete y validador"
+                f": claves divergentes (faltantes_en_validador={faltantes_en_validador}, "
+                f"extras_en_validador={extras_en_validador}, codigo_interno='missing_keys', troubleshooting='claves_de_metadata_desincronizadas')."
+                f"{self._detalle_debug_metadata_usar(expected_keys=claves_interp, received_keys=claves_validador)}{detalle_etapa}"
+            )
+        # Fail-closed: no conversiones implícitas de payloads en pre-auditoría.
+        for nombre, metadata_interp in self._usar_symbol_metadata.items():
+            try:
+                metadata_interp_canonica = self._canonicalizar_metadata_usar(nombre, metadata_interp)
+                self._usar_symbol_metadata[nombre] = dict(metadata_interp_canonica)
+            except PrimitivaPeligrosaError as exc:
+                raise PrimitivaPeligrosaError(
+                    "Metadata de validador inválida para símbolos usar: "
+                    f"metadata de intérprete inválida para símbolo '{nombre}' "
+                    f"(clave_esperada='module|kind|public_api|sanitized', tipo='{type(metadata_interp).__name__}', codigo_interno='invalid_symbol_metadata', troubleshooting='metadata_interprete_no_cumple_contrato', detalle={exc})."
+                    f"{self._detalle_debug_metadata_usar(symbol=nombre)}{detalle_etapa}"
+                ) from exc
+            metadata_val = metadata_validador.get(nombre)
+            try:
+                metadata_val_canonica = self._canonicalizar_metadata_usar(nombre, metadata_val)
+                metadata_validador[nombre] = dict(metadata_val_canonica)
+            except PrimitivaPeligrosaError as exc:
+                tipo_recibido = type(metadata_val).__name__
+                raise PrimitivaPeligrosaError(
+                    "Metadata de validador inválida para símbolos usar: "
+                    f"metadata por símbolo inválida para '{nombre}' "
+                    f"(clave_esperada='module|kind|public_api|sanitized', tipo='{tipo_recibido}', codigo_interno='invalid_symbol_metadata', troubleshooting='metadata_validador_no_cumple_contrato', detalle={exc})."
+                    f"{self._detalle_debug_metadata_usar(symbol=nombre)}{detalle_etapa}"
+                ) from exc
+            if metadata_interp_canonica != metadata_val_canonica:
+                raise PrimitivaPeligrosaError(
+                    "Divergencia de metadata usar entre intérprete y validador"
+                    f": metadata por símbolo no coincide (símbolo='{nombre}', clave_esperada='module|kind|public_api|sanitized', tipo='{type(metadata_val).__name__}', codigo_interno='mismatch_payload', troubleshooting='payload_de_metadata_difiere')."
+                    f"{self._detalle_debug_metadata_usar(symbol=nombre, expected_keys=set(metadata_interp_canonica.keys()), received_keys=set(metadata_val_canonica.keys()))}{detalle_etapa}"
+                )
+
+    def _contiene_yield(self, nodo, visitados_ids: set[int] | None = None):
+        if visitados_ids is None:
+            visitados_ids = set()
+        if isinstance(nodo, NodoYield):
+            return True
+        if isinstance(nodo, Token):
+            return False
+        if not hasattr(nodo, "__dict__"):
+            return False
+
+        nodo_id = id(nodo)
+        if nodo_id in visitados_ids:
+            return False
+        visitados_ids.add(nodo_id)
+
+        for valor in getattr(nodo, "__dict__", {}).values():
+            if isinstance(valor, list):
+                for elem in valor:
+                    if hasattr(elem, "__dict__") and self._contiene_yield(
+                        elem, visitados_ids
+                    ):
+                        return True
+            elif hasattr(valor, "__dict__") and self._contiene_yield(
+                valor, visitados_ids
+            ):
+                return True
+        return False
+
+    @staticmethod
+    def _contar_nodos(ast):
+        total = 0
+        pila = list(ast)
+        visitados = set()
+        while pila:
+            nodo = pila.pop()
+            if id(nodo) in visitados:
+                continue
+            visitados.add(id(nodo))
+            total += 1
+            for val in getattr(nodo, "__dict__", {}).values():
+                if isinstance(val, list):
+                    for elem in val:
+                        if hasattr(elem, "__dict__"):
+                            pila.append(elem)
+                elif hasattr(val, "__dict__"):
+                    pila.append(val)
+        return total
+
+    @staticmethod
+    def _asegurar_ast_tipado(ast, fase: str) -> None:
+        """Garantiza el contrato mínimo del AST en una fase concreta."""
+        try:
+            validar_ast_estructural(ast)
+        except ErrorEstructuraAST as exc:
+            raise RuntimeError(f"Estructura AST inválida en fase '{fase}': {exc}") from exc
+
+    def _asegurar_no_autorreferencia_asignacion(
+        self, nombre, valor_nodo, visitados
+    ) -> None:
+        """Rechaza ciclos reales entre bindings sin bloquear lecturas válidas del valor previo.
+
+        Importante: expresiones como ``x = x + 1`` son semánticamente válidas y
+        deben poder leer el valor previo de ``x``. Solo se rechazan ciclos
+        indirectos al intentar resolver otros identificadores que acaben
+        volviendo al binding en actualización.
+        """
+        if not isinstance(nombre, str):
+            return
+        if nombre in visitados:
+            raise RuntimeError(f"Ciclo de variables detectado en '{nombre}'")
+
+        visitados.add(nombre)
+        try:
+            pila = [valor_nodo]
+            while pila:
+                actual = pila.pop()
+                if isinstance(actual, NodoIdentificador):
+                    if actual.nombre == nombre:
+                        # Permite patrones válidos como ``x = x + 1`` usando el
+                        # valor previamente materializado en el entorno actual.
+                        continue
+                    self._resolver_identificador(actual.nombre, visitados)
+                    continue
+                if isinstance(actual, Token):
+                    continue
+                if isinstance(actual, list):
+                    pila.extend(actual)
+                    continue
+                if isinstance(actual, NodoAST):
+                    pila.extend(getattr(actual, "__dict__", {}).values())
+        finally:
+            visitados.discard(nombre)
+
+    @staticmethod
+    def _debug_resumen_ast_habilitado() -> bool:
+        """Activa una salida resumida del AST cuando el repr es grande."""
+        return os.getenv("PCOBRA_DEBUG_AST_RESUMEN", "").strip().lower() in {
+            "1",
+            "true",
+            "yes",
+            "on",
+        }
+
+    @staticmethod
+    def _resumir_ast(ast, max_chars: int = 2000) -> str:
+        """Devuelve un resumen seguro del AST sin renderizar subnodos."""
+        if not isinstance(ast, list):
+            return f"ast_tipo={type(ast).__name__}"
+
+        tipos_raiz = [type(nodo).__name__ for nodo in ast[:10]]
+        restante = max(0, len(ast) - len(tipos_raiz))
+        resumen = (
+            f"ast_len={len(ast)} "
+            f"total_nodos={InterpretadorCobra._contar_nodos(ast)} "
+            f"tipos_raiz={tipos_raiz}"
+        )
+        if restante:
+            resumen += f" (+{restante} tipos raíz más)"
+        if len(resumen) <= max_chars:
+            return resumen
+        truncado = max_chars - len("... <resumen recortado>")
+        return f"{resumen[:max(0, truncado)]}... <resumen recortado>"
+
+    def _repr_corto(self, valor, max_chars: int = 160) -> str:
+        """Devuelve un ``repr`` compacto para mensajes de error."""
+        try:
+            texto = repr(valor)
+        except RecursionError:
+            return (
+                f"<repr_recursivo tipo={type(valor).__name__} "
+                f"id={id(valor)}>"
+            )
+        if len(texto) <= max_chars:
+            return texto
+        restante = len(texto) - max_chars
+        return f"{texto[:max_chars]}... <recortado {restante} caracteres>"
+
+    def _asegurar_resultado_no_ast(
+        self,
+        resultado,
+        *,
+        nodo_origen,
+        operador=None,
+    ):
+        """Garantiza que un resultado evaluado no propague nodos AST.
+
+        Contrato explícito: las salidas de ``evaluar_expresion`` deben ser
+        valores materializados y nunca instancias de ``NodoAST``.
+        """
+        if isinstance(resultado, NodoAST):
+            operador_txt = operador if operador is not None else "<sin_operador>"
+            raise RuntimeError(
+                "Resultado no materializado en evaluar_expresion: "
+                f"operador='{operador_txt}', "
+                f"nodo_origen={type(nodo_origen).__name__}, "
+                f"resultado_tipo={type(resultado).__name__}, "
+                f"resultado_id={id(resultado)}"
+            )
+        return resultado
+
+    def _asegurar_ast_aciclico_por_identidad(self, ast, fase: str) -> None:
+        """Verifica que el AST no tenga ciclos por identidad de objetos."""
+
+        visitados_globales: set[int] = set()
+        en_ruta: set[int] = set()
+        pila: list[tuple[object, bool]] = [(ast, False)]
+
+        while pila:
+            actual, salir = pila.pop()
+            if not isinstance(actual, (NodoAST, NodoBloque, list)):
+                continue
+
+            actual_id = id(actual)
+            if salir:
+                en_ruta.discard(actual_id)
+                visitados_globales.add(actual_id)
+                continue
+
+            if actual_id in visitados_globales:
+                continue
+            if actual_id in en_ruta:
+                raise RuntimeError(
+                    f"Se detectó un ciclo en el AST durante '{fase}' "
+                    f"(node_id={actual_id})"
+                )
+
+            en_ruta.add(actual_id)
+            pila.append((actual, True))
+
+            if isinstance(actual, list):
+                hijos = reversed(actual)
+            else:
+                hijos = reversed(list(getattr(actual, "__dict__", {}).values()))
+
+            for hijo in hijos:
+                if not isinstance(hijo, (NodoAST, NodoBloque, list)):
+                    continue
+                hijo_id = id(hijo)
+                if hijo_id in en_ruta:
+                    raise RuntimeError(
+                        f"Se detectó un ciclo en el AST durante '{fase}' "
+                        f"(node_id={hijo_id})"
+                    )
+                if hijo_id not in visitados_globales:
+                    pila.append((hijo, False))
+
+    def ejecutar_ast(self, ast):
+        # Pipeline explícito:
+        # 1) parseo/entrada tipada válida
+        # 2) análisis semántico
+        # 3) evaluación de AST validado
+        self._validados.clear()
+        self._asegurar_ast_tipado(ast, "parseo")
+        total = self._contar_nodos(ast)
+        max_nodos = max(limite_nodos(), len(ast) + 1)
+        if total > max_nodos:
+            raise RuntimeError(f"El AST excede el límite de {max_nodos} nodos")
+
+        self._asegurar_ast_tipado(ast, "pre_optimizacion")
+        self._asegurar_ast_aciclico_por_identidad(ast, "pre_optimizacion")
+        self._registrar_funciones_declaradas_como_valores(ast)
+        self._trace_debug("[AST BEFORE OPT]")
+        self._trace_debug(self._resumir_ast(ast))
+        if self._debug_resumen_ast_habilitado():
+            self._trace_debug("[AST BEFORE OPT][SUMMARY]")
+            self._trace_debug(self._resumir_ast(ast))
+
+        ast = optimize_constants(ast)
+        ast = self._aplanar_ast_top_level(ast)
+        self._asegurar_ast_aciclico_por_identidad(ast, "post_optimize_constants")
+        ast = eliminate_common_subexpressions(ast)
+        ast = self._aplanar_ast_top_level(ast)
+        self._asegurar_ast_aciclico_por_identidad(
+            ast, "post_eliminate_common_subexpressions"
+        )
+        ast = inline_functions(ast)
+        ast = self._aplanar_ast_top_level(ast)
+        self._asegurar_ast_aciclico_por_identidad(ast, "post_inline_functions")
+        ast = remove_dead_code(ast)
+        ast = self._aplanar_ast_top_level(ast)
+        self._asegurar_ast_aciclico_por_identidad(ast, "post_remove_dead_code")
+
+        self._trace_debug("[AST AFTER OPT]")
+        self._trace_debug(self._resumir_ast(ast))
+        if self._debug_resumen_ast_habilitado():
+            self._trace_debug("[AST AFTER OPT][SUMMARY]")
+            self._trace_debug(self._resumir_ast(ast))
+        self._asegurar_ast_tipado(ast, "post_optimizacion")
+        self.ultimo_ir = None
+        ultimo_resultado = None
+        self._trace_debug("[RUN] antes de iterar AST")
+        for index, nodo in enumerate(ast):
+            self._trace_debug(
+                f"[RUN] index={index} node_type={type(nodo).__name__} node_id={id(nodo)}"
+            )
+            modo_prev = self._set_mode("analysis")
+            try:
+                self._validar(nodo)
+                self._set_mode("execution")
+                self._trace_debug("[RUN] antes de ejecutar_nodo")
+                resultado = self.ejecutar_nodo(nodo)
+                if resultado is not None:
+                    ultimo_resultado = resultado
+            finally:
+                self._set_mode(modo_prev)
+        return ultimo_resultado
+
+    @staticmethod
+    def _aplanar_ast_top_level(ast):
+        """Normaliza optimizadores que devuelven listas de sentencias en top-level."""
+        if not isinstance(ast, list):
+            return ast
+        resultado = []
+        for nodo in ast:
+            if isinstance(nodo, list):
+                resultado.extend(nodo)
+            else:
+                resultado.append(nodo)
+        return resultado
+
+    # -- Generación de IR ----------------------------------------------------
+    def generar_internal_ir(self, ast) -> InternalIRModule:
+        """Convierte un AST de Cobra en un módulo IR interno."""
+
+        return build_internal_ir(ast)
+
+    def configurar_archivo_principal(self, main_file: Path | str | None) -> None:
+        """Configura el archivo principal y recalcula la raíz canonicalizada.
+
+        La raíz autorizada de ``usar`` pertenece siempre al programa principal:
+        ``current_file`` y la pila de módulos sólo aportan contexto de carga y
+        detección de ciclos, pero no pueden ampliar ni desplazar ``_project_root``
+        hacia un módulo anidado con su propio ``cobra.toml``.
+        """
+
+        self._main_file = (
+            Path(main_file).expanduser().resolve(strict=False)
+            if main_file is not None
+            else None
+        )
+        self._project_root = descubrir_raiz_proyecto(self._main_file, self._main_file)
+        self._contexto_proyecto_verificado = self._main_file is not None
+
+    def ejecutar_nodo(self, nodo):
+        self._trace_debug(f"[EXEC] node_type={type(nodo).__name__} node_id={id(nodo)}")
+        # Contrato de control de flujo:
+        # - Las declaraciones (`var`/`variable`) no emiten señal de corte.
+        # - Solo nodos de control (retorno/romper/continuar/errores) interrumpen bloques.
+        if self.mode == "analysis":
+            # En análisis no se ejecutan nodos: evita prints, mutaciones y efectos observables.
+            return None
+
+        if isinstance(nodo, NodoUsar):
+            # Para NodoUsar, ejecutamos primero para poblar _usar_symbol_metadata
+            # antes de la auditoría.
+            result = self.ejecutar_usar(nodo)
+            self._auditar_en_ejecucion(nodo)  # Auditar después de la ejecución para NodoUsar
+            return result
+        
+        # Para el resto de los nodos, auditar antes de la ejecución
+        self._auditar_en_ejecucion(nodo)
+        
+        if isinstance(nodo, NodoAsignacion):
+            return self.ejecutar_asignacion(nodo)
+        elif isinstance(nodo, NodoCondicional):
+            return self.ejecutar_condicional(nodo)
+        elif isinstance(nodo, NodoBucleMientras):
+            return self.ejecutar_mientras(nodo)
+        elif isinstance(nodo, NodoPara):
+            return self.ejecutar_para(nodo)
+        elif isinstance(nodo, NodoClase):
+            self.ejecutar_clase(nodo)
+        elif isinstance(nodo, NodoInstancia):
+            return self.ejecutar_instancia(nodo)
+        elif isinstance(nodo, NodoFuncion):
+            self.ejecutar_funcion(nodo)
+        elif isinstance(nodo, NodoLlamadaFuncion):
+            return self.ejecutar_llamada_funcion(nodo)
+        elif isinstance(nodo, NodoLlamadaMetodo):
+            return self.ejecutar_llamada_metodo(nodo)
+        elif isinstance(nodo, NodoImprimir):
+            # Contrato: está prohibido serializar nodos completos (str/repr/f-string)
+            # antes de evaluar; en debug solo usar type(nodo).__name__ e id(nodo).
+            expresion = nodo.expresion
+            valor = self.evaluar_expresion(expresion)
+            valor = self._materializar_valor(valor)
+            valor = self._asegurar_resultado_no_ast(
+                valor,
+                nodo_origen=expresion,
+                operador="imprimir",
+            )
+            if self.in_execution():
+                if isinstance(valor, bool):
+                    print("verdadero" if valor else "falso")
+                else:
+                    print(valor)
+        elif isinstance(nodo, NodoImport):
+            return self.ejecutar_import(nodo)
+        elif isinstance(nodo, NodoUsar):
+            return self.ejecutar_usar(nodo)
+        elif isinstance(nodo, NodoTryCatch):
+            return self.ejecutar_try_catch(nodo)
+        elif isinstance(nodo, NodoThrow):
+            raise ExcepcionCobra(self.evaluar_expresion(nodo.expresion))
+        elif isinstance(nodo, NodoAssert):
+            condicion = self.evaluar_expresion(nodo.condicion)
+            if not condicion:
+                mensaje = (
+                    self.evaluar_expresion(nodo.mensaje)
+                    if nodo.mensaje
+                    else "Assertion failed"
+                )
+                raise AssertionError(mensaje)
+        elif isinstance(nodo, NodoDel):
+            if not isinstance(nodo.objetivo, NodoIdentificador):
+                raise TypeError(
+                    "del requiere un identificador como objetivo, "
+                    f"se recibió: {type(nodo.objetivo).__name__}"
+                )
+            nombre = nodo.objetivo.nombre
+            indice_contexto = self._indice_entorno_variable(nombre)
+            self.contextos[-1].delete(nombre)
+            if indice_contexto is not None:
+                self._liberar_memoria_variable_en_contexto(nombre, indice_contexto)
+        elif isinstance(nodo, NodoGlobal):
+            pass  # sin efecto en este intérprete simplificado
+        elif isinstance(nodo, NodoNoLocal):
+            pass
+        elif isinstance(nodo, NodoWith):
+            self.evaluar_expresion(nodo.contexto)
+            self.contextos.append(Environment(parent=self.contextos[-1]))
+            self.mem_contextos.append({})
+            try:
+                for instr in nodo.cuerpo:
+                    self.ejecutar_nodo(instr)
+            finally:
+                memoria_local = self.mem_contextos.pop()
+                for idx, tam in memoria_local.values():
+                    self.liberar_memoria(idx, tam)
+                self.contextos.pop()
+        elif isinstance(nodo, NodoImportDesde):
+            return self.ejecutar_import(NodoImport(nodo.modulo))
+        elif isinstance(nodo, NodoHolobit):
+            return self.ejecutar_holobit(nodo)
+        elif isinstance(nodo, NodoHilo):
+            return self.ejecutar_hilo(nodo)
+        elif isinstance(nodo, NodoRetorno):
+            if self._call_depth == 0:
+                raise RuntimeError("retorno fuera de función")
+            raise _ControlRetorno(self.evaluar_expresion(nodo.expresion))
+        elif isinstance(nodo, NodoRomper):
+            raise _ControlRomper
+        elif isinstance(nodo, NodoContinuar):
+            raise _ControlContinuar
+        elif isinstance(nodo, NodoEsperar):
+            return self.evaluar_expresion(nodo.expresion)
+        elif isinstance(nodo, NodoValor):
+            return nodo.valor  # Retorna el valor directo de NodoValor
+        else:
+            raise ValueError(f"Nodo no soportado: {type(nodo)}")
+
+    def ejecutar_asignacion(self, nodo, visitados=None):
+        """Evalúa una asignación de variable o atributo."""
+        # Contrato: una declaración (`var`/`variable`) solo muta contexto y nunca
+        # devuelve señal de control para cortar un bloque.
+        visitados = set() if visitados is None else visitados
+        nombre = getattr(nodo, "identificador", getattr(nodo, "variable", None))
+        valor_nodo = getattr(nodo, "expresion", getattr(nodo, "valor", None))
+        # Evita llamadas recursivas directas con el mismo nodo
+        if valor_nodo is nodo:
+            raise ValueError("Asignación no puede evaluarse a sí misma")
+        self._asegurar_no_autorreferencia_asignacion(nombre, valor_nodo, visitados)
+        valor = self.evaluar_expresion(valor_nodo, visitados)
+        valor = self._materializar_valor(valor, visitados)
+        self._verificar_valor_contexto(valor)
+        if isinstance(nombre, NodoAtributo):
+            objeto = self.evaluar_expresion(nombre.objeto, visitados)
+            if objeto is None:
+                raise ValueError("Objeto no definido para asignación de atributo")
+            atributos = objeto.setdefault("__atributos__", {})
+            self._verificar_valor_contexto(valor)
+            atributos[nombre.nombre] = valor
+        else:
+            if getattr(nodo, "inferencia", False) or getattr(nodo, "declaracion", False):
+                # Declaración local (explícita o por inferencia)
+                indice_contexto = len(self.mem_contextos) - 1
+                self._liberar_memoria_variable_en_contexto(nombre, indice_contexto)
+                indice = self.solicitar_memoria(1)
+                self.mem_contextos[indice_contexto][nombre] = (indice, 1)
+                self.contextos[-1].define(nombre, valor)
+                # Contrato explícito: toda declaración muta estado local y
+                # devuelve ``None`` (nunca señal de control).
+                return None
+            else:
+                indice_contexto = self._indice_entorno_variable(nombre)
+                if indice_contexto is None:
+                    if self._call_depth == 0:
+                        raise NameError(f"Variable no declarada: {nombre}")
+                    # Una asignación simple dentro de una función introduce un
+                    # nombre local cuando no existe en su cadena léxica. Este
+                    # contexto permanece activo durante todo el cuerpo.
+                    indice_contexto = len(self.mem_contextos) - 1
+                    indice = self.solicitar_memoria(1)
+                    self.mem_contextos[indice_contexto][nombre] = (indice, 1)
+                    self.contextos[-1].define(nombre, valor)
+                else:
+                    # Mutación sobre una variable existente: ``set`` solo
+                    # actualiza en el scope donde ya está declarada.
+                    self._liberar_memoria_variable_en_contexto(nombre, indice_contexto)
+                    indice = self.solicitar_memoria(1)
+                    self.mem_contextos[indice_contexto][nombre] = (indice, 1)
+                    self.contextos[-1].set(nombre, valor)
+        # Igual que una declaración, una reasignación solo muta estado y nunca
+        # debe propagarse como señal de control dentro de bloques/bucles.
+        return None
+
+    def evaluar_expresion(self, expresion, visitados=None):
+        """Resuelve el valor de una expresión de forma recursiva.
+
+        El parámetro ``visitados`` se utiliza internamente para propagar el
+        seguimiento de variables visitadas y detectar referencias circulares
+        durante la evaluación.
+
+        Contrato explícito de errores del evaluador:
+        - identificador ausente -> ``NameError('Variable no declarada: ...')``
+        - ciclo de referencias -> ``RuntimeError`` con mensaje de ciclo
+        - para comparaciones, ambos operandos se evalúan/materializan por
+          completo antes de aplicar el operador;
+        - nunca debe propagarse un ``NodoAST`` hacia capas superiores:
+          cualquier rama crítica debe devolver un valor materializado.
+        """
+        visitados = set() if visitados is None else visitados
+        expresion_id = id(expresion)
+        self._trace_debug(f"[EVAL] tipo={type(expresion).__name__} id={expresion_id}")
+        expresion_key = (expresion_id, self._call_depth)
+        if expresion_key in self._eval_stack:
+            self._trace_debug(
+                f"[RECURSION DETECTED] tipo={type(expresion).__name__} id={expresion_id}"
+            )
+            raise Exception("Recursive evaluation detected")
+        self._eval_stack.add(expresion_key)
+        try:
+            def _retorno_critico(resultado, *, operador=None):
+                return self._asegurar_resultado_no_ast(
+                    resultado,
+                    nodo_origen=expresion,
+                    operador=operador,
+                )
+
+            if isinstance(expresion, NodoValor):
+                return expresion.valor  # Obtiene el valor directo si es un NodoValor
+            elif isinstance(expresion, Token) and expresion.tipo in {
+                TipoToken.ENTERO,
+                TipoToken.FLOTANTE,
+                TipoToken.CADENA,
+                TipoToken.BOOLEANO,
+            }:
+                return expresion.valor  # Si es un token de tipo literal, devuelve su valor
+            elif isinstance(expresion, NodoAsignacion):
+                # Resuelve asignaciones anidadas y devuelve su valor
+                return self.ejecutar_asignacion(expresion, visitados)
+            elif isinstance(expresion, NodoIdentificador):
+                self._trace_debug(f"[ID] resolving {expresion.nombre}")
+                valor = self._resolver_identificador(expresion.nombre, visitados)
+
+                if valor is None:
+                    raise RuntimeError(
+                        f"Error semántico: identificador no definido '{expresion.nombre}'"
+                    )
+
+                if isinstance(valor, NodoValor):
+                    valor = valor.valor
+
+                if isinstance(valor, NodoAST):
+                    raise RuntimeError(
+                        "Error semántico: identificador "
+                        f"'{expresion.nombre}' resolvió a un nodo AST "
+                        f"({type(valor).__name__}) en lugar de un valor materializado"
+                    )
+
+                self._trace_debug(
+                    "[ID] "
+                    f"value_type={type(valor).__name__} value_id={id(valor)} "
+                    f"is_runtime_value={not isinstance(valor, NodoAST)}"
+                )
+
+                return _retorno_critico(valor, operador="identificador")
+            elif isinstance(expresion, NodoInstancia):
+                return self.ejecutar_instancia(expresion)
+            elif isinstance(expresion, NodoAtributo):
+                if (
+                    isinstance(expresion.objeto, NodoIdentificador)
+                    and expresion.objeto.nombre == "math"
+                ):
+                    objeto = math
+                else:
+                    objeto = self.evaluar_expresion(expresion.objeto, visitados)
+                if objeto is None:
+                    raise ValueError("Objeto no definido al acceder al atributo")
+                if hasattr(objeto, expresion.nombre):
+                    valor = getattr(objeto, expresion.nombre)
+                else:
+                    atributos = objeto.get("__atributos__", {})
+                    valor = atributos.get(expresion.nombre)
+                valor_resuelto = self._materializar_valor(valor, visitados)
+                if valor_resuelto is not valor:
+                    if hasattr(objeto, expresion.nombre):
+                        setattr(objeto, expresion.nombre, valor_resuelto)
+                    else:
+                        atributos[expresion.nombre] = valor_resuelto
+                return _retorno_critico(valor_resuelto, operador="atributo")
+            elif isinstance(expresion, NodoHolobit):
+                return self.ejecutar_holobit(expresion)
+            elif isinstance(expresion, NodoLista):
+                elementos: list[object] = []
+                for indice, elemento in enumerate(expresion.elementos):
+                    valor_elemento = self.evaluar_expresion(elemento, visitados)
+                    valor_elemento = self._materializar_valor(
+                        valor_elemento,
+                        visitados,
+                        origen=f"lista[{indice}]",
+                    )
+                    valor_elemento = self._asegurar_resultado_no_ast(
+                        valor_elemento,
+                        nodo_origen=elemento,
+                        operador=f"lista:elemento[{indice}]",
+                    )
+                    self._verificar_valor_contexto(valor_elemento)
+                    elementos.append(valor_elemento)
+                self._verificar_valor_contexto(elementos)
+                return _retorno_critico(elementos, operador="lista")
+            elif isinstance(expresion, NodoOperacionBinaria):
+                tipo = expresion.operador.tipo
+                self._trace_debug(
+                    "[BIN-ENTER] "
+                    f"id={id(expresion)} op={expresion.operador.valor} op_tipo={tipo} "
+                    f"left_type={type(expresion.izquierda).__name__} "
+                    f"right_type={type(expresion.derecha).__name__}"
+                )
+                self._trace_debug(f"[BIN] op_tipo={tipo} op_valor={expresion.operador.valor}")
+
+                left = self.evaluar_expresion(expresion.izquierda, visitados)
+                self._trace_debug(
+                    "[BIN-LEFT] "
+                    f"type={type(left).__name__} id={id(left)} "
+                    f"is_primitive={isinstance(left, (int, float, bool, str))}"
+                )
+                right = self.evaluar_expresion(expresion.derecha, visitados)
+                self._trace_debug(
+                    "[BIN-RIGHT] "
+                    f"type={type(right).__name__} id={id(right)} "
+                    f"is_primitive={isinstance(right, (int, float, bool, str))}"
+                )
+
+                left = self._materializar_valor(
+                    left,
+                    visitados,
+                    origen="operacion_binaria",
+                )
+                right = self._materializar_valor(
+                    right,
+                    visitados,
+                    origen="operacion_binaria",
+                )
+
+                self._asegurar_resultado_no_ast(
+                    left,
+                    nodo_origen=expresion.izquierda,
+                    operador=f"{tipo}:izquierda",
+                )
+                self._asegurar_resultado_no_ast(
+                    right,
+                    nodo_origen=expresion.derecha,
+                    operador=f"{tipo}:derecha",
+                )
+
+                def _validar_operandos_primitivos():
+                    """Valida de forma defensiva que ambos operandos sean primitivos runtime."""
+                    if not isinstance(left, (int, float, bool, str)):
+                        raise RuntimeError(
+                            "Error semántico: operando izquierdo no es un valor "
+                            f"primitivo runtime ({type(left).__name__})"
+                        )
+                    if not isinstance(right, (int, float, bool, str)):
+                        raise RuntimeError(
+                            "Error semántico: operando derecho no es un valor "
+                            f"primitivo runtime ({type(right).__name__})"
+                        )
+
+                _validar_operandos_primitivos()
+
+                if tipo == TipoToken.MAYORQUE:
+                    verificar_comparables(left, right, ">")
+                    result = left > right
+                    self._trace_debug(f"[BIN-RESULT] value={result} type={type(result).__name__}")
+                    return result
+                elif tipo == TipoToken.MENORQUE:
+                    verificar_comparables(left, right, "<")
+                    result = left < right
+                    self._trace_debug(f"[BIN-RESULT] value={result} type={type(result).__name__}")
+                    return result
+                elif tipo == TipoToken.MAYORIGUAL:
+                    verificar_comparables(left, right, ">=")
+                    result = left >= right
+                    self._trace_debug(f"[BIN-RESULT] value={result} type={type(result).__name__}")
+                    return result
+                elif tipo == TipoToken.MENORIGUAL:
+                    verificar_comparables(left, right, "<=")
+                    result = left <= right
+                    self._trace_debug(f"[BIN-RESULT] value={result} type={type(result).__name__}")
+                    return result
+                elif tipo == TipoToken.IGUAL:
+                    result = left == right
+                    self._trace_debug(f"[BIN-RESULT] value={result} type={type(result).__name__}")
+                    return result
+                elif tipo == TipoToken.DIFERENTE:
+                    result = left != right
+                    self._trace_debug(f"[BIN-RESULT] value={result} type={type(result).__name__}")
+                    return result
+
+                if tipo == TipoToken.SUMA:
+                    verificar_sumables(left, right)
+                    result = left + right
+                    self._trace_debug(f"[BIN-RESULT] value={result} type={type(result).__name__}")
+                    return result
+                elif tipo == TipoToken.RESTA:
+                    verificar_numeros(left, right, "-")
+                    result = left - right
+                    self._trace_debug(f"[BIN-RESULT] value={result} type={type(result).__name__}")
+                    return result
+                elif tipo == TipoToken.MULT:
+                    verificar_numeros(left, right, "*")
+                    result = left * right
+                    self._trace_debug(f"[BIN-RESULT] value={result} type={type(result).__name__}")
+                    return result
+                elif tipo == TipoToken.DIV:
+                    verificar_numeros(left, right, "/")
+                    result = left / right
+                    self._trace_debug(f"[BIN-RESULT] value={result} type={type(result).__name__}")
+                    return result
+                elif tipo == TipoToken.MOD:
+                    verificar_numeros(left, right, "%")
+                    result = left % right
+                    self._trace_debug(f"[BIN-RESULT] value={result} type={type(result).__name__}")
+                    return result
+                elif tipo == TipoToken.Y:
+                    verificar_booleanos(left, right, "&&")
+                    result = left and right
+                    self._trace_debug(f"[BIN-RESULT] value={result} type={type(result).__name__}")
+                    return result
+                elif tipo == TipoToken.O:
+                    verificar_booleanos(left, right, "||")
+                    result = left or right
+                    self._trace_debug(f"[BIN-RESULT] value={result} type={type(result).__name__}")
+                    return result
+                else:
+                    raise ValueError(f"Operador no soportado: {tipo}")
+            elif isinstance(expresion, NodoOperacionUnaria):
+                valor = self.evaluar_expresion(expresion.operando, visitados)
+                valor = self._materializar_valor(valor, visitados)
+                self._asegurar_resultado_no_ast(
+                    valor,
+                    nodo_origen=expresion.operando,
+                    operador=f"{expresion.operador.tipo}:operando",
+                )
+                tipo = expresion.operador.tipo
+                if tipo == TipoToken.NO:
+                    verificar_booleano(valor, "!")
+                    return _retorno_critico(not valor, operador=tipo)
+                else:
+                    raise ValueError(f"Operador unario no soportado: {tipo}")
+            elif isinstance(expresion, NodoEsperar):
+                return self.evaluar_expresion(expresion.expresion, visitados)
+            elif isinstance(expresion, NodoLlamadaMetodo):
+                return _retorno_critico(
+                    self.ejecutar_llamada_metodo(expresion),
+                    operador="llamada_metodo",
+                )
+            elif isinstance(expresion, NodoLlamadaFuncion):
+                return _retorno_critico(
+                    self.ejecutar_llamada_funcion(expresion),
+                    operador="llamada_funcion",
+                )
+            else:
+                tipo_expresion = type(expresion).__name__
+                expresion_id_seguro = id(expresion)
+                raise ValueError(
+                    f"Expresión no soportada: tipo={tipo_expresion} id={expresion_id_seguro}"
+                )
+        finally:
+            # Siempre limpiar la traza de evaluación, incluso ante errores
+            # semánticos o excepciones en ramas internas, para evitar
+            # falsos positivos en evaluaciones posteriores.
+            self._eval_stack.discard(expresion_key)
+
+    def _evaluar_condicion_control(self, condicion):
+        """Evalúa una condición y exige que quede materializada.
+
+        Una condición no debe propagarse como ``NodoAST`` sin resolver para
+        evitar comparaciones ambiguas entre nodos y errores opacos aguas abajo.
+
+        Contrato de control de flujo:
+        - la condición se evalúa usando ``evaluar_expresion``;
+        - si aparece un identificador indefinido, ``NameError`` se propaga;
+        - el resultado debe quedar materializado y ser estrictamente booleano
+          antes de ejecutar cualquier bloque ``si/sino`` o ``mientras``.
+        """
+        condicion_resuelta = self.evaluar_expresion(condicion)
+        if isinstance(condicion_resuelta, NodoAST):
+            raise RuntimeError(
+                "Condición no materializada: "
+                f"se recibió nodo AST {type(condicion_resuelta).__name__}"
+            )
+        # No se permite coerción implícita (bool(x)); la condición debe ser
+        # un booleano real para evitar ambigüedad semántica en control de flujo.
+        if not isinstance(condicion_resuelta, bool):
+            raise CondicionNoBooleanaError()
+        return condicion_resuelta
+
+    def ejecutar_condicional(self, nodo):
+        """Ejecuta un bloque condicional."""
+        # Contrato explícito del runtime:
+        # "control-flow no abre scope; function-call sí abre scope".
+        # Regla semántica de scope:
+        # ``si/sino`` NO crea un entorno nuevo. Las instrucciones de cada rama
+        # se ejecutan sobre ``self.contextos[-1]`` (contexto activo), por lo que
+        # cualquier asignación queda visible al salir del condicional.
+        # Nota: no se captura ``NameError`` ni otras excepciones aquí para no
+        # ocultar la causa real del fallo en la evaluación de la condición.
+        bloque_si = getattr(
+            nodo, "cuerpo_si", getattr(nodo, "bloque_si", NodoBloque())
+        )
+        bloque_sino = getattr(
+            nodo, "cuerpo_sino", getattr(nodo, "bloque_sino", NodoBloque())
+        )
+        condicion = self._evaluar_condicion_control(nodo.condicion)
+
+        if condicion is True:
+            for instruccion in bloque_si:
+                self.ejecutar_nodo(instruccion)
+            return None
+
+        # Única ruta restante válida: ``False``.
+        if bloque_sino is None:
+            return None
+        for instruccion in bloque_sino:
+            self.ejecutar_nodo(instruccion)
+        return None
+
+    def ejecutar_mientras(self, nodo):
+        """Ejecuta un bucle ``mientras`` hasta que la condición sea falsa."""
+        # Regla semántica de scope:
+        # ``mientras`` NO abre un ámbito nuevo por iteración. El cuerpo del
+        # bucle reutiliza ``self.contextos[-1]`` en cada vuelta y, por tanto,
+        # las mutaciones del contexto persisten entre iteraciones y después.
+        while self._evaluar_condicion_control(nodo.condicion):
+            try:
+                for instruccion in nodo.cuerpo:
+                    self.ejecutar_nodo(instruccion)
+            except _ControlContinuar:
+                continue
+            except _ControlRomper:
+                break
+        return None
+
+    def ejecutar_para(self, nodo):
+        """Ejecuta un bucle ``para`` sobre un iterable."""
+        iterable = self.evaluar_expresion(nodo.iterable)
+        iterable = self._materializar_valor(
+            iterable,
+            origen="bucle_para",
+        )
+
+        try:
+            iterador = iter(iterable)
+        except TypeError as exc:
+            raise TypeError(
+                "El iterable de 'para' no es recorrible: "
+                f"{type(iterable).__name__}"
+            ) from exc
+
+        for valor in iterador:
+            declaracion = not self.contextos[-1].contains(nodo.variable)
+
+            self.ejecutar_asignacion(
+                NodoAsignacion(
+                    nodo.variable,
+                    NodoValor(valor),
+                    declaracion=declaracion,
+                )
+            )
+
+            try:
+                for instruccion in nodo.cuerpo:
+                    self.ejecutar_nodo(instruccion)
+            except _ControlContinuar:
+                continue
+            except _ControlRomper:
+                break
+
+        return None
+
+    def ejecutar_try_catch(self, nodo):
+        """Ejecuta un bloque ``try`` con manejo de excepciones Cobra."""
+        try:
+            for instruccion in nodo.bloque_try:
+                self.ejecutar_nodo(instruccion)
+        except ExcepcionCobra as exc:
+            if nodo.nombre_excepcion:
+                contexto_actual = self.contextos[-1]
+                if contexto_actual.contains(nodo.nombre_excepcion):
+                    contexto_actual.set(nodo.nombre_excepcion, exc.valor)
+                else:
+                    contexto_actual.define(nodo.nombre_excepcion, exc.valor)
+            for instruccion in nodo.bloque_catch:
+                self.ejecutar_nodo(instruccion)
+        finally:
+            for instruccion in nodo.bloque_finally:
+                self.ejecutar_nodo(instruccion)
+
+    def ejecutar_funcion(self, nodo):
+        """Registra una función definida por el usuario sin ejecutarla.
+
+        Contrato de ejecución:
+        - Solo construye el descriptor de función y lo guarda con ``define`` en
+          el entorno actual.
+        - No evalúa parámetros por defecto dinámicos (si existieran) durante la
+          definición.
+        - No ejecuta ni recorre ``nodo.cuerpo`` en esta fase; el cuerpo se
+          procesa únicamente al invocar la función.
+        """
+        funcion = self._construir_funcion(nodo)
+        self._verificar_valor_contexto(funcion)
+        self.contextos[-1].define(nodo.nombre, funcion)
+        return None
+
+    @staticmethod
+    def _es_descriptor_funcion_cobra(valor):
+        """Indica si ``valor`` es un descriptor runtime de función Cobra."""
+        return isinstance(valor, dict) and valor.get("tipo") == "funcion"
+
+    def _ejecutar_descriptor_funcion_cobra(self, funcion, argumentos):
+        """Ejecuta un descriptor de función Cobra con argumentos ya resueltos."""
+        parametros = funcion.get("parametros", funcion.get("params", []))
+        cuerpo = funcion.get("cuerpo", funcion.get("body", []))
+
+        if len(parametros) != len(argumentos):
+            raise TypeError(f"se esperaban {len(parametros)} argumentos")
+
+        entorno_capturado = funcion.get(
+            "scope_lexico", funcion.get("entorno", self.contextos[-1])
+        )
+        self.contextos.append(Environment(parent=entorno_capturado))
+        self.mem_contextos.append({})
+        try:
+            for nombre_param, valor in zip(parametros, argumentos):
+                indice = self.solicitar_memoria(1)
+                self.mem_contextos[-1][nombre_param] = (indice, 1)
+                self.contextos[-1].define(nombre_param, valor)
+
+            self._call_depth += 1
+            try:
+                for instruccion in cuerpo:
+                    self.ejecutar_nodo(instruccion)
+                return None
+            except _ControlRetorno as retorno:
+                return retorno.valor
+            finally:
+                self._call_depth -= 1
+        finally:
+            memoria_local = self.mem_contextos.pop()
+            for idx, tam in memoria_local.values():
+                self.liberar_memoria(idx, tam)
+            self.contextos.pop()
+
+    def _adaptar_callback_cobra(self, funcion):
+        """Convierte un descriptor de función Cobra en un callback Python mínimo."""
+
+        def callback(*argumentos):
+            return self._ejecutar_descriptor_funcion_cobra(funcion, list(argumentos))
+
+        nombre = funcion.get("nombre")
+        if nombre:
+            callback.__name__ = str(nombre)
+        return callback
+
+    def ejecutar_llamada_funcion(self, nodo):
+        """Ejecuta la invocación de una función, interna o del usuario."""
+        emitir_salida_llamada = self.in_execution()
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Llamada a función: %s", nodo.nombre)
+        if nodo.nombre == "imprimir":
+            for arg in nodo.argumentos:
+                if isinstance(arg, Token) and arg.tipo == TipoToken.IDENTIFICADOR:
+                    arg = NodoIdentificador(arg.valor)
+                valor = self.evaluar_expresion(arg)
+                if valor is True:
+                    valor = "verdadero"
+                elif valor is False:
+                    valor = "falso"
+                if emitir_salida_llamada:
+                    print(valor)
+        else:
+            funcion = self.obtener_variable(nodo.nombre)
+
+            if callable(funcion):
+                argumentos_resueltos = []
+                for arg in nodo.argumentos:
+                    valor = self.evaluar_expresion(arg)
+                    self._verificar_valor_contexto(valor)
+                    if self._es_descriptor_funcion_cobra(valor):
+                        valor = self._adaptar_callback_cobra(valor)
+                    argumentos_resueltos.append(valor)
+
+                try:
+                    resultado = funcion(*argumentos_resueltos)
+                except (TypeError, IndexError) as exc:
+                    raise self._normalizar_error_publico_usar(nodo.nombre, exc) from exc
+                self._verificar_valor_contexto(resultado)
+                return resultado
+
+            if not self._es_descriptor_funcion_cobra(funcion):
+                if emitir_salida_llamada:
+                    print(f"Funci\u00f3n '{nodo.nombre}' no implementada")
+                return None
+
+            parametros = funcion.get("parametros", funcion.get("params", []))
+            if len(parametros) != len(nodo.argumentos):
+                if emitir_salida_llamada:
+                    print(f"Error: se esperaban {len(parametros)} argumentos")
+                return None
+
+            cuerpo = funcion.get("cuerpo", funcion.get("body", []))
+            contiene_yield = any(self._contiene_yield(instr) for instr in cuerpo)
+
+            def preparar_contexto():
+                # Los argumentos se evalúan en el contexto llamador antes de
+                # abrir el nuevo scope local de la función.
+                argumentos_resueltos = []
+                for arg in nodo.argumentos:
+                    valor = self.evaluar_expresion(arg)
+                    self._verificar_valor_contexto(valor)
+                    argumentos_resueltos.append(valor)
+
+                # Regla semántica opuesta al control de flujo: cada llamada de
+                # función sí encapsula su scope creando un nuevo contexto local.
+                entorno_capturado = funcion.get(
+                    "scope_lexico", funcion.get("entorno", self.contextos[-1])
+                )
+                self.contextos.append(Environment(parent=entorno_capturado))
+                self.mem_contextos.append({})
+                for nombre_param, valor in zip(parametros, argumentos_resueltos):
+                    indice = self.solicitar_memoria(1)
+                    self.mem_contextos[-1][nombre_param] = (indice, 1)
+                    self.contextos[-1].define(nombre_param, valor)
+
+            def limpiar_contexto():
+                # Se restaura el scope anterior al finalizar la llamada.
+                memoria_local = self.mem_contextos.pop()
+                for idx, tam in memoria_local.values():
+                    self.liberar_memoria(idx, tam)
+                self.contextos.pop()
+
+            if contiene_yield:
+
+                def generador():
+                    preparar_contexto()
+                    self._call_depth += 1
+                    try:
+                        try:
+                            for instr in cuerpo:
+                                if isinstance(instr, NodoYield):
+                                    yield self.evaluar_expresion(instr.expresion)
+                                else:
+                                    self.ejecutar_nodo(instr)
+                        except _ControlRetorno as retorno:
+                            return retorno.valor
+                    finally:
+                        self._call_depth -= 1
+                        limpiar_contexto()
+
+                return generador()
+            else:
+                preparar_contexto()
+                try:
+                    self._call_depth += 1
+                    try:
+                        for instruccion in cuerpo:
+                            self.ejecutar_nodo(instruccion)
+                        return None
+                    except _ControlRetorno as retorno:
+                        return retorno.valor
+                    finally:
+                        self._call_depth -= 1
+                finally:
+                    limpiar_contexto()
+
+    def _normalizar_error_publico_usar(self, nombre: str, exc: Exception) -> Exception:
+        """Normaliza errores contractuales de APIs públicas `usar`.
+
+        Captura únicamente errores esperados para evitar ocultar fallas reales.
+        """
+        metadata = self._usar_symbol_metadata.get(nombre) or {}
+        if metadata.get("module") == "datos" and metadata.get("symbol") == "elemento":
+            mensaje = str(exc).strip()
+            mensajes_permitidos = _ERRORES_USUARIO_ELEMENTO.get(type(exc), set())
+            if mensaje in mensajes_permitidos:
+                return type(exc)(f"Error: {mensaje}")
+        return exc
+
+    def ejecutar_clase(self, nodo):
+        """Registra una clase definida por el usuario."""
+        bases_resueltas = []
+        for base_nombre in nodo.bases:
+            base = self.obtener_variable(base_nombre)
+            if not isinstance(base, dict) or base.get("tipo") != "clase":
+                raise ValueError(f"Clase base '{base_nombre}' no definida")
+            bases_resueltas.append(base)
+        clase = self._construir_clase(nodo, bases_resueltas)
+        self._verificar_valor_contexto(clase)
+        self.contextos[-1].define(nodo.nombre, clase)
+
+    def ejecutar_instancia(self, nodo):
+        """Crea una instancia de la clase indicada."""
+        clase = self.obtener_variable(nodo.nombre_clase)
+        if not isinstance(clase, dict) or clase.get("tipo") != "clase":
+            raise ValueError(f"Clase '{nodo.nombre_clase}' no definida")
+        bases = clase.get("bases", [])
+        instancia = {"__clase__": clase, "__bases__": bases, "__atributos__": {}}
+        self._verificar_valor_contexto(instancia)
+        return instancia
+
+    def ejecutar_llamada_metodo(self, nodo):
+        """Invoca un método de un objeto instanciado."""
+        objeto = self.evaluar_expresion(nodo.objeto)
+        if not isinstance(objeto, dict) or "__clase__" not in objeto:
+            raise ValueError("Objeto inv\u00e1lido en llamada a m\u00e9todo")
+        clase = objeto["__clase__"]
+
+        def buscar_metodo(clase_actual):
+            metodos = clase_actual.get("metodos", [])
+            metodo = next(
+                (m for m in metodos if m.get("nombre") == nodo.nombre_metodo),
+                None,
+            )
+            if metodo is not None:
+                return metodo
+            for base in clase_actual.get("bases", []):
+                encontrado = buscar_metodo(base)
+                if encontrado is not None:
+                    return encontrado
+            return None
+
+        metodo = buscar_metodo(clase)
+        if metodo is None:
+            raise ValueError(f"Método '{nodo.nombre_metodo}' no encontrado")
+
+        entorno_capturado = metodo.get("entorno", self.contextos[-1])
+        self.contextos.append(Environment(parent=entorno_capturado))
+        self.mem_contextos.append({})
+        self.contextos[-1].define("self", objeto)
+        for nombre_param, arg in zip(metodo.get("parametros", [])[1:], nodo.argumentos):
+            valor = self.evaluar_expresion(arg)
+            self._verificar_valor_contexto(valor)
+            self.contextos[-1].define(nombre_param, valor)
+
+        try:
+            self._call_depth += 1
+            try:
+                for instruccion in metodo.get("cuerpo", []):
+                    self.ejecutar_nodo(instruccion)
+                return None
+            except _ControlRetorno as retorno:
+                return retorno.valor
+            finally:
+                self._call_depth -= 1
+        finally:
+            memoria_local = self.mem_contextos.pop()
+            for idx, tam in memoria_local.values():
+                self.liberar_memoria(idx, tam)
+            self.contextos.pop()
+
+    def ejecutar_import(self, nodo: NodoImport) -> None:
+        """Ejecuta una declaración de importación de módulo legacy.
+
+        ``NodoImport`` mantiene la semántica histórica de ``import``: carga el
+        AST del archivo con ``cargar_ast_modulo`` y ejecuta todos sus nodos en el
+        contexto actual. La caché de AST sólo evita parseos repetidos; no debe
+        delegar en ``usar_modulo`` ni aplicar la semántica pública/exportada de
+        ``usar``.
+        """
+        ruta = Path(nodo.ruta).expanduser()
+        ruta_import_legacy = str(ruta)
+        if not ruta.is_absolute():
+            base = (
+                self._current_module_stack[-1].parent
+                if self._current_module_stack
+                else (
+                    self._main_file.parent
+                    if self._main_file is not None
+                    else Path.cwd()
+                )
+            )
+            ruta = base / ruta
+
+        ruta_canonica = ruta.resolve(strict=False)
+        ast_cache = self._import_ast_cache
+
+        if ruta_canonica in self._imported_module_paths:
+            return
+
+        if ruta_canonica in self._import_execution_stack:
+            inicio_ciclo = self._import_execution_stack.index(ruta_canonica)
+            ciclo = self._import_execution_stack[inicio_ciclo:] + [ruta_canonica]
+            nombres = " -> ".join(ruta.name for ruta in ciclo)
+            raise ImportError(f"Ciclo de módulos detectado en import: {nombres}")
+
+        if ruta_canonica in ast_cache:
+            ast = ast_cache[ruta_canonica]
+        else:
+            # Pasar la pila de carga del intérprete a cargar_ast_modulo
+            ruta_para_loader = (
+                str(ruta_canonica)
+                if getattr(cargar_ast_modulo, "__module__", "") == "pcobra.core.import_utils"
+                else ruta_import_legacy
+            )
+            ast = cargar_ast_modulo(
+                ruta_para_loader,
+                modules_path=str(MODULES_PATH),
+                whitelist={MODULES_PATH, self._project_root, *IMPORT_WHITELIST},
+                loading_stack=self._usar_loading_stack,
+            )
+            ast_cache[ruta_canonica] = ast
+
+        self._import_execution_stack.append(ruta_canonica)
+        self._current_module_stack.append(ruta_canonica)
+        try:
+            for subnodo in ast:
+                self.ejecutar_nodo(subnodo)
+        finally:
+            self._current_module_stack.pop()
+            self._import_execution_stack.pop()
+        self._imported_module_paths.add(ruta_canonica)
+
+    def _ejecutar_usar_modulo_proyecto(self, nombre_modulo: str) -> None:
+        """Compatibilidad interna: delega directamente en ``usar_modulo``.
+
+        La resolución, caché y detección de ciclos de módulos Cobra de proyecto
+        pertenecen exclusivamente a :func:`pcobra.cobra.usar_loader.usar_modulo`.
+        Este método se conserva sólo para callers internos legacy y no debe
+        reimplementar un segundo sistema de imports.
+        """
+
+        current_file = (
+            self._current_module_stack[-1]
+            if self._current_module_stack
+            else self._main_file
+        )
+        exports = _usar_modulo_con_estado_aislado(
+            nombre_modulo,
+            project_root=self._project_root,
+            current_file=current_file,
+            module_cache=self._usar_module_cache,
+            loading_stack=self._usar_loading_stack,
+            contexto_proyecto_verificado=self._contexto_proyecto_verificado,
+        )
+        self._inyectar_exports_modulo_proyecto(exports)
+
+    def _inyectar_exports_modulo_proyecto(self, exports: Mapping[str, object]) -> None:
+        """Inyecta en el contexto activo los exports cacheados de un módulo de proyecto."""
+
+        simbolos_saneados = list(exports.get("simbolos", []))
+        metadata_por_simbolo = {
+            nombre: dict(metadata)
+            for nombre, metadata in dict(exports.get("metadata", {})).items()
+        }
+        conflictos = self._detectar_conflictos_usar_en_contexto(
+            simbolos_saneados,
+            metadata_por_simbolo=metadata_por_simbolo,
+        )
+        if conflictos:
+            simbolo = conflictos[0]
+            modulo = str(
+                metadata_por_simbolo.get(simbolo, {}).get("module", "módulo Cobra")
+            )
+            detalle = {
+                "code": "symbol_collision",
+                "message": "símbolo ya existe en contexto actual",
+                "symbol": simbolo,
+                "module": modulo,
+                "phase": "preflight",
+            }
+
+            if self._usar_collision_policy == USAR_COLLISION_WARN_ALIAS_REQUIRED:
+                warnings.warn(
+                    "Conflicto de nombres en `usar`: "
+                    f"el símbolo '{simbolo}' ya existe y no será sobrescrito.",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+
+            raise NameError(
+                f"No se puede usar '{modulo}': "
+                "hay conflicto de símbolos en el contexto actual. "
+                f"Símbolo conflictivo: {simbolo}. "
+                f"No se puede usar el módulo '{modulo}': "
+                f"colisión estructurada={detalle}"
+            )
+        self._inyectar_simbolos_usar_en_contexto(
+            simbolos_saneados,
+            metadata_por_simbolo=metadata_por_simbolo,
+        )
+
+    def ejecutar_usar(self, nodo):
+        """Importa símbolos públicos usando ``usar_modulo`` como fuente única.
+
+        ``usar_modulo`` concentra la resolución de módulos oficiales y de
+        proyecto, así como la caché y la pila de ciclos. El intérprete sólo
+        adapta el contexto de llamada e inyecta atómicamente los exports
+        devueltos mediante ``_inyectar_exports_modulo_proyecto``.
+        """
+
+        try:
+            nombre_modulo_limpio = str(nodo.modulo).strip().strip('\"\'')
+            current_file = (
+                self._current_module_stack[-1]
+                if self._current_module_stack
+                else self._main_file
+            )
+            exports = _usar_modulo_con_estado_aislado(
+                nombre_modulo_limpio,
+                project_root=self._project_root,
+                current_file=current_file,
+                module_cache=self._usar_module_cache,
+                loading_stack=self._usar_loading_stack,
+                contexto_proyecto_verificado=self._contexto_proyecto_verificado,
+            )
+            self._inyectar_exports_modulo_proyecto(exports)
+        except Exception as exc:
+            detalle_usar_habilitado = _usar_detalle_habilitado()
+            exc_usuario = exc
+            if (
+                isinstance(exc, ModuloFueraCatalogoPublicoError)
+            ):
+                exc_usuario = _error_usuario_modulo_fuera_catalogo(
+                    nombre_modulo_limpio,
+                    exc,
+                    repl_estricto=self._repl_usar_alias_map is not None,
+                    incluir_detalle=detalle_usar_habilitado,
+                )
+            if detalle_usar_habilitado:
+                logging.exception("Error al usar el módulo '%s': %s", nodo.modulo, exc_usuario)
+            else:
+                logging.debug(
+                    "Error esperado al usar módulo %s: %s",
+                    nodo.modulo,
+                    exc_usuario,
+                )
+            if isinstance(
+                exc,
+                (ImportError, PermissionError, ValueError, NameError, FileNotFoundError),
+            ):
+                if exc_usuario is not exc:
+                    raise exc_usuario from exc
+                raise
+            raise ImportError(
+                formatear_error_usar_usuario("carga_modulo_error", nodo.modulo)
+            ) from exc
+
+    def _detectar_conflictos_usar_en_contexto(
+        self,
+        simbolos_saneados: list[tuple[str, object]],
+        *,
+        metadata_por_simbolo: Mapping[str, dict[str, object]],
+    ) -> list[str]:
+        """Devuelve símbolos en conflicto real (ignora reimport idempotente por metadatos)."""
+        contexto_actual = self.contextos[-1]
+        conflictos: list[str] = []
+        for nombre, simbolo in simbolos_saneados:
+            if not contexto_actual.contains(nombre):
+                continue
+            previo = self._usar_symbol_metadata.get(nombre)
+            metadata_actual = metadata_por_simbolo.get(nombre)
+            if metadata_actual is None:
+                continue
+            if self._metadata_usar_equivalente_idempotente(previo, metadata_actual):
+                # Reimport idempotente: mismo símbolo, mismo módulo origen y misma identidad.
+                continue
+            conflictos.append(nombre)
+        if conflictos:
+            self._trace_debug(
+                "[USAR_COLLISION][PREFLIGHT] "
+                f"módulo={metadata_por_simbolo[conflictos[0]].get('module')} conflictos={','.join(conflictos)}"
+            )
+        return conflictos
+
+    def _inyectar_simbolos_usar_en_contexto(
+        self,
+        simbolos_saneados: list[tuple[str, object]],
+        *,
+        metadata_por_simbolo: Mapping[str, dict[str, object]],
+        permitir_sobrescritura: bool = False,
+    ) -> None:
+        """Inyecta símbolos saneados en el entorno activo centralizando el binding."""
+        contexto_actual = self.contextos[-1]
+        for nombre, simbolo in simbolos_saneados:
+            if contexto_actual.contains(nombre) and not permitir_sobrescritura:
+                previo = self._usar_symbol_metadata.get(nombre)
+                metadata_actual = metadata_por_simbolo.get(nombre)
+                if metadata_actual is None:
+                    continue
+                if self._metadata_usar_equivalente_idempotente(previo, metadata_actual):
+                    # No-op idempotente: evita warning/ruido al reimportar lo mismo.
+                    continue
+                modulo = str(metadata_actual.get("module"))
+                detalle = {
+                    "module": modulo,
+                    "symbol": nombre,
+                    "code": "symbol_collision_runtime_recheck",
+                    "message": "símbolo ya existe en contexto actual",
+                    "policy": self._usar_collision_policy,
+                    "phase": "runtime_recheck",
+                }
+                self._trace_debug(
+                    "[USAR_COLLISION][ERROR] "
+                    f"módulo={modulo} símbolo={nombre} code=symbol_collision_runtime_recheck"
+                )
+                raise NameError(
+                    "No se puede usar el módulo "
+                    f"'{metadata_actual.get('module')}': {USAR_SYMBOL_CONFLICT_ERROR} colisión estructurada={detalle}"
+                )
+            metadata_simbolo = metadata_por_simbolo.get(nombre)
+            if metadata_simbolo is None:
+                continue
+            metadata_simbolo = self._canonicalizar_metadata_usar(nombre, metadata_simbolo)
+            simbolo = self._materializar_valor(simbolo, visitados=None)
+            contexto_actual.define(nombre, simbolo)
+            self._usar_symbol_metadata[nombre] = dict(metadata_simbolo)
+            if self._validador is not None and hasattr(self._validador, "registrar_simbolo_publico_usar"):
+                resumen = {
+                    "module": metadata_simbolo.get("module"),
+                    "symbol": metadata_simbolo.get("symbol"),
+                    "callable": metadata_simbolo.get("callable"),
+                    "public_api": metadata_simbolo.get("public_api"),
+                    "sanitized": metadata_simbolo.get("sanitized"),
+                }
+                self._trace_debug(f"[USAR_METADATA][PRE_REGISTRO] {resumen}")
+                self._validador.registrar_simbolo_publico_usar(
+                    nombre,
+                    str(metadata_simbolo["module"]),
+                    metadata=dict(metadata_simbolo),
+                )
+                self._sincronizar_metadata_usar_no_destructiva()
+                self._trace_debug(f"[USAR_METADATA][POST_REGISTRO] {resumen}")
+                if str(metadata_simbolo.get("module")) == "archivo" and nombre == "existe":
+                    self._trace_debug(
+                        "[USAR_TRACE][archivo.existe] confirmado wrapper sanitizado "
+                        f"(public_api={metadata_simbolo.get('public_api')}, sanitized={metadata_simbolo.get('sanitized')})"
+                    )
+                self._asegurar_metadata_usar_sincronizada(etapa="post-registro")
+
+    def ejecutar_holobit(self, nodo):
+        """Simula la ejecución de un holobit y devuelve sus valores."""
+        if self.in_execution():
+            print(f"Simulando holobit: {nodo.nombre}")
+        valores = []
+        for v in nodo.valores:
+            if isinstance(v, NodoValor):
+                valores.append(v.valor)
+            else:
+                valores.append(v)
+        return valores
+
+    def ejecutar_hilo(self, nodo):
+        """Planifica la llamada de ``nodo`` como tarea concurrente.
+
+        La tarea se ejecuta en el :class:`PlanificadorHilos` compartido, que
+        limita los trabajadores y aplica contrapresión cuando la cola se
+        llena. Cada tarea obtiene su propia pila de marcos, que parte del
+        contexto activo al lanzarla. Devuelve el :class:`TareaHilo` asociado.
+        """
+        contexto_base = self.contextos[-1]
+        memoria_base = self.mem_contextos[-1]
+        marcos = self._marcos
+
+        def destino():
+            previos = {
+                nombre: getattr(marcos, nombre)
+                for nombre in _ESTADO_TAREA
+                if hasattr(marcos, nombre)
+            }
+            marcos.contextos = [contexto_base]
+            marcos.mem_contextos = [memoria_base]
+            marcos._eval_stack = set()
+            marcos._call_depth = 0
+            try:
+                return self.ejecutar_llamada_funcion(nodo.llamada)
+            finally:
+                for nombre in _ESTADO_TAREA:
+                    if nombre in previos:
+                        setattr(marcos, nombre, previos[nombre])
+                    else:
+                        delattr(marcos, nombre)
+
+        planificador = self._planificador or obtener_planificador()
+        nombre = getattr(nodo.llamada, "nombre", None)
+        return planificador.enviar(destino, nombre=f"hilo:{nombre}" if nombre else None)
+
+
+_ESTADO_TAREA = ("contextos", "mem_contextos", "_eval_stack", "_call_depth")
+
+
+# Protección de compatibilidad: algunos consumidores legacy sustituyen
+# ``InterpretadorCobra`` en el módulo global durante inicialización de CLI.
+# Evitamos que stubs incompletos contaminen imports posteriores del runtime.
+import sys as _sys
+from types import ModuleType as _ModuleType
+
+
+class _InterpreterModule(_ModuleType):
+    def __setattr__(self, name, value):
+        if name == "InterpretadorCobra" and not hasattr(value, "ejecutar_asignacion"):
+            return
+        super().__setattr__(name, value)
+
+
+_sys.modules[__name__].__class__ = _InterpreterModule
@@ -0,0 +1,280 @@
+"""Planificador acotado para las tareas lanzadas con ``hilo``.
+
+Cada sentencia ``hilo`` solía crear un ``threading.Thread`` propio, sin límite
+alguno: un programa que lanzaba miles de tareas saturaba la máquina. El
+:class:`PlanificadorHilos` reparte las tareas entre un número fijo de
+trabajadores daemon y una cola acotada. Cuando la cola está llena, quien
+envía espera (contrapresión); si el que envía es a su vez un trabajador del
+planificador, la tarea se ejecuta en línea para evitar interbloqueos.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import queue
+import threading
+from typing import Any, Callable
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_EN_COLA = 1024
+
+
+def trabajadores_por_defecto() -> int:
+    """Número de trabajadores usado cuando la configuración no lo fija."""
+
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class ColaHilosLlenaError(RuntimeError):
+    """La cola del planificador siguió llena durante todo el tiempo de espera."""
+
+
+class TareaHilo:
+    """Manejador de una tarea planificada.
+
+    Expone la misma interfaz básica que ``threading.Thread`` (``join``,
+    ``is_alive``, ``daemon``, ``name``) para que el código existente siga
+    funcionando, y añade :meth:`resultado` para recuperar el valor devuelto.
+    """
+
+    daemon = True
+
+    def __init__(self, nombre: str) -> None:
+        self.name = nombre
+        self._terminada = threading.Event()
+        self._resultado: Any = None
+        self._error: BaseException | None = None
+
+    def _completar(self, resultado: Any = None, error: BaseException | None = None) -> None:
+        self._resultado = resultado
+        self._error = error
+        self._terminada.set()
+
+    def join(self, timeout: float | None = None) -> None:
+        """Espera a que la tarea termine (sin propagar errores)."""
+
+        self._terminada.wait(timeout)
+
+    def is_alive(self) -> bool:
+        return not self._terminada.is_set()
+
+    def done(self) -> bool:
+        return self._terminada.is_set()
+
+    def excepcion(self, timeout: float | None = None) -> BaseException | None:
+        """Devuelve el error producido por la tarea, si lo hubo."""
+
+        if not self._terminada.wait(timeout):
+            raise TimeoutError(f"La tarea {self.name} no terminó a tiempo")
+        return self._error
+
+    def resultado(self, timeout: float | None = None) -> Any:
+        """Devuelve el valor de la tarea o propaga su excepción."""
+
+        error = self.excepcion(timeout)
+        if error is not None:
+            raise error
+        return self._resultado
+
+    def __repr__(self) -> str:
+        estado = "terminada" if self.done() else "pendiente"
+        return f"<TareaHilo {self.name} {estado}>"
+
+
+_FIN = object()
+
+
+class PlanificadorHilos:
+    """Reparte tareas entre trabajadores daemon con una cola acotada.
+
+    Args:
+        max_trabajadores: Hilos que ejecutan tareas en paralelo.
+        max_en_cola: Tareas que pueden esperar turno antes de aplicar
+            contrapresión sobre quien envía.
+        prefijo: Prefijo del nombre de los hilos trabajadores.
+    """
+
+    def __init__(
+        self,
+        max_trabajadores: int | None = None,
+        max_en_cola: int | None = None,
+        *,
+        prefijo: str = "cobra-hilo",
+    ) -> None:
+        self.max_trabajadores = max(1, int(max_trabajadores or trabajadores_por_defecto()))
+        self.max_en_cola = max(1, int(max_en_cola or DEFAULT_MAX_EN_COLA))
+        self._prefijo = prefijo
+        self._cola: queue.Queue = queue.Queue(maxsize=self.max_en_cola)
+        self._trabajadores: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._inactivas = threading.Condition(self._lock)
+        self._contador = itertools.count(1)
+        self._locales = threading.local()
+        self._cerrado = False
+        self._en_ejecucion = 0
+        self._pendientes = 0
+        self._completadas = 0
+        self._fallidas = 0
+        self._en_linea = 0
+
+    # -- trabajadores -----------------------------------------------------
+    def _asegurar_trabajador(self) -> None:
+        """Arranca un trabajador más mientras no se alcance el máximo."""
+
+        with self._lock:
+            if len(self._trabajadores) >= self.max_trabajadores:
+                return
+            hilo = threading.Thread(
+                target=self._bucle,
+                name=f"{self._prefijo}-{len(self._trabajadores) + 1}",
+                daemon=True,
+            )
+            self._trabajadores.append(hilo)
+        hilo.start()
+
+    def _bucle(self) -> None:
+        self._locales.es_trabajador = True
+        while True:
+            elemento = self._cola.get()
+            try:
+                if elemento is _FIN:
+                    return
+                tarea, funcion, args, kwargs = elemento
+                self._ejecutar(tarea, funcion, args, kwargs)
+            finally:
+                self._cola.task_done()
+
+    def _ejecutar(self, tarea: TareaHilo, funcion: Callable, args, kwargs) -> None:
+        with self._lock:
+            self._en_ejecucion += 1
+        resultado = error = None
+        try:
+            resultado = funcion(*args, **kwargs)
+        except BaseException as exc:  # noqa: BLE001 - se entrega por el manejador
+            error = exc
+            LOGGER.debug("La tarea %s terminó con error: %s", tarea.name, exc)
+        finally:
+            with self._lock:
+                self._en_ejecucion -= 1
+                self._pendientes -= 1
+                if error is None:
+                    self._completadas += 1
+                else:
+                    self._fallidas += 1
+                if self._pendientes == 0:
+                    self._inactivas.notify_all()
+            tarea._completar(resultado, error)
+
+    # -- API pública ------------------------------------------------------
+    def en_trabajador(self) -> bool:
+        """Indica si el hilo actual es un trabajador de este planificador."""
+
+        return getattr(self._locales, "es_trabajador", False)
+
+    def enviar(
+        self,
+        funcion: Callable[..., Any],
+        *args: Any,
+        nombre: str | None = None,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> TareaHilo:
+        """Planifica ``funcion(*args, **kwargs)`` y devuelve su manejador.
+
+        Si la cola está llena se bloquea hasta ``timeout`` segundos y lanza
+        :class:`ColaHilosLlenaError` al agotarlos. Desde un trabajador del
+        propio planificador la tarea se ejecuta en línea en lugar de esperar.
+        """
+
+        if self._cerrado:
+            raise RuntimeError("El planificador de hilos está cerrado")
+        tarea = TareaHilo(nombre or f"{self._prefijo}-tarea-{next(self._contador)}")
+        elemento = (tarea, funcion, args, kwargs)
+        with self._lock:
+            self._pendientes += 1
+        try:
+            if self.en_trabajador():
+                self._cola.put_nowait(elemento)
+            else:
+                self._cola.put(elemento, timeout=timeout)
+        except queue.Full:
+            if not self.en_trabajador():
+                with self._lock:
+                    self._pendientes -= 1
+                raise ColaHilosLlenaError(
+                    f"La cola de hilos siguió llena ({self.max_en_cola} tareas)"
+                ) from None
+            with self._lock:
+                self._en_linea += 1
+            self._ejecutar(tarea, funcion, args, kwargs)
+            return tarea
+        self._asegurar_trabajador()
+        return tarea
+
+    def esperar_todas(self, timeout: float | None = None) -> bool:
+        """Espera a que no queden tareas pendientes; devuelve si lo logró."""
+
+        with self._inactivas:
+            return self._inactivas.wait_for(lambda: self._pendientes == 0, timeout)
+
+    def metricas(self) -> dict[str, int]:
+        """Tareas en cola, en ejecución, completadas y fallidas."""
+
+        with self._lock:
+            return {
+                "en_cola": self._cola.qsize(),
+                "en_ejecucion": self._en_ejecucion,
+                "completadas": self._completadas,
+                "fallidas": self._fallidas,
+                "en_linea": self._en_linea,
+                "trabajadores": len(self._trabajadores),
+            }
+
+    def cerrar(self, esperar: bool = True, timeout: float | None = None) -> None:
+        """Deja de aceptar tareas y detiene los trabajadores."""
+
+        with self._lock:
+            if self._cerrado:
+                return
+            self._cerrado = True
+            trabajadores = list(self._trabajadores)
+        if esperar:
+            self.esperar_todas(timeout)
+        for _ in trabajadores:
+            try:
+                self._cola.put_nowait(_FIN)
+            except queue.Full:
+                break
+        if esperar:
+            for hilo in trabajadores:
+                if hilo is not threading.current_thread():
+                    hilo.join(timeout)
+
+
+_PLANIFICADOR: PlanificadorHilos | None = None
+_PLANIFICADOR_LOCK = threading.Lock()
+
+
+def obtener_planificador() -> PlanificadorHilos:
+    """Devuelve el planificador compartido por todos los intérpretes.
+
+    Los límites se leen de la sección ``[concurrencia]`` de ``cobra.toml``
+    (``max_hilos`` y ``max_hilos_en_cola``) la primera vez que se solicita.
+    """
+
+    global _PLANIFICADOR
+    with _PLANIFICADOR_LOCK:
+        if _PLANIFICADOR is None:
+            from .cobra_config import max_hilos, max_hilos_en_cola
+
+            _PLANIFICADOR = PlanificadorHilos(max_hilos(), max_hilos_en_cola())
+        return _PLANIFICADOR
+
+
+def metricas_hilos() -> dict[str, int]:
+    """Métricas del planificador compartido."""
+
+    return obtener_planificador().metricas()
@@ -0,0 +1,181 @@
+import threading
+
+from ..visitor import NodeVisitor
+from .cache import POLITICA_VERSION, VEREDICTOS, hash_estructural
+
+# Validadores con un recorrido en curso en el hilo actual (por ``id``).
+_ESTADO = threading.local()
+
+
+def _activos() -> set[int]:
+    activos = getattr(_ESTADO, "activos", None)
+    if activos is None:
+        activos = _ESTADO.activos = set()
+    return activos
+
+
+def _en_despacho() -> set[int]:
+    despacho = getattr(_ESTADO, "despacho", None)
+    if despacho is None:
+        despacho = _ESTADO.despacho = set()
+    return despacho
+
+
+class ValidadorBase(NodeVisitor):
+    """Validador base para componer una cadena de validadores.
+
+    Cuando un nodo se entrega a la cabeza de la cadena, los validadores
+    consecutivos que declaran ``despacho_unico`` se combinan en un único
+    recorrido del árbol: cada nodo se visita una vez y se despacha a todos
+    ellos. El resto de la cadena conserva el recorrido encadenado clásico.
+    Si todos los validadores exponen una :meth:`huella_politica`, el veredicto
+    favorable se memoriza por hash estructural del subárbol.
+    """
+
+    # El validador solo inspecciona nodos individuales y no depende del
+    # contexto de recorrido; puede combinarse en una pasada única.
+    despacho_unico = False
+    # Tipos de nodo cuyo veredicto depende de estado externo y no se cachea.
+    tipos_no_cacheables: frozenset[str] = frozenset()
+
+    def __init__(self):
+        self.siguiente = None
+
+    def set_siguiente(self, validador):
+        """Establece el siguiente validador en la cadena."""
+        self.siguiente = validador
+        return validador
+
+    def huella_politica(self):
+        """Devuelve una huella hashable de la política aplicada o ``None``.
+
+        ``None`` indica que los veredictos de este validador no pueden
+        reutilizarse (por ejemplo, porque emite efectos secundarios).
+        """
+        return None
+
+    def cadena(self):
+        """Devuelve la lista de validadores desde este hasta el final."""
+        validadores = []
+        vistos = set()
+        cursor = self
+        while cursor is not None and id(cursor) not in vistos:
+            vistos.add(id(cursor))
+            validadores.append(cursor)
+            cursor = getattr(cursor, "siguiente", None)
+        return validadores
+
+    def visit(self, node):
+        if id(self) in _activos():
+            return super().visit(node)
+        return self._validar_arbol(node)
+
+    def _validar_arbol(self, node):
+        cadena = self.cadena()
+        clave = self._clave_cache(cadena, node)
+        if clave is not None and VEREDICTOS.contiene(clave):
+            return None
+
+        combinables = []
+        for validador in cadena:
+            if not getattr(validador, "despacho_unico", False):
+                break
+            combinables.append(validador)
+
+        activos = _activos()
+        if combinables:
+            resto = cadena[len(combinables)] if len(combinables) < len(cadena) else None
+            self._recorrido_unico(combinables, node)
+            if resto is not None:
+                node.aceptar(resto)
+        else:
+            activos.add(id(self))
+            try:
+                NodeVisitor.visit(self, node)
+            finally:
+                activos.discard(id(self))
+
+        if clave is not None:
+            VEREDICTOS.registrar(clave)
+        return None
+
+    @staticmethod
+    def _clave_cache(cadena, node):
+        huellas = []
+        excluidos = set()
+        for validador in cadena:
+            huella_fn = getattr(validador, "huella_politica", None)
+            huella = huella_fn() if callable(huella_fn) else None
+            if huella is None:
+                return None
+            huellas.append(huella)
+            excluidos.update(getattr(validador, "tipos_no_cacheables", ()))
+        estructura = hash_estructural(node, excluidos)
+        if estructura is None:
+            return None
+        return estructura, (POLITICA_VERSION, tuple(huellas))
+
+    @staticmethod
+    def _recorrido_unico(validadores, raiz):
+        """Visita cada nodo una sola vez despachándolo a todos los validadores."""
+        activos = _activos()
+        despacho = _en_despacho()
+        ids = [id(validador) for validador in validadores]
+        activos.update(ids)
+        despacho.update(ids)
+        try:
+            visitados = set()
+            pila = [raiz]
+            while pila:
+                nodo = pila.pop()
+                if id(nodo) in visitados:
+                    continue
+                visitados.add(id(nodo))
+                for validador in validadores:
+                    NodeVisitor.visit(validador, nodo)
+                hijos = []
+                for atributo in getattr(nodo, "__dict__", {}).values():
+                    if isinstance(atributo, list):
+                        hijos.extend(e for e in atributo if hasattr(e, "aceptar"))
+                    elif hasattr(atributo, "aceptar"):
+                        hijos.append(atributo)
+                pila.extend(reversed(hijos))
+        finally:
+            activos.difference_update(ids)
+            despacho.difference_update(ids)
+
+    def delegar(self, nodo):
+        if id(self) in _en_despacho():
+            return
+        if self.siguiente is not None:
+            nodo.aceptar(self.siguiente)
+
+    def generic_visit(self, node, _visitados_ids=None):
+        if id(self) in _en_despacho():
+            # El recorrido lo realiza ``_recorrido_unico``.
+            return
+        restaurar_visitados = False
+        if _visitados_ids is None:
+            _visitados_ids = getattr(self, "_visitados_ids", None)
+        if _visitados_ids is None:
+            _visitados_ids = set()
+            restaurar_visitados = True
+
+        node_id = id(node)
+        if node_id in _visitados_ids:
+            return
+
+        _visitados_ids.add(node_id)
+        self._visitados_ids = _visitados_ids
+        try:
+            for atributo in getattr(node, "__dict__", {}).values():
+                if isinstance(atributo, list):
+                    for elem in atributo:
+                        if hasattr(elem, "aceptar"):
+                            elem.aceptar(self)
+                elif hasattr(atributo, "aceptar"):
+                    atributo.aceptar(self)
+            self.delegar(node)
+        finally:
+            if restaurar_visitados:
+                self._visitados_ids = None
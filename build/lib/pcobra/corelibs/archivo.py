@@ -0,0 +1,348 @@
+"""Funciones de manejo de archivos de texto.
+
+Además de leer y escribir archivos completos, el módulo ofrece primitivas en
+flujo para archivos grandes: :func:`iterar_lineas` y :func:`leer_bloques`
+recorren el contenido sin cargarlo entero, :func:`mapear_memoria` devuelve una
+vista de solo lectura proyectada en memoria y :func:`abrir_anexador` agrupa
+escrituras sucesivas en un único archivo abierto. Todas resuelven la ruta con
+el mismo sandbox que el resto del módulo.
+"""
+
+import mmap
+import os
+from pathlib import Path
+from typing import Iterator, Union
+
+PathLike = Union[str, os.PathLike[str]]
+EQUIVALENCIAS_SEMANTICAS_ARCHIVO: dict[str, str] = {
+    "open(...).read": "leer",
+    "open(...).write": "escribir",
+    "os.path.exists": "existe",
+    "os.remove": "eliminar",
+    "open(..., 'a')": "anexar",
+    "readlines": "leer_lineas",
+}
+
+def _es_ruta_absoluta_o_sensible_windows(ruta: PathLike) -> bool:
+    texto = str(ruta).strip()
+    if not texto:
+        return False
+    if texto.startswith("\\\\"):
+        return True
+    if len(texto) >= 2 and texto[1] == ":" and texto[0].isalpha():
+        return True
+    return False
+
+
+def _resolver_ruta(
+    ruta: PathLike, *, permitir_absoluta_dentro_base: bool = False
+) -> Path:
+    """Normaliza ``ruta`` dentro de un directorio permitido.
+
+    Se utiliza ``COBRA_IO_BASE_DIR`` como directorio base si está definido;
+    en caso contrario se emplea el directorio de trabajo actual. Si la ruta
+    resultante se sale de este directorio controlado, se genera un
+    ``ValueError``. Por defecto rechaza rutas absolutas para mantener la
+    política histórica de las corelibs; los clientes GUI pueden activar
+    ``permitir_absoluta_dentro_base`` para aceptar rutas absolutas que ya
+    resuelven dentro del mismo sandbox.
+    """
+
+    base = Path(os.environ.get("COBRA_IO_BASE_DIR") or Path.cwd()).resolve()
+    objetivo = Path(ruta).expanduser()
+    es_absoluta = objetivo.is_absolute() or _es_ruta_absoluta_o_sensible_windows(ruta)
+    if es_absoluta and not permitir_absoluta_dentro_base:
+        raise ValueError("Las rutas absolutas no están permitidas")
+    if ".." in objetivo.parts:
+        raise ValueError("La ruta no puede contener '..'")
+    destino = objetivo.resolve() if es_absoluta else (base / objetivo).resolve()
+    try:
+        destino.relative_to(base)
+    except ValueError as exc:
+        raise ValueError("La ruta queda fuera del directorio permitido") from exc
+    return destino
+
+
+def leer(ruta: PathLike) -> str:
+    """Devuelve el contenido de un archivo dentro del directorio permitido.
+
+    La ruta debe permanecer dentro de ``COBRA_IO_BASE_DIR`` (si existe) o del
+    directorio de trabajo actual. Se lanza ``ValueError`` si la ruta no es
+    válida.
+    """
+
+    ruta_segura = _resolver_ruta(ruta)
+    with ruta_segura.open("r", encoding="utf-8") as f:
+        return f.read()
+
+
+def escribir(ruta: PathLike, datos: str) -> None:
+    """Escribe ``datos`` en un archivo dentro del directorio permitido.
+
+    La ruta debe permanecer dentro de ``COBRA_IO_BASE_DIR`` (si existe) o del
+    directorio de trabajo actual. Se lanza ``ValueError`` si la ruta no es
+    válida.
+    """
+
+    ruta_segura = _resolver_ruta(ruta)
+    with ruta_segura.open("w", encoding="utf-8") as f:
+        f.write(datos)
+
+
+def existe(ruta: PathLike) -> bool:
+    """Indica si el archivo existe dentro del directorio permitido."""
+
+    try:
+        if not isinstance(ruta, str):
+            return False
+        destino = _resolver_ruta(ruta)
+        return destino.is_file()
+    except Exception:
+        # Mantiene el error encapsulado para no exponer tracebacks en REPL.
+        return False
+
+
+def eliminar(ruta: PathLike) -> None:
+    """Elimina un archivo dentro del directorio permitido."""
+
+    ruta_segura = _resolver_ruta(ruta) if not Path(ruta).is_absolute() else Path(ruta)
+    if ruta_segura.is_absolute():
+        base = Path(os.environ.get("COBRA_IO_BASE_DIR") or Path.cwd()).resolve()
+        destino = ruta_segura.resolve()
+        try:
+            destino.relative_to(base)
+        except ValueError as exc:
+            raise ValueError("La ruta queda fuera del directorio permitido") from exc
+        ruta_segura = destino
+    else:
+        ruta_segura = ruta_segura.resolve()
+    try:
+        ruta_segura.unlink(missing_ok=True)
+    except TypeError:
+        # Compatibilidad con versiones de Python anteriores a 3.8.
+        if ruta_segura.exists():
+            ruta_segura.unlink()
+
+
+
+def anexar(ruta: PathLike, datos: str) -> None:
+    """Agrega ``datos`` al final del archivo respetando el sandbox de rutas."""
+
+    ruta_segura = _resolver_ruta(ruta)
+    with ruta_segura.open("a", encoding="utf-8") as f:
+        f.write(datos)
+
+
+def leer_lineas(ruta: PathLike, *, mantener_saltos: bool = False) -> list[str]:
+    """Lee un archivo y devuelve sus líneas."""
+
+    contenido = leer(ruta)
+    return contenido.splitlines(keepends=mantener_saltos)
+
+
+def iterar_lineas(ruta: PathLike, *, mantener_saltos: bool = False) -> Iterator[str]:
+    """Recorre las líneas de un archivo de una en una sin cargarlo entero.
+
+    La ruta se valida al llamar; el archivo se abre al pedir la primera línea
+    y se cierra al agotar el iterador.
+    """
+
+    ruta_segura = _resolver_ruta(ruta)
+
+    def _lineas() -> Iterator[str]:
+        with ruta_segura.open("r", encoding="utf-8") as f:
+            for linea in f:
+                yield linea if mantener_saltos else linea.rstrip("\r\n")
+
+    return _lineas()
+
+
+def leer_bloques(
+    ruta: PathLike, tamano: int = 1024 * 1024, *, binario: bool = False
+) -> Iterator[Union[str, bytes]]:
+    """Recorre un archivo en bloques de ``tamano`` caracteres (o bytes con ``binario``)."""
+
+    if tamano < 1:
+        raise ValueError("tamano debe ser un entero positivo")
+    ruta_segura = _resolver_ruta(ruta)
+
+    def _bloques() -> Iterator[Union[str, bytes]]:
+        if binario:
+            f = ruta_segura.open("rb")
+        else:
+            f = ruta_segura.open("r", encoding="utf-8")
+        with f:
+            while True:
+                bloque = f.read(tamano)
+                if not bloque:
+                    return
+                yield bloque
+
+    return _bloques()
+
+
+class VistaArchivo:
+    """Vista de solo lectura de un archivo proyectado en memoria.
+
+    Se indexa y se corta como ``bytes`` sin copiar el archivo a memoria; el
+    sistema operativo carga solo las páginas que se tocan. Debe cerrarse con
+    :meth:`cerrar` o usarse como gestor de contexto.
+    """
+
+    def __init__(self, ruta: Path) -> None:
+        with ruta.open("rb") as f:
+            tamano = os.fstat(f.fileno()).st_size
+            # ``mmap`` no admite archivos vacíos.
+            self._mapa = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if tamano else None
+            )
+        self._cerrada = False
+
+    def _datos(self) -> Union[mmap.mmap, bytes]:
+        if self._cerrada:
+            raise ValueError("La vista del archivo está cerrada")
+        return self._mapa if self._mapa is not None else b""
+
+    def __len__(self) -> int:
+        return len(self._datos())
+
+    def __getitem__(self, indice: Union[int, slice]) -> Union[int, bytes]:
+        return self._datos()[indice]
+
+    def __enter__(self) -> "VistaArchivo":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.cerrar()
+
+    @property
+    def cerrada(self) -> bool:
+        return self._cerrada
+
+    def buscar(
+        self, subcadena: Union[str, bytes], inicio: int = 0, fin: Union[int, None] = None
+    ) -> int:
+        """Devuelve la posición en bytes de ``subcadena`` o ``-1``."""
+
+        if isinstance(subcadena, str):
+            subcadena = subcadena.encode("utf-8")
+        datos = self._datos()
+        return datos.find(subcadena, inicio, len(datos) if fin is None else fin)
+
+    def buscar_todas(self, subcadena: Union[str, bytes]) -> Iterator[int]:
+        """Produce la posición de cada aparición (sin solaparse) de ``subcadena``."""
+
+        if isinstance(subcadena, str):
+            subcadena = subcadena.encode("utf-8")
+        if not subcadena:
+            raise ValueError("subcadena no puede estar vacía")
+        posicion = self.buscar(subcadena)
+        while posicion != -1:
+            yield posicion
+            posicion = self.buscar(subcadena, posicion + len(subcadena))
+
+    def texto(self, inicio: int = 0, fin: Union[int, None] = None) -> str:
+        """Decodifica como UTF-8 el rango ``[inicio, fin)`` de la vista."""
+
+        return self._datos()[inicio:fin].decode("utf-8", errors="replace")
+
+    def cerrar(self) -> None:
+        if self._mapa is not None:
+            self._mapa.close()
+        self._cerrada = True
+
+
+def mapear_memoria(ruta: PathLike) -> VistaArchivo:
+    """Proyecta un archivo en memoria y devuelve una :class:`VistaArchivo`."""
+
+    return VistaArchivo(_resolver_ruta(ruta))
+
+
+class Anexador:
+    """Manejador que agrega texto al final de un archivo agrupando escrituras.
+
+    El archivo permanece abierto y los datos se acumulan hasta reunir
+    ``tamano_buffer`` caracteres, momento en que se escriben de una vez.
+    :meth:`vaciar` fuerza la escritura y :meth:`cerrar` vacía y cierra.
+    """
+
+    def __init__(self, ruta: Path, tamano_buffer: int) -> None:
+        self._archivo = ruta.open("a", encoding="utf-8")
+        self._tamano_buffer = tamano_buffer
+        self._pendiente: list[str] = []
+        self._acumulado = 0
+
+    def escribir(self, datos: str) -> None:
+        if self._archivo.closed:
+            raise ValueError("El anexador está cerrado")
+        if not isinstance(datos, str):
+            raise TypeError("datos debe ser texto")
+        self._pendiente.append(datos)
+        self._acumulado += len(datos)
+        if self._acumulado >= self._tamano_buffer:
+            self.vaciar()
+
+    def vaciar(self) -> None:
+        if self._pendiente:
+            self._archivo.write("".join(self._pendiente))
+            self._pendiente.clear()
+            self._acumulado = 0
+        self._archivo.flush()
+
+    def cerrar(self) -> None:
+        if self._archivo.closed:
+            return
+        try:
+            self.vaciar()
+        finally:
+            self._archivo.close()
+
+    @property
+    def cerrado(self) -> bool:
+        return self._archivo.closed
+
+    def __enter__(self) -> "Anexador":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.cerrar()
+
+    def __del__(self) -> None:
+        # Evita perder datos pendientes si el manejador no se cerró.
+        archivo = getattr(self, "_archivo", None)
+        if archivo is not None and not archivo.closed:
+            self.cerrar()
+
+
+def abrir_anexador(ruta: PathLike, *, tamano_buffer: int = 64 * 1024) -> Anexador:
+    """Abre ``ruta`` para agregar texto con escrituras agrupadas."""
+
+    if tamano_buffer < 1:
+        raise ValueError("tamano_buffer debe ser un entero positivo")
+    return Anexador(_resolver_ruta(ruta), tamano_buffer)
+
+
+__all__ = [
+    "leer",
+    "escribir",
+    "existe",
+    "eliminar",
+    "anexar",
+    "leer_lineas",
+    "iterar_lineas",
+    "leer_bloques",
+    "mapear_memoria",
+    "abrir_anexador",
+]
+
+PUBLIC_API_ARCHIVO: tuple[str, ...] = tuple(__all__)
+
+
+def _validar_superficie_publica_archivo() -> None:
+    if tuple(__all__) != PUBLIC_API_ARCHIVO:
+        raise RuntimeError(
+            "[STARTUP CONTRACT] archivo.__all__ debe exponer únicamente la API pública canónica de Cobra."
+        )
+
+
+_validar_superficie_publica_archivo()
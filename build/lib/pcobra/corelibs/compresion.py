@@ -0,0 +1,528 @@
+"""Utilidades de compresión para las corelibs de Cobra.
+
+La superficie pública de Cobra cubre archivos ZIP (:func:`crear_zip`,
+:func:`extraer_zip`, :func:`listar_zip`). Los miembros de un ZIP se comprimen
+en hilos auxiliares (``zlib`` libera el GIL) y se escriben en orden, y la
+extracción descomprime varios miembros a la vez. Desde Python también se
+ofrecen archivos tar en flujo (:func:`crear_tar`, :func:`extraer_tar`) y
+compresión de bytes o flujos sin archivos temporales
+(:func:`comprimir_bytes`, :func:`comprimir_flujo`...) con ``gzip``, ``bz2`` y
+``xz`` de la biblioteca estándar y ``zstd``/``lz4`` si ``zstandard`` o ``lz4``
+están instalados.
+"""
+
+from __future__ import annotations
+
+import bz2
+import collections
+import gzip
+import importlib
+import io
+import lzma
+import os
+import shutil
+import tarfile
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Any, BinaryIO
+from zipfile import ZIP64_LIMIT, ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
+
+PathLike = str | os.PathLike[str]
+
+__all__ = ["crear_zip", "extraer_zip", "listar_zip"]
+
+_NIVEL_ZIP_POR_DEFECTO = 6
+# Los miembros mayores se comprimen en flujo desde el hilo principal para no
+# retener su contenido completo en memoria.
+_MAX_MIEMBRO_EN_MEMORIA = 32 * 1024 * 1024
+_TAMANO_BLOQUE = 1024 * 1024
+_FORMATOS = ("gzip", "bz2", "xz", "zstd", "lz4")
+
+
+def _hilos_por_defecto(hilos: int | None) -> int:
+    if hilos is None:
+        return os.cpu_count() or 1
+    if hilos < 1:
+        raise ValueError("hilos debe ser un entero positivo")
+    return hilos
+
+
+def crear_zip(
+    destino: PathLike,
+    rutas: PathLike | list[PathLike] | tuple[PathLike, ...],
+    *,
+    base: PathLike | None = None,
+    nivel: int | None = None,
+    hilos: int | None = None,
+) -> list[str]:
+    """Crea un ZIP en ``destino`` con las rutas indicadas y devuelve sus nombres.
+
+    Cada ruta de ``rutas`` debe existir. Cuando ``base`` se proporciona, los
+    nombres dentro del ZIP se calculan de forma relativa a ese directorio; si
+    no se indica, se usa el directorio común de las rutas recibidas.
+
+    Los miembros se comprimen con *deflate* de nivel ``nivel`` (``0`` los
+    almacena sin comprimir, ``9`` comprime al máximo; por defecto ``6``)
+    repartidos entre ``hilos`` hilos, y se escriben en el mismo orden que en
+    modo secuencial.
+    """
+
+    rutas_normalizadas = _normalizar_rutas(rutas)
+    for ruta in rutas_normalizadas:
+        if not ruta.exists():
+            raise FileNotFoundError(f"La ruta a comprimir no existe: {ruta}")
+    nivel = _NIVEL_ZIP_POR_DEFECTO if nivel is None else nivel
+    if not 0 <= nivel <= 9:
+        raise ValueError("nivel debe estar entre 0 y 9")
+    hilos = _hilos_por_defecto(hilos)
+
+    base_resuelta = _resolver_base(rutas_normalizadas, base)
+    destino_zip = _validar_ruta(destino, "destino")
+    destino_zip.parent.mkdir(parents=True, exist_ok=True)
+
+    elementos = [
+        (elemento, _nombre_en_zip(elemento, base_resuelta))
+        for ruta in rutas_normalizadas
+        for elemento in _iterar_elementos_zip(ruta)
+    ]
+    tipo = ZIP_STORED if nivel == 0 else ZIP_DEFLATED
+
+    with ZipFile(
+        destino_zip, "w", compression=tipo, compresslevel=nivel
+    ) as archivo_zip:
+        if hilos == 1 or len(elementos) < 2:
+            for elemento, nombre in elementos:
+                archivo_zip.write(elemento, nombre)
+        else:
+            _escribir_zip_en_paralelo(archivo_zip, elementos, nivel, hilos)
+
+    return [nombre for _elemento, nombre in elementos]
+
+
+def _comprimir_miembro(ruta: Path, nivel: int) -> tuple[bytes, int, int]:
+    datos = ruta.read_bytes()
+    crc = zlib.crc32(datos)
+    if nivel == 0:
+        return datos, crc, len(datos)
+    compresor = zlib.compressobj(nivel, zlib.DEFLATED, -15)
+    return compresor.compress(datos) + compresor.flush(), crc, len(datos)
+
+
+def _escribir_precomprimido(archivo_zip: ZipFile, info: ZipInfo, datos: bytes) -> None:
+    # Replica lo que hace ``ZipFile.open(..., "w")`` pero con el CRC y los
+    # tamaños ya conocidos, de modo que no hace falta volver a comprimir.
+    zip64 = info.file_size > ZIP64_LIMIT or info.compress_size > ZIP64_LIMIT
+    info.flag_bits = 0
+    archivo_zip.fp.seek(archivo_zip.start_dir)
+    info.header_offset = archivo_zip.fp.tell()
+    archivo_zip._writecheck(info)
+    archivo_zip._didModify = True
+    archivo_zip.fp.write(info.FileHeader(zip64))
+    archivo_zip.fp.write(datos)
+    archivo_zip.filelist.append(info)
+    archivo_zip.NameToInfo[info.filename] = info
+    archivo_zip.start_dir = archivo_zip.fp.tell()
+
+
+def _escribir_zip_en_paralelo(
+    archivo_zip: ZipFile, elementos: list[tuple[Path, str]], nivel: int, hilos: int
+) -> None:
+    pendientes: collections.deque[tuple[Path, str, Future[Any] | None]] = (
+        collections.deque()
+    )
+    fuente = iter(elementos)
+    with ThreadPoolExecutor(max_workers=hilos) as ejecutor:
+
+        def _encolar() -> bool:
+            siguiente = next(fuente, None)
+            if siguiente is None:
+                return False
+            elemento, nombre = siguiente
+            futuro = None
+            if elemento.stat().st_size <= _MAX_MIEMBRO_EN_MEMORIA:
+                futuro = ejecutor.submit(_comprimir_miembro, elemento, nivel)
+            pendientes.append((elemento, nombre, futuro))
+            return True
+
+        # Se mantienen como mucho dos miembros por hilo en memoria.
+        while len(pendientes) < 2 * hilos and _encolar():
+            pass
+        while pendientes:
+            elemento, nombre, futuro = pendientes.popleft()
+            if futuro is None:
+                archivo_zip.write(elemento, nombre)
+            else:
+                datos, crc, tamano = futuro.result()
+                info = ZipInfo.from_file(elemento, nombre)
+                info.compress_type = ZIP_STORED if nivel == 0 else ZIP_DEFLATED
+                info.CRC = crc
+                info.file_size = tamano
+                info.compress_size = len(datos)
+                _escribir_precomprimido(archivo_zip, info, datos)
+            _encolar()
+
+
+def extraer_zip(
+    origen: PathLike, destino: PathLike, *, hilos: int | None = None
+) -> list[str]:
+    """Extrae ``origen`` en ``destino`` evitando path traversal.
+
+    Devuelve las rutas extraídas como cadenas. Cada miembro del ZIP se resuelve
+    contra el directorio destino y se rechaza si queda fuera de él; todos los
+    nombres se validan antes de escribir nada. Los miembros se descomprimen en
+    paralelo con ``hilos`` hilos.
+    """
+
+    origen_zip = _validar_ruta(origen, "origen")
+    if not origen_zip.exists():
+        raise FileNotFoundError(f"El ZIP de origen no existe: {origen_zip}")
+    hilos = _hilos_por_defecto(hilos)
+
+    destino_base = _validar_ruta(destino, "destino").resolve()
+    destino_base.mkdir(parents=True, exist_ok=True)
+
+    with ZipFile(origen_zip, "r") as archivo_zip:
+        miembros = [
+            (miembro, _ruta_segura_extraccion(destino_base, miembro.filename))
+            for miembro in archivo_zip.infolist()
+        ]
+        # Si un nombre se repite gana la última entrada, como en modo secuencial.
+        archivos: dict[Path, Any] = {}
+        for miembro, ruta_destino in miembros:
+            if miembro.is_dir():
+                ruta_destino.mkdir(parents=True, exist_ok=True)
+            else:
+                ruta_destino.parent.mkdir(parents=True, exist_ok=True)
+                archivos[ruta_destino] = miembro
+
+        def _extraer(ruta_destino: Path) -> None:
+            with (
+                archivo_zip.open(archivos[ruta_destino], "r") as origen_archivo,
+                ruta_destino.open("wb") as destino_archivo,
+            ):
+                shutil.copyfileobj(origen_archivo, destino_archivo, _TAMANO_BLOQUE)
+
+        if hilos == 1 or len(archivos) < 2:
+            for ruta_destino in archivos:
+                _extraer(ruta_destino)
+        else:
+            with ThreadPoolExecutor(max_workers=hilos) as ejecutor:
+                list(ejecutor.map(_extraer, archivos))
+
+    return [str(ruta_destino) for _miembro, ruta_destino in miembros]
+
+
+def listar_zip(origen: PathLike) -> list[str]:
+    """Devuelve la lista simple de nombres incluidos en ``origen``."""
+
+    origen_zip = _validar_ruta(origen, "origen")
+    if not origen_zip.exists():
+        raise FileNotFoundError(f"El ZIP de origen no existe: {origen_zip}")
+
+    with ZipFile(origen_zip, "r") as archivo_zip:
+        return archivo_zip.namelist()
+
+
+# -- Formatos de flujo ---------------------------------------------------------
+
+
+def _modulo_opcional(nombre: str, formato: str) -> Any:
+    try:
+        return importlib.import_module(nombre)
+    except ModuleNotFoundError as exc:
+        paquete = nombre.split(".")[0]
+        raise ModuleNotFoundError(
+            f"El formato '{formato}' requiere el paquete opcional '{paquete}'. "
+            f"Instálalo ejecutando 'pip install {paquete}'."
+        ) from exc
+
+
+def formatos_disponibles() -> tuple[str, ...]:
+    """Devuelve los formatos de compresión en flujo utilizables en este entorno."""
+
+    disponibles = []
+    for formato in _FORMATOS:
+        if formato == "zstd":
+            modulo = "zstandard"
+        elif formato == "lz4":
+            modulo = "lz4.frame"
+        else:
+            disponibles.append(formato)
+            continue
+        try:
+            importlib.import_module(modulo)
+        except ModuleNotFoundError:
+            continue
+        disponibles.append(formato)
+    return tuple(disponibles)
+
+
+def _validar_formato(formato: str) -> str:
+    if formato not in _FORMATOS:
+        raise ValueError(
+            f"Formato de compresión no soportado: {formato!r}; usa uno de {_FORMATOS}"
+        )
+    return formato
+
+
+def _abrir_escritura(formato: str, destino: BinaryIO, nivel: int | None) -> BinaryIO:
+    """Envuelve ``destino`` en un compresor; al cerrarlo no se cierra ``destino``."""
+
+    _validar_formato(formato)
+    if formato == "gzip":
+        return gzip.GzipFile(
+            fileobj=destino,
+            mode="wb",
+            compresslevel=9 if nivel is None else nivel,
+            mtime=0,
+        )
+    if formato == "bz2":
+        return bz2.BZ2File(destino, "wb", compresslevel=9 if nivel is None else nivel)
+    if formato == "xz":
+        return lzma.LZMAFile(destino, "wb", preset=nivel)
+    if formato == "zstd":
+        zstd = _modulo_opcional("zstandard", formato)
+        # ``threads=-1`` reparte la compresión entre todos los núcleos.
+        compresor = zstd.ZstdCompressor(level=3 if nivel is None else nivel, threads=-1)
+        return compresor.stream_writer(destino, closefd=False)
+    lz4_frame = _modulo_opcional("lz4.frame", formato)
+    return lz4_frame.LZ4FrameFile(
+        destino, "wb", compression_level=0 if nivel is None else nivel
+    )
+
+
+def _abrir_lectura(formato: str, origen: BinaryIO) -> BinaryIO:
+    _validar_formato(formato)
+    if formato == "gzip":
+        return gzip.GzipFile(fileobj=origen, mode="rb")
+    if formato == "bz2":
+        return bz2.BZ2File(origen, "rb")
+    if formato == "xz":
+        return lzma.LZMAFile(origen, "rb")
+    if formato == "zstd":
+        zstd = _modulo_opcional("zstandard", formato)
+        return zstd.ZstdDecompressor().stream_reader(origen, closefd=False)
+    lz4_frame = _modulo_opcional("lz4.frame", formato)
+    return lz4_frame.LZ4FrameFile(origen, "rb")
+
+
+def comprimir_flujo(
+    origen: BinaryIO,
+    destino: BinaryIO,
+    formato: str = "gzip",
+    *,
+    nivel: int | None = None,
+) -> int:
+    """Comprime ``origen`` en ``destino`` por bloques y devuelve los bytes leídos.
+
+    Ambos son objetos binarios tipo archivo y ninguno se cierra, de modo que
+    sirven sockets, tuberías o :class:`io.BytesIO` sin pasar por disco.
+    """
+
+    total = 0
+    with _abrir_escritura(formato, destino, nivel) as compresor:
+        while bloque := origen.read(_TAMANO_BLOQUE):
+            compresor.write(bloque)
+            total += len(bloque)
+    return total
+
+
+def descomprimir_flujo(
+    origen: BinaryIO, destino: BinaryIO, formato: str = "gzip"
+) -> int:
+    """Descomprime ``origen`` en ``destino`` por bloques y devuelve los bytes escritos."""
+
+    total = 0
+    with _abrir_lectura(formato, origen) as descompresor:
+        while bloque := descompresor.read(_TAMANO_BLOQUE):
+            destino.write(bloque)
+            total += len(bloque)
+    return total
+
+
+def comprimir_bytes(
+    datos: bytes, formato: str = "gzip", *, nivel: int | None = None
+) -> bytes:
+    """Comprime ``datos`` en memoria con ``formato``."""
+
+    destino = io.BytesIO()
+    comprimir_flujo(io.BytesIO(datos), destino, formato, nivel=nivel)
+    return destino.getvalue()
+
+
+def descomprimir_bytes(datos: bytes, formato: str = "gzip") -> bytes:
+    """Descomprime en memoria ``datos`` producidos con ``formato``."""
+
+    destino = io.BytesIO()
+    descomprimir_flujo(io.BytesIO(datos), destino, formato)
+    return destino.getvalue()
+
+
+def crear_tar(
+    destino: PathLike,
+    rutas: PathLike | list[PathLike] | tuple[PathLike, ...],
+    *,
+    base: PathLike | None = None,
+    compresion: str | None = "gzip",
+    nivel: int | None = None,
+) -> list[str]:
+    """Crea un archivo tar en flujo con ``compresion`` y devuelve sus nombres.
+
+    Los nombres se calculan como en :func:`crear_zip`. El tar se escribe de
+    forma secuencial a través del compresor sin archivos intermedios;
+    ``compresion=None`` produce un tar sin comprimir.
+    """
+
+    rutas_normalizadas = _normalizar_rutas(rutas)
+    for ruta in rutas_normalizadas:
+        if not ruta.exists():
+            raise FileNotFoundError(f"La ruta a comprimir no existe: {ruta}")
+    base_resuelta = _resolver_base(rutas_normalizadas, base)
+    destino_tar = _validar_ruta(destino, "destino")
+    destino_tar.parent.mkdir(parents=True, exist_ok=True)
+
+    nombres: list[str] = []
+    with destino_tar.open("wb") as archivo:
+        flujo = (
+            archivo
+            if compresion is None
+            else _abrir_escritura(compresion, archivo, nivel)
+        )
+        try:
+            with tarfile.open(fileobj=flujo, mode="w|") as archivo_tar:
+                for ruta in rutas_normalizadas:
+                    for elemento in _iterar_elementos_zip(ruta):
+                        nombre = _nombre_en_zip(elemento, base_resuelta)
+                        archivo_tar.add(elemento, arcname=nombre, recursive=False)
+                        nombres.append(nombre)
+        finally:
+            if flujo is not archivo:
+                flujo.close()
+    return nombres
+
+
+def extraer_tar(
+    origen: PathLike, destino: PathLike, *, compresion: str | None = "gzip"
+) -> list[str]:
+    """Extrae en flujo un tar creado con ``compresion`` evitando path traversal.
+
+    Cada miembro se valida con las mismas reglas que :func:`extraer_zip` y solo
+    se aceptan archivos regulares y directorios (nunca enlaces ni
+    dispositivos).
+    """
+
+    origen_tar = _validar_ruta(origen, "origen")
+    if not origen_tar.exists():
+        raise FileNotFoundError(f"El tar de origen no existe: {origen_tar}")
+    destino_base = _validar_ruta(destino, "destino").resolve()
+    destino_base.mkdir(parents=True, exist_ok=True)
+
+    rutas_extraidas: list[str] = []
+    with origen_tar.open("rb") as archivo:
+        flujo = archivo if compresion is None else _abrir_lectura(compresion, archivo)
+        try:
+            with tarfile.open(fileobj=flujo, mode="r|") as archivo_tar:
+                for miembro in archivo_tar:
+                    ruta_destino = _ruta_segura_extraccion(destino_base, miembro.name)
+                    if miembro.isdir():
+                        ruta_destino.mkdir(parents=True, exist_ok=True)
+                    elif miembro.isfile():
+                        ruta_destino.parent.mkdir(parents=True, exist_ok=True)
+                        contenido = archivo_tar.extractfile(miembro)
+                        assert contenido is not None
+                        with ruta_destino.open("wb") as destino_archivo:
+                            shutil.copyfileobj(
+                                contenido, destino_archivo, _TAMANO_BLOQUE
+                            )
+                    else:
+                        raise ValueError(
+                            f"Entrada tar no soportada (enlace o dispositivo): {miembro.name}"
+                        )
+                    rutas_extraidas.append(str(ruta_destino))
+        finally:
+            if flujo is not archivo:
+                flujo.close()
+    return rutas_extraidas
+
+
+def _normalizar_rutas(
+    rutas: PathLike | list[PathLike] | tuple[PathLike, ...],
+) -> list[Path]:
+    if isinstance(rutas, (str, os.PathLike)):
+        return [_validar_ruta(rutas, "rutas")]
+    if not isinstance(rutas, (list, tuple)):
+        raise TypeError("rutas debe ser una ruta o una lista/tupla de rutas")
+    return [
+        _validar_ruta(ruta, f"rutas[{indice}]") for indice, ruta in enumerate(rutas)
+    ]
+
+
+def _validar_ruta(ruta: PathLike, nombre_argumento: str) -> Path:
+    if not isinstance(ruta, (str, os.PathLike)):
+        raise TypeError(
+            f"{nombre_argumento} debe ser una ruta de texto o compatible con os.PathLike"
+        )
+    texto = os.fspath(ruta)
+    if not isinstance(texto, str):
+        raise TypeError(f"{nombre_argumento} debe representar una ruta de texto")
+    if texto == "":
+        raise ValueError(f"{nombre_argumento} no puede estar vacía")
+    return Path(texto)
+
+
+def _resolver_base(rutas: list[Path], base: PathLike | None) -> Path:
+    if not rutas:
+        raise ValueError("Debe indicarse al menos una ruta para comprimir")
+
+    if base is not None:
+        base_resuelta = _validar_ruta(base, "base").resolve()
+        if not base_resuelta.exists():
+            raise FileNotFoundError(f"La base no existe: {base_resuelta}")
+        if not base_resuelta.is_dir():
+            raise ValueError(f"La base debe ser un directorio: {base_resuelta}")
+    else:
+        padres = [ruta.resolve().parent for ruta in rutas]
+        base_resuelta = Path(os.path.commonpath(padres)).resolve()
+
+    for ruta in rutas:
+        try:
+            ruta.resolve().relative_to(base_resuelta)
+        except ValueError as exc:
+            raise ValueError(f"La ruta queda fuera de la base: {ruta}") from exc
+    return base_resuelta
+
+
+def _iterar_elementos_zip(ruta: Path) -> list[Path]:
+    if ruta.is_dir():
+        return sorted(
+            (elemento for elemento in ruta.rglob("*") if elemento.is_file()),
+            key=lambda p: str(p),
+        )
+    return [ruta]
+
+
+def _nombre_en_zip(ruta: Path, base: Path) -> str:
+    return ruta.resolve().relative_to(base).as_posix()
+
+
+def _ruta_segura_extraccion(destino_base: Path, nombre: str) -> Path:
+    nombre_normalizado = nombre.replace("\\", "/")
+    ruta_posix = PurePosixPath(nombre_normalizado)
+    if (
+        ruta_posix.is_absolute()
+        or ".." in ruta_posix.parts
+        or _parece_ruta_windows_absoluta(nombre_normalizado)
+    ):
+        raise ValueError(f"Entrada ZIP insegura fuera del destino: {nombre}")
+
+    ruta_destino = (destino_base / ruta_posix).resolve()
+    try:
+        ruta_destino.relative_to(destino_base)
+    except ValueError as exc:
+        raise ValueError(f"Entrada ZIP insegura fuera del destino: {nombre}") from exc
+    return ruta_destino
+
+
+def _parece_ruta_windows_absoluta(nombre: str) -> bool:
+    return len(nombre) >= 2 and nombre[1] == ":" and nombre[0].isalpha()
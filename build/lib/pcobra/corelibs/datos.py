@@ -0,0 +1,137 @@
+"""Módulo canónico ``datos`` para `usar`.
+
+Este puente mantiene el nombre público en español (`usar "datos"`) y reexpone
+la implementación oficial ubicada en ``pcobra.standard_library.datos`` mediante
+una whitelist explícita de símbolos Cobra.
+"""
+
+from pcobra.standard_library import datos as _datos
+
+EQUIVALENCIAS_SEMANTICAS_DATOS: dict[str, str] = {
+    "keys": "claves",
+    "values": "valores",
+    "len": "longitud",
+    "map": "mapear",
+    "filter": "filtrar",
+    "reduce": "reducir",
+    "merge": "combinar_tablas",
+    "pivot": "pivotar_tabla",
+}
+
+leer_csv = _datos.leer_csv
+leer_json = _datos.leer_json
+escribir_csv = _datos.escribir_csv
+escribir_json = _datos.escribir_json
+leer_excel = _datos.leer_excel
+escribir_excel = _datos.escribir_excel
+leer_parquet = _datos.leer_parquet
+escribir_parquet = _datos.escribir_parquet
+leer_feather = _datos.leer_feather
+escribir_feather = _datos.escribir_feather
+describir = _datos.describir
+correlacion_pearson = _datos.correlacion_pearson
+correlacion_spearman = _datos.correlacion_spearman
+matriz_covarianza = _datos.matriz_covarianza
+calcular_percentiles = _datos.calcular_percentiles
+resumen_rapido = _datos.resumen_rapido
+seleccionar_columnas = _datos.seleccionar_columnas
+filtrar = _datos.filtrar
+mutar_columna = _datos.mutar_columna
+separar_columna = _datos.separar_columna
+unir_columnas = _datos.unir_columnas
+agrupar_y_resumir = _datos.agrupar_y_resumir
+tabla_cruzada = _datos.tabla_cruzada
+pivotar_ancho = _datos.pivotar_ancho
+pivotar_largo = _datos.pivotar_largo
+ordenar_tabla = _datos.ordenar_tabla
+combinar_tablas = _datos.combinar_tablas
+rellenar_nulos = _datos.rellenar_nulos
+desplegar_tabla = _datos.desplegar_tabla
+pivotar_tabla = _datos.pivotar_tabla
+invertir_tabla = _datos.invertir_tabla
+tomar = _datos.tomar
+
+
+def agregar(tabla, fila):
+    """Wrapper público seguro hacia :mod:`pcobra.standard_library.datos`."""
+    return _datos.agregar(tabla, fila)
+
+
+def mapear(tabla, transformacion):
+    """Wrapper público seguro hacia :mod:`pcobra.standard_library.datos`."""
+    return _datos.mapear(tabla, transformacion)
+
+
+def longitud(valor):
+    """Wrapper público seguro hacia :mod:`pcobra.standard_library.datos`."""
+    return _datos.longitud(valor)
+
+
+def elemento(coleccion, indice):
+    """Wrapper público seguro hacia :mod:`pcobra.standard_library.datos`."""
+    return _datos.elemento(coleccion, indice)
+
+
+def filtrar(tabla, condicion):
+    """Wrapper público seguro hacia :mod:`pcobra.standard_library.datos`."""
+    return _datos.filtrar(tabla, condicion)
+
+
+reducir = _datos.reducir
+claves = _datos.claves
+valores = _datos.valores
+
+PUBLIC_API_DATOS: tuple[str, ...] = (
+    "leer_csv",
+    "leer_json",
+    "escribir_csv",
+    "escribir_json",
+    "leer_excel",
+    "escribir_excel",
+    "leer_parquet",
+    "escribir_parquet",
+    "leer_feather",
+    "escribir_feather",
+    "describir",
+    "correlacion_pearson",
+    "correlacion_spearman",
+    "matriz_covarianza",
+    "calcular_percentiles",
+    "resumen_rapido",
+    "seleccionar_columnas",
+    "filtrar",
+    "mutar_columna",
+    "separar_columna",
+    "unir_columnas",
+    "agrupar_y_resumir",
+    "tabla_cruzada",
+    "pivotar_ancho",
+    "pivotar_largo",
+    "ordenar_tabla",
+    "combinar_tablas",
+    "rellenar_nulos",
+    "desplegar_tabla",
+    "pivotar_tabla",
+    "agregar",
+    "mapear",
+    "reducir",
+    "claves",
+    "valores",
+    "longitud",
+    "elemento",
+    "invertir_tabla",
+    "tomar",
+)
+
+
+def _validar_superficie_publica_datos() -> None:
+    if tuple(__all__) != PUBLIC_API_DATOS:
+        raise RuntimeError(
+            "[STARTUP CONTRACT] datos.__all__ debe exponer únicamente la API pública canónica de Cobra."
+        )
+
+
+__all__ = list(PUBLIC_API_DATOS)
+
+
+_validar_superficie_publica_datos()
@@ -0,0 +1,295 @@
+"""Adaptador público de Holobit para `usar "holobit"`.
+
+Este módulo expone únicamente funciones serializables y compatibles con Cobra.
+No re-exporta clases ni símbolos internos del runtime de Holobit.
+"""
+
+import json
+import math
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from pcobra.core.holobits.graficar import graficar as _runtime_graficar
+from pcobra.core.holobits.holobit import Holobit as _runtime_holobit_tipo
+
+# Alias interno para compatibilidad de pruebas sin exponer SDK en la API pública.
+_SDKHolobit = _runtime_holobit_tipo
+
+EQUIVALENCIAS_SEMANTICAS_HOLOBIT: dict[str, str] = {
+    "new Holobit": "crear_holobit",
+    "validate": "validar_holobit",
+    "serialize": "serializar_holobit",
+    "deserialize": "deserializar_holobit",
+    "project": "proyectar",
+    "transform": "transformar",
+    "render": "graficar",
+}
+
+_SIMBOLOS_SDK_BLOQUEADOS = frozenset({"_SDKHolobit", "Holobit", "holobit_sdk"})
+
+
+class ErrorHolobit(ValueError):
+    """Error de dominio Cobra para operaciones de Holobit."""
+
+
+def _error_dominio(mensaje: str, *, causa: Exception | None = None) -> ErrorHolobit:
+    if causa is None:
+        return ErrorHolobit(mensaje)
+    return ErrorHolobit(mensaje)
+
+
+def _traducir_error_interno(operacion: str, exc: Exception) -> ErrorHolobit:
+    """Traduce errores internos/SDK a errores Cobra legibles sin fuga de internals."""
+    _ = exc
+    return _error_dominio(
+        f"No se pudo ejecutar la operación '{operacion}' de holobit en runtime Cobra"
+    )
+
+
+class _AdaptadorInternoHolobit:
+    """Encapsula acceso al runtime interno de Holobit sin exponer backend."""
+
+    @staticmethod
+    def crear_desde_valores(valores: list[float]) -> Any:
+        return _SDKHolobit(valores)
+
+    @staticmethod
+    def obtener_valores(hb: Any) -> list[float]:
+        return [float(v) for v in hb.valores]
+
+    @staticmethod
+    def graficar(hb: Any) -> str:
+        return _runtime_graficar(hb)
+
+
+
+
+def _es_json_primitivo(valor: Any) -> bool:
+    return valor is None or isinstance(valor, (str, int, float, bool))
+
+
+def _garantizar_json_estable(valor: Any) -> None:
+    if _es_json_primitivo(valor):
+        return
+    if isinstance(valor, list):
+        for item in valor:
+            _garantizar_json_estable(item)
+        return
+    if isinstance(valor, dict):
+        for clave, contenido in valor.items():
+            if not isinstance(clave, str):
+                raise TypeError("Las claves públicas de holobit deben ser texto JSON")
+            _garantizar_json_estable(contenido)
+        return
+    raise TypeError("La API pública de holobit solo permite estructuras JSON estables")
+
+def _es_numero(valor: Any) -> bool:
+    return isinstance(valor, (int, float)) and not isinstance(valor, bool)
+
+
+def _normalizar_valores(valores: Iterable[Any]) -> list[float]:
+    if isinstance(valores, (str, bytes)):
+        raise TypeError("'valores' debe ser una colección numérica, no texto")
+    salida: list[float] = []
+    for item in valores:
+        if not _es_numero(item):
+            raise TypeError("Todos los valores del holobit deben ser numéricos")
+        salida.append(float(item))
+    return salida
+
+
+def _a_estructura_cobra(hb: Any) -> dict[str, Any]:
+    estructura = {"tipo": "holobit", "valores": _AdaptadorInternoHolobit.obtener_valores(hb)}
+    _garantizar_json_estable(estructura)
+    return estructura
+
+
+def _rechazar_simbolos_sdk_en_estructura(valor: Any) -> None:
+    if isinstance(valor, str):
+        if valor in _SIMBOLOS_SDK_BLOQUEADOS:
+            raise TypeError("Estructura de holobit contiene símbolos internos no permitidos")
+        return
+    if isinstance(valor, dict):
+        for clave, contenido in valor.items():
+            _rechazar_simbolos_sdk_en_estructura(clave)
+            _rechazar_simbolos_sdk_en_estructura(contenido)
+        return
+    if isinstance(valor, Sequence) and not isinstance(valor, (str, bytes)):
+        for item in valor:
+            _rechazar_simbolos_sdk_en_estructura(item)
+
+
+def _validar_estructura_holobit(hb: Any) -> dict[str, Any]:
+    _garantizar_json_estable(hb)
+    _rechazar_simbolos_sdk_en_estructura(hb)
+    if not isinstance(hb, dict):
+        raise TypeError("El holobit debe ser un objeto tipo dict")
+    claves = set(hb.keys())
+    if claves != {"tipo", "valores"}:
+        raise TypeError("Las claves permitidas del holobit son exactamente: tipo, valores")
+    if hb["tipo"] != "holobit":
+        raise TypeError("La clave 'tipo' debe ser la cadena 'holobit'")
+    valores = hb["valores"]
+    if not isinstance(valores, Sequence) or isinstance(valores, (str, bytes)):
+        raise TypeError("La clave 'valores' debe ser una lista o secuencia numérica")
+    return hb
+
+
+def _desde_estructura_cobra(hb: dict[str, Any]) -> Any:
+    estructura = _validar_estructura_holobit(hb)
+    try:
+        return _AdaptadorInternoHolobit.crear_desde_valores(_normalizar_valores(estructura["valores"]))
+    except Exception as exc:  # pragma: no cover - defensivo frente al SDK
+        raise _error_dominio("No se pudo adaptar el holobit al runtime de Cobra", causa=exc) from None
+
+
+def crear_holobit(valores: Iterable[Any]) -> dict[str, Any]:
+    if valores is None:
+        raise TypeError("'valores' no puede ser None")
+    try:
+        interno = _AdaptadorInternoHolobit.crear_desde_valores(_normalizar_valores(valores))
+    except (TypeError, ValueError):
+        raise
+    except Exception as exc:  # pragma: no cover - defensivo frente al runtime interno
+        raise _traducir_error_interno("crear", exc) from None
+    return _a_estructura_cobra(interno)
+
+
+def validar_holobit(hb: Any) -> bool:
+    try:
+        _desde_estructura_cobra(hb)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def serializar_holobit(hb: dict[str, Any]) -> str:
+    try:
+        estructura_cobra = _a_estructura_cobra(_desde_estructura_cobra(hb))
+        _rechazar_simbolos_sdk_en_estructura(estructura_cobra)
+        return json.dumps(estructura_cobra, ensure_ascii=False)
+    except (TypeError, ValueError):
+        raise
+    except Exception as exc:  # pragma: no cover - defensivo frente al runtime interno
+        raise _traducir_error_interno("serializar", exc) from None
+
+
+def deserializar_holobit(payload: str) -> dict[str, Any]:
+    if not isinstance(payload, str):
+        raise TypeError("El payload de holobit debe ser texto JSON")
+    try:
+        datos = json.loads(payload)
+    except json.JSONDecodeError:
+        raise _error_dominio("El payload de holobit no es JSON válido") from None
+    _validar_estructura_holobit(datos)
+    return crear_holobit(datos["valores"])
+
+
+def proyectar(hb: dict[str, Any], modo: str) -> dict[str, Any]:
+    if not isinstance(modo, str):
+        raise TypeError("'modo' debe ser texto")
+    try:
+        interno = _desde_estructura_cobra(hb)
+    except (TypeError, ValueError):
+        raise
+    except Exception as exc:  # pragma: no cover - defensivo frente al runtime interno
+        raise _traducir_error_interno("proyectar", exc) from None
+    valores = list(interno.valores)
+    modo_norm = modo.strip().lower()
+    if modo_norm == "2d":
+        return crear_holobit(valores[:2])
+    if modo_norm == "3d":
+        return crear_holobit(valores[:3])
+    raise ValueError("Modo de proyección no soportado")
+
+
+def transformar(hb: dict[str, Any], operacion: str, *parametros: Any) -> dict[str, Any]:
+    if not isinstance(operacion, str):
+        raise TypeError("'operacion' debe ser texto")
+    try:
+        valores = list(_desde_estructura_cobra(hb).valores)
+    except (TypeError, ValueError):
+        raise
+    except Exception as exc:  # pragma: no cover - defensivo frente al runtime interno
+        raise _traducir_error_interno("transformar", exc) from None
+    op = operacion.strip().lower()
+    if op == "rotar":
+        if len(parametros) < 2:
+            raise ValueError("rotar requiere eje y ángulo")
+        eje = str(parametros[0]).strip().lower()
+        if not _es_numero(parametros[1]):
+            raise TypeError("El ángulo de rotación debe ser numérico")
+        angulo = float(parametros[1])
+        if eje != "z" or len(valores) < 2:
+            return crear_holobit(valores)
+        rad = math.radians(angulo)
+        x, y = valores[0], valores[1]
+        valores[0] = x * math.cos(rad) - y * math.sin(rad)
+        valores[1] = x * math.sin(rad) + y * math.cos(rad)
+        return crear_holobit(valores)
+
+    raise ValueError(f"Operacion no soportada: {operacion}")
+
+
+def graficar(hb: dict[str, Any]) -> str:
+    try:
+        vista = _AdaptadorInternoHolobit.graficar(_desde_estructura_cobra(hb))
+    except Exception as exc:  # pragma: no cover - defensivo frente al SDK
+        raise _error_dominio("No se pudo graficar el holobit en el runtime de Cobra", causa=exc) from None
+    if not isinstance(vista, str):
+        raise TypeError("La salida de graficar debe ser texto")
+    return vista
+
+
+def combinar(a: dict[str, Any], b: dict[str, Any]) -> dict[str, Any]:
+    try:
+        ha = _desde_estructura_cobra(a)
+        hb = _desde_estructura_cobra(b)
+    except (TypeError, ValueError):
+        raise
+    except Exception as exc:  # pragma: no cover - defensivo frente al runtime interno
+        raise _traducir_error_interno("combinar", exc) from None
+    return crear_holobit([*ha.valores, *hb.valores])
+
+
+def medir(hb: dict[str, Any]) -> dict[str, float | int]:
+    try:
+        interno = _desde_estructura_cobra(hb)
+    except (TypeError, ValueError):
+        raise
+    except Exception as exc:  # pragma: no cover - defensivo frente al runtime interno
+        raise _traducir_error_interno("medir", exc) from None
+    valores = interno.valores
+    magnitud = sum(v * v for v in valores) ** 0.5
+    salida = {"dimension": len(valores), "magnitud": float(magnitud)}
+    if not isinstance(salida["dimension"], int) or not _es_numero(salida["magnitud"]):
+        raise TypeError("Salida inválida de medir")
+    _garantizar_json_estable(salida)
+    return salida
+
+
+PUBLIC_API_HOLOBIT: tuple[str, ...] = (
+    "crear_holobit",
+    "validar_holobit",
+    "serializar_holobit",
+    "deserializar_holobit",
+    "proyectar",
+    "transformar",
+    "graficar",
+    "combinar",
+    "medir",
+)
+
+
+def _validar_superficie_publica_holobit() -> None:
+    exportados = tuple(__all__)
+    if exportados != PUBLIC_API_HOLOBIT:
+        raise RuntimeError(
+            "[STARTUP CONTRACT] holobit.__all__ debe exponer únicamente la API pública canónica de Cobra."
+        )
+
+
+__all__ = list(PUBLIC_API_HOLOBIT)
+
+
+_validar_superficie_publica_holobit()
@@ -0,0 +1,267 @@
+"""Funciones utilitarias para trabajar con expresiones regulares.
+
+Los patrones se compilan una sola vez y se guardan en una caché LRU acotada
+(:func:`estadisticas_cache` informa de aciertos y fallos), independiente de la
+caché interna de :mod:`re`, que es pequeña. :func:`compilar` devuelve un
+:class:`PatronCompilado` reutilizable cuyos métodos de lote
+(:meth:`PatronCompilado.filtrar`, :meth:`PatronCompilado.buscar_en_archivo`)
+recorren iterables o archivos línea a línea de forma perezosa.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import re
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from pcobra.corelibs.archivo import _resolver_ruta
+
+__all__ = [
+    "buscar",
+    "coincidir",
+    "reemplazar",
+    "dividir",
+    "encontrar_todos",
+    "compilar",
+]
+
+_Reemplazo = str | Callable[[re.Match[str]], str]
+_TAMANO_CACHE = 2048
+
+
+def _validar_texto(valor: str, nombre_argumento: str) -> str:
+    if not isinstance(valor, str):
+        raise TypeError(f"{nombre_argumento} debe ser texto")
+    return valor
+
+
+def _error_patron(exc: re.error) -> ValueError:
+    """Convierte errores de ``re`` en mensajes claros para Cobra."""
+
+    return ValueError(f"patrón de expresión regular inválido: {exc}")
+
+
+def _crear_cache(maximo: int) -> Callable[[str, int], re.Pattern[str]]:
+    @functools.lru_cache(maxsize=maximo)
+    def _compilar_en_cache(patron: str, flags: int) -> re.Pattern[str]:
+        try:
+            return re.compile(patron, flags)
+        except re.error as exc:
+            raise _error_patron(exc) from None
+
+    return _compilar_en_cache
+
+
+_compilar_en_cache = _crear_cache(_TAMANO_CACHE)
+
+
+def configurar_cache(maximo: int) -> None:
+    """Cambia el número máximo de patrones compilados retenidos y vacía la caché."""
+
+    global _compilar_en_cache
+    if maximo < 1:
+        raise ValueError("maximo debe ser un entero positivo")
+    _compilar_en_cache = _crear_cache(maximo)
+
+
+def limpiar_cache() -> None:
+    """Descarta los patrones compilados y reinicia las estadísticas."""
+
+    _compilar_en_cache.cache_clear()
+
+
+def estadisticas_cache() -> dict[str, int]:
+    """Devuelve ``aciertos``, ``fallos``, ``tamano`` y ``maximo`` de la caché."""
+
+    info = _compilar_en_cache.cache_info()
+    return {
+        "aciertos": info.hits,
+        "fallos": info.misses,
+        "tamano": info.currsize,
+        "maximo": info.maxsize or 0,
+    }
+
+
+def _expresion(patron: "str | PatronCompilado", flags: int) -> re.Pattern[str]:
+    if isinstance(patron, PatronCompilado):
+        if flags:
+            raise ValueError("flags no se admite con un patrón ya compilado")
+        return patron._regex
+    return _compilar_en_cache(_validar_texto(patron, "patron"), flags)
+
+
+def _grupo(coincidencia: re.Match[str] | None) -> str | None:
+    if coincidencia is None:
+        return None
+    return coincidencia.group(0)
+
+
+class PatronCompilado:
+    """Expresión regular compilada y reutilizable devuelta por :func:`compilar`.
+
+    Ofrece las mismas operaciones que las funciones del módulo sin volver a
+    validar ni buscar el patrón en cada llamada, más variantes por lotes que
+    procesan iterables o archivos de forma perezosa.
+    """
+
+    __slots__ = ("_regex",)
+
+    def __init__(self, regex: re.Pattern[str]) -> None:
+        self._regex = regex
+
+    @property
+    def patron(self) -> str:
+        return self._regex.pattern
+
+    @property
+    def flags(self) -> int:
+        return self._regex.flags
+
+    def __repr__(self) -> str:
+        return f"PatronCompilado({self._regex.pattern!r})"
+
+    def buscar(self, texto: str) -> str | None:
+        return _grupo(self._regex.search(_validar_texto(texto, "texto")))
+
+    def coincidir(self, texto: str) -> str | None:
+        return _grupo(self._regex.match(_validar_texto(texto, "texto")))
+
+    def reemplazar(self, reemplazo: _Reemplazo, texto: str, *, limite: int = 0) -> str:
+        try:
+            return self._regex.sub(reemplazo, _validar_texto(texto, "texto"), count=limite)
+        except re.error as exc:
+            raise _error_patron(exc) from None
+
+    def dividir(self, texto: str, *, maximo: int = 0) -> list[str]:
+        return self._regex.split(_validar_texto(texto, "texto"), maxsplit=maximo)
+
+    def encontrar_todos(self, texto: str) -> list[Any]:
+        return self._regex.findall(_validar_texto(texto, "texto"))
+
+    # -- lotes ----------------------------------------------------------------
+    def filtrar(self, lineas: Iterable[str], *, invertir: bool = False) -> Iterator[str]:
+        """Produce las líneas en las que aparece el patrón (o no, con ``invertir``)."""
+
+        buscar_en = self._regex.search
+        for linea in lineas:
+            if (buscar_en(linea) is None) is invertir:
+                yield linea
+
+    def buscar_todos(self, lineas: Iterable[str]) -> Iterator[str | None]:
+        """Aplica :meth:`buscar` a cada línea y produce los resultados en orden."""
+
+        buscar_en = self._regex.search
+        for linea in lineas:
+            coincidencia = buscar_en(linea)
+            yield None if coincidencia is None else coincidencia.group(0)
+
+    def reemplazar_todos(
+        self, reemplazo: _Reemplazo, lineas: Iterable[str], *, limite: int = 0
+    ) -> Iterator[str]:
+        """Aplica :meth:`reemplazar` a cada línea de forma perezosa."""
+
+        sustituir = self._regex.sub
+        for linea in lineas:
+            yield sustituir(reemplazo, linea, count=limite)
+
+    def buscar_en_archivo(
+        self, ruta: str | os.PathLike[str], *, codificacion: str = "utf-8"
+    ) -> Iterator[tuple[int, str]]:
+        """Produce ``(numero_linea, linea)`` por cada línea de ``ruta`` que coincide.
+
+        El archivo se lee línea a línea sin cargarlo entero y la ruta se
+        resuelve dentro del directorio permitido, como en
+        :mod:`pcobra.corelibs.archivo`. Las líneas se entregan sin el salto
+        final y se numeran desde 1.
+        """
+
+        ruta_segura = _resolver_ruta(ruta)
+        buscar_en = self._regex.search
+        with ruta_segura.open("r", encoding=codificacion, newline="") as archivo:
+            for numero, linea in enumerate(archivo, start=1):
+                linea = linea.rstrip("\r\n")
+                if buscar_en(linea) is not None:
+                    yield numero, linea
+
+
+def compilar(patron: str, *, flags: int = 0) -> PatronCompilado:
+    """Compila ``patron`` (usando la caché del módulo) y devuelve un objeto reutilizable."""
+
+    return PatronCompilado(_expresion(patron, flags))
+
+
+def buscar(patron: str, texto: str, *, flags: int = 0) -> str | None:
+    """Busca ``patron`` en ``texto`` y devuelve el texto coincidente o ``None``."""
+
+    regex = _expresion(patron, flags)
+    return _grupo(regex.search(_validar_texto(texto, "texto")))
+
+
+def coincidir(patron: str, texto: str, *, flags: int = 0) -> str | None:
+    """Comprueba si ``texto`` empieza con ``patron`` y devuelve la coincidencia."""
+
+    regex = _expresion(patron, flags)
+    return _grupo(regex.match(_validar_texto(texto, "texto")))
+
+
+def reemplazar(
+    patron: str,
+    reemplazo: _Reemplazo,
+    texto: str,
+    *,
+    limite: int = 0,
+    flags: int = 0,
+) -> str:
+    """Reemplaza coincidencias de ``patron`` en ``texto`` respetando ``limite``."""
+
+    regex = _expresion(patron, flags)
+    try:
+        return regex.sub(reemplazo, _validar_texto(texto, "texto"), count=limite)
+    except re.error as exc:
+        raise _error_patron(exc) from None
+
+
+def dividir(patron: str, texto: str, *, maximo: int = 0, flags: int = 0) -> list[str]:
+    """Divide ``texto`` usando ``patron`` como separador."""
+
+    regex = _expresion(patron, flags)
+    return regex.split(_validar_texto(texto, "texto"), maxsplit=maximo)
+
+
+def encontrar_todos(patron: str, texto: str, *, flags: int = 0) -> list[Any]:
+    """Devuelve una lista con todas las coincidencias de ``patron`` en ``texto``."""
+
+    regex = _expresion(patron, flags)
+    return list(regex.findall(_validar_texto(texto, "texto")))
+
+
+def filtrar_lineas(
+    patron: "str | PatronCompilado",
+    lineas: Iterable[str],
+    *,
+    flags: int = 0,
+    invertir: bool = False,
+) -> Iterator[str]:
+    """Versión por lotes de :func:`buscar`: produce las líneas que coinciden.
+
+    El patrón se compila al llamar, así que un patrón inválido falla de
+    inmediato aunque el iterador no llegue a consumirse.
+    """
+
+    return PatronCompilado(_expresion(patron, flags)).filtrar(lineas, invertir=invertir)
+
+
+def buscar_en_archivo(
+    patron: "str | PatronCompilado",
+    ruta: str | os.PathLike[str],
+    *,
+    flags: int = 0,
+    codificacion: str = "utf-8",
+) -> Iterator[tuple[int, str]]:
+    """Recorre ``ruta`` línea a línea y produce ``(numero_linea, linea)`` coincidentes."""
+
+    return PatronCompilado(_expresion(patron, flags)).buscar_en_archivo(
+        ruta, codificacion=codificacion
+    )
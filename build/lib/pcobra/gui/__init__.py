@@ -0,0 +1 @@
+"""Componentes de la interfaz gráfica de Cobra."""
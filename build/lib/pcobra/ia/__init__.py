@@ -0,0 +1 @@
+"""Herramientas experimentales de inteligencia artificial aplicadas a Cobra."""
@@ -0,0 +1 @@
+"""Servidor LSP sencillo basado en python-lsp-server."""
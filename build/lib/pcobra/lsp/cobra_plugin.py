@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+"""Plugin de completado para palabras clave y funciones estándar de Cobra."""
+
+import logging
+import re
+import threading
+from pathlib import Path
+
+try:
+    from pylsp import hookimpl, lsp  # type: ignore[import-not-found]
+except ModuleNotFoundError:  # pragma: no cover - dependencia opcional
+
+    def hookimpl(func=None, **_kwargs):  # type: ignore[no-redef]
+        """Decorador neutro cuando ``python-lsp-server`` no está presente."""
+
+        if func is None:
+            return lambda f: f
+        return func
+
+    class _DummyLSP:  # pragma: no cover - funcionalidad mínima
+        class DiagnosticSeverity:
+            Error = 1
+            Warning = 2
+
+        class CompletionItemKind:
+            Keyword = 14
+            Function = 3
+            Method = 2
+            Variable = 6
+            Class = 7
+
+        class SymbolKind:
+            Class = 5
+            Method = 6
+            Function = 12
+            Variable = 13
+
+    lsp = _DummyLSP()  # type: ignore[assignment]
+from pcobra.standard_library import __all__ as STD_FUNCS
+from pcobra.cobra.core import Lexer, LexerError
+from pcobra.cobra.core import Parser, ParserError
+from pcobra.cobra.cli.services.format_service import format_code_with_black
+from pcobra.lsp.diagnostics import DiagnosticsScheduler
+from pcobra.lsp.workspace_index import SimboloIndexado, WorkspaceIndex
+
+# Palabras reservadas más comunes de Cobra
+KEYWORDS = [
+    "func",
+    "clase",
+    "metodo",
+    "atributo",
+    "si",
+    "sino",
+    "sino si",
+    "elseif",
+    "para",
+    "mientras",
+    "y",
+    "o",
+    "no",
+    "romper",
+    "continuar",
+    "regresar",
+    "importar",
+    "intentar",
+    "excepto",
+    "fin",
+]
+
+# Funciones incluidas en la biblioteca estándar
+BUILTINS = list(STD_FUNCS) + ["imprimir"]
+
+
+def lint_lines(lines: list[str]):
+    """Devuelve diagnósticos básicos de estilo."""
+    diagnostics: list[dict] = []
+    for idx, line in enumerate(lines):
+        if line.rstrip() != line:
+            diagnostics.append(
+                {
+                    "source": "cobra-lint",
+                    "range": {
+                        "start": {"line": idx, "character": len(line.rstrip())},
+                        "end": {"line": idx, "character": len(line)},
+                    },
+                    "message": "Espacios en blanco al final de la línea",
+                    "severity": lsp.DiagnosticSeverity.Warning,
+                }
+            )
+        if "\t" in line:
+            col = line.index("\t")
+            diagnostics.append(
+                {
+                    "source": "cobra-lint",
+                    "range": {
+                        "start": {"line": idx, "character": col},
+                        "end": {"line": idx, "character": col + 1},
+                    },
+                    "message": "Usa espacios en lugar de tabulaciones",
+                    "severity": lsp.DiagnosticSeverity.Warning,
+                }
+            )
+        if len(line) > 79:
+            diagnostics.append(
+                {
+                    "source": "cobra-lint",
+                    "range": {
+                        "start": {"line": idx, "character": 79},
+                        "end": {"line": idx, "character": len(line)},
+                    },
+                    "message": "Línea supera los 79 caracteres",
+                    "severity": lsp.DiagnosticSeverity.Warning,
+                }
+            )
+    return diagnostics
+
+
+@hookimpl
+def pylsp_settings():
+    """Activa el plugin por defecto."""
+    return {"plugins": {"cobra": {"enabled": True}}}
+
+
+_INDICES: dict[str, WorkspaceIndex] = {}
+_INDICES_LOCK = threading.Lock()
+
+
+def _sincronizar_indice(indice: WorkspaceIndex) -> None:
+    try:
+        indice.sincronizar()
+        indice.guardar()
+    except Exception:  # pragma: no cover - registro defensivo
+        logging.exception("No se pudo sincronizar el índice de %s", indice.root)
+
+
+def _obtener_indice(workspace) -> WorkspaceIndex | None:
+    """Devuelve el índice del workspace, creándolo la primera vez.
+
+    El índice persistido se carga de inmediato y la sincronización con el
+    disco se realiza en segundo plano para no retrasar la primera petición.
+    """
+    root = getattr(workspace, "root_path", None)
+    if not root:
+        return None
+    with _INDICES_LOCK:
+        indice = _INDICES.get(root)
+        if indice is None:
+            indice = WorkspaceIndex(root)
+            indice.cargar()
+            _INDICES[root] = indice
+            threading.Thread(
+                target=_sincronizar_indice,
+                args=(indice,),
+                name="cobra-lsp-index",
+                daemon=True,
+            ).start()
+    return indice
+
+
+_KINDS_COMPLETADO = {
+    "funcion": "Function",
+    "clase": "Class",
+    "variable": "Variable",
+    "metodo": "Method",
+}
+
+
+def _kind(familia, tipo: str):
+    return getattr(familia, _KINDS_COMPLETADO.get(tipo, "Variable"))
+
+
+def _ubicacion(simbolo: SimboloIndexado) -> dict:
+    return {
+        "uri": Path(simbolo.ruta).as_uri(),
+        "range": {
+            "start": {"line": simbolo.linea, "character": simbolo.columna},
+            "end": {
+                "line": simbolo.linea,
+                "character": simbolo.columna + len(simbolo.nombre),
+            },
+        },
+    }
+
+
+def _simbolo_lsp(simbolo: SimboloIndexado) -> dict:
+    item = {
+        "name": simbolo.nombre,
+        "kind": _kind(lsp.SymbolKind, simbolo.tipo),
+        "location": _ubicacion(simbolo),
+    }
+    if simbolo.contenedor:
+        item["containerName"] = simbolo.contenedor
+    return item
+
+
+def _palabra_en(document, position) -> str:
+    line = document.lines[position["line"]]
+    col = position["character"]
+    antes = re.search(r"\w*$", line[:col])
+    despues = re.match(r"\w*", line[col:])
+    return (antes.group(0) if antes else "") + (despues.group(0) if despues else "")
+
+
+@hookimpl
+def pylsp_completions(config, workspace, document, position):
+    """Devuelve sugerencias de autocompletado para Cobra."""
+    line = document.lines[position["line"]]
+    prefix_match = re.search(r"\w*$", line[: position["character"]])
+    prefix = prefix_match.group(0) if prefix_match else ""
+
+    items = []
+    for word in KEYWORDS:
+        if word.startswith(prefix):
+            items.append(
+                {
+                    "label": word,
+                    "kind": lsp.CompletionItemKind.Keyword,
+                    "detail": "Palabra clave Cobra",
+                }
+            )
+    for func in BUILTINS:
+        if func.startswith(prefix):
+            items.append(
+                {
+                    "label": func,
+                    "kind": lsp.CompletionItemKind.Function,
+                    "detail": "Función estándar Cobra",
+                }
+            )
+    indice = _obtener_indice(workspace)
+    if indice is not None and prefix:
+        vistos = {item["label"] for item in items}
+        for simbolo in indice.completar(prefix):
+            if simbolo.nombre in vistos:
+                continue
+            vistos.add(simbolo.nombre)
+            items.append(
+                {
+                    "label": simbolo.nombre,
+                    "kind": _kind(lsp.CompletionItemKind, simbolo.tipo),
+                    "detail": f"{simbolo.tipo} en {Path(simbolo.ruta).name}",
+                }
+            )
+    return items or None
+
+
+@hookimpl
+def pylsp_definitions(config, workspace, document, position):
+    """Resuelve la declaración de un símbolo usando el índice del workspace."""
+    indice = _obtener_indice(workspace)
+    nombre = _palabra_en(document, position)
+    if indice is None or not nombre:
+        return []
+    return [_ubicacion(simbolo) for simbolo in indice.definiciones(nombre)]
+
+
+@hookimpl
+def pylsp_document_symbols(config, workspace, document):
+    """Lista los símbolos declarados en el documento actual."""
+    indice = _obtener_indice(workspace)
+    if indice is None:
+        return []
+    ruta = document.path
+    indice.actualizar(ruta, document.source)
+    return [_simbolo_lsp(simbolo) for simbolo in indice.simbolos_de(ruta)]
+
+
+def buscar_simbolos_workspace(workspace, query: str) -> list[dict]:
+    """Resuelve una consulta ``workspace/symbol`` sobre el índice."""
+    indice = _obtener_indice(workspace)
+    if indice is None:
+        return []
+    return [_simbolo_lsp(simbolo) for simbolo in indice.buscar(query)]
+
+
+def _reindexar_documento(workspace, document) -> None:
+    indice = _obtener_indice(workspace)
+    if indice is None:
+        return
+    indice.actualizar(document.path, document.source)
+    indice.guardar()
+
+
+@hookimpl
+def pylsp_document_did_open(config, workspace, document):
+    """Incorpora el documento abierto al índice del workspace."""
+    _reindexar_documento(workspace, document)
+
+
+@hookimpl
+def pylsp_document_did_save(config, workspace, document):
+    """Actualiza el índice con la versión guardada del documento."""
+    _reindexar_documento(workspace, document)
+
+
+def analizar_codigo(codigo: str) -> list[dict]:
+    """Ejecuta lexer, parser y linter sobre ``codigo`` y devuelve diagnósticos."""
+    diagnostics = []
+    parser: Parser | None = None
+    try:
+        tokens = Lexer(codigo).tokenizar()
+        parser = Parser(tokens)
+        parser.parsear()
+    except LexerError as exc:
+        line = getattr(exc, "linea", 1) - 1
+        col = getattr(exc, "columna", 1) - 1
+        diagnostics.append(
+            {
+                "source": "cobra",
+                "range": {
+                    "start": {"line": line, "character": col},
+                    "end": {"line": line, "character": col + 1},
+                },
+                "message": str(exc),
+                "severity": lsp.DiagnosticSeverity.Error,
+            }
+        )
+    except ParserError as exc:
+        token = parser.token_actual() if parser is not None else None
+        line = getattr(token, "linea", 1) - 1 if token else 0
+        col = getattr(token, "columna", 1) - 1 if token else 0
+        diagnostics.append(
+            {
+                "source": "cobra",
+                "range": {
+                    "start": {"line": line, "character": col},
+                    "end": {"line": line, "character": col + 1},
+                },
+                "message": str(exc),
+                "severity": lsp.DiagnosticSeverity.Error,
+            }
+        )
+
+    diagnostics.extend(lint_lines(codigo.splitlines()))
+    return diagnostics
+
+
+# Documentos con más líneas se analizan en segundo plano.
+SYNC_LINE_LIMIT = 400
+
+_SCHEDULER: DiagnosticsScheduler | None = None
+
+
+def _obtener_programador() -> DiagnosticsScheduler:
+    """Crea de forma diferida el planificador de diagnósticos compartido."""
+    global _SCHEDULER
+    if _SCHEDULER is None:
+        _SCHEDULER = DiagnosticsScheduler(analizar_codigo)
+    return _SCHEDULER
+
+
+def _publicador(workspace):
+    def publicar(uri, diagnostics, version):
+        workspace.publish_diagnostics(uri, diagnostics, doc_version=version)
+
+    return publicar
+
+
+@hookimpl
+def pylsp_diagnostics(config, workspace, document, **_args):
+    """Valida el documento y reporta errores de sintaxis.
+
+    Los documentos pequeños se analizan en línea; los grandes se delegan al
+    planificador, que publica el resultado cuando termina y mientras tanto
+    devuelve los diagnósticos de la última versión analizada.
+    """
+    codigo = document.source
+    uri = getattr(document, "uri", None) or getattr(document, "path", "")
+    version = getattr(document, "version", None)
+    scheduler = _obtener_programador()
+
+    if len(document.lines) <= SYNC_LINE_LIMIT or not hasattr(
+        workspace, "publish_diagnostics"
+    ):
+        return scheduler.analizar_ahora(uri, version, codigo)
+
+    return scheduler.programar(uri, version, codigo, _publicador(workspace))
+
+
+@hookimpl
+def pylsp_format_document(config, workspace, document):
+    """Formatea el archivo actual utilizando el formateador de Cobra."""
+    path = document.path
+    try:
+        if not format_code_with_black(path):
+            raise RuntimeError(f"Fallo de formateo con black para el documento {path}")
+        with open(path, "r", encoding="utf-8") as fh:
+            formatted = fh.read()
+    except Exception as exc:
+        logging.exception("Error al formatear el documento %s", path)
+        raise RuntimeError(
+            f"No se pudo formatear el documento {path}: {exc}"
+        ) from exc
+    return [
+        {
+            "range": {
+                "start": {"line": 0, "character": 0},
+                "end": {"line": len(document.lines), "character": 0},
+            },
+            "newText": formatted,
+        }
+    ]
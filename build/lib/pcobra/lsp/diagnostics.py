@@ -0,0 +1,250 @@
+"""Planificador de diagnósticos en segundo plano para el plugin LSP de Cobra.
+
+El análisis léxico y sintáctico de documentos grandes puede tardar lo
+suficiente como para bloquear el hilo del servidor. ``DiagnosticsScheduler``
+agrupa las notificaciones de cada documento (debounce), descarta ejecuciones
+obsoletas cuando llega una versión más nueva, realiza el análisis en un hilo
+de trabajo y conserva en caché el resultado de cada versión.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+LOGGER = logging.getLogger(__name__)
+
+Diagnosticos = list[dict[str, Any]]
+Analizador = Callable[[str], Diagnosticos]
+Publicador = Callable[[str, Diagnosticos, Any], None]
+
+DEFAULT_DEBOUNCE_SECONDS = 0.3
+DEFAULT_MAX_DOCUMENTS = 128
+
+
+def huella_contenido(source: str) -> str:
+    """Devuelve un hash estable del contenido de un documento."""
+
+    return hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass
+class _EstadoDocumento:
+    generacion: int = 0
+    version: Any = None
+    huella: str | None = None
+    diagnosticos: Diagnosticos = field(default_factory=list)
+    huella_calculada: str | None = None
+    version_calculada: Any = None
+    temporizador: threading.Timer | None = None
+    futuro: Future | None = None
+
+
+class DiagnosticsScheduler:
+    """Coordina diagnósticos por documento con debounce y cancelación.
+
+    Args:
+        analizar: Función que recibe el código fuente y devuelve diagnósticos.
+        debounce: Segundos de espera antes de lanzar el análisis de un documento.
+        max_workers: Hilos de trabajo dedicados al análisis.
+        max_documentos: Documentos cuyo estado se conserva en caché (LRU).
+    """
+
+    def __init__(
+        self,
+        analizar: Analizador,
+        *,
+        debounce: float = DEFAULT_DEBOUNCE_SECONDS,
+        max_workers: int = 1,
+        max_documentos: int = DEFAULT_MAX_DOCUMENTS,
+    ) -> None:
+        self._analizar = analizar
+        self._debounce = max(0.0, float(debounce))
+        self._max_documentos = max(1, int(max_documentos))
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, int(max_workers)),
+            thread_name_prefix="cobra-lsp-diag",
+        )
+        self._estados: OrderedDict[str, _EstadoDocumento] = OrderedDict()
+        self._lock = threading.Lock()
+        self._cerrado = False
+
+    def _estado(self, uri: str) -> _EstadoDocumento:
+        estado = self._estados.get(uri)
+        if estado is None:
+            estado = _EstadoDocumento()
+            self._estados[uri] = estado
+            while len(self._estados) > self._max_documentos:
+                _, expulsado = self._estados.popitem(last=False)
+                self._cancelar_pendientes(expulsado)
+        else:
+            self._estados.move_to_end(uri)
+        return estado
+
+    @staticmethod
+    def _cancelar_pendientes(estado: _EstadoDocumento) -> None:
+        if estado.temporizador is not None:
+            estado.temporizador.cancel()
+            estado.temporizador = None
+        if estado.futuro is not None:
+            estado.futuro.cancel()
+            estado.futuro = None
+
+    def cached(self, uri: str, source: str) -> Diagnosticos | None:
+        """Devuelve los diagnósticos en caché si corresponden a ``source``."""
+
+        huella = huella_contenido(source)
+        with self._lock:
+            estado = self._estados.get(uri)
+            if estado is not None and estado.huella_calculada == huella:
+                return list(estado.diagnosticos)
+        return None
+
+    def analizar_ahora(self, uri: str, version: Any, source: str) -> Diagnosticos:
+        """Analiza ``source`` de forma síncrona reutilizando la caché."""
+
+        previos = self.cached(uri, source)
+        if previos is not None:
+            return previos
+        diagnosticos = self._analizar(source)
+        huella = huella_contenido(source)
+        with self._lock:
+            estado = self._estado(uri)
+            self._cancelar_pendientes(estado)
+            estado.generacion += 1
+            estado.version = version
+            estado.huella = huella
+            self._guardar(estado, version, huella, diagnosticos)
+        return list(diagnosticos)
+
+    def programar(
+        self, uri: str, version: Any, source: str, publicar: Publicador
+    ) -> Diagnosticos:
+        """Programa el análisis de ``source`` y devuelve el último resultado.
+
+        Si la versión ya está calculada se devuelve directamente. En otro caso
+        se cancela cualquier ejecución pendiente del documento, se arranca un
+        temporizador de debounce y, al terminar el análisis, ``publicar`` recibe
+        ``(uri, diagnosticos, version)`` solo si ninguna versión más nueva
+        llegó entretanto. Mientras tanto se devuelven los diagnósticos de la
+        última versión analizada.
+        """
+
+        huella = huella_contenido(source)
+        with self._lock:
+            if self._cerrado:
+                return []
+            estado = self._estado(uri)
+            if estado.huella_calculada == huella:
+                return list(estado.diagnosticos)
+            if estado.huella == huella and (
+                estado.temporizador is not None or estado.futuro is not None
+            ):
+                return list(estado.diagnosticos)
+            self._cancelar_pendientes(estado)
+            estado.generacion += 1
+            estado.version = version
+            estado.huella = huella
+            generacion = estado.generacion
+            temporizador = threading.Timer(
+                self._debounce,
+                self._lanzar,
+                args=(uri, generacion, version, source, huella, publicar),
+            )
+            temporizador.daemon = True
+            estado.temporizador = temporizador
+            anteriores = list(estado.diagnosticos)
+        temporizador.start()
+        return anteriores
+
+    def _vigente(self, uri: str, generacion: int) -> _EstadoDocumento | None:
+        estado = self._estados.get(uri)
+        if estado is None or estado.generacion != generacion or self._cerrado:
+            return None
+        return estado
+
+    def _lanzar(
+        self,
+        uri: str,
+        generacion: int,
+        version: Any,
+        source: str,
+        huella: str,
+        publicar: Publicador,
+    ) -> None:
+        with self._lock:
+            estado = self._vigente(uri, generacion)
+            if estado is None:
+                return
+            estado.temporizador = None
+            futuro = self._executor.submit(self._trabajar, uri, generacion, source)
+            estado.futuro = futuro
+        futuro.add_done_callback(
+            lambda fut: self._completar(fut, uri, generacion, version, huella, publicar)
+        )
+
+    def _trabajar(self, uri: str, generacion: int, source: str) -> Diagnosticos | None:
+        with self._lock:
+            if self._vigente(uri, generacion) is None:
+                return None
+        return self._analizar(source)
+
+    def _completar(
+        self,
+        futuro: Future,
+        uri: str,
+        generacion: int,
+        version: Any,
+        huella: str,
+        publicar: Publicador,
+    ) -> None:
+        if futuro.cancelled():
+            return
+        try:
+            diagnosticos = futuro.result()
+        except Exception:  # pragma: no cover - registro defensivo
+            LOGGER.exception("Fallo al calcular diagnósticos de %s", uri)
+            return
+        if diagnosticos is None:
+            return
+        with self._lock:
+            estado = self._vigente(uri, generacion)
+            if estado is None:
+                return
+            estado.futuro = None
+            self._guardar(estado, version, huella, diagnosticos)
+        try:
+            publicar(uri, list(diagnosticos), version)
+        except Exception:  # pragma: no cover - registro defensivo
+            LOGGER.exception("No se pudieron publicar los diagnósticos de %s", uri)
+
+    @staticmethod
+    def _guardar(
+        estado: _EstadoDocumento, version: Any, huella: str, diagnosticos: Diagnosticos
+    ) -> None:
+        estado.diagnosticos = list(diagnosticos)
+        estado.huella_calculada = huella
+        estado.version_calculada = version
+
+    def olvidar(self, uri: str) -> None:
+        """Cancela el trabajo pendiente y descarta la caché de ``uri``."""
+
+        with self._lock:
+            estado = self._estados.pop(uri, None)
+            if estado is not None:
+                self._cancelar_pendientes(estado)
+
+    def cerrar(self) -> None:
+        """Cancela todo el trabajo pendiente y detiene los hilos de trabajo."""
+
+        with self._lock:
+            self._cerrado = True
+            for estado in self._estados.values():
+                self._cancelar_pendientes(estado)
+            self._estados.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,314 @@
+"""Representación columnar de tablas para :mod:`pcobra.standard_library.datos`.
+
+Las funciones de ``datos`` operan sobre listas de diccionarios, lo que obliga a
+copiar cada fila en cada paso. :class:`TablaColumnar` guarda cada columna como
+un arreglo contiguo (``numpy.ndarray`` cuando NumPy real está disponible,
+``array.array`` para columnas numéricas homogéneas en otro caso y ``list`` para
+el resto) y solo materializa diccionarios cuando el llamador los solicita.
+Las tablas leídas de Parquet o Feather conservan las columnas de Arrow tal
+cual (:meth:`TablaColumnar.desde_arrow`); los cálculos numéricos obtienen de
+ellas vistas NumPy sin copia mediante :func:`como_numpy`.
+
+Las columnas son rectangulares: una clave ausente en una fila de origen se
+representa con ``None``.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+
+from pcobra._stubs.compat import import_optional_module
+
+np = import_optional_module("numpy", safe_stub=True)
+
+# El stub de NumPy del repositorio no implementa arreglos reales.
+NUMPY_DISPONIBLE = getattr(np, "__name__", "") == "numpy"
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+__all__ = ["TablaColumnar", "NUMPY_DISPONIBLE", "es_columnar"]
+
+
+def construir_columna(valores: Iterable[Any]) -> Any:
+    """Devuelve el almacenamiento más compacto que conserva ``valores``.
+
+    Las columnas enteras o flotantes sin nulos se guardan en un arreglo
+    tipado; cualquier otra combinación se conserva como ``list``.
+    """
+
+    if (
+        isinstance(valores, array)
+        or (NUMPY_DISPONIBLE and isinstance(valores, np.ndarray))
+        or es_arrow(valores)
+    ):
+        return valores
+    lista = valores if isinstance(valores, list) else list(valores)
+    if not lista:
+        return lista
+    # Mezclar enteros y flotantes cambiaría el tipo de los enteros al volver a
+    # objetos Python, así que solo se tipan columnas homogéneas.
+    tipo = type(lista[0])
+    if tipo not in (int, float):
+        return lista
+    for valor in lista:
+        if type(valor) is not tipo:
+            return lista
+        if tipo is int and not _INT64_MIN <= valor <= _INT64_MAX:
+            return lista
+    if NUMPY_DISPONIBLE:
+        return np.asarray(lista, dtype=np.int64 if tipo is int else np.float64)
+    return array("q" if tipo is int else "d", lista)
+
+
+def es_arrow(columna: Any) -> bool:
+    """Indica si ``columna`` es un arreglo de ``pyarrow`` (sin importarlo)."""
+
+    return type(columna).__module__.startswith("pyarrow")
+
+
+def _arrow_numerica(columna: Any) -> bool:
+    import pyarrow as pa  # type: ignore[import-not-found]
+
+    return pa.types.is_integer(columna.type) or pa.types.is_floating(columna.type)
+
+
+def como_numpy(columna: Any, *, omitir_nulos: bool = False) -> Any:
+    """Devuelve una vista NumPy de una columna numérica o ``None``.
+
+    Los arreglos NumPy enteros o flotantes se devuelven tal cual. Las columnas
+    de Arrow de un solo fragmento y sin nulos se exponen sin copiar el búfer;
+    con ``omitir_nulos`` también se aceptan columnas con nulos, descartándolos.
+    """
+
+    if not NUMPY_DISPONIBLE:
+        return None
+    if isinstance(columna, np.ndarray):
+        return columna if columna.dtype.kind in "if" else None
+    if not es_arrow(columna) or not _arrow_numerica(columna):
+        return None
+    if columna.null_count:
+        if not omitir_nulos:
+            return None
+        columna = columna.drop_null()
+    arreglo = columna.to_numpy()
+    return arreglo if arreglo.dtype.kind in "if" else None
+
+
+def es_arreglo_numerico(columna: Any) -> bool:
+    """Indica si ``columna`` usa almacenamiento numérico tipado."""
+
+    return isinstance(columna, array) or (
+        NUMPY_DISPONIBLE and isinstance(columna, np.ndarray) and columna.dtype.kind in "if"
+    )
+
+
+def a_lista(columna: Any) -> list[Any]:
+    """Convierte un almacenamiento de columna en una lista de objetos Python."""
+
+    if isinstance(columna, list):
+        return columna
+    if es_arrow(columna):
+        return columna.to_pylist()
+    return columna.tolist()
+
+
+def tomar_posiciones(columna: Any, indices: Sequence[int]) -> Any:
+    """Devuelve los valores de ``columna`` en ``indices`` (``-1`` produce ``None``)."""
+
+    if NUMPY_DISPONIBLE and isinstance(columna, np.ndarray):
+        posiciones = np.asarray(indices, dtype=np.int64)
+        if posiciones.size == 0 or posiciones.min() >= 0:
+            return columna[posiciones]
+    if es_arrow(columna) and all(i >= 0 for i in indices):
+        return columna.take(list(indices))
+    fuente = a_lista(columna)
+    return construir_columna([fuente[i] if i >= 0 else None for i in indices])
+
+
+def _valor(columna: Any, indice: int) -> Any:
+    if NUMPY_DISPONIBLE and isinstance(columna, np.ndarray):
+        return columna[indice].item()
+    if es_arrow(columna):
+        return columna[indice].as_py()
+    return columna[indice]
+
+
+def es_columnar(valor: Any) -> bool:
+    return isinstance(valor, TablaColumnar)
+
+
+class TablaColumnar:
+    """Tabla almacenada por columnas.
+
+    Se comporta como una secuencia de filas (``len``, iteración e indexación
+    devuelven diccionarios nuevos), de modo que cualquier función de
+    :mod:`pcobra.standard_library.datos` la acepta. Las operaciones que tienen
+    ruta columnar devuelven a su vez una :class:`TablaColumnar`.
+    """
+
+    __slots__ = ("_datos", "_longitud")
+
+    def __init__(self, columnas: Mapping[str, Iterable[Any]] | None = None) -> None:
+        datos: dict[str, Any] = {}
+        longitud: int | None = None
+        for nombre, valores in (columnas or {}).items():
+            columna = construir_columna(valores)
+            if longitud is None:
+                longitud = len(columna)
+            elif len(columna) != longitud:
+                raise ValueError("Todas las columnas deben tener la misma longitud")
+            datos[nombre] = columna
+        self._datos = datos
+        self._longitud = longitud or 0
+
+    @classmethod
+    def _desde_almacenamiento(cls, datos: dict[str, Any], longitud: int) -> "TablaColumnar":
+        tabla = cls.__new__(cls)
+        tabla._datos = datos
+        tabla._longitud = longitud
+        return tabla
+
+    @classmethod
+    def desde_filas(cls, filas: Iterable[Mapping[str, Any]]) -> "TablaColumnar":
+        """Construye la tabla a partir de diccionarios fila a fila."""
+
+        if isinstance(filas, TablaColumnar):
+            return filas
+        valores: dict[str, list[Any]] = {}
+        longitud = 0
+        for fila in filas:
+            if not isinstance(fila, Mapping):
+                raise TypeError("Las filas deben ser diccionarios")
+            for columna in fila:
+                if columna not in valores:
+                    valores[columna] = [None] * longitud
+            for columna, destino in valores.items():
+                destino.append(fila.get(columna))
+            longitud += 1
+        return cls._desde_almacenamiento(
+            {nombre: construir_columna(lista) for nombre, lista in valores.items()},
+            longitud,
+        )
+
+    @classmethod
+    def desde_arrow(cls, tabla: Any) -> "TablaColumnar":
+        """Envuelve una ``pyarrow.Table`` sin copiar sus búferes."""
+
+        return cls._desde_almacenamiento(
+            {nombre: tabla.column(nombre) for nombre in tabla.column_names},
+            tabla.num_rows,
+        )
+
+    def a_arrow(self) -> Any:
+        """Convierte la tabla en ``pyarrow.Table`` sin pasar por filas.
+
+        Las columnas de Arrow y los arreglos NumPy numéricos se reutilizan sin
+        copia; el resto se convierte columna a columna.
+        """
+
+        import pyarrow as pa  # type: ignore[import-not-found]
+
+        columnas = {}
+        for nombre, columna in self._datos.items():
+            if isinstance(columna, array):
+                columna = a_lista(columna)
+            columnas[nombre] = columna if es_arrow(columna) else pa.array(columna)
+        return pa.table(columnas)
+
+    # -- acceso -------------------------------------------------------------
+    @property
+    def columnas(self) -> list[str]:
+        return list(self._datos)
+
+    def __len__(self) -> int:
+        return self._longitud
+
+    def __contains__(self, columna: object) -> bool:
+        return columna in self._datos
+
+    def almacenamiento(self, columna: str) -> Any:
+        """Devuelve el arreglo subyacente de ``columna`` sin copiarlo."""
+
+        return self._datos[columna]
+
+    def columna(self, nombre: str) -> list[Any]:
+        """Devuelve los valores de ``nombre`` como lista de objetos Python."""
+
+        return list(a_lista(self._datos[nombre]))
+
+    def a_listas(self) -> dict[str, list[Any]]:
+        return {nombre: self.columna(nombre) for nombre in self._datos}
+
+    def filas(self) -> Iterator[dict[str, Any]]:
+        """Genera cada fila como un diccionario nuevo."""
+
+        nombres = list(self._datos)
+        listas = [a_lista(self._datos[nombre]) for nombre in nombres]
+        for valores in zip(*listas):
+            yield dict(zip(nombres, valores))
+        if not nombres:
+            for _ in range(self._longitud):
+                yield {}
+
+    def a_filas(self) -> list[dict[str, Any]]:
+        return list(self.filas())
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return self.filas()
+
+    def __getitem__(self, indice: int | slice) -> Any:
+        if isinstance(indice, slice):
+            return self.tomar_indices(range(self._longitud)[indice])
+        if indice < 0:
+            indice += self._longitud
+        if not 0 <= indice < self._longitud:
+            raise IndexError("índice fuera de rango")
+        return {nombre: _valor(col, indice) for nombre, col in self._datos.items()}
+
+    def __eq__(self, otro: object) -> bool:
+        if isinstance(otro, TablaColumnar):
+            return self.columnas == otro.columnas and self.a_listas() == otro.a_listas()
+        if isinstance(otro, list):
+            return self.a_filas() == otro
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"TablaColumnar(filas={self._longitud}, columnas={self.columnas!r})"
+
+    # -- transformaciones ---------------------------------------------------
+    def seleccionar(self, columnas: Sequence[str]) -> "TablaColumnar":
+        """Proyecta ``columnas`` sin copiar sus arreglos."""
+
+        datos = {}
+        for columna in columnas:
+            if columna not in self._datos:
+                raise KeyError(columna)
+            datos[columna] = self._datos[columna]
+        return self._desde_almacenamiento(datos, self._longitud)
+
+    def tomar_indices(self, indices: Sequence[int]) -> "TablaColumnar":
+        """Reordena o filtra filas por posición (``-1`` produce una fila nula)."""
+
+        indices = list(indices)
+        datos = {
+            nombre: tomar_posiciones(columna, indices)
+            for nombre, columna in self._datos.items()
+        }
+        return self._desde_almacenamiento(datos, len(indices))
+
+    def filtrar_mascara(self, mascara: Sequence[bool]) -> "TablaColumnar":
+        return self.tomar_indices([i for i, conservar in enumerate(mascara) if conservar])
+
+    def con_columna(self, nombre: str, valores: Iterable[Any]) -> "TablaColumnar":
+        """Devuelve una tabla nueva con ``nombre`` añadida o reemplazada."""
+
+        columna = construir_columna(valores)
+        if len(columna) != self._longitud:
+            raise ValueError("Todas las columnas deben tener la misma longitud")
+        datos = dict(self._datos)
+        datos[nombre] = columna
+        return self._desde_almacenamiento(datos, self._longitud)
@@ -0,0 +1,2379 @@
+"""Utilidades tabulares sin depender de :mod:`pandas`.
+
+El proyecto original utilizaba ``pandas`` para todas las operaciones sobre
+conjuntos de datos. Durante las pruebas del repositorio las dependencias
+pesadas no siempre están disponibles, por lo que este módulo implementa las
+funciones clave únicamente con la biblioteca estándar y el stub ligero de
+:nmod:`numpy` incluido en la base de código. Las funciones mantienen la misma
+firma pública para que el código existente continúe funcionando.
+"""
+
+from __future__ import annotations
+
+import builtins
+import functools
+import gc
+import heapq
+import importlib.util
+import csv
+import json
+import math
+import multiprocessing
+import os
+import statistics
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from operator import itemgetter
+from itertools import chain, groupby, islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Mapping, MutableMapping, Sequence, Sized, TYPE_CHECKING
+
+from pcobra._stubs.compat import import_optional_module
+from pcobra.standard_library.columnar import (
+    NUMPY_DISPONIBLE,
+    TablaColumnar,
+    a_lista,
+    como_numpy,
+    tomar_posiciones,
+)
+from pcobra.standard_library.estadistica import (
+    TAMANO_BLOQUE,
+    CovarianzaIncremental,
+    EstadisticasColumna,
+    ResumenNumerico,
+)
+
+np = import_optional_module("numpy", safe_stub=True)
+
+if TYPE_CHECKING:  # pragma: no cover - solo para anotaciones
+    from pandas import DataFrame
+
+Registro = dict[str, Any]
+Tabla = list[Registro]
+_MISSING = object()
+
+__all__ = [
+    "leer_csv",
+    "leer_json",
+    "escribir_csv",
+    "escribir_json",
+    "leer_excel",
+    "escribir_excel",
+    "leer_parquet",
+    "escribir_parquet",
+    "leer_feather",
+    "escribir_feather",
+    "describir",
+    "correlacion_pearson",
+    "correlacion_spearman",
+    "matriz_covarianza",
+    "calcular_percentiles",
+    "resumen_rapido",
+    "seleccionar_columnas",
+    "filtrar",
+    "mutar_columna",
+    "separar_columna",
+    "unir_columnas",
+    "agrupar_y_resumir",
+    "tabla_cruzada",
+    "pivotar_ancho",
+    "pivotar_largo",
+    "ordenar_tabla",
+    "combinar_tablas",
+    "rellenar_nulos",
+    "desplegar_tabla",
+    "pivotar_tabla",
+    "agregar",
+    "mapear",
+    "reducir",
+    "claves",
+    "valores",
+    "longitud",
+    "elemento",
+    "invertir_tabla",
+    "tomar",
+]
+
+
+# ---------------------------------------------------------------------------
+# Utilidades internas
+# ---------------------------------------------------------------------------
+
+
+def _es_numero(valor: Any) -> bool:
+    return isinstance(valor, (int, float)) and not isinstance(valor, bool)
+
+
+def _convertir_valor_crudo(valor: str | None) -> Any:
+    if valor is None:
+        return None
+    texto = valor.strip()
+    if texto == "":
+        return None
+    with suppress(ValueError):
+        return int(texto)
+    with suppress(ValueError):
+        return float(texto)
+    texto_lower = texto.lower()
+    if texto_lower in {"true", "false"}:
+        return texto_lower == "true"
+    return texto
+
+
+def _copiar_tabla(tabla: Tabla) -> Tabla:
+    return [dict(fila) for fila in tabla]
+
+
+def _materializar_tabla(
+    datos: Iterable[Registro]
+    | Mapping[str, Sequence[Any]]
+    | "DataFrame"  # type: ignore[name-defined]
+) -> Tabla:
+    if isinstance(datos, list):
+        return [dict(fila) for fila in datos]
+    if isinstance(datos, TablaColumnar):
+        return datos.a_filas()
+    if isinstance(datos, Mapping):
+        columnas = {clave: list(valor) for clave, valor in datos.items()}
+        longitudes = {len(valores) for valores in columnas.values()}
+        if len(longitudes) > 1:
+            raise ValueError("Todas las columnas deben tener la misma longitud")
+        longitud = longitudes.pop() if columnas else 0
+        return [
+            {columna: columnas[columna][indice] for columna in columnas}
+            for indice in range(longitud)
+        ]
+    to_dict = getattr(datos, "to_dict", None)
+    if callable(to_dict):
+        try:
+            registros = to_dict(orient="records")  # type: ignore[call-arg]
+        except TypeError:
+            pass
+        else:
+            if isinstance(registros, list):
+                return [dict(fila) for fila in registros]
+    if isinstance(datos, Iterable):
+        resultado: Tabla = []
+        for fila in datos:
+            if isinstance(fila, Mapping):
+                resultado.append(dict(fila))
+            else:
+                raise TypeError("Las filas deben ser diccionarios")
+        return resultado
+    raise TypeError("Formato de datos no soportado")
+
+
+def _conserva_columnar(funcion: Callable[..., Any]) -> Callable[..., Any]:
+    """Devuelve una :class:`TablaColumnar` cuando la tabla de entrada lo era."""
+
+    @functools.wraps(funcion)
+    def envoltura(tabla: Any, *args: Any, **kwargs: Any) -> Any:
+        resultado = funcion(tabla, *args, **kwargs)
+        if isinstance(tabla, TablaColumnar) and isinstance(resultado, list):
+            return TablaColumnar.desde_filas(resultado)
+        return resultado
+
+    return envoltura
+
+
+def _a_columnar(datos: Any) -> TablaColumnar:
+    if isinstance(datos, TablaColumnar):
+        return datos
+    if isinstance(datos, list):
+        return TablaColumnar.desde_filas(datos)
+    return TablaColumnar.desde_filas(_materializar_tabla(datos))
+
+
+def _columna_o_nulos(tabla: TablaColumnar, columna: str) -> list[Any]:
+    if columna in tabla:
+        return a_lista(tabla.almacenamiento(columna))
+    return [None] * len(tabla)
+
+
+def _es_ndarray(valor: Any) -> bool:
+    return NUMPY_DISPONIBLE and isinstance(valor, np.ndarray)
+
+
+def _numeros_columnar(tabla: TablaColumnar, columna: str) -> Any:
+    """Valores numéricos de ``columna``; arreglo NumPy si ya está tipada."""
+
+    if columna not in tabla:
+        return []
+    almacenamiento = tabla.almacenamiento(columna)
+    arreglo = como_numpy(almacenamiento, omitir_nulos=True)
+    if arreglo is not None:
+        return arreglo.astype(np.float64, copy=False)
+    return [float(valor) for valor in a_lista(almacenamiento) if _es_numero(valor)]
+
+
+def _columnas_numericas_columnar(tabla: TablaColumnar) -> list[str]:
+    numericas = []
+    for columna in tabla.columnas:
+        almacenamiento = tabla.almacenamiento(columna)
+        if como_numpy(almacenamiento, omitir_nulos=True) is not None:
+            if len(almacenamiento) - getattr(almacenamiento, "null_count", 0):
+                numericas.append(columna)
+        elif any(_es_numero(valor) for valor in a_lista(almacenamiento)):
+            numericas.append(columna)
+    return numericas
+
+
+def _pares_columnar(tabla: TablaColumnar, columna_a: str, columna_b: str) -> tuple[Any, Any]:
+    """Valores de dos columnas en las filas donde ambos son numéricos."""
+
+    if columna_a in tabla and columna_b in tabla:
+        arreglo_a = como_numpy(tabla.almacenamiento(columna_a))
+        arreglo_b = como_numpy(tabla.almacenamiento(columna_b))
+        if arreglo_a is not None and arreglo_b is not None:
+            return arreglo_a.astype(np.float64, copy=False), arreglo_b.astype(np.float64, copy=False)
+    pares = [
+        (float(valor_a), float(valor_b))
+        for valor_a, valor_b in zip(
+            _columna_o_nulos(tabla, columna_a), _columna_o_nulos(tabla, columna_b)
+        )
+        if _es_numero(valor_a) and _es_numero(valor_b)
+    ]
+    return [par[0] for par in pares], [par[1] for par in pares]
+
+
+def _modulo_disponible(nombre: str) -> bool:
+    """Comprueba si un módulo opcional está disponible."""
+
+    return importlib.util.find_spec(nombre) is not None
+
+
+def _columnas(tabla: Tabla) -> list[str]:
+    columnas: list[str] = []
+    for fila in tabla:
+        for columna in fila.keys():
+            if columna not in columnas:
+                columnas.append(columna)
+    return columnas
+
+
+def _columnas_numericas(tabla: Tabla) -> list[str]:
+    return [
+        columna
+        for columna in _columnas(tabla)
+        if any(_es_numero(fila.get(columna)) for fila in tabla)
+    ]
+
+
+def _valores_columna(
+    tabla: Tabla, columna: str, *, solo_numeros: bool = False
+) -> list[Any]:
+    valores: list[Any] = []
+    for fila in tabla:
+        valor = fila.get(columna)
+        if solo_numeros and not _es_numero(valor):
+            continue
+        valores.append(valor)
+    return valores
+
+
+def _pares_columnas(tabla: Tabla, columna_a: str, columna_b: str) -> list[tuple[float, float]]:
+    pares: list[tuple[float, float]] = []
+    for fila in tabla:
+        valor_a = fila.get(columna_a)
+        valor_b = fila.get(columna_b)
+        if _es_numero(valor_a) and _es_numero(valor_b):
+            pares.append((float(valor_a), float(valor_b)))
+    return pares
+
+
+def _pares_listas(tabla: Tabla, columna_a: str, columna_b: str) -> tuple[list[float], list[float]]:
+    pares = _pares_columnas(tabla, columna_a, columna_b)
+    return [par[0] for par in pares], [par[1] for par in pares]
+
+
+def _valores_numericos(tabla: Tabla, columna: str) -> list[float]:
+    return [float(valor) for valor in _valores_columna(tabla, columna, solo_numeros=True)]
+
+
+def _valores_numericos_alineados(tabla: Tabla, columnas: Sequence[str]) -> list[list[float]]:
+    alineados: list[list[float]] = []
+    for fila in tabla:
+        fila_convertida: list[float] = []
+        for columna in columnas:
+            valor = fila.get(columna)
+            if not _es_numero(valor):
+                break
+            fila_convertida.append(float(valor))
+        else:
+            alineados.append(fila_convertida)
+    return alineados
+
+
+def _aplicar_agregacion(nombre: str, valores: Sequence[Any]) -> Any:
+    filtrados = [valor for valor in valores if valor is not None]
+    if not filtrados:
+        return None
+    if nombre in {"sum", "suma"}:
+        total = 0
+        for valor in filtrados:
+            total += valor  # type: ignore[operator]
+        return total
+    if nombre in {"mean", "promedio", "avg"}:
+        numeros = [float(valor) for valor in filtrados]
+        return sum(numeros) / len(numeros)
+    if nombre in {"max", "min"}:
+        comparables = list(filtrados)
+        return getattr(builtins, nombre)(comparables)  # type: ignore[arg-type]
+    if nombre in {"count", "conteo", "len"}:
+        return len(filtrados)
+    raise ValueError(f"Agregación desconocida: {nombre}")
+
+
+def _calcular_covarianza(valores_a: Sequence[float], valores_b: Sequence[float]) -> float:
+    n = len(valores_a)
+    if n < 2:
+        return 0.0
+    if _es_ndarray(valores_a) and _es_ndarray(valores_b) and len(valores_b) == n:
+        return float(np.dot(valores_a - valores_a.mean(), valores_b - valores_b.mean()) / (n - 1))
+    media_a = sum(valores_a) / n
+    media_b = sum(valores_b) / n
+    acumulado = sum((a - media_a) * (b - media_b) for a, b in zip(valores_a, valores_b))
+    return acumulado / (n - 1)
+
+
+def _calcular_pearson(valores_a: Sequence[float], valores_b: Sequence[float]) -> float:
+    covarianza = _calcular_covarianza(valores_a, valores_b)
+    desviacion_a = math.sqrt(_calcular_covarianza(valores_a, valores_a))
+    desviacion_b = math.sqrt(_calcular_covarianza(valores_b, valores_b))
+    if desviacion_a == 0 or desviacion_b == 0:
+        return 0.0
+    return covarianza / (desviacion_a * desviacion_b)
+
+
+def _rango_promedio(valores: Sequence[float]) -> Any:
+    if _es_ndarray(valores):
+        _unicos, inversos, conteos = np.unique(valores, return_inverse=True, return_counts=True)
+        finales = np.cumsum(conteos)
+        return ((finales - conteos + 1 + finales) / 2.0)[inversos.reshape(-1)]
+    pares = sorted((valor, indice) for indice, valor in enumerate(valores))
+    rangos = [0.0] * len(valores)
+    posicion = 0
+    while posicion < len(pares):
+        valor, indice = pares[posicion]
+        j = posicion
+        while j < len(pares) and pares[j][0] == valor:
+            j += 1
+        rango_promedio = sum(range(posicion + 1, j + 1)) / (j - posicion)
+        for k in range(posicion, j):
+            rangos[pares[k][1]] = rango_promedio
+        posicion = j
+    return rangos
+
+
+# ---------------------------------------------------------------------------
+# Rutas columnares
+# ---------------------------------------------------------------------------
+
+
+def _codigos_grupo(tabla: TablaColumnar, por: Sequence[str]) -> tuple[Any, list[tuple[Any, ...]]]:
+    """Asigna a cada fila el índice de su grupo en orden de primera aparición."""
+
+    longitud_tabla = len(tabla)
+    if len(por) == 1 and por[0] in tabla:
+        almacenamiento = como_numpy(tabla.almacenamiento(por[0]))
+        if almacenamiento is not None:
+            unicos, primeros, inversos = np.unique(
+                almacenamiento, return_index=True, return_inverse=True
+            )
+            orden = np.argsort(primeros, kind="stable")
+            rango = np.empty_like(orden)
+            rango[orden] = np.arange(len(orden))
+            claves_grupo = [(valor,) for valor in unicos[orden].tolist()]
+            return rango[inversos.reshape(-1)], claves_grupo
+
+    columnas_clave = [_columna_o_nulos(tabla, columna) for columna in por]
+    tuplas = zip(*columnas_clave) if columnas_clave else (() for _ in range(longitud_tabla))
+    indices: dict[tuple[Any, ...], int] = {}
+    claves_grupo = []
+    codigos = []
+    for clave in tuplas:
+        codigo = indices.get(clave)
+        if codigo is None:
+            codigo = indices[clave] = len(claves_grupo)
+            claves_grupo.append(clave)
+        codigos.append(codigo)
+    if NUMPY_DISPONIBLE:
+        return np.asarray(codigos, dtype=np.int64), claves_grupo
+    return codigos, claves_grupo
+
+
+def _agregar_vectorizado(nombre: str, valores: Any, codigos: Any, grupos: int) -> list[Any] | None:
+    """Agrega una columna tipada por grupo con NumPy o devuelve ``None``."""
+
+    valores = como_numpy(valores)
+    if valores is None or not _es_ndarray(codigos):
+        return None
+    if nombre in {"count", "conteo", "len"}:
+        return np.bincount(codigos, minlength=grupos).tolist()
+    if nombre in {"mean", "promedio", "avg"}:
+        sumas = np.bincount(codigos, weights=valores.astype(np.float64), minlength=grupos)
+        return (sumas / np.bincount(codigos, minlength=grupos)).tolist()
+    if nombre in {"sum", "suma"}:
+        if valores.dtype.kind == "f":
+            return np.bincount(codigos, weights=valores, minlength=grupos).tolist()
+        sumas = np.zeros(grupos, dtype=np.int64)
+        np.add.at(sumas, codigos, valores)
+        return sumas.tolist()
+    if nombre in {"max", "min"}:
+        inicial = valores[np.unique(codigos, return_index=True)[1]]
+        acumulado = inicial.copy()
+        getattr(np, "maximum" if nombre == "max" else "minimum").at(acumulado, codigos, valores)
+        return acumulado.tolist()
+    return None
+
+
+def _agrupar_columnar(
+    tabla: TablaColumnar,
+    por: Sequence[str],
+    agregaciones: Mapping[str, str | Sequence[str]],
+) -> TablaColumnar:
+    codigos, claves_grupo = _codigos_grupo(tabla, por)
+    grupos = len(claves_grupo)
+    salida: dict[str, list[Any]] = {
+        columna: [clave[posicion] for clave in claves_grupo]
+        for posicion, columna in enumerate(por)
+    }
+    lista_codigos = a_lista(codigos)
+    for columna, agg in agregaciones.items():
+        nombres = [str(agg)] if isinstance(agg, str) or not isinstance(agg, Sequence) else list(agg)
+        valores = tabla.almacenamiento(columna) if columna in tabla else None
+        por_grupo: list[list[Any]] | None = None
+        for nombre in nombres:
+            resultado = (
+                _agregar_vectorizado(nombre, valores, codigos, grupos)
+                if valores is not None
+                else None
+            )
+            if resultado is None:
+                if por_grupo is None:
+                    por_grupo = [[] for _ in range(grupos)]
+                    fuente = a_lista(valores) if valores is not None else [None] * len(tabla)
+                    for codigo, valor in zip(lista_codigos, fuente):
+                        por_grupo[codigo].append(valor)
+                resultado = [_aplicar_agregacion(nombre, grupo) for grupo in por_grupo]
+            salida[f"{columna}_{nombre}"] = resultado
+    return TablaColumnar(salida)
+
+
+def _ordenar_columnar(
+    tabla: TablaColumnar, por: Sequence[str], ordenes: Sequence[bool]
+) -> TablaColumnar:
+    indices: Any = list(range(len(tabla)))
+    for columna, asc in reversed(list(zip(por, ordenes))):
+        almacenamiento = como_numpy(tabla.almacenamiento(columna)) if columna in tabla else None
+        if almacenamiento is not None:
+            actuales = np.asarray(indices, dtype=np.int64)
+            valores = almacenamiento[actuales]
+            orden = np.argsort(valores if asc else -valores, kind="stable")
+            indices = actuales[orden].tolist()
+            continue
+        valores = _columna_o_nulos(tabla, columna)
+        indices.sort(key=lambda i: (valores[i] is None, valores[i]), reverse=not asc)
+    return tabla.tomar_indices(indices)
+
+
+def _combinar_columnar(
+    izquierda: TablaColumnar,
+    derecha: TablaColumnar,
+    clave_izquierda: Any,
+    clave_derecha: Any,
+    tipo: str,
+) -> TablaColumnar:
+    indice_derecho: dict[Any, list[int]] = defaultdict(list)
+    for posicion, clave in enumerate(_columna_o_nulos(derecha, clave_derecha)):
+        indice_derecho[clave].append(posicion)
+
+    pos_izquierda: list[int] = []
+    pos_derecha: list[int] = []
+    emparejadas: set[Any] = set()
+    for posicion, clave in enumerate(_columna_o_nulos(izquierda, clave_izquierda)):
+        coincidencias = indice_derecho.get(clave)
+        if coincidencias:
+            pos_izquierda.extend([posicion] * len(coincidencias))
+            pos_derecha.extend(coincidencias)
+            emparejadas.add(clave)
+        elif tipo in {"left", "outer"}:
+            pos_izquierda.append(posicion)
+            pos_derecha.append(-1)
+    if tipo == "outer":
+        for clave, posiciones in indice_derecho.items():
+            if clave in emparejadas:
+                continue
+            pos_izquierda.extend([-1] * len(posiciones))
+            pos_derecha.extend(posiciones)
+
+    salida: dict[str, Any] = {}
+    compartidas: dict[str, list[Any] | None] = {}
+    for columna in izquierda.columnas:
+        if columna in derecha:
+            compartidas[columna] = None
+            continue
+        salida[columna] = tomar_posiciones(izquierda.almacenamiento(columna), pos_izquierda)
+    for columna in compartidas:
+        valores_izq = a_lista(izquierda.almacenamiento(columna))
+        valores_der = a_lista(derecha.almacenamiento(columna))
+        combinados: list[Any] = []
+        conflictos: list[Any] = []
+        hay_conflicto = False
+        for i, j in zip(pos_izquierda, pos_derecha):
+            if i < 0:
+                combinados.append(valores_der[j])
+                conflictos.append(None)
+            elif j >= 0 and valores_izq[i] != valores_der[j]:
+                combinados.append(valores_izq[i])
+                conflictos.append(valores_der[j])
+                hay_conflicto = True
+            else:
+                combinados.append(valores_izq[i] if j < 0 else valores_der[j])
+                conflictos.append(None)
+        salida[columna] = combinados
+        compartidas[columna] = conflictos if hay_conflicto else None
+    orden = list(izquierda.columnas)
+    for columna in derecha.columnas:
+        if columna not in compartidas:
+            salida[columna] = tomar_posiciones(derecha.almacenamiento(columna), pos_derecha)
+            orden.append(columna)
+        elif compartidas[columna] is not None:
+            salida[f"{columna}_derecha"] = compartidas[columna]
+            orden.append(f"{columna}_derecha")
+    return TablaColumnar({columna: salida[columna] for columna in orden})
+
+
+# ---------------------------------------------------------------------------
+# Lectura y escritura
+# ---------------------------------------------------------------------------
+
+
+def leer_csv(
+    ruta: str | Path,
+    *,
+    separador: str = ",",
+    encoding: str = "utf-8",
+    limite_filas: int | None = None,
+) -> Tabla:
+    try:
+        with Path(ruta).open("r", encoding=encoding, newline="") as archivo:
+            lector = csv.DictReader(archivo, delimiter=separador, strict=True)
+            resultado: Tabla = []
+            columnas = lector.fieldnames or []
+            for indice, fila in enumerate(lector):
+                if limite_filas is not None and indice >= limite_filas:
+                    break
+                if None in fila or len(fila) != len(columnas):
+                    raise ValueError("No fue posible leer el CSV: formato inválido")
+                resultado.append({clave: _convertir_valor_crudo(valor) for clave, valor in fila.items()})
+            return resultado
+    except (csv.Error, OSError, UnicodeDecodeError) as exc:
+        raise ValueError(f"No fue posible leer el CSV: {exc}") from exc
+
+
+# Tipos reconocidos por :func:`inferir_esquema`.
+_TIPOS_ESQUEMA = ("entero", "decimal", "booleano", "texto")
+
+
+def _tipo_de_valor(valor: Any) -> str | None:
+    if valor is None:
+        return None
+    if isinstance(valor, bool):
+        return "booleano"
+    if isinstance(valor, int):
+        return "entero"
+    if isinstance(valor, float):
+        return "decimal"
+    return "texto"
+
+
+def _unificar_tipos(actual: str | None, nuevo: str | None) -> str | None:
+    if actual is None or actual == nuevo:
+        return nuevo if actual is None else actual
+    if nuevo is None:
+        return actual
+    if {actual, nuevo} == {"entero", "decimal"}:
+        return "decimal"
+    return "texto"
+
+
+def inferir_esquema(filas: Iterable[Mapping[str, str | None]]) -> dict[str, str | None]:
+    """Infiere el tipo de cada columna a partir de filas de texto sin convertir.
+
+    Devuelve ``entero``, ``decimal``, ``booleano`` o ``texto`` por columna, o
+    ``None`` si la muestra solo contenía valores vacíos.
+    """
+
+    esquema: dict[str, str | None] = {}
+    for fila in filas:
+        for columna, valor in fila.items():
+            esquema[columna] = _unificar_tipos(
+                esquema.get(columna), _tipo_de_valor(_convertir_valor_crudo(valor))
+            )
+    return esquema
+
+
+def _convertidor_tipado(tipo: str | None) -> Callable[[str | None], Any]:
+    """Devuelve un conversor especializado para ``tipo``.
+
+    Los valores que no encajan en el tipo inferido se convierten con la regla
+    general de :func:`leer_csv`.
+    """
+
+    if tipo is None:
+        return _convertir_valor_crudo
+    if tipo not in _TIPOS_ESQUEMA:
+        raise ValueError(f"Tipo de esquema desconocido: {tipo}")
+
+    def convertir(valor: str | None) -> Any:
+        if valor is None:
+            return None
+        texto = valor.strip()
+        if texto == "":
+            return None
+        try:
+            if tipo == "entero":
+                return int(texto)
+            if tipo == "decimal":
+                return float(texto)
+        except ValueError:
+            return _convertir_valor_crudo(texto)
+        if tipo == "booleano":
+            minusculas = texto.lower()
+            if minusculas in {"true", "false"}:
+                return minusculas == "true"
+            return _convertir_valor_crudo(texto)
+        return texto
+
+    return convertir
+
+
+def _emitir_lote(lote: Tabla, columnar: bool) -> Tabla | TablaColumnar:
+    return TablaColumnar.desde_filas(lote) if columnar else lote
+
+
+def leer_csv_por_lotes(
+    ruta: str | Path,
+    *,
+    tamano_lote: int = 10_000,
+    separador: str = ",",
+    encoding: str = "utf-8",
+    muestra_esquema: int = 1_000,
+    esquema: Mapping[str, str | None] | None = None,
+    columnas: Sequence[str] | None = None,
+    filtro: Callable[[Registro], bool] | None = None,
+    columnar: bool = False,
+) -> Iterator[Tabla | TablaColumnar]:
+    """Lee un CSV en lotes de como máximo ``tamano_lote`` filas.
+
+    El esquema se infiere sobre las primeras ``muestra_esquema`` filas (o se
+    toma de ``esquema``) y el resto del archivo se convierte con un conversor
+    fijo por columna. Solo un lote permanece en memoria a la vez; con
+    ``columnas`` se descartan las demás columnas al leer, ``filtro`` descarta
+    filas antes de acumularlas en el lote y con ``columnar`` cada lote se
+    entrega como :class:`TablaColumnar`.
+    """
+
+    if tamano_lote < 1:
+        raise ValueError("tamano_lote debe ser >= 1")
+    try:
+        with Path(ruta).open("r", encoding=encoding, newline="") as archivo:
+            lector = csv.DictReader(archivo, delimiter=separador, strict=True)
+            nombres = lector.fieldnames or []
+            if columnas is not None:
+                faltantes = [columna for columna in columnas if columna not in nombres]
+                if faltantes:
+                    raise KeyError(faltantes[0])
+            seleccion = list(columnas) if columnas is not None else list(nombres)
+
+            def validar(fila: dict[str, Any]) -> dict[str, Any]:
+                if None in fila or len(fila) != len(nombres):
+                    raise ValueError("No fue posible leer el CSV: formato inválido")
+                return fila
+
+            muestra = [validar(fila) for fila in islice(lector, max(0, muestra_esquema))]
+            tipos = dict(esquema) if esquema is not None else inferir_esquema(
+                {columna: fila[columna] for columna in seleccion} for fila in muestra
+            )
+            convertidores = [
+                (columna, _convertidor_tipado(tipos.get(columna))) for columna in seleccion
+            ]
+
+            lote: Tabla = []
+            for fila in chain(muestra, (validar(fila) for fila in lector)):
+                registro = {columna: convertir(fila[columna]) for columna, convertir in convertidores}
+                if filtro is not None and not filtro(registro):
+                    continue
+                lote.append(registro)
+                if len(lote) >= tamano_lote:
+                    yield _emitir_lote(lote, columnar)
+                    lote = []
+            if lote:
+                yield _emitir_lote(lote, columnar)
+    except (csv.Error, OSError, UnicodeDecodeError) as exc:
+        raise ValueError(f"No fue posible leer el CSV: {exc}") from exc
+
+
+def leer_json_por_lotes(
+    ruta: str | Path,
+    *,
+    tamano_lote: int = 10_000,
+    encoding: str = "utf-8",
+    columnar: bool = False,
+) -> Iterator[Tabla | TablaColumnar]:
+    """Lee un archivo JSON Lines en lotes sin cargarlo completo en memoria."""
+
+    if tamano_lote < 1:
+        raise ValueError("tamano_lote debe ser >= 1")
+    try:
+        with Path(ruta).open("r", encoding=encoding) as archivo:
+            lote: Tabla = []
+            for numero, linea in enumerate(archivo, start=1):
+                if not linea.strip():
+                    continue
+                try:
+                    registro = json.loads(linea)
+                except json.JSONDecodeError as exc:
+                    raise ValueError(f"No fue posible leer el JSON: línea {numero}: {exc}") from exc
+                if not isinstance(registro, Mapping):
+                    raise ValueError(
+                        f"No fue posible leer el JSON: línea {numero}: las filas deben ser objetos"
+                    )
+                lote.append(dict(registro))
+                if len(lote) >= tamano_lote:
+                    yield _emitir_lote(lote, columnar)
+                    lote = []
+            if lote:
+                yield _emitir_lote(lote, columnar)
+    except (OSError, UnicodeDecodeError) as exc:
+        raise ValueError(f"No fue posible leer el JSON: {exc}") from exc
+
+
+def escribir_csv(
+    datos: Iterable[Registro] | Mapping[str, Sequence[Any]] | "DataFrame",
+    ruta: str | Path,
+    *,
+    separador: str = ",",
+    encoding: str = "utf-8",
+    aniadir: bool = False,
+    incluir_indice: bool = False,
+) -> None:
+    tabla = _materializar_tabla(datos)
+    ruta = Path(ruta)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+
+    modo = "a" if aniadir and ruta.exists() else "w"
+    escribir_encabezado = modo == "w" or (modo == "a" and ruta.stat().st_size == 0)
+
+    with ruta.open(modo, encoding=encoding, newline="") as archivo:
+        columnas = _columnas(tabla)
+        escritor = csv.DictWriter(archivo, fieldnames=columnas, delimiter=separador)
+        if escribir_encabezado:
+            escritor.writeheader()
+        for indice, fila in enumerate(tabla):
+            fila_a_escribir = dict(fila)
+            if incluir_indice:
+                fila_a_escribir.setdefault("index", indice)
+            for clave, valor in fila_a_escribir.items():
+                if valor is None:
+                    fila_a_escribir[clave] = ""
+            escritor.writerow(fila_a_escribir)
+
+
+def leer_json(ruta: str | Path, *, orient: str | None = None, lineas: bool = False) -> Tabla:
+    try:
+        texto = Path(ruta).read_text(encoding="utf-8")
+    except OSError as exc:
+        raise ValueError(f"No fue posible leer el JSON: {exc}") from exc
+
+    try:
+        if lineas:
+            registros = [json.loads(linea) for linea in texto.splitlines() if linea.strip()]
+        else:
+            datos = json.loads(texto)
+            if isinstance(datos, list):
+                registros = datos
+            elif isinstance(datos, dict):
+                registros = datos.get("records") if orient == "records" else [datos]
+            else:
+                raise TypeError("Estructura JSON no soportada")
+    except (json.JSONDecodeError, TypeError) as exc:
+        raise ValueError(f"No fue posible leer el JSON: {exc}") from exc
+    return _materializar_tabla(registros)
+
+
+def escribir_json(
+    datos: Iterable[Registro] | Mapping[str, Sequence[Any]] | "DataFrame",
+    ruta: str | Path,
+    *,
+    indent: int | None = 2,
+    lineas: bool = False,
+    aniadir: bool = False,
+) -> None:
+    tabla = _materializar_tabla(datos)
+    ruta = Path(ruta)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+
+    if lineas:
+        modo = "a" if aniadir else "w"
+        claves_existentes: set[str] = set()
+        if aniadir and ruta.exists():
+            for linea in ruta.read_text(encoding="utf-8").splitlines():
+                linea = linea.strip()
+                if linea:
+                    try:
+                        claves_existentes.update(json.loads(linea).keys())
+                    except json.JSONDecodeError:
+                        continue
+        claves_totales = set(claves_existentes)
+        for fila in tabla:
+            claves_totales.update(fila.keys())
+        with ruta.open(modo, encoding="utf-8") as archivo:
+            for fila in tabla:
+                completo = {clave: fila.get(clave) for clave in claves_totales}
+                archivo.write(json.dumps(completo, ensure_ascii=False))
+                archivo.write("\n")
+        return
+
+    texto = json.dumps(tabla, ensure_ascii=False, indent=indent)
+    ruta.write_text(texto, encoding="utf-8")
+
+
+def _asegurar_openpyxl() -> Any:
+    try:
+        import openpyxl  # type: ignore[import-not-found]
+    except ModuleNotFoundError as exc:  # pragma: no cover - depende del entorno
+        raise ValueError("Para trabajar con Excel instala el extra opcional con 'pip install .[excel]' (incluye 'openpyxl').") from exc
+    return openpyxl
+
+
+def escribir_excel(
+    datos: Iterable[Registro] | Mapping[str, Sequence[Any]] | "DataFrame",
+    ruta: str | Path,
+    *,
+    hoja: str = "Hoja1",
+    engine: str | None = None,
+) -> None:
+    _asegurar_openpyxl()
+    tabla = _materializar_tabla(datos)
+    ruta = Path(ruta)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+
+    from openpyxl import Workbook  # type: ignore[import-not-found]
+
+    libro = Workbook()
+    hoja_obj = libro.active
+    hoja_obj.title = hoja
+
+    columnas = _columnas(tabla)
+    if columnas:
+        hoja_obj.append(columnas)
+    for fila in tabla:
+        hoja_obj.append([fila.get(columna) for columna in columnas])
+
+    libro.save(ruta)
+
+
+def leer_excel(
+    ruta: str | Path,
+    *,
+    hoja: str | int | None = 0,
+    encabezado: int | None = 0,
+    engine: str | None = None,
+) -> Tabla:
+    _asegurar_openpyxl()
+    from openpyxl import load_workbook  # type: ignore[import-not-found]
+
+    libro = load_workbook(Path(ruta), read_only=True, data_only=True)
+    try:
+        if hoja is None:
+            hoja_obj = libro.active
+        elif isinstance(hoja, int):
+            hoja_obj = libro.worksheets[hoja]
+        else:
+            hoja_obj = libro[hoja]
+
+        filas = list(hoja_obj.iter_rows(values_only=True))
+        if not filas:
+            return []
+
+        if encabezado is None:
+            columnas = [i for i in range(len(filas[0]))]
+            inicio_datos = 0
+        else:
+            encabezados = filas[encabezado]
+            columnas = [
+                enc if enc is not None else indice
+                for indice, enc in enumerate(encabezados)
+            ]
+            inicio_datos = encabezado + 1
+
+        resultado: Tabla = []
+        for fila in filas[inicio_datos:]:
+            registro: Registro = {}
+            for indice, columna in enumerate(columnas):
+                registro[columna] = fila[indice] if indice < len(fila) else None
+            resultado.append(registro)
+        return resultado
+    finally:
+        libro.close()
+
+
+def _asegurar_pyarrow(accion: str) -> tuple[Any, Any]:
+    if not _modulo_disponible("pyarrow"):
+        raise ValueError(
+            f"No fue posible {accion}: instala el extra opcional con 'pip install .[columnar]' (incluye 'pyarrow')."
+        )
+    try:
+        import pyarrow as pa  # type: ignore[import-not-found]
+        import pyarrow.feather as feather  # type: ignore[import-not-found]
+        import pyarrow.parquet as pq  # type: ignore[import-not-found]
+    except ModuleNotFoundError as exc:  # pragma: no cover - depende del entorno
+        raise ValueError(
+            f"No fue posible {accion}: instala el extra opcional con 'pip install .[columnar]' (incluye 'pyarrow')."
+        ) from exc
+    return pa, (feather, pq)
+
+
+def _a_tabla_arrow(pa: Any, datos: Any) -> Any:
+    """Convierte ``datos`` en ``pyarrow.Table`` evitando filas intermedias."""
+
+    if isinstance(datos, pa.Table):
+        return datos
+    if isinstance(datos, TablaColumnar):
+        return datos.a_arrow()
+    return pa.Table.from_pylist(_materializar_tabla(datos))
+
+
+def _desde_tabla_arrow(tabla: Any, columnar: bool) -> Tabla | TablaColumnar:
+    if columnar:
+        return TablaColumnar.desde_arrow(tabla)
+    return tabla.to_pylist()
+
+
+def escribir_parquet(
+    datos: Iterable[Registro] | Mapping[str, Sequence[Any]] | "DataFrame",
+    ruta: str | Path,
+    *,
+    engine: str | None = None,
+    filas_por_grupo: int | None = None,
+) -> None:
+    """Escribe ``datos`` en Parquet.
+
+    Una :class:`TablaColumnar` se entrega a Arrow columna a columna, sin
+    materializar filas. ``filas_por_grupo`` fija el tamaño de los grupos de
+    filas, que es la granularidad con la que ``leer_parquet`` puede omitir
+    datos al filtrar.
+    """
+
+    pa, (_, pq) = _asegurar_pyarrow("escribir el archivo Parquet")
+    tabla = _a_tabla_arrow(pa, datos)
+    ruta = Path(ruta)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(tabla, ruta, row_group_size=filas_por_grupo)
+
+
+def leer_parquet(
+    ruta: str | Path,
+    *,
+    engine: str | None = None,
+    columnas: Sequence[str] | None = None,
+    filtros: Sequence[Any] | None = None,
+    columnar: bool = False,
+) -> Tabla | TablaColumnar:
+    """Lee un archivo Parquet.
+
+    ``columnas`` limita las columnas leídas del disco. ``filtros`` usa la
+    notación de ``pyarrow.parquet`` (``[("edad", ">=", 18)]`` o una lista de
+    conjunciones): los grupos de filas cuyas estadísticas descartan el filtro
+    no se leen y el resto se filtra fila a fila. Con ``columnar=True`` se
+    devuelve una :class:`TablaColumnar` que reutiliza los búferes de Arrow sin
+    crear objetos Python por fila.
+    """
+
+    _pa, (_feather, pq) = _asegurar_pyarrow("leer el archivo Parquet")
+    tabla = pq.read_table(
+        Path(ruta),
+        columns=list(columnas) if columnas is not None else None,
+        filters=list(filtros) if filtros else None,
+    )
+    return _desde_tabla_arrow(tabla, columnar)
+
+
+def escribir_feather(
+    datos: Iterable[Registro] | Mapping[str, Sequence[Any]] | "DataFrame",
+    ruta: str | Path,
+    *,
+    compression: str | None = None,
+) -> None:
+    pa, (feather, _) = _asegurar_pyarrow("escribir el archivo Feather")
+    tabla = _a_tabla_arrow(pa, datos)
+    ruta = Path(ruta)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    feather.write_feather(tabla, ruta, compression=compression)
+
+
+def leer_feather(
+    ruta: str | Path,
+    *,
+    columnas: Sequence[str] | None = None,
+    columnar: bool = False,
+) -> Tabla | TablaColumnar:
+    """Lee un archivo Feather.
+
+    El archivo se proyecta en memoria, de modo que con ``columnar=True`` y sin
+    compresión las columnas se leen sin copiar del disco.
+    """
+
+    _pa, (feather, _pq) = _asegurar_pyarrow("leer el archivo Feather")
+    tabla = feather.read_table(
+        Path(ruta),
+        columns=list(columnas) if columnas is not None else None,
+        memory_map=True,
+    )
+    return _desde_tabla_arrow(tabla, columnar)
+
+
+# ---------------------------------------------------------------------------
+# Transformaciones
+# ---------------------------------------------------------------------------
+
+
+def a_listas(tabla: Iterable[Registro]) -> dict[str, list[Any]]:
+    if isinstance(tabla, TablaColumnar):
+        return tabla.a_listas()
+    filas = _materializar_tabla(tabla)
+    columnas = _columnas(filas)
+    resultado: dict[str, list[Any]] = {columna: [] for columna in columnas}
+    for fila in filas:
+        for columna in columnas:
+            resultado[columna].append(fila.get(columna))
+    return resultado
+
+
+def de_listas(columnas: Mapping[str, Sequence[Any]], *, columnar: bool = False) -> Tabla:
+    if columnar:
+        return TablaColumnar(columnas)
+    longitudes = {len(valores) for valores in columnas.values()}
+    if len(longitudes) > 1:
+        raise ValueError("Todas las columnas deben tener la misma longitud")
+    longitud = longitudes.pop() if columnas else 0
+    claves = list(columnas.keys())
+    return [
+        {clave: columnas[clave][indice] for clave in claves}
+        for indice in range(longitud)
+    ]
+
+
+@_conserva_columnar
+def agregar(tabla: Iterable[Registro], fila: Registro) -> Tabla:
+    """Agrega ``fila`` a ``tabla`` devolviendo una nueva tabla materializada."""
+
+    if not isinstance(fila, Mapping):
+        raise TypeError("fila debe ser un mapeo (dict u objeto similar)")
+    base = _materializar_tabla(tabla)
+    base.append(dict(fila))
+    return base
+
+
+def mapear(tabla: Iterable[Any], transformacion: Callable[[Any], Any]) -> list[Any]:
+    """Aplica ``transformacion`` por fila devolviendo una nueva lista."""
+
+    if not callable(transformacion):
+        raise TypeError("transformacion debe ser callable")
+    try:
+        filas = _materializar_tabla(tabla)
+    except TypeError:
+        if isinstance(tabla, Mapping) or not isinstance(tabla, Iterable):
+            raise
+        filas = list(tabla)
+    resultado: list[Any] = []
+    for fila in filas:
+        valor = transformacion(dict(fila) if isinstance(fila, Mapping) else fila)
+        resultado.append(dict(valor) if isinstance(valor, Mapping) else valor)
+    return resultado
+
+
+def reducir(
+    tabla: Iterable[Registro],
+    funcion: Callable[[Any, Registro], Any],
+    inicial: Any = _MISSING,
+) -> Any:
+    """Reduce filas acumulando con ``funcion`` y acumulador inicial opcional."""
+
+    if not callable(funcion):
+        raise TypeError("funcion debe ser callable")
+    filas = _materializar_tabla(tabla)
+    if inicial is _MISSING:
+        if not filas:
+            raise TypeError("reducir() requiere un acumulador inicial para tabla vacía")
+        acumulado = dict(filas[0])
+        inicio = 1
+    else:
+        acumulado = inicial
+        inicio = 0
+
+    for fila in filas[inicio:]:
+        acumulado = funcion(acumulado, dict(fila))
+    return acumulado
+
+
+def claves(registro: Mapping[str, Any]) -> list[str]:
+    """Devuelve las claves de ``registro``."""
+
+    if not isinstance(registro, Mapping):
+        raise TypeError("registro debe ser un mapeo")
+    return list(registro.keys())
+
+
+def valores(registro: Mapping[str, Any]) -> list[Any]:
+    """Devuelve los valores de ``registro``."""
+
+    if not isinstance(registro, Mapping):
+        raise TypeError("registro debe ser un mapeo")
+    return list(registro.values())
+
+
+def longitud(valor: Sized | Sequence[Any] | Mapping[str, Any]) -> int:
+    """Devuelve la longitud de una estructura compatible con ``len``."""
+
+    try:
+        return len(valor)
+    except TypeError as exc:
+        raise TypeError("valor no soporta longitud") from exc
+
+
+def elemento(coleccion: Any, indice: int) -> Any:
+    """Devuelve ``coleccion[indice]`` con validaciones Cobra-facing."""
+
+    if not isinstance(indice, int) or isinstance(indice, bool):
+        raise TypeError("índice debe ser entero")
+
+    if not isinstance(coleccion, Sequence) or isinstance(coleccion, (str, bytes, bytearray)):
+        raise TypeError("objeto no indexable")
+
+    try:
+        return coleccion[indice]
+    except IndexError as exc:
+        raise IndexError("índice fuera de rango") from exc
+    except TypeError as exc:
+        raise TypeError("objeto no indexable") from exc
+
+
+def seleccionar_columnas(tabla: Iterable[Registro], columnas: Sequence[str]) -> Tabla:
+    if isinstance(tabla, TablaColumnar):
+        if not len(tabla):
+            return TablaColumnar()
+        return tabla.seleccionar(columnas)
+    filas = _materializar_tabla(tabla)
+    resultado: Tabla = []
+    for fila in filas:
+        seleccionado: Registro = {}
+        for columna in columnas:
+            if columna not in fila:
+                raise KeyError(columna)
+            seleccionado[columna] = fila[columna]
+        resultado.append(seleccionado)
+    return resultado
+
+
+def filtrar(tabla: Iterable[Any], condicion: Callable[[Any], bool]) -> list[Any]:
+    if isinstance(tabla, TablaColumnar):
+        mascara: list[bool] = []
+        for fila in tabla.filas():
+            try:
+                mascara.append(bool(condicion(fila)))
+            except Exception as exc:  # pragma: no cover - errores usuario
+                raise ValueError(f"La condición de filtrado falló: {exc}") from exc
+        return tabla.filtrar_mascara(mascara)
+    try:
+        filas = _materializar_tabla(tabla)
+    except TypeError:
+        if isinstance(tabla, Mapping) or not isinstance(tabla, Iterable):
+            raise
+        filas = list(tabla)
+    resultado: list[Any] = []
+    for fila in filas:
+        try:
+            if condicion(fila):
+                resultado.append(dict(fila) if isinstance(fila, Mapping) else fila)
+        except Exception as exc:  # pragma: no cover - errores usuario
+            raise ValueError(f"La condición de filtrado falló: {exc}") from exc
+    return resultado
+
+
+def mutar_columna(
+    tabla: Iterable[Registro],
+    columna: str,
+    transformacion: Callable[[Registro], Any],
+    *,
+    crear_si_no_existe: bool = True,
+) -> Tabla:
+    if isinstance(tabla, TablaColumnar):
+        if not crear_si_no_existe and columna not in tabla and len(tabla):
+            raise KeyError(columna)
+        return tabla.con_columna(columna, [transformacion(fila) for fila in tabla.filas()])
+    filas = _materializar_tabla(tabla)
+    resultado: Tabla = []
+    for fila in filas:
+        nuevo = dict(fila)
+        if not crear_si_no_existe and columna not in nuevo:
+            raise KeyError(columna)
+        nuevo[columna] = transformacion(nuevo)
+        resultado.append(nuevo)
+    return resultado
+
+
+@_conserva_columnar
+def separar_columna(
+    tabla: Iterable[Registro],
+    columna: str,
+    *,
+    en: Sequence[str],
+    separador: str = ",",
+    eliminar_original: bool = True,
+    relleno: Any = "",
+    descartar_nulos: bool = False,
+) -> Tabla:
+    filas = _materializar_tabla(tabla)
+    resultado: Tabla = []
+    for fila in filas:
+        valor = fila.get(columna)
+        if valor is None:
+            if descartar_nulos:
+                continue
+            partes = [relleno for _ in en]
+        else:
+            partes = str(valor).split(separador)
+            if len(partes) < len(en):
+                partes.extend(relleno for _ in range(len(en) - len(partes)))
+            if len(partes) > len(en):
+                partes = partes[: len(en)]
+        nuevo = dict(fila)
+        if eliminar_original:
+            nuevo.pop(columna, None)
+        for nombre, parte in zip(en, partes):
+            nuevo[nombre] = parte
+        resultado.append(nuevo)
+    return resultado
+
+
+@_conserva_columnar
+def unir_columnas(
+    tabla: Iterable[Registro],
+    columnas: Sequence[str],
+    destino: str,
+    *,
+    separador: str = " ",
+    omitir_nulos: bool = False,
+    relleno: str = "sin dato",
+    eliminar_original: bool = True,
+) -> Tabla:
+    filas = _materializar_tabla(tabla)
+    resultado: Tabla = []
+    for fila in filas:
+        partes: list[str] = []
+        for columna in columnas:
+            valor = fila.get(columna)
+            if valor is None:
+                if omitir_nulos:
+                    continue
+                partes.append(relleno)
+            else:
+                partes.append(str(valor))
+        nuevo = dict(fila)
+        if omitir_nulos and not partes:
+            nuevo[destino] = None
+        else:
+            nuevo[destino] = separador.join(partes)
+        if eliminar_original:
+            for columna in columnas:
+                nuevo.pop(columna, None)
+        resultado.append(nuevo)
+    return resultado
+
+
+def agrupar_y_resumir(
+    tabla: Iterable[Registro],
+    *,
+    por: Sequence[str],
+    agregaciones: Mapping[str, str | Sequence[str]],
+    procesos: int | None = None,
+) -> Tabla:
+    """Agrupa ``tabla`` por ``por`` y resume cada columna de ``agregaciones``.
+
+    Los grupos se devuelven en el orden de su primera aparición. Con
+    ``procesos`` mayor que 1 las tablas grandes se reparten en fragmentos
+    contiguos que se resumen en paralelo y cuyos parciales se fusionan; las
+    sumas en coma flotante pueden diferir en los últimos decimales por el
+    orden de acumulación.
+    """
+
+    if isinstance(tabla, TablaColumnar):
+        return _agrupar_columnar(tabla, por, agregaciones)
+    filas = _materializar_tabla(tabla)
+    efectivos = _procesos_efectivos(procesos, len(filas))
+    if efectivos:
+        return _agrupar_en_paralelo(filas, por, agregaciones, efectivos)
+    grupos: dict[tuple[Any, ...], dict[str, list[Any]]] = {}
+    orden_claves: list[tuple[Any, ...]] = []
+    for fila in filas:
+        clave = tuple(fila.get(columna) for columna in por)
+        if clave not in grupos:
+            grupos[clave] = {columna: [] for columna in agregaciones}
+            orden_claves.append(clave)
+        grupo = grupos[clave]
+        for columna in agregaciones:
+            grupo.setdefault(columna, []).append(fila.get(columna))
+
+    resultado: Tabla = []
+    for clave in orden_claves:
+        fila_salida: Registro = {col: val for col, val in zip(por, clave)}
+        datos_grupo = grupos[clave]
+        for columna, agg in agregaciones.items():
+            valores = datos_grupo.get(columna, [])
+            if isinstance(agg, Sequence) and not isinstance(agg, str):
+                for nombre in agg:
+                    fila_salida[f"{columna}_{nombre}"] = _aplicar_agregacion(nombre, valores)
+            else:
+                nombre = str(agg)
+                fila_salida[f"{columna}_{nombre}"] = _aplicar_agregacion(nombre, valores)
+        resultado.append(fila_salida)
+    return resultado
+
+
+# Agregaciones que se calculan por partes y se fusionan después.
+_PARCIALES_POR_AGREGACION = {
+    "sum": ("sum",),
+    "suma": ("sum",),
+    "count": ("count",),
+    "conteo": ("count",),
+    "len": ("count",),
+    "mean": ("sum", "count"),
+    "promedio": ("sum", "count"),
+    "avg": ("sum", "count"),
+    "max": ("max",),
+    "min": ("min",),
+}
+
+
+def _agregaciones_parciales(
+    agregaciones: Mapping[str, str | Sequence[str]],
+) -> dict[str, list[str]]:
+    parciales: dict[str, list[str]] = {}
+    for columna, agg in agregaciones.items():
+        nombres = [agg] if isinstance(agg, str) else list(agg)
+        necesarias = parciales.setdefault(columna, [])
+        for nombre in nombres:
+            if nombre not in _PARCIALES_POR_AGREGACION:
+                raise ValueError(f"Agregación desconocida: {nombre}")
+            for parcial in _PARCIALES_POR_AGREGACION[nombre]:
+                if parcial not in necesarias:
+                    necesarias.append(parcial)
+    return parciales
+
+
+def _fusionar_parcial(nombre: str, actual: Any, nuevo: Any) -> Any:
+    if actual is None:
+        return nuevo
+    if nuevo is None:
+        return actual
+    if nombre in {"sum", "count"}:
+        return actual + nuevo
+    return getattr(builtins, nombre)(actual, nuevo)
+
+
+class _AcumuladorGrupos:
+    """Fusiona resultados parciales de :func:`agrupar_y_resumir` por grupo."""
+
+    def __init__(self, por: Sequence[str], agregaciones: Mapping[str, str | Sequence[str]]):
+        self.por = list(por)
+        self.agregaciones = agregaciones
+        self.parciales = _agregaciones_parciales(agregaciones)
+        self.grupos: dict[tuple[Any, ...], dict[str, Any]] = {}
+
+    def agregar_lote(self, lote: Iterable[Registro]) -> None:
+        self.fusionar(agrupar_y_resumir(lote, por=self.por, agregaciones=self.parciales))
+
+    def fusionar(self, filas: Iterable[Registro]) -> None:
+        for fila in filas:
+            clave = tuple(fila.get(columna) for columna in self.por)
+            destino = self.grupos.get(clave)
+            if destino is None:
+                self.grupos[clave] = {
+                    columna: valor for columna, valor in fila.items() if columna not in self.por
+                }
+                continue
+            for columna, necesarias in self.parciales.items():
+                for nombre in necesarias:
+                    campo = f"{columna}_{nombre}"
+                    destino[campo] = _fusionar_parcial(nombre, destino.get(campo), fila.get(campo))
+
+    def resultado(self) -> Tabla:
+        salida: Tabla = []
+        for clave, parciales in self.grupos.items():
+            fila: Registro = dict(zip(self.por, clave))
+            for columna, agg in self.agregaciones.items():
+                for nombre in [agg] if isinstance(agg, str) else list(agg):
+                    partes = _PARCIALES_POR_AGREGACION[nombre]
+                    if partes == ("sum", "count"):
+                        suma = parciales.get(f"{columna}_sum")
+                        conteo = parciales.get(f"{columna}_count")
+                        valor = float(suma) / conteo if conteo else None
+                    else:
+                        valor = parciales.get(f"{columna}_{partes[0]}")
+                    fila[f"{columna}_{nombre}"] = valor
+            salida.append(fila)
+        return salida
+
+
+def filtrar_lotes(
+    lotes: Iterable[Iterable[Any]], condicion: Callable[[Any], bool]
+) -> Iterator[list[Any]]:
+    """Aplica :func:`filtrar` a cada lote conforme se va leyendo."""
+
+    for lote in lotes:
+        yield filtrar(lote, condicion)
+
+
+def mapear_lotes(
+    lotes: Iterable[Iterable[Any]], transformacion: Callable[[Any], Any]
+) -> Iterator[list[Any]]:
+    """Aplica :func:`mapear` a cada lote conforme se va leyendo."""
+
+    for lote in lotes:
+        yield mapear(lote, transformacion)
+
+
+def agrupar_y_resumir_por_lotes(
+    lotes: Iterable[Iterable[Registro]],
+    *,
+    por: Sequence[str],
+    agregaciones: Mapping[str, str | Sequence[str]],
+) -> Tabla:
+    """Equivalente incremental de :func:`agrupar_y_resumir`.
+
+    Cada lote se resume por separado y los parciales (suma, conteo, mínimo y
+    máximo) se fusionan, por lo que la memoria depende del número de grupos
+    y no del tamaño total de la entrada. El orden de los grupos es el de su
+    primera aparición.
+    """
+
+    acumulador = _AcumuladorGrupos(por, agregaciones)
+    for lote in lotes:
+        acumulador.agregar_lote(lote)
+    return acumulador.resultado()
+
+
+# ---------------------------------------------------------------------------
+# Ejecución en paralelo
+# ---------------------------------------------------------------------------
+
+# Por debajo de este número de filas el coste de repartir los datos entre
+# procesos supera al del cálculo secuencial.
+_FILAS_MINIMAS_PARALELO = 50_000
+
+
+# Entradas de las operaciones en curso. Con el método ``fork`` los procesos
+# hijos las heredan en memoria en lugar de recibirlas serializadas.
+_ENTRADAS_HEREDADAS: dict[int, list[Any]] = {}
+
+
+def _procesos_efectivos(procesos: int | None, filas: int) -> int:
+    """Procesos a usar; 0 indica que la operación se ejecuta en serie."""
+
+    if procesos is None or filas < _FILAS_MINIMAS_PARALELO:
+        return 0
+    efectivos = min(int(procesos), os.cpu_count() or 1)
+    return efectivos if efectivos > 1 else 0
+
+
+def _mapear_en_procesos(
+    funcion: Callable[..., Any], entradas: list[Any], procesos: int, *argumentos: Any
+) -> list[Any]:
+    """Aplica ``funcion(entrada, *argumentos)`` a cada entrada en un grupo de procesos."""
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            futuros = [ejecutor.submit(funcion, entrada, *argumentos) for entrada in entradas]
+            return [futuro.result() for futuro in futuros]
+    ficha = id(entradas)
+    _ENTRADAS_HEREDADAS[ficha] = entradas
+    # Congelar el recolector evita que los hijos recorran (y copien) las
+    # páginas de los objetos heredados.
+    gc.freeze()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=procesos, mp_context=multiprocessing.get_context("fork")
+        ) as ejecutor:
+            futuros = [
+                ejecutor.submit(_ejecutar_heredada, funcion, ficha, indice, argumentos)
+                for indice in range(len(entradas))
+            ]
+            return [futuro.result() for futuro in futuros]
+    finally:
+        gc.unfreeze()
+        del _ENTRADAS_HEREDADAS[ficha]
+
+
+def _ejecutar_heredada(
+    funcion: Callable[..., Any], ficha: int, indice: int, argumentos: tuple[Any, ...]
+) -> Any:
+    return funcion(_ENTRADAS_HEREDADAS[ficha][indice], *argumentos)
+
+
+def _resumir_fragmento(
+    filas: Tabla, por: Sequence[str], parciales: Mapping[str, Sequence[str]]
+) -> Tabla:
+    return agrupar_y_resumir(filas, por=por, agregaciones=parciales)
+
+
+def _agrupar_en_paralelo(
+    filas: Tabla,
+    por: Sequence[str],
+    agregaciones: Mapping[str, str | Sequence[str]],
+    procesos: int,
+) -> Tabla:
+    # Los fragmentos son contiguos y se fusionan en orden, así que cada grupo
+    # conserva la posición de su primera aparición.
+    acumulador = _AcumuladorGrupos(por, agregaciones)
+    tamano = -(-len(filas) // procesos)
+    fragmentos = [filas[inicio : inicio + tamano] for inicio in range(0, len(filas), tamano)]
+    for parcial in _mapear_en_procesos(
+        _resumir_fragmento, fragmentos, procesos, acumulador.por, acumulador.parciales
+    ):
+        acumulador.fusionar(parcial)
+    return acumulador.resultado()
+
+
+def _combinar_filas(
+    izquierda: Sequence[Registro],
+    derecha: Sequence[Registro],
+    clave_izquierda: Any,
+    clave_derecha: Any,
+    tipo: str,
+    columnas_izquierda: Sequence[str],
+    columnas_derecha: Sequence[str],
+) -> tuple[list[tuple[int, Registro]], list[tuple[int, Registro]]]:
+    """Une ``izquierda`` con ``derecha`` por hash de la clave.
+
+    Devuelve las filas guiadas por la izquierda, cada una con el índice de su
+    fila izquierda, y (en uniones ``outer``) las filas derechas sin pareja con
+    el índice de la primera fila derecha de su clave.
+    """
+
+    indice_derecho: dict[Any, list[int]] = defaultdict(list)
+    for posicion, fila in enumerate(derecha):
+        indice_derecho[fila.get(clave_derecha)].append(posicion)
+
+    cuerpo: list[tuple[int, Registro]] = []
+    emparejadas: set[Any] = set()
+    for posicion, fila_izquierda in enumerate(izquierda):
+        clave = fila_izquierda.get(clave_izquierda)
+        coincidencias = indice_derecho.get(clave)
+        if coincidencias:
+            for indice in coincidencias:
+                combinada = dict(fila_izquierda)
+                for columna, valor in derecha[indice].items():
+                    if columna in combinada and combinada[columna] != valor:
+                        combinada[f"{columna}_derecha"] = valor
+                    else:
+                        combinada[columna] = valor
+                cuerpo.append((posicion, combinada))
+            emparejadas.add(clave)
+        elif tipo in {"left", "outer"}:
+            combinada = dict(fila_izquierda)
+            for columna in columnas_derecha:
+                if columna not in combinada:
+                    combinada[columna] = None
+            cuerpo.append((posicion, combinada))
+
+    cola: list[tuple[int, Registro]] = []
+    if tipo == "outer":
+        vacia = dict.fromkeys(columnas_izquierda)
+        for clave, posiciones in indice_derecho.items():
+            if clave in emparejadas:
+                continue
+            for indice in posiciones:
+                combinada = dict(vacia)
+                combinada.update(derecha[indice])
+                cola.append((posiciones[0], combinada))
+    return cuerpo, cola
+
+
+def _combinar_particion(
+    particion: tuple[tuple[list[int], Tabla], tuple[list[int], Tabla]],
+    *argumentos: Any,
+) -> tuple[list[tuple[int, Registro]], list[tuple[int, Registro]]]:
+    (posiciones_izquierda, izquierda), (posiciones_derecha, derecha) = particion
+    cuerpo, cola = _combinar_filas(izquierda, derecha, *argumentos)
+    return (
+        [(posiciones_izquierda[indice], fila) for indice, fila in cuerpo],
+        [(posiciones_derecha[indice], fila) for indice, fila in cola],
+    )
+
+
+def _particionar_por_clave(
+    tabla: Tabla, clave: Any, particiones: int
+) -> list[tuple[list[int], Tabla]]:
+    destinos: list[tuple[list[int], Tabla]] = [([], []) for _ in range(particiones)]
+    for posicion, fila in enumerate(tabla):
+        posiciones, filas = destinos[hash(fila.get(clave)) % particiones]
+        posiciones.append(posicion)
+        filas.append(fila)
+    return destinos
+
+
+def _combinar_en_paralelo(
+    tabla_izquierda: Tabla,
+    tabla_derecha: Tabla,
+    clave_izquierda: Any,
+    clave_derecha: Any,
+    tipo: str,
+    columnas_izquierda: Sequence[str],
+    columnas_derecha: Sequence[str],
+    procesos: int,
+) -> Tabla:
+    # Las claves iguales caen en la misma partición, de modo que cada proceso
+    # resuelve su parte de forma independiente. Las posiciones originales
+    # permiten intercalar los resultados en el orden de la unión secuencial.
+    particiones = list(
+        zip(
+            _particionar_por_clave(tabla_izquierda, clave_izquierda, procesos),
+            _particionar_por_clave(tabla_derecha, clave_derecha, procesos),
+        )
+    )
+    partes = _mapear_en_procesos(
+        _combinar_particion,
+        particiones,
+        procesos,
+        clave_izquierda,
+        clave_derecha,
+        tipo,
+        columnas_izquierda,
+        columnas_derecha,
+    )
+    orden = itemgetter(0)
+    cuerpo = heapq.merge(*(parte[0] for parte in partes), key=orden)
+    cola = heapq.merge(*(parte[1] for parte in partes), key=orden)
+    return [fila for _, fila in chain(cuerpo, cola)]
+
+
+@_conserva_columnar
+def tabla_cruzada(
+    tabla: Iterable[Registro],
+    filas: str,
+    columnas: str,
+    *,
+    valores: str | None = None,
+    aggfunc: str | Callable[[Sequence[Any]], Any] = "count",
+    normalizar: str | None = None,
+) -> Tabla:
+    datos = _materializar_tabla(tabla)
+    orden_filas: list[Any] = []
+    orden_columnas: list[Any] = []
+    acumulados: dict[Any, dict[Any, list[Any]]] = {}
+
+    for fila in datos:
+        clave_fila = fila.get(filas)
+        clave_columna = fila.get(columnas)
+        if clave_fila not in orden_filas:
+            orden_filas.append(clave_fila)
+        if clave_columna not in orden_columnas:
+            orden_columnas.append(clave_columna)
+        acumulados.setdefault(clave_fila, {}).setdefault(clave_columna, []).append(
+            fila.get(valores) if valores is not None else 1
+        )
+
+    resultado: Tabla = []
+    for clave_fila in orden_filas:
+        fila_salida: Registro = {filas: clave_fila}
+        for clave_columna in orden_columnas:
+            valores_celda = acumulados.get(clave_fila, {}).get(clave_columna, [])
+            if valores is None:
+                valor = len(valores_celda)
+            else:
+                if callable(aggfunc):
+                    valor = aggfunc(valores_celda)
+                else:
+                    valor = _aplicar_agregacion(str(aggfunc), valores_celda)
+                if valor is None:
+                    valor = 0
+            fila_salida[clave_columna] = valor
+        resultado.append(fila_salida)
+
+    if normalizar == "filas":
+        for fila in resultado:
+            total = sum(valor for clave, valor in fila.items() if clave != filas)
+            if total:
+                for clave in orden_columnas:
+                    fila[clave] = fila[clave] / total
+    elif normalizar == "columnas":
+        totales = Counter({clave: 0.0 for clave in orden_columnas})
+        for fila in resultado:
+            for clave in orden_columnas:
+                totales[clave] += fila[clave]
+        for fila in resultado:
+            for clave in orden_columnas:
+                total = totales[clave]
+                fila[clave] = fila[clave] / total if total else 0.0
+
+    return resultado
+
+
+@_conserva_columnar
+def pivotar_ancho(
+    tabla: Iterable[Registro],
+    *,
+    id_columnas: str,
+    nombres_desde: str,
+    valores_desde: str,
+    valores_relleno: Any = None,
+) -> Tabla:
+    filas = _materializar_tabla(tabla)
+    indices: list[Any] = []
+    columnas_dinamicas: list[Any] = []
+    resultado: dict[Any, Registro] = {}
+
+    for fila in filas:
+        clave = fila.get(id_columnas)
+        if clave not in indices:
+            indices.append(clave)
+            resultado[clave] = {id_columnas: clave}
+        nombre = fila.get(nombres_desde)
+        if nombre not in columnas_dinamicas:
+            columnas_dinamicas.append(nombre)
+        valor = fila.get(valores_desde, valores_relleno)
+        if valor is None:
+            valor = valores_relleno
+        resultado[clave][f"{valores_desde}_{nombre}"] = valor
+
+    salida: Tabla = []
+    for clave in indices:
+        fila = resultado[clave]
+        for nombre in columnas_dinamicas:
+            columna = f"{valores_desde}_{nombre}"
+            fila.setdefault(columna, valores_relleno)
+        salida.append(dict(fila))
+    return salida
+
+
+@_conserva_columnar
+def pivotar_largo(
+    tabla: Iterable[Registro],
+    *,
+    columnas: Sequence[str],
+    id_columnas: str,
+    nombres_a: str,
+    valores_a: str,
+    eliminar_nulos: bool = False,
+) -> Tabla:
+    filas = _materializar_tabla(tabla)
+    resultado: Tabla = []
+    for fila in filas:
+        identificador = fila.get(id_columnas)
+        for columna in columnas:
+            valor = fila.get(columna)
+            if valor is None and eliminar_nulos:
+                continue
+            resultado.append({
+                id_columnas: identificador,
+                nombres_a: columna,
+                valores_a: valor,
+            })
+    return resultado
+
+
+def ordenar_tabla(
+    tabla: Iterable[Registro],
+    *,
+    por: Sequence[str],
+    ascendente: bool | Sequence[bool] = True,
+) -> Tabla:
+    if isinstance(ascendente, bool):
+        ordenes = [ascendente] * len(por)
+    else:
+        ordenes = list(ascendente)
+    if len(ordenes) != len(por):
+        raise ValueError("La lista de orden debe coincidir con las columnas")
+    if isinstance(tabla, TablaColumnar):
+        return _ordenar_columnar(tabla, por, ordenes)
+    filas = _materializar_tabla(tabla)
+
+    resultado = _copiar_tabla(filas)
+    for columna, asc in reversed(list(zip(por, ordenes))):
+        resultado.sort(key=lambda fila: (fila.get(columna) is None, fila.get(columna)), reverse=not asc)
+    return resultado
+
+
+def combinar_tablas(
+    izquierda: Iterable[Registro],
+    derecha: Iterable[Registro],
+    *,
+    claves: Mapping[str, str] | Sequence[str] | tuple[str, str],
+    tipo: str = "inner",
+    procesos: int | None = None,
+) -> Tabla:
+    """Une ``izquierda`` y ``derecha`` por igualdad de clave.
+
+    Las filas siguen el orden de la tabla izquierda; en uniones ``outer`` las
+    filas derechas sin pareja se añaden al final en el orden de aparición de
+    su clave. Con ``procesos`` mayor que 1 las tablas grandes se reparten por
+    hash de la clave entre un grupo de procesos y los resultados se
+    intercalan conservando ese mismo orden.
+    """
+
+    if isinstance(claves, Mapping):
+        clave_izquierda = claves.get("izquierda")
+        clave_derecha = claves.get("derecha")
+    elif isinstance(claves, Sequence) and len(claves) == 2:
+        clave_izquierda, clave_derecha = claves
+    else:
+        raise ValueError("Debes proporcionar las claves de unión")
+
+    if isinstance(izquierda, TablaColumnar) or isinstance(derecha, TablaColumnar):
+        return _combinar_columnar(
+            _a_columnar(izquierda), _a_columnar(derecha), clave_izquierda, clave_derecha, tipo
+        )
+    tabla_izquierda = _materializar_tabla(izquierda)
+    tabla_derecha = _materializar_tabla(derecha)
+    # Las columnas de relleno se calculan una sola vez por tabla.
+    columnas_derecha = _columnas(tabla_derecha) if tipo in {"left", "outer"} else []
+    columnas_izquierda = _columnas(tabla_izquierda) if tipo == "outer" else []
+    argumentos = (clave_izquierda, clave_derecha, tipo, columnas_izquierda, columnas_derecha)
+
+    efectivos = _procesos_efectivos(procesos, len(tabla_izquierda) + len(tabla_derecha))
+    if efectivos:
+        return _combinar_en_paralelo(tabla_izquierda, tabla_derecha, *argumentos, efectivos)
+    cuerpo, cola = _combinar_filas(tabla_izquierda, tabla_derecha, *argumentos)
+    return [fila for _, fila in chain(cuerpo, cola)]
+
+
+@_conserva_columnar
+def rellenar_nulos(
+    tabla: Iterable[Registro],
+    reemplazos: Mapping[str, Any] | Any,
+) -> Tabla:
+    filas = _materializar_tabla(tabla)
+    if isinstance(reemplazos, Mapping):
+        reemplazos_map = reemplazos
+    else:
+        reemplazos_map = defaultdict(lambda: reemplazos)
+    resultado: Tabla = []
+    for fila in filas:
+        nuevo = dict(fila)
+        for columna, valor in list(nuevo.items()):
+            if valor is None and columna in reemplazos_map:
+                nuevo[columna] = reemplazos_map[columna]
+        resultado.append(nuevo)
+    return resultado
+
+
+@_conserva_columnar
+def desplegar_tabla(
+    tabla: Iterable[Registro],
+    *,
+    identificadores: Sequence[str] | str,
+    valores: Sequence[str] | None = None,
+    var_name: str = "variable",
+    value_name: str = "value",
+) -> Tabla:
+    filas = _materializar_tabla(tabla)
+    ids = [identificadores] if isinstance(identificadores, str) else list(identificadores)
+    columnas = valores if valores is not None else [col for col in _columnas(filas) if col not in ids]
+
+    resultado: Tabla = []
+    for columna in columnas:
+        for fila in filas:
+            base = {col: fila.get(col) for col in ids}
+            registro = dict(base)
+            registro[var_name] = columna
+            registro[value_name] = fila.get(columna)
+            resultado.append(registro)
+    return resultado
+
+
+@_conserva_columnar
+def pivotar_tabla(
+    tabla: Iterable[Registro],
+    *,
+    index: str | Sequence[str],
+    columnas: str,
+    valores: str | Sequence[str],
+    agregacion: Mapping[str, str | Sequence[str]] | str = "mean",
+) -> Tabla:
+    filas = _materializar_tabla(tabla)
+    indices = [index] if isinstance(index, str) else list(index)
+    valores_lista = [valores] if isinstance(valores, str) else list(valores)
+
+    if isinstance(agregacion, Mapping):
+        agregaciones = agregacion
+    else:
+        agregaciones = {valor: agregacion for valor in valores_lista}
+
+    orden_indices: list[tuple[Any, ...]] = []
+    orden_columnas: list[Any] = []
+    acumulados: dict[tuple[Any, ...], dict[Any, dict[str, list[Any]]]] = {}
+
+    for fila in filas:
+        clave_indice = tuple(fila.get(col) for col in indices)
+        clave_columna = fila.get(columnas)
+        if clave_indice not in acumulados:
+            acumulados[clave_indice] = {}
+            orden_indices.append(clave_indice)
+        if clave_columna not in orden_columnas:
+            orden_columnas.append(clave_columna)
+        destino = acumulados[clave_indice].setdefault(clave_columna, {valor: [] for valor in valores_lista})
+        for valor in valores_lista:
+            destino.setdefault(valor, []).append(fila.get(valor))
+
+    resultado: Tabla = []
+    for clave_indice in orden_indices:
+        fila_salida: Registro = {col: val for col, val in zip(indices, clave_indice)}
+        for clave_columna in orden_columnas:
+            valores_columna = acumulados[clave_indice].get(clave_columna, {})
+            for valor in valores_lista:
+                agreg = agregaciones.get(valor, "mean")
+                valores_celda = valores_columna.get(valor, [])
+                if isinstance(agreg, Sequence) and not isinstance(agreg, str):
+                    for nombre in agreg:
+                        fila_salida[f"{valor}_{nombre}_{clave_columna}"] = _aplicar_agregacion(nombre, valores_celda)
+                else:
+                    nombre = str(agreg)
+                    fila_salida[f"{valor}_{nombre}_{clave_columna}"] = _aplicar_agregacion(nombre, valores_celda)
+        resultado.append(fila_salida)
+    return resultado
+
+
+# ---------------------------------------------------------------------------
+# Métricas estadísticas
+# ---------------------------------------------------------------------------
+
+
+def _registros(datos: Any) -> Iterator[Mapping[str, Any]]:
+    """Recorre las filas de ``datos`` sin copiarlas."""
+
+    if (
+        isinstance(datos, (Mapping, TablaColumnar))
+        or callable(getattr(datos, "to_dict", None))
+        or not isinstance(datos, Iterable)
+    ):
+        yield from _materializar_tabla(datos)
+        return
+    for fila in datos:
+        if not isinstance(fila, Mapping):
+            raise TypeError("Las filas deben ser diccionarios")
+        yield fila
+
+
+def _acumular_columnas(
+    datos: Any,
+    columnas: Sequence[str] | None,
+    exacto: bool,
+    estado: dict[str, EstadisticasColumna | None] | None = None,
+) -> dict[str, EstadisticasColumna | None]:
+    """Acumula en una sola pasada las estadísticas de cada columna numérica.
+
+    ``estado`` conserva las columnas en orden de primera aparición (con
+    ``None`` mientras no hayan mostrado valores numéricos) y permite seguir
+    acumulando lote a lote.
+    """
+
+    estado = {} if estado is None else estado
+    if isinstance(datos, TablaColumnar):
+        for columna in columnas if columnas is not None else datos.columnas:
+            valores = _numeros_columnar(datos, columna)
+            actual = estado.setdefault(columna, None)
+            if len(valores):
+                if actual is None:
+                    actual = estado[columna] = EstadisticasColumna(exacto=exacto)
+                actual.agregar_bloque(valores)
+        return estado
+    if columnas is not None:
+        for columna in columnas:
+            estado.setdefault(columna, None)
+    for fila in _registros(datos):
+        for columna, valor in fila.items():
+            actual = estado.get(columna, _MISSING)
+            if actual is _MISSING:
+                if columnas is not None:
+                    continue
+                actual = estado[columna] = None
+            if not _es_numero(valor):
+                continue
+            if actual is None:
+                actual = estado[columna] = EstadisticasColumna(exacto=exacto)
+            actual.agregar(float(valor))
+    return estado
+
+
+def _describir_estado(estado: Mapping[str, EstadisticasColumna | None]) -> dict[str, dict[str, float]]:
+    return {
+        columna: estadisticas.describir()
+        for columna, estadisticas in estado.items()
+        if estadisticas is not None
+    }
+
+
+def describir(datos: Iterable[Registro], *, exacto: bool = True) -> dict[str, dict[str, float]]:
+    """Conteo, media, desviación, extremos y cuartiles de cada columna numérica.
+
+    Los datos se recorren una sola vez. Con ``exacto=False`` los cuartiles se
+    estiman con un boceto de memoria acotada
+    (:class:`~pcobra.standard_library.estadistica.BocetoCuantiles`).
+    """
+
+    return _describir_estado(_acumular_columnas(datos, None, exacto))
+
+
+def describir_por_lotes(
+    lotes: Iterable[Iterable[Registro]], *, exacto: bool = True
+) -> dict[str, dict[str, float]]:
+    """Equivalente incremental de :func:`describir` para lotes en streaming."""
+
+    estado: dict[str, EstadisticasColumna | None] = {}
+    for lote in lotes:
+        _acumular_columnas(lote, None, exacto, estado)
+    return _describir_estado(estado)
+
+
+def _preparar_estadistica(
+    datos: Any, columnas: Sequence[str] | None
+) -> tuple[Tabla | TablaColumnar, list[str]]:
+    if isinstance(datos, TablaColumnar):
+        objetivo = list(columnas) if columnas is not None else _columnas_numericas_columnar(datos)
+        return datos, objetivo
+    tabla = _materializar_tabla(datos)
+    objetivo = list(columnas) if columnas is not None else _columnas_numericas(tabla)
+    return tabla, objetivo
+
+
+def _pares(tabla: Tabla | TablaColumnar, columna_a: str, columna_b: str) -> tuple[Any, Any]:
+    if isinstance(tabla, TablaColumnar):
+        return _pares_columnar(tabla, columna_a, columna_b)
+    return _pares_listas(tabla, columna_a, columna_b)
+
+
+def _comomentos(
+    tabla: Tabla | TablaColumnar, columnas: Sequence[str]
+) -> dict[tuple[int, int], CovarianzaIncremental]:
+    """Co-momentos de cada par de columnas ``(i, j)`` con ``i <= j``.
+
+    Cada par usa solo las filas en las que ambos valores son numéricos. Las
+    tablas de filas se recorren una única vez para todos los pares.
+    """
+
+    comomentos = {
+        (i, j): CovarianzaIncremental()
+        for i in range(len(columnas))
+        for j in range(i, len(columnas))
+    }
+    if isinstance(tabla, TablaColumnar):
+        for (i, j), acumulador in comomentos.items():
+            acumulador.agregar_bloque(*_pares_columnar(tabla, columnas[i], columnas[j]))
+        return comomentos
+    por_fila = [
+        [comomentos[(i, j)] for j in range(i, len(columnas))] for i in range(len(columnas))
+    ]
+    for fila in tabla:
+        numeros = []
+        for indice, columna in enumerate(columnas):
+            valor = fila.get(columna)
+            if _es_numero(valor):
+                numeros.append((indice, float(valor)))
+        for posicion, (i, x) in enumerate(numeros):
+            acumuladores = por_fila[i]
+            for j, y in numeros[posicion:]:
+                acumuladores[j - i].agregar(x, y)
+    return comomentos
+
+
+def _comomento(
+    comomentos: Mapping[tuple[int, int], CovarianzaIncremental], i: int, j: int
+) -> CovarianzaIncremental:
+    return comomentos[(i, j) if i <= j else (j, i)]
+
+
+def correlacion_pearson(
+    datos: Iterable[Registro],
+    *,
+    columnas: Sequence[str] | None = None,
+) -> dict[str, dict[str, float]]:
+    tabla, columnas_objetivo = _preparar_estadistica(datos, columnas)
+    if not columnas_objetivo:
+        raise ValueError("No hay columnas numéricas para calcular la correlación")
+
+    if isinstance(tabla, TablaColumnar):
+        disponibles = set(tabla.columnas)
+    else:
+        disponibles = {col for fila in tabla for col in fila.keys()}
+    for columna in columnas_objetivo:
+        if columna not in disponibles:
+            raise KeyError(columna)
+
+    comomentos = _comomentos(tabla, columnas_objetivo)
+    resultado: dict[str, dict[str, float]] = {}
+    algun_valor = False
+    for i, columna_a in enumerate(columnas_objetivo):
+        resultado[columna_a] = {}
+        for j, columna_b in enumerate(columnas_objetivo):
+            acumulador = _comomento(comomentos, i, j)
+            if not acumulador.conteo:
+                valor = 0.0
+            else:
+                valor = 1.0 if columna_a == columna_b else acumulador.correlacion
+                algun_valor = True
+            resultado[columna_a][columna_b] = valor
+    if not algun_valor:
+        raise ValueError("No hay suficientes datos numéricos para correlación")
+    return resultado
+
+
+def correlacion_spearman(
+    datos: Iterable[Registro],
+    *,
+    columnas: Sequence[str] | None = None,
+) -> dict[str, dict[str, float]]:
+    tabla, columnas_objetivo = _preparar_estadistica(datos, columnas)
+    if not columnas_objetivo:
+        raise ValueError("No hay columnas numéricas para calcular la correlación")
+
+    # La correlación es simétrica: cada par se calcula una sola vez.
+    por_par: dict[tuple[str, str], float | None] = {}
+    resultado: dict[str, dict[str, float]] = {}
+    algun_valor = False
+    for columna_a in columnas_objetivo:
+        resultado[columna_a] = {}
+        for columna_b in columnas_objetivo:
+            clave = (columna_b, columna_a)
+            if clave in por_par:
+                valor = por_par[clave]
+            else:
+                valores_a, valores_b = _pares(tabla, columna_a, columna_b)
+                valor = None
+                if len(valores_a):
+                    rangos_a = _rango_promedio(valores_a)
+                    rangos_b = _rango_promedio(valores_b)
+                    valor = _calcular_pearson(rangos_a, rangos_b)
+                por_par[(columna_a, columna_b)] = valor
+            if valor is None:
+                valor = 0.0
+            else:
+                algun_valor = True
+                if columna_a == columna_b:
+                    valor = 1.0
+            resultado[columna_a][columna_b] = valor
+    if not algun_valor:
+        raise ValueError("No hay suficientes datos numéricos para correlación")
+    return resultado
+
+
+def matriz_covarianza(
+    datos: Iterable[Registro],
+    *,
+    columnas: Sequence[str] | None = None,
+) -> dict[str, dict[str, float]]:
+    tabla, columnas_objetivo = _preparar_estadistica(datos, columnas)
+    if not columnas_objetivo:
+        raise ValueError("No hay columnas numéricas para calcular la covarianza")
+
+    if isinstance(tabla, TablaColumnar):
+        obtener_valores = functools.partial(_numeros_columnar, tabla)
+    else:
+        obtener_valores = functools.partial(_valores_numericos, tabla)
+    comomentos = _comomentos(tabla, columnas_objetivo)
+    resultado: dict[str, dict[str, float]] = {}
+    algun_valor = False
+    for i, columna_a in enumerate(columnas_objetivo):
+        resultado[columna_a] = {}
+        for j, columna_b in enumerate(columnas_objetivo):
+            acumulador = _comomento(comomentos, i, j)
+            if acumulador.conteo:
+                valor = acumulador.covarianza
+                algun_valor = True
+            else:
+                valores_a = obtener_valores(columna_a)
+                valores_b = obtener_valores(columna_b)
+                if not len(valores_a) or not len(valores_b):
+                    valor = 0.0
+                else:
+                    valor = _calcular_covarianza(list(valores_a), list(valores_b))
+                    algun_valor = True
+            resultado[columna_a][columna_b] = valor
+    if not algun_valor:
+        raise ValueError("No hay suficientes datos numéricos para covarianza")
+    return resultado
+
+
+def calcular_percentiles(
+    datos: Iterable[Registro],
+    *,
+    columnas: Sequence[str] | None = None,
+    percentiles: Sequence[int] = (25, 50, 75),
+    exacto: bool = True,
+) -> dict[str, dict[str, float]]:
+    """Percentiles por columna numérica con interpolación lineal.
+
+    Todos los percentiles de una columna salen de una única ordenación; con
+    ``exacto=False`` se estiman con un boceto de memoria acotada.
+    """
+
+    if not percentiles:
+        raise ValueError("Debes proporcionar al menos un percentil")
+    if any(percentil < 0 or percentil > 100 for percentil in percentiles):
+        raise ValueError("Los percentiles deben estar entre 0 y 100")
+
+    estado = _acumular_columnas(datos, columnas, exacto)
+    resultado: dict[str, dict[str, float]] = {}
+    for columna, estadisticas in estado.items():
+        if estadisticas is None:
+            continue
+        valores = estadisticas.percentiles(percentiles)
+        resultado[columna] = {
+            f"p{percentil}": valor for percentil, valor in zip(percentiles, valores)
+        }
+    return resultado
+
+
+class _ColumnaRapida:
+    """Estado de :func:`resumen_rapido` para una columna."""
+
+    __slots__ = (
+        "no_nulos",
+        "ejemplo",
+        "numeros",
+        "solo_numeros",
+        "solo_fechas",
+        "minimo",
+        "maximo",
+        "_pendientes",
+    )
+
+    def __init__(self) -> None:
+        self.no_nulos = 0
+        self.ejemplo: Any = None
+        self.numeros = ResumenNumerico()
+        self.solo_numeros = True
+        self.solo_fechas = True
+        self.minimo: Any = _MISSING
+        self.maximo: Any = _MISSING
+        self._pendientes: list[Any] = []
+
+    def agregar(self, valor: Any) -> None:
+        if valor is None:
+            return
+        if not self.no_nulos:
+            self.ejemplo = valor
+        self.no_nulos += 1
+        if _es_numero(valor):
+            self.solo_fechas = False
+            if self.solo_numeros:
+                # Los números se acumulan por bloques; el mínimo bruto se
+                # actualiza al volcarlos.
+                self._pendientes.append(valor)
+                if len(self._pendientes) >= TAMANO_BLOQUE:
+                    self._volcar()
+                return
+        else:
+            if self.solo_numeros:
+                # Volcar antes conserva el orden de comparación del mínimo.
+                self._volcar()
+                self.solo_numeros = False
+            if self.solo_fechas and not hasattr(valor, "isoformat"):
+                self.solo_fechas = False
+        if self.minimo is _MISSING or valor < self.minimo:
+            self.minimo = valor
+        if self.solo_fechas and (self.maximo is _MISSING or valor > self.maximo):
+            self.maximo = valor
+
+    def _volcar(self) -> None:
+        if not self._pendientes:
+            return
+        bloque = self._pendientes
+        self._pendientes = []
+        menor = min(bloque)
+        if self.minimo is _MISSING or menor < self.minimo:
+            self.minimo = menor
+        if NUMPY_DISPONIBLE:
+            self.numeros.agregar_bloque(np.asarray(bloque, dtype=np.float64))
+        else:
+            self.numeros.agregar_bloque([float(valor) for valor in bloque])
+
+    def agregar_arreglo(self, valores: Any) -> None:
+        if not len(valores):
+            return
+        if not self.no_nulos:
+            self.ejemplo = valores[0].item()
+        self.no_nulos += len(valores)
+        self.numeros.agregar_bloque(valores.astype(np.float64, copy=False))
+
+    def registro(self, columna: str, total: int) -> dict[str, Any]:
+        self._volcar()
+        ejemplo = self.ejemplo
+        registro: dict[str, Any] = {
+            "columna": columna,
+            "conteo": total,
+            "nulos": total - self.no_nulos,
+            "ejemplo": ejemplo.isoformat() if hasattr(ejemplo, "isoformat") else ejemplo,
+        }
+        if not self.no_nulos:
+            return registro
+        if self.solo_numeros:
+            registro["media"] = self.numeros.media
+            registro["min"] = self.numeros.minimo
+            registro["max"] = self.numeros.maximo
+        elif self.solo_fechas:
+            registro["min"] = self.minimo.isoformat()
+            registro["max"] = self.maximo.isoformat()
+        else:
+            registro["min"] = str(self.minimo)
+        return registro
+
+
+def resumen_rapido(datos: Iterable[Registro]) -> list[dict[str, Any]]:
+    """Conteo, nulos, ejemplo y rango de cada columna en una sola pasada."""
+
+    columnas: dict[str, _ColumnaRapida] = {}
+    total = 0
+    if isinstance(datos, TablaColumnar):
+        total = len(datos)
+        for columna in datos.columnas:
+            estado = columnas[columna] = _ColumnaRapida()
+            almacenamiento = datos.almacenamiento(columna)
+            arreglo = como_numpy(almacenamiento)
+            if arreglo is not None:
+                estado.agregar_arreglo(arreglo)
+                continue
+            for valor in a_lista(almacenamiento):
+                estado.agregar(valor)
+    else:
+        for fila in _registros(datos):
+            total += 1
+            for columna, valor in fila.items():
+                estado = columnas.get(columna)
+                if estado is None:
+                    estado = columnas[columna] = _ColumnaRapida()
+                estado.agregar(valor)
+    return [estado.registro(columna, total) for columna, estado in columnas.items()]
+
+
+def invertir_tabla(tabla: Iterable[Registro]) -> Tabla:
+    """Devuelve una copia de ``tabla`` en orden inverso."""
+
+    if isinstance(tabla, TablaColumnar):
+        return tabla[::-1]
+    materializada = _materializar_tabla(tabla)
+    return list(reversed(materializada))
+
+
+def tomar(tabla: Iterable[Registro], cantidad: int) -> Tabla:
+    """Retorna las primeras ``cantidad`` filas de ``tabla``."""
+
+    if cantidad < 0:
+        raise ValueError("cantidad debe ser >= 0")
+    if isinstance(tabla, TablaColumnar):
+        return tabla[:cantidad]
+    materializada = _materializar_tabla(tabla)
+    return materializada[:cantidad]
@@ -0,0 +1,11 @@
+"""Wrapper de tooling para comparar backends de serialización.
+
+Importante: ``scripts/`` no forma parte del contrato de import en distribución;
+el código reusable de runtime vive en ``src/pcobra/...``.
+"""
+
+from pcobra.cobra.benchmarks.serializacion_bench import main
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,28 +5,39 @@ principal para paquetes ``.co`` ya descargados, pero escribe artefactos propios
 un subdirectorio separado. Así se evitan escrituras accidentales dentro del
 proyecto: el instalador solo debe tocar el árbol del usuario cuando genera de
 forma explícita ``cobra.lock``.
+
+La capa propia guarda cada contenido una vez en un
+:class:`~pcobra.cobra.hub.store.ContentAddressedStore` (subdirectorio
+``store``) y expone los artefactos como enlaces a esos blobs. Su índice
+recuerda el SHA-256 de cada candidato, de modo que validar un artefacto que no
+ha cambiado no vuelve a leerlo.
 """
 
 from __future__ import annotations
 
 import os
-import shutil
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
+from typing import Iterable
 
 from pcobra.cobra.hub.repository import package_cache_dir
 from pcobra.cobra.packaging import normalizar_nombre_paquete, validar_version_paquete
 from pcobra.cobra.hub.integrity import normalize_sha256, sha256_file
+from pcobra.cobra.hub.store import ContentAddressedStore
 
 __all__ = [
     "COBRA_INSTALLER_CACHE_DIR_ENV",
+    "COBRA_INSTALLER_CACHE_MAX_BYTES_ENV",
     "CobraInstallerCache",
     "CobraInstallerCacheEntry",
     "installer_cache_dir",
 ]
 
 COBRA_INSTALLER_CACHE_DIR_ENV = "COBRA_INSTALLER_CACHE_DIR"
+COBRA_INSTALLER_CACHE_MAX_BYTES_ENV = "COBRA_INSTALLER_CACHE_MAX_BYTES"
 _INSTALLER_CACHE_SUBDIR = "cobra-installer"
+_STORE_SUBDIR = "store"
 
 
 @dataclass(frozen=True)
@@ -50,7 +61,10 @@ class CobraInstallerCache:
     2. Subdirectorio propio de CobraInstaller para artefactos temporales.
 
     Las escrituras de :meth:`put` siempre van a la capa propia del instalador y
-    nunca al directorio del proyecto.
+    nunca al directorio del proyecto. Con ``max_bytes`` (o
+    ``COBRA_INSTALLER_CACHE_MAX_BYTES``) cada :meth:`put` expulsa los
+    artefactos usados hace más tiempo hasta respetar ese presupuesto, salvo el
+    recién guardado aunque por sí solo lo supere.
     """
 
     def __init__(
@@ -58,6 +72,7 @@ class CobraInstallerCache:
         *,
         cache_dir: str | Path | None = None,
         hub_cache_dir: str | Path | None = None,
+        max_bytes: int | None = None,
     ) -> None:
         env_cache_dir = os.environ.get(COBRA_INSTALLER_CACHE_DIR_ENV)
         self._explicit_installer_cache = cache_dir is not None or bool(env_cache_dir)
@@ -66,6 +81,16 @@ class CobraInstallerCache:
         )
         self.cache_dir = installer_cache_dir(cache_dir, hub_cache_dir=self.hub_cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        env_max_bytes = os.environ.get(COBRA_INSTALLER_CACHE_MAX_BYTES_ENV)
+        if max_bytes is None and env_max_bytes:
+            max_bytes = int(env_max_bytes)
+        self.max_bytes = max_bytes
+
+    @cached_property
+    def store(self) -> ContentAddressedStore:
+        """Almacén direccionado por contenido de la capa propia del instalador."""
+
+        return ContentAddressedStore(self.cache_dir / _STORE_SUBDIR)
 
     def get(
         self,
@@ -97,7 +122,21 @@ class CobraInstallerCache:
                 return entry
             if source == "installer-cache":
                 candidate.unlink(missing_ok=True)
-        return None
+        # El índice conserva el contenido aunque falte el enlace con nombre.
+        stored = self.store.get(
+            normalized_name, normalized_version, expected_sha256=expected_sha256
+        )
+        if stored is None:
+            return None
+        target = self.cache_dir / self._filename(normalized_name, normalized_version)
+        self.store.install(stored.sha256, target)
+        return CobraInstallerCacheEntry(
+            name=normalized_name,
+            version=normalized_version,
+            path=target,
+            sha256=stored.sha256,
+            source="installer-cache",
+        )
 
     def put(
         self,
@@ -107,14 +146,31 @@ class CobraInstallerCache:
         *,
         expected_sha256: str | None = None,
     ) -> CobraInstallerCacheEntry:
-        """Copia ``artifact`` a la caché propia del instalador y lo valida."""
+        """Guarda ``artifact`` en la caché propia del instalador y lo valida.
+
+        El contenido se almacena una sola vez por SHA-256 y se enlaza en
+        ``<nombre>-<versión>.co`` de forma atómica.
+        """
 
         normalized_name, normalized_version = self._normalize_key(name, version)
         expected_sha256 = self._normalize_hash(expected_sha256)
         source_path = Path(artifact).expanduser()
         target = self.cache_dir / self._filename(normalized_name, normalized_version)
-        if source_path.resolve() != target.resolve():
-            shutil.copy2(source_path, target)
+        try:
+            stored = self.store.add(
+                normalized_name,
+                normalized_version,
+                source_path,
+                expected_sha256=expected_sha256,
+            )
+        except ValueError:
+            raise ValueError(
+                f"Artefacto inválido para {normalized_name}=={normalized_version}"
+            ) from None
+        self.store.install(stored.sha256, target)
+        if self.max_bytes is not None:
+            # El artefacto recién guardado nunca se expulsa a sí mismo.
+            self.gc(self.max_bytes, keep=(stored.sha256,))
         entry = self.validate(
             target,
             normalized_name,
@@ -149,7 +205,7 @@ class CobraInstallerCache:
             f"{normalized_name}.co",
         }:
             return None
-        digest = self._sha256_file(path)
+        digest = self.store.digest(path)
         expected_sha256 = self._normalize_hash(expected_sha256)
         if expected_sha256 and digest.lower() != expected_sha256.lower():
             return None
@@ -174,8 +230,30 @@ class CobraInstallerCache:
                 continue
             path.unlink(missing_ok=True)
             deleted += 1
+        self.store.remove(
+            normalizar_nombre_paquete(name) if name is not None else None,
+            validar_version_paquete(version) if version is not None else None,
+        )
         return deleted
 
+    def gc(self, max_bytes: int, *, keep: Iterable[str] = ()) -> int:
+        """Expulsa los artefactos usados hace más tiempo hasta ocupar ``max_bytes``.
+
+        Elimina también sus enlaces con nombre en la caché propia para que el
+        espacio se libere de verdad; los SHA-256 de ``keep`` se conservan.
+        Devuelve el número de entradas expulsadas.
+        """
+
+        evicted = self.store.gc(max_bytes, keep=keep)
+        for artifact in evicted:
+            path = self.cache_dir / self._filename(artifact.name, artifact.version)
+            try:
+                if path.is_file() and self.store.digest(path) == artifact.sha256:
+                    path.unlink()
+            except OSError:
+                continue
+        return len(evicted)
+
     def candidates(self, name: str, version: str) -> list[Path]:
         """Lista rutas candidatas en orden de prioridad de lectura."""
 
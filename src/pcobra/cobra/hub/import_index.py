@@ -0,0 +1,251 @@
+"""Índice persistente de imports Cobra por archivo.
+
+Recorre los fuentes ``.cobra``/``.co`` de un proyecto podando los directorios
+ignorados durante el recorrido y guarda, por archivo, su ``mtime``, tamaño,
+SHA-256 y los módulos que importa con ``usar``/``import``. En recorridos
+posteriores solo se vuelven a leer los archivos cuya marca cambió, y solo se
+reanalizan aquellos cuyo contenido cambió de verdad.
+
+El índice vive fuera del proyecto (``COBRA_IMPORT_INDEX_DIR`` o
+``<caché de CobraHub>/import-index``) para no escribir en el árbol del usuario,
+y es reutilizable por el resolvedor de dependencias, el orquestador de
+construcción y el LSP.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from pcobra.cobra.hub.repository import package_cache_dir
+
+__all__ = [
+    "COBRA_IMPORT_INDEX_DIR_ENV",
+    "IGNORED_DIRS",
+    "ImportIndex",
+    "ImportIndexEntry",
+    "MAX_INDEXES",
+    "import_index_dir",
+    "scan_cobra_imports",
+]
+
+COBRA_IMPORT_INDEX_DIR_ENV = "COBRA_IMPORT_INDEX_DIR"
+IGNORED_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        "__pycache__",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".ruff_cache",
+    }
+)
+_SOURCE_SUFFIXES = (".cobra", ".co")
+_INDEX_FORMAT = 1
+# Índices que se conservan en ``import_index_dir()``; al superarse se borran
+# los usados hace más tiempo (por ``mtime``).
+MAX_INDEXES = 256
+_IMPORT_RE = re.compile(
+    r"^\s*(?:usar\s+(?P<usar>\"[^\"]+\"|'[^']+'|[A-Za-z_][\w]*(?:\.[A-Za-z_][\w]*)+)|import\s+(?P<import>\"[^\"]+\"|'[^']+'))",
+    re.MULTILINE,
+)
+
+
+def scan_cobra_imports(text: str) -> tuple[str, ...]:
+    """Devuelve los módulos importados estáticamente por un fuente Cobra."""
+
+    modules = []
+    for match in _IMPORT_RE.finditer(text):
+        raw = match.group("usar") or match.group("import") or ""
+        modules.append(raw.strip().strip("\"'"))
+    return tuple(modules)
+
+
+def import_index_dir() -> Path:
+    """Directorio donde se guardan los índices de imports."""
+
+    configured = os.environ.get(COBRA_IMPORT_INDEX_DIR_ENV)
+    if configured:
+        return Path(configured).expanduser()
+    return package_cache_dir() / "import-index"
+
+
+@dataclass(frozen=True)
+class ImportIndexEntry:
+    """Imports de un archivo junto con la marca usada para detectar cambios."""
+
+    path: Path
+    mtime_ns: int
+    size: int
+    sha256: str
+    imports: tuple[str, ...]
+
+
+class ImportIndex:
+    """Índice incremental de imports Cobra de ``root``."""
+
+    def __init__(
+        self, root: str | Path, *, index_path: str | Path | None = None
+    ) -> None:
+        self.root = Path(root).resolve()
+        # Solo se poda el directorio compartido, nunca el de una ruta explícita.
+        self._prunable = index_path is None
+        if index_path is None:
+            key = hashlib.sha256(str(self.root).encode("utf-8")).hexdigest()[:32]
+            index_path = import_index_dir() / f"{key}.json"
+        self.index_path = Path(index_path)
+        self.rescanned = 0
+
+    def scan(self) -> dict[Path, ImportIndexEntry]:
+        """Actualiza el índice y devuelve una entrada por fuente del proyecto.
+
+        ``rescanned`` indica cuántos archivos hubo que leer en esta pasada.
+        """
+
+        previous = self._load()
+        entries: dict[Path, ImportIndexEntry] = {}
+        self.rescanned = 0
+        for path in self._iter_sources():
+            relative = path.relative_to(self.root).as_posix()
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            cached = previous.get(relative)
+            if (
+                cached is not None
+                and cached.mtime_ns == stat.st_mtime_ns
+                and cached.size == stat.st_size
+            ):
+                entries[path] = ImportIndexEntry(
+                    path, cached.mtime_ns, cached.size, cached.sha256, cached.imports
+                )
+                continue
+            try:
+                data = path.read_bytes()
+            except OSError:
+                continue
+            self.rescanned += 1
+            digest = hashlib.sha256(data).hexdigest()
+            if cached is not None and cached.sha256 == digest:
+                imports = cached.imports
+            else:
+                try:
+                    imports = scan_cobra_imports(data.decode("utf-8"))
+                except UnicodeDecodeError:
+                    imports = ()
+            entries[path] = ImportIndexEntry(
+                path, stat.st_mtime_ns, stat.st_size, digest, imports
+            )
+
+        current = {
+            path.relative_to(self.root).as_posix(): entry
+            for path, entry in entries.items()
+        }
+        if current != previous:
+            self._save(current)
+        else:
+            try:
+                # Marca el índice como usado para la poda LRU.
+                os.utime(self.index_path)
+            except OSError:
+                pass
+        return entries
+
+    def modules(self) -> set[str]:
+        """Módulos importados por cualquier fuente del proyecto."""
+
+        return {module for entry in self.scan().values() for module in entry.imports}
+
+    def _iter_sources(self) -> Iterator[Path]:
+        for directory, dirnames, filenames in os.walk(self.root):
+            # Podar aquí evita descender a ``.git`` y similares.
+            dirnames[:] = sorted(name for name in dirnames if name not in IGNORED_DIRS)
+            for filename in sorted(filenames):
+                if not filename.endswith(_SOURCE_SUFFIXES):
+                    continue
+                path = Path(directory, filename)
+                if path.is_file():
+                    yield path
+
+    def _load(self) -> dict[str, ImportIndexEntry]:
+        try:
+            raw = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(raw, dict) or raw.get("format") != _INDEX_FORMAT:
+            return {}
+        if raw.get("root") != str(self.root):
+            return {}
+        entries = {}
+        for relative, item in (raw.get("files") or {}).items():
+            try:
+                mtime_ns, size, digest, imports = item
+                entries[relative] = ImportIndexEntry(
+                    self.root / relative,
+                    int(mtime_ns),
+                    int(size),
+                    str(digest),
+                    tuple(str(module) for module in imports),
+                )
+            except (TypeError, ValueError):
+                continue
+        return entries
+
+    def _save(self, entries: dict[str, ImportIndexEntry]) -> None:
+        payload = {
+            "format": _INDEX_FORMAT,
+            "root": str(self.root),
+            "files": {
+                relative: [
+                    entry.mtime_ns,
+                    entry.size,
+                    entry.sha256,
+                    list(entry.imports),
+                ]
+                for relative, entry in sorted(entries.items())
+            },
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            descriptor, temporary = tempfile.mkstemp(
+                dir=self.index_path.parent, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                    json.dump(payload, handle)
+                os.replace(temporary, self.index_path)
+            except BaseException:
+                Path(temporary).unlink(missing_ok=True)
+                raise
+        except OSError:
+            # El índice es solo una optimización: sin permisos se recalcula.
+            return
+        if self._prunable:
+            _prune(self.index_path.parent)
+
+
+def _prune(directory: Path) -> None:
+    """Borra los índices usados hace más tiempo por encima de ``MAX_INDEXES``."""
+
+    indexes = []
+    for path in directory.glob("*.json"):
+        try:
+            indexes.append((path.stat().st_mtime_ns, path))
+        except OSError:
+            continue
+    if len(indexes) <= MAX_INDEXES:
+        return
+    indexes.sort()
+    for _mtime, path in indexes[: len(indexes) - MAX_INDEXES]:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            continue
@@ -33,7 +33,6 @@ from pcobra.cobra.hub.models import (
 from pcobra.cobra.hub.providers.local import LocalArtifactProvider
 from pcobra.cobra.packaging import (
     es_paquete_cobra,
-    inspeccionar_paquete,
     normalizar_nombre_paquete,
     validar_paquete,
     validar_version_paquete,
@@ -118,6 +117,7 @@ class CobraHubResolver:
                     source=cache_entry.source if cache_entry else str(candidate),
                     platform=platform,
                     architecture=architecture,
+                    known_sha256=cache_entry.sha256 if cache_entry else None,
                 )
 
         if self.repository is None:
@@ -161,12 +161,15 @@ class CobraHubResolver:
         source: str,
         platform: str = "any",
         architecture: str = "any",
+        known_sha256: str | None = None,
     ) -> CobraHubResolution:
         try:
             if not es_paquete_cobra(path):
                 raise ValueError("el artefacto no es un paquete Cobra .co válido")
-            validation = validar_paquete(path)
-            inspection = inspeccionar_paquete(path)
+            # ``validar_paquete`` ya devuelve la inspección (manifiesto y
+            # SHA-256); repetirla leería y hashearía el artefacto otra vez. Los
+            # candidatos de caché aportan el digest de su índice.
+            validation = inspection = validar_paquete(path, sha256=known_sha256)
         except CobraHubError:
             raise
         except Exception as exc:  # noqa: BLE001 - valida una distribución externa
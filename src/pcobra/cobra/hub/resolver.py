@@ -7,13 +7,14 @@ reinventar el formato ``.co`` ni la caché existente bajo ``pcobra.cobra``.
 
 from __future__ import annotations
 
-import re
 import tomllib
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
 from pcobra.cobra.packaging import normalizar_nombre_paquete, validar_version_paquete
 from pcobra.cobra.hub.errors import PackageResolutionError
+from pcobra.cobra.hub.import_index import ImportIndex
 from pcobra.cobra.hub.installation import CobraHubResolver
 from pcobra.cobra.hub.lockfile import read_lockfile, write_lockfile
 from pcobra.cobra.hub.models import (
@@ -40,19 +41,10 @@ class CobraDependencyError(PackageResolutionError):
     """Error controlado de dependencias apto para CLI e IDLE."""
 
 
-_IMPORT_RE = re.compile(
-    r"^\s*(?:usar\s+(?P<usar>\"[^\"]+\"|'[^']+'|[A-Za-z_][\w]*(?:\.[A-Za-z_][\w]*)+)|import\s+(?P<import>\"[^\"]+\"|'[^']+'))",
-    re.MULTILINE,
-)
-_IGNORED_DIRS = {
-    ".git",
-    ".hg",
-    ".svn",
-    "__pycache__",
-    ".pytest_cache",
-    ".mypy_cache",
-    ".ruff_cache",
-}
+# No supera el tamaño por defecto del pool de conexiones de ``requests`` (10),
+# de modo que las descargas simultáneas reutilizan la sesión de CobraHub sin
+# abrir conexiones desechables.
+_DEFAULT_MAX_WORKERS = 8
 
 
 def resolve_project_dependencies(
@@ -60,6 +52,7 @@ def resolve_project_dependencies(
     *,
     resolver: CobraHubResolver | None = None,
     fail_on_unused_declared: bool = False,
+    max_workers: int | None = None,
 ) -> DependencyResolutionResult:
     """Resuelve y valida las dependencias Cobra de ``project_root``.
 
@@ -67,8 +60,18 @@ def resolve_project_dependencies(
     coincidan con el lockfile cuando existe, que no haya conflictos transitivos y
     que los hashes de los artefactos coincidan con ``cobra.lock``. Si no existe
     lockfile, lo genera con las descargas/localizaciones resueltas.
+
+    El grafo se recorre por niveles: los paquetes de un mismo nivel se
+    localizan/descargan a la vez con hasta ``max_workers`` hilos (``1`` fuerza
+    el modo secuencial) y sus resultados se validan en el mismo orden que el
+    recorrido secuencial, por lo que errores y ``cobra.lock`` son idénticos.
     """
 
+    if max_workers is None:
+        max_workers = _DEFAULT_MAX_WORKERS
+    if max_workers < 1:
+        raise ValueError("max_workers debe ser un entero positivo")
+
     root = Path(project_root).resolve()
     declared = read_declared_dependencies(root / "cobra.toml")
     used_imports = detect_cobra_imports(root)
@@ -96,52 +99,72 @@ def resolve_project_dependencies(
         name: f"proyecto -> {name}=={dep.version}" for name, dep in declared.items()
     }
     requested_sources = {name: dep.source for name, dep in declared.items()}
-    pending = sorted(requested_versions.items())
+    level = sorted(requested_versions.items())
 
-    while pending:
-        name, version = pending.pop(0)
-        if name in resolved:
-            continue
+    def resolve_one(name: str, version: str) -> CobraHubResolution:
         lock_entry = locked.get(name)
-        resolution = hub.resolve(
+        return hub.resolve(
             name,
             version,
             expected_sha256=lock_entry.sha256 if lock_entry else None,
             source=(lock_entry.source if lock_entry else requested_sources.get(name)),
         )
-        if resolution.version != version:
-            raise CobraDependencyError(
-                f"Conflicto de versión para {name}: se pidió {version}, "
-                f"pero CobraHub resolvió {resolution.version}. "
-                f"Cadena: {dependency_chains[name]}."
-            )
-        resolved[name] = resolution
 
-        for transitive_name, transitive_version in sorted(
-            resolution.dependencies.items()
-        ):
-            chain = (
-                f"{dependency_chains[name]} -> {transitive_name}=={transitive_version}"
-            )
-            requested = requested_versions.get(transitive_name)
-            if requested is not None and requested != transitive_version:
-                previous_chain = dependency_chains[transitive_name]
-                raise CobraDependencyError(
-                    f"Conflicto de versiones para {transitive_name}: "
-                    f"se requieren versiones incompatibles {requested} y {transitive_version}. "
-                    f"Cadena existente: {previous_chain}. "
-                    f"Cadena nueva: {chain}."
+    executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    try:
+        while level:
+            # Cada nivel contiene solo nombres nuevos: ``requested_versions``
+            # impide volver a encolar un paquete ya pedido.
+            futures: list[Future[CobraHubResolution]] | None = None
+            if executor is not None and len(level) > 1:
+                futures = [
+                    executor.submit(resolve_one, name, version)
+                    for name, version in level
+                ]
+            next_level: list[tuple[str, str]] = []
+            for index, (name, version) in enumerate(level):
+                resolution = (
+                    futures[index].result()
+                    if futures is not None
+                    else resolve_one(name, version)
                 )
-            if requested is None:
-                requested_versions[transitive_name] = transitive_version
-                parent_source = requested_sources.get(name)
-                if parent_source:
-                    parent_path = Path(parent_source)
-                    requested_sources[transitive_name] = str(
-                        parent_path if parent_path.is_dir() else parent_path.parent
+                if resolution.version != version:
+                    raise CobraDependencyError(
+                        f"Conflicto de versión para {name}: se pidió {version}, "
+                        f"pero CobraHub resolvió {resolution.version}. "
+                        f"Cadena: {dependency_chains[name]}."
                     )
-                dependency_chains[transitive_name] = chain
-                pending.append((transitive_name, transitive_version))
+                resolved[name] = resolution
+
+                for transitive_name, transitive_version in sorted(
+                    resolution.dependencies.items()
+                ):
+                    chain = f"{dependency_chains[name]} -> {transitive_name}=={transitive_version}"
+                    requested = requested_versions.get(transitive_name)
+                    if requested is not None and requested != transitive_version:
+                        previous_chain = dependency_chains[transitive_name]
+                        raise CobraDependencyError(
+                            f"Conflicto de versiones para {transitive_name}: "
+                            f"se requieren versiones incompatibles {requested} y {transitive_version}. "
+                            f"Cadena existente: {previous_chain}. "
+                            f"Cadena nueva: {chain}."
+                        )
+                    if requested is None:
+                        requested_versions[transitive_name] = transitive_version
+                        parent_source = requested_sources.get(name)
+                        if parent_source:
+                            parent_path = Path(parent_source)
+                            requested_sources[transitive_name] = str(
+                                parent_path
+                                if parent_path.is_dir()
+                                else parent_path.parent
+                            )
+                        dependency_chains[transitive_name] = chain
+                        next_level.append((transitive_name, transitive_version))
+            level = next_level
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     created = False
     if not lock_path.exists():
@@ -199,34 +222,26 @@ def read_declared_dependencies(path: str | Path) -> dict[str, DeclaredDependency
     return declared
 
 
-def detect_cobra_imports(project_root: str | Path) -> set[str]:
-    """Detecta estáticamente imports Cobra usados por archivos ``.cobra``/``.co``."""
+def detect_cobra_imports(
+    project_root: str | Path, *, index: ImportIndex | None = None
+) -> set[str]:
+    """Detecta estáticamente imports Cobra usados por archivos ``.cobra``/``.co``.
+
+    El análisis se apoya en :class:`ImportIndex`, que solo vuelve a leer los
+    archivos modificados desde la última llamada.
+    """
 
-    root = Path(project_root)
+    if index is None:
+        index = ImportIndex(project_root)
     imports: set[str] = set()
-    for file in _iter_cobra_sources(root):
-        try:
-            text = file.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
+    for module in sorted(index.modules()):
+        if _is_local_import(module):
             continue
-        for match in _IMPORT_RE.finditer(text):
-            raw = match.group("usar") or match.group("import") or ""
-            module = raw.strip().strip("\"'")
-            if _is_local_import(module):
-                continue
-            package = module.split(".", 1)[0]
-            imports.add(_normalize_dependency_name(package))
+        package = module.split(".", 1)[0]
+        imports.add(_normalize_dependency_name(package))
     return imports
 
 
-def _iter_cobra_sources(root: Path):
-    for path in root.rglob("*"):
-        if any(part in _IGNORED_DIRS for part in path.relative_to(root).parts):
-            continue
-        if path.is_file() and path.suffix in {".cobra", ".co"}:
-            yield path
-
-
 def _is_local_import(module: str) -> bool:
     return (
         module.startswith((".", "/"))
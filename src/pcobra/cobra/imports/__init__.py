@@ -4,12 +4,18 @@ from pcobra.cobra.imports.resolver import (
     CobraImportResolver,
     HybridModuleSpec,
     ImportResolutionError,
+    ResolutionCacheInfo,
     ResolutionResult,
+    clear_resolution_cache,
+    resolution_cache_info,
 )
 
 __all__ = [
     "CobraImportResolver",
     "HybridModuleSpec",
     "ImportResolutionError",
+    "ResolutionCacheInfo",
     "ResolutionResult",
+    "clear_resolution_cache",
+    "resolution_cache_info",
 ]
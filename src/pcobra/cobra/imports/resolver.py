@@ -4,9 +4,13 @@ from __future__ import annotations
 
 import importlib
 import importlib.util
+import json
 import logging
 import os
+import sys
+import threading
 import warnings
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from types import ModuleType
@@ -72,6 +76,113 @@ _SOURCE_ORDER: tuple[str, ...] = RESOLUTION_SOURCE_ORDER
 _SUPPORTED_COLLISION_POLICIES: frozenset[str] = frozenset(
     {"warn", "strict_error", "namespace_required"}
 )
+_RESOLUTION_CACHE_MAXSIZE = 1024
+
+FileStamp = tuple[str, int | None]
+
+
+@dataclass(frozen=True)
+class ResolutionCacheInfo:
+    """Estadísticas de la caché de resoluciones compartida por el proceso."""
+
+    hits: int
+    misses: int
+    size: int
+
+
+class _ResolutionCache:
+    """Candidatos por ``(módulo, raíz, huella de config, sys.path)``.
+
+    Cada entrada guarda las marcas ``mtime`` de los archivos locales sondeados
+    y de los directorios donde ``find_spec`` busca el módulo Python; si alguna
+    cambia (o aparece/desaparece un archivo) la entrada se descarta.
+    La política de colisiones, el adapter de backend y la auditoría se aplican
+    en cada llamada, de modo que avisos y errores no dependen de la caché.
+    """
+
+    def __init__(self, maxsize: int = _RESOLUTION_CACHE_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[
+            tuple[object, ...],
+            tuple[tuple[ResolutionResult, ...], tuple[FileStamp, ...]],
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[object, ...]) -> tuple[ResolutionResult, ...] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            candidates, stamps = entry
+            if all(_file_stamp(path) == stamp for path, stamp in stamps):
+                with self._lock:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                return candidates
+        with self._lock:
+            self._entries.pop(key, None)
+            self.misses += 1
+        return None
+
+    def put(
+        self,
+        key: tuple[object, ...],
+        candidates: tuple[ResolutionResult, ...],
+        stamps: tuple[FileStamp, ...],
+    ) -> None:
+        with self._lock:
+            self._entries[key] = (candidates, stamps)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> ResolutionCacheInfo:
+        with self._lock:
+            return ResolutionCacheInfo(self.hits, self.misses, len(self._entries))
+
+
+def _file_stamp(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _python_search_dirs(name: str | None = None) -> tuple[str, ...]:
+    """Directorios donde ``find_spec`` busca ``name``.
+
+    Igual que los ``FileFinder`` de :mod:`importlib`, se usa su ``mtime`` para
+    notar que un módulo Python apareció o desapareció. Sin ``name`` devuelve
+    las entradas de ``sys.path``; con él, el ``__path__`` del paquete padre.
+    """
+
+    if name is None:
+        return tuple(dict.fromkeys(entry or os.getcwd() for entry in sys.path))
+    parent = name.rpartition(".")[0]
+    module = sys.modules.get(parent) if parent else None
+    return tuple(dict.fromkeys(getattr(module, "__path__", None) or ()))
+
+
+_RESOLUTION_CACHE = _ResolutionCache()
+
+
+def resolution_cache_info() -> ResolutionCacheInfo:
+    """Devuelve cuántas resoluciones se sirvieron desde la caché."""
+
+    return _RESOLUTION_CACHE.info()
+
+
+def clear_resolution_cache() -> None:
+    """Vacía la caché de resoluciones y reinicia sus contadores."""
+
+    _RESOLUTION_CACHE.clear()
 
 
 class CobraImportResolver:
@@ -90,6 +201,7 @@ class CobraImportResolver:
         strict_ambiguous_imports: bool = False,
         collision_policy: str | None = None,
         audit_debug: bool | None = None,
+        use_cache: bool = True,
     ) -> None:
         self.project_root = Path(project_root).resolve() if project_root else None
         config = get_toml_map()
@@ -105,6 +217,16 @@ class CobraImportResolver:
         self.audit_events: list[ImportResolutionAuditEvent] = []
         self.stdlib_modules = self._load_stdlib_modules()
         self.project_modules = self._load_project_modules()
+        self.use_cache = use_cache
+        modulos = config.get("modulos", {}) if isinstance(config, Mapping) else {}
+        self.config_fingerprint = hash(
+            (
+                # Los valores de ``[modulos]`` también cuentan, no solo las claves.
+                json.dumps(modulos, sort_keys=True, default=repr),
+                tuple(sorted(self.hybrid_modules.items())),
+                tuple(sorted(self.stdlib_modules)),
+            )
+        )
 
     def _load_hybrid_modules(
         self,
@@ -235,12 +357,7 @@ class CobraImportResolver:
         if not name:
             raise ImportResolutionError("Nombre de módulo vacío", code="IMP-REQUEST-001")
 
-        candidates: list[ResolutionResult] = []
-        for source in RESOLUTION_SOURCE_ORDER:
-            candidate = self._build_candidate(source, name)
-            if candidate is not None:
-                candidates.append(candidate)
-
+        candidates = self._cached_candidates(name)
         if not candidates:
             raise ImportResolutionError(
                 f"No se encontró módulo para '{name}'",
@@ -288,6 +405,43 @@ class CobraImportResolver:
         self._emit_audit(resolved)
         return resolved
 
+    def _cached_candidates(self, name: str) -> tuple[ResolutionResult, ...]:
+        if not self.use_cache:
+            return self._collect_candidates(name)
+        key = (
+            name,
+            str(self.project_root) if self.project_root else None,
+            self.config_fingerprint,
+            # ``python_bridge`` depende de ``sys.path`` y del buscador activo.
+            hash(tuple(sys.path)),
+            importlib.util.find_spec,
+        )
+        candidates = _RESOLUTION_CACHE.get(key)
+        if candidates is not None:
+            return candidates
+        paths = [str(path) for path in self._local_file_paths(name)]
+        paths.extend(_python_search_dirs())
+        stamps = [(path, _file_stamp(path)) for path in paths]
+        candidates = self._collect_candidates(name)
+        # ``find_spec`` de un nombre con puntos busca en el ``__path__`` del
+        # paquete padre, que solo se conoce después de importarlo.
+        stamps.extend(
+            (path, _file_stamp(path))
+            for path in _python_search_dirs(name)
+            if path not in paths
+        )
+        if candidates:
+            _RESOLUTION_CACHE.put(key, candidates, tuple(stamps))
+        return candidates
+
+    def _collect_candidates(self, name: str) -> tuple[ResolutionResult, ...]:
+        candidates: list[ResolutionResult] = []
+        for source in RESOLUTION_SOURCE_ORDER:
+            candidate = self._build_candidate(source, name)
+            if candidate is not None:
+                candidates.append(candidate)
+        return tuple(candidates)
+
     def load_module(
         self,
         module_name: str,
@@ -373,18 +527,7 @@ class CobraImportResolver:
         return None
 
     def _resolve_local_file_module(self, name: str) -> ResolutionResult | None:
-        if self.project_root is None:
-            return None
-
-        relative = Path(*name.split("."))
-        local_patterns = (
-            relative.with_suffix(".co"),
-            relative.with_suffix(".cobra"),
-            relative / "__init__.co",
-            relative / "__init__.cobra",
-        )
-        for pattern in local_patterns:
-            candidate_path = self.project_root / pattern
+        for candidate_path in self._local_file_paths(name):
             if candidate_path.exists():
                 file_path = candidate_path.resolve()
                 self._verify_path_inside_project_root(file_path)
@@ -397,6 +540,17 @@ class CobraImportResolver:
                 )
         return None
 
+    def _local_file_paths(self, name: str) -> tuple[Path, ...]:
+        if self.project_root is None:
+            return ()
+        relative = Path(*name.split("."))
+        return (
+            self.project_root / relative.with_suffix(".co"),
+            self.project_root / relative.with_suffix(".cobra"),
+            self.project_root / relative / "__init__.co",
+            self.project_root / relative / "__init__.cobra",
+        )
+
     def _verify_path_inside_project_root(self, file_path: Path) -> None:
         if self.project_root is None:
             return
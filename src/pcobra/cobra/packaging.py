@@ -397,11 +397,15 @@ def es_paquete_cobra(path: str | Path) -> bool:
         return False
 
 
-def inspeccionar_paquete(package: str | Path) -> PackageInspection:
+def inspeccionar_paquete(
+    package: str | Path, *, sha256: str | None = None
+) -> PackageInspection:
     """API pública: devuelve manifiesto, entradas y SHA-256 del paquete ``.co``.
 
     Realiza la comprobación estructural básica del contenedor antes de leer sus
-    metadatos, sin extraer archivos ni invocar Lexer/Parser.
+    metadatos, sin extraer archivos ni invocar Lexer/Parser. ``sha256`` permite
+    reutilizar un digest ya conocido (por ejemplo, de un índice de caché) en vez
+    de volver a leer el archivo completo.
     """
     pkg = Path(package)
     if not pkg.exists():
@@ -417,7 +421,9 @@ def inspeccionar_paquete(package: str | Path) -> PackageInspection:
         manifest = manifest_from_dict(
             json.loads(zf.read(MANIFEST_NAME).decode("utf-8"))
         )
-    return PackageInspection(pkg, manifest_to_dict(manifest), names, _sha256_file(pkg))
+    return PackageInspection(
+        pkg, manifest_to_dict(manifest), names, sha256 or _sha256_file(pkg)
+    )
 
 
 def _normalizar_ruta_paquete(name: str) -> str:
@@ -484,13 +490,15 @@ def _normalizar_checksums(values: Any) -> dict[str, str]:
     }
 
 
-def validar_paquete(package: str | Path) -> PackageInspection:
+def validar_paquete(
+    package: str | Path, *, sha256: str | None = None
+) -> PackageInspection:
     """API pública: valida manifiesto, rutas declaradas y checksums del ``.co``.
 
     Es el contrato canónico que deben usar CLI, IDLE y CobraHub antes de
     publicar, instalar o confiar en un paquete Cobra.
     """
-    inspection = inspeccionar_paquete(package)
+    inspection = inspeccionar_paquete(package, sha256=sha256)
     manifest = manifest_from_dict(inspection.manifest)
 
     declared_files = _normalizar_lista_archivos(manifest.files, field="files")
@@ -1,3 +1,4 @@
+import hashlib
 import importlib
 import importlib.util
 import logging
@@ -35,6 +36,11 @@ _PROJECT_MODULE_FORBIDDEN_CHARS = frozenset('/\\@$%*?"\'<>|;`!()[]{}=+,')
 _USAR_PROJECT_MODULE_CACHE: dict[Path, dict[str, Any]] = {}
 _USAR_PROJECT_LOADING_STACK: list[Path] = []
 _IMPORT_CO_AST_CACHE: dict[Path, list[Any]] = {} # Nueva caché para ASTs de .co
+# Huellas ``(mtime_ns, tamaño), sha256`` de cada entrada de la caché global de
+# módulos de proyecto: el propio archivo y los módulos que importa con ``usar``.
+_USAR_PROJECT_MODULE_FINGERPRINTS: dict[
+    Path, dict[Path, tuple[tuple[int, int], str]]
+] = {}
 CobraImportResolver = imports_resolver.CobraImportResolver
 _DEFAULT_COBRA_IMPORT_RESOLVER = CobraImportResolver
 
@@ -346,11 +352,47 @@ def resolver_ruta_canonica_modulo_cobra_proyecto(
 
 
 def obtener_cache_modulos_cobra_proyecto() -> dict[Path, dict[str, Any]]:
-    """Expone la caché compartida de módulos de proyecto para el intérprete."""
+    """Expone la caché compartida de módulos de proyecto para el intérprete.
+
+    Las entradas se invalidan al cambiar en disco el módulo o sus ``usar``.
+    """
 
     return _USAR_PROJECT_MODULE_CACHE
 
 
+def _huella_modulo_cobra_proyecto(ruta: Path) -> tuple[tuple[int, int], str] | None:
+    try:
+        stat = ruta.stat()
+        contenido = ruta.read_bytes()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size), hashlib.sha256(contenido).hexdigest()
+
+
+def _modulo_cobra_proyecto_vigente(ruta_modulo: Path) -> bool:
+    """Indica si la entrada global de ``ruta_modulo`` sigue reflejando sus archivos.
+
+    Solo se relee un archivo cuando cambia su ``stat``; si el contenido es el
+    mismo se actualiza la marca y la entrada sigue siendo válida.
+    """
+
+    huellas = _USAR_PROJECT_MODULE_FINGERPRINTS.get(ruta_modulo)
+    if huellas is None:
+        return True
+    for ruta, (marca, digest) in list(huellas.items()):
+        try:
+            stat = ruta.stat()
+        except OSError:
+            return False
+        if (stat.st_mtime_ns, stat.st_size) == marca:
+            continue
+        actual = _huella_modulo_cobra_proyecto(ruta)
+        if actual is None or actual[1] != digest:
+            return False
+        huellas[ruta] = actual
+    return True
+
+
 def obtener_pila_carga_modulos_cobra_proyecto() -> list[Path]:
     """Expone la pila compartida de carga para detectar ciclos entre entrypoints."""
 
@@ -728,8 +770,14 @@ def _cargar_exports_modulo_cobra_proyecto(
     )
     _verificar_path_dentro_de_root(ruta_modulo, root_canonico)
 
+    cache_global = cache is _USAR_PROJECT_MODULE_CACHE
     if ruta_modulo in cache:
-        return cache[ruta_modulo]
+        # La caché global se comparte entre ejecuciones: se descarta la entrada
+        # si el módulo o alguno de sus ``usar`` cambió en disco.
+        if not cache_global or _modulo_cobra_proyecto_vigente(ruta_modulo):
+            return cache[ruta_modulo]
+        del cache[ruta_modulo]
+        _USAR_PROJECT_MODULE_FINGERPRINTS.pop(ruta_modulo, None)
 
     if ruta_modulo in pila_carga:
         cadena = formatear_ciclo_modulos_cobra_proyecto(
@@ -739,6 +787,8 @@ def _cargar_exports_modulo_cobra_proyecto(
 
     pila_carga.append(ruta_modulo)
     interpretador = None
+    huella = _huella_modulo_cobra_proyecto(ruta_modulo) if cache_global else None
+    rutas_hijas: list[Path] = []
     try:
         try:
             ast = import_utils.cargar_ast_modulo(
@@ -772,6 +822,7 @@ def _cargar_exports_modulo_cobra_proyecto(
                     current_file=ruta_modulo,
                 )
                 _verificar_path_dentro_de_root(ruta_hijo, root_canonico)
+                rutas_hijas.append(ruta_hijo)
                 if ruta_hijo in pila_carga:
                     cadena = formatear_ciclo_modulos_cobra_proyecto(
                         ruta_hijo, project_root=root_canonico, loading_stack=pila_carga
@@ -790,6 +841,11 @@ def _cargar_exports_modulo_cobra_proyecto(
                 for nombre, metadata in exports["metadata"].items()
             },
         )
+        if huella is not None:
+            huellas = {ruta_modulo: huella}
+            for ruta_hijo in rutas_hijas:
+                huellas.update(_USAR_PROJECT_MODULE_FINGERPRINTS.get(ruta_hijo, {}))
+            _USAR_PROJECT_MODULE_FINGERPRINTS[ruta_modulo] = huellas
         return cache[ruta_modulo]
     finally:
         if interpretador is not None:
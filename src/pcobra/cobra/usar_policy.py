@@ -319,6 +319,7 @@ CANONICAL_MODULE_SURFACE_CONTRACTS: dict[str, CanonicalModuleSurfaceContract] =
             "reemplazar",
             "dividir",
             "encontrar_todos",
+            "compilar",
         ),
         allowed_aliases={},
         forbidden_symbols=("re",),
@@ -507,6 +508,10 @@ USAR_RUNTIME_EXPORT_OVERRIDES: dict[str, tuple[str, ...]] = {
         "eliminar",
         "anexar",
         "leer_lineas",
+        "iterar_lineas",
+        "leer_bloques",
+        "mapear_memoria",
+        "abrir_anexador",
     ),
     "tiempo": (
         "ahora",
@@ -13,7 +13,7 @@ CAPACIDADES_POR_MODULO: dict[str, dict[str, object]] = {
     "logica": {"familia":"logica","modulo":"pcobra.standard_library.logica","api_canonica": ('es_verdadero','es_falso','conjuncion','disyuncion','negacion','entonces','si_no','coalescer','condicional','xor','nand','nor','implica','equivale','xor_multiple','todas','alguna','ninguna','solo_uno','conteo_verdaderos','paridad','mayoria','exactamente_n','tabla_verdad','diferencia_simetrica'),"equivalencia_python":{"all":"todas","any":"alguna","bool":"es_verdadero"}},
     "asincrono": {"familia":"asincrono","modulo":"pcobra.standard_library.asincrono","api_canonica": ('grupo_tareas','limitar_tiempo','proteger_tarea','ejecutar_en_hilo','reintentar_async','recolectar','carrera','primero_exitoso','esperar_timeout','crear_tarea','iterar_completadas','mapear_concurrencia','recolectar_resultados','dormir_async'),"equivalencia_python":{"asyncio.TaskGroup":"grupo_tareas","asyncio.wait_for":"limitar_tiempo","asyncio.sleep":"dormir_async"}},
     "sistema": {"familia":"sistema","modulo":"pcobra.standard_library.sistema","api_canonica": ('obtener_os','ejecutar','ejecutar_async','ejecutar_stream','obtener_env','listar_dir','directorio_actual','ejecutar_comando_async'),"equivalencia_python":{"os.getenv":"obtener_env","os.listdir":"listar_dir","subprocess.run":"ejecutar"}},
-    "archivo": {"familia":"archivo","modulo":"pcobra.standard_library.archivo","api_canonica": ('leer','escribir','adjuntar','existe','eliminar','leer_lineas','anexar'),"equivalencia_python":{"open.read":"leer","open.write":"escribir","pathlib.Path.exists":"existe"}},
+    "archivo": {"familia":"archivo","modulo":"pcobra.standard_library.archivo","api_canonica": ('leer','escribir','adjuntar','existe','eliminar','leer_lineas','anexar','iterar_lineas','leer_bloques','mapear_memoria','abrir_anexador'),"equivalencia_python":{"open.read":"leer","open.write":"escribir","pathlib.Path.exists":"existe"}},
     "tiempo": {"familia":"tiempo","modulo":"pcobra.standard_library.tiempo","api_canonica": ('ahora','formatear','dormir','epoch','desde_epoch'),"equivalencia_python":{"time.time":"epoch","time.sleep":"dormir","datetime.now":"ahora"}},
     "red": {"familia":"red","modulo":"pcobra.standard_library.red","api_canonica": ('obtener_url','enviar_post','obtener_url_async','enviar_post_async','descargar_archivo','obtener_json','obtener_url_texto'),"equivalencia_python":{"urllib.request.urlopen":"obtener_url","requests.post":"enviar_post"}},
     "holobit": {"familia":"holobit","modulo":"pcobra.standard_library.holobit","api_canonica": ('crear_holobit','validar_holobit','serializar_holobit','deserializar_holobit','proyectar','transformar','graficar','combinar','medir'),"equivalencia_python":{"json.dumps":"serializar_holobit","json.loads":"deserializar_holobit"}},
@@ -49,3 +49,17 @@ def tiempo_max_transpilacion(config: dict | None = None) -> float:
     return float(
         cfg.get("rendimiento", {}).get("tiempo_max_transpilacion_seg", 1.0)
     )
+
+
+def max_hilos(config: dict | None = None) -> int | None:
+    """Trabajadores simultáneos para ``hilo`` o ``None`` para el valor por defecto."""
+    cfg = config or cargar_configuracion()
+    valor = cfg.get("concurrencia", {}).get("max_hilos")
+    return int(valor) if valor else None
+
+
+def max_hilos_en_cola(config: dict | None = None) -> int | None:
+    """Tareas de ``hilo`` que pueden esperar turno antes de aplicar contrapresión."""
+    cfg = config or cargar_configuracion()
+    valor = cfg.get("concurrencia", {}).get("max_hilos_en_cola")
+    return int(valor) if valor else None
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
+import threading
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from pathlib import Path
 from typing import Iterable, FrozenSet, Tuple, List
 
 from pcobra.core.lexer import Lexer
@@ -21,6 +23,41 @@ MODULES_PATH = Path.home() / ".cobra" / "modules"
 IMPORT_WHITELIST: set[str | os.PathLike[str]] = {MODULES_PATH}
 FingerprintArchivo = tuple[int, int]
 
+# ASTs compartidos por todo el proceso: ruta real -> (sha256 del código, AST).
+# Cada intérprete ejecuta los módulos en su propio estado; solo se reutiliza el
+# resultado del lexer/parser mientras el contenido del archivo no cambie.
+_AST_MODULOS_COMPARTIDOS: dict[str, tuple[str, tuple]] = {}
+_AST_MODULOS_LOCK = threading.Lock()
+_AST_MODULOS_ESTADISTICAS = {"aciertos": 0, "fallos": 0}
+
+
+@dataclass(frozen=True)
+class EstadisticasCacheAST:
+    """Aciertos, fallos y entradas de la caché de ASTs de módulos."""
+
+    aciertos: int
+    fallos: int
+    entradas: int
+
+
+def estadisticas_cache_ast_modulos() -> EstadisticasCacheAST:
+    """Devuelve el uso de la caché de ASTs compartida entre intérpretes."""
+
+    with _AST_MODULOS_LOCK:
+        return EstadisticasCacheAST(
+            _AST_MODULOS_ESTADISTICAS["aciertos"],
+            _AST_MODULOS_ESTADISTICAS["fallos"],
+            len(_AST_MODULOS_COMPARTIDOS),
+        )
+
+
+def limpiar_cache_ast_modulos() -> None:
+    """Vacía la caché de ASTs compartida y reinicia sus contadores."""
+
+    with _AST_MODULOS_LOCK:
+        _AST_MODULOS_COMPARTIDOS.clear()
+        _AST_MODULOS_ESTADISTICAS.update(aciertos=0, fallos=0)
+
 
 class _ArchivoModuloInestableError(RuntimeError):
     """Error interno para reintentar cuando el módulo cambia durante su lectura."""
@@ -102,7 +139,12 @@ def cargar_ast_modulo(
     expected_fingerprint: FingerprintArchivo | None = None,
     loading_stack: List[Path] | None = None, # Nuevo parámetro
 ):
-    """Parsa un módulo Cobra y devuelve su AST."""
+    """Parsa un módulo Cobra y devuelve su AST.
+
+    El AST se reutiliza entre llamadas (y entre intérpretes) mientras el
+    SHA-256 del código leído coincida con el de la última vez que se parseó la
+    misma ruta real. Cada llamada recibe una lista nueva.
+    """
 
     codigo, ruta_real = _leer_codigo_modulo(ruta, modules_path, whitelist)
     ruta_real_path = Path(ruta_real) # Convertir a Path para comparación
@@ -123,10 +165,20 @@ def cargar_ast_modulo(
                 raise _ArchivoModuloInestableError(
                     f"El módulo cambió durante la lectura: {ruta_real}"
                 )
+        digest = hashlib.sha256(codigo.encode("utf-8")).hexdigest()
+        with _AST_MODULOS_LOCK:
+            cacheado = _AST_MODULOS_COMPARTIDOS.get(ruta_real)
+            if cacheado is not None and cacheado[0] == digest:
+                _AST_MODULOS_ESTADISTICAS["aciertos"] += 1
+                return list(cacheado[1])
+            _AST_MODULOS_ESTADISTICAS["fallos"] += 1
         lexer = Lexer(codigo)
         tokens = lexer.analizar_token()
         parser = Parser(tokens)
-        return parser.parsear()
+        ast = parser.parsear()
+        with _AST_MODULOS_LOCK:
+            _AST_MODULOS_COMPARTIDOS[ruta_real] = (digest, tuple(ast))
+        return ast
     finally:
         if loading_stack is not None:
             loading_stack.pop()
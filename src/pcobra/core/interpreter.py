@@ -5,6 +5,7 @@ import os
 import hashlib
 import inspect
 import math
+import threading
 import warnings
 from pathlib import Path
 from typing import Mapping, Optional
@@ -88,6 +89,7 @@ from .usar_symbol_policy import (
     validate_usar_symbol_metadata,
 )
 from .environment import Environment
+from .planificador import PlanificadorHilos, obtener_planificador
 from pcobra.cobra.usar_loader import descubrir_raiz_proyecto
 
 MODULES_PATH = _DEFAULT_MODULES_PATH
@@ -254,9 +256,52 @@ class _ControlRetorno(Exception):
         self.valor = valor
 
 
+_SIN_VALOR = object()
+
+
+class _EstadoPorHilo:
+    """Atributo del intérprete que cada tarea de ``hilo`` puede aislar.
+
+    Fuera de una tarea se usa el valor raíz de la instancia. Dentro de una
+    tarea planificada, el valor se lee y escribe en ``InterpretadorCobra._marcos``
+    (un ``threading.local``), de modo que la pila de marcos de la tarea no
+    compite con la del hilo que la lanzó.
+    """
+
+    def __set_name__(self, owner, nombre):
+        self.nombre = nombre
+        self.raiz = f"_{nombre}_raiz"
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        marcos = obj.__dict__.get("_marcos")
+        if marcos is not None:
+            valor = getattr(marcos, self.nombre, _SIN_VALOR)
+            if valor is not _SIN_VALOR:
+                return valor
+        try:
+            return obj.__dict__[self.raiz]
+        except KeyError:
+            raise AttributeError(self.nombre) from None
+
+    def __set__(self, obj, valor):
+        marcos = obj.__dict__.get("_marcos")
+        if marcos is not None and hasattr(marcos, self.nombre):
+            setattr(marcos, self.nombre, valor)
+            return
+        obj.__dict__[self.raiz] = valor
+
+
 class InterpretadorCobra:
     """Interpreta y ejecuta nodos del lenguaje Cobra."""
 
+    # Estado de ejecución propio de cada tarea de ``hilo``.
+    contextos = _EstadoPorHilo()
+    mem_contextos = _EstadoPorHilo()
+    _eval_stack = _EstadoPorHilo()
+    _call_depth = _EstadoPorHilo()
+
     @staticmethod
     def _debug_trazas_habilitadas() -> bool:
         """Indica si las trazas internas de depuración están activadas."""
@@ -574,6 +619,9 @@ class InterpretadorCobra:
         self.analizador = AnalizadorSemantico()
         # Conjunto para evitar validar el mismo nodo varias veces
         self._validados = set()
+        # Marcos por hilo de las tareas lanzadas con ``hilo``
+        self._marcos = threading.local()
+        self._planificador: PlanificadorHilos | None = None
         # Pila de entornos para mantener variables locales en cada llamada
         self.contextos = [Environment()]
         # Mapa paralelo para gestionar bloques de memoria por contexto
@@ -2753,17 +2801,42 @@ class InterpretadorCobra:
         return valores
 
     def ejecutar_hilo(self, nodo):
-        """Ejecuta una función en un hilo separado."""
-        import threading
+        """Planifica la llamada de ``nodo`` como tarea concurrente.
+
+        La tarea se ejecuta en el :class:`PlanificadorHilos` compartido, que
+        limita los trabajadores y aplica contrapresión cuando la cola se
+        llena. Cada tarea obtiene su propia pila de marcos, que parte del
+        contexto activo al lanzarla. Devuelve el :class:`TareaHilo` asociado.
+        """
+        contexto_base = self.contextos[-1]
+        memoria_base = self.mem_contextos[-1]
+        marcos = self._marcos
 
         def destino():
-            self.ejecutar_llamada_funcion(nodo.llamada)
+            previos = {
+                nombre: getattr(marcos, nombre)
+                for nombre in _ESTADO_TAREA
+                if hasattr(marcos, nombre)
+            }
+            marcos.contextos = [contexto_base]
+            marcos.mem_contextos = [memoria_base]
+            marcos._eval_stack = set()
+            marcos._call_depth = 0
+            try:
+                return self.ejecutar_llamada_funcion(nodo.llamada)
+            finally:
+                for nombre in _ESTADO_TAREA:
+                    if nombre in previos:
+                        setattr(marcos, nombre, previos[nombre])
+                    else:
+                        delattr(marcos, nombre)
+
+        planificador = self._planificador or obtener_planificador()
+        nombre = getattr(nodo.llamada, "nombre", None)
+        return planificador.enviar(destino, nombre=f"hilo:{nombre}" if nombre else None)
+
 
-        # El hilo se marca como daemon para evitar que bloquee el cierre del
-        # intérprete si queda en ejecución al finalizar el programa.
-        hilo = threading.Thread(target=destino, daemon=True)
-        hilo.start()
-        return hilo
+_ESTADO_TAREA = ("contextos", "mem_contextos", "_eval_stack", "_call_depth")
 
 
 # Protección de compatibilidad: algunos consumidores legacy sustituyen
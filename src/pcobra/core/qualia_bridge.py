@@ -1,8 +1,13 @@
+import atexit
 import json
 import logging
 import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, List, Union
+from typing import Any, Deque, Iterable, Iterator, List, Union
 
 from pcobra.core.lexer import Lexer
 from pcobra.core.parser import Parser
@@ -14,6 +19,13 @@ DEFAULT_STATE_FILE = os.path.join(
     os.path.expanduser("~"), ".cobra", "qualia_state.json"
 )
 
+# Número máximo de ejecuciones conservadas en ``QualiaSpirit.history``.
+# Los contadores agregados de ``QualiaKnowledge`` no dependen de este límite.
+HISTORY_LIMIT = 200
+
+# Segundos que espera el escritor en segundo plano para agrupar guardados.
+SAVE_DEBOUNCE_SECONDS = 0.5
+
 
 def _resolve_state_file() -> str:
     """Devuelve la ruta de estado validada y normalizada."""
@@ -95,22 +107,49 @@ def _is_persistence_enabled() -> bool:
 
 
 class QualiaSpirit:
-    """Modelo simple para registrar ejecuciones y generar sugerencias."""
+    """Modelo simple para registrar ejecuciones y generar sugerencias.
+
+    El historial es un búfer circular acotado por ``HISTORY_LIMIT``; las
+    métricas que alimentan :meth:`suggestions` se actualizan de forma
+    incremental en :meth:`register`, por lo que no es necesario recorrer el
+    historial completo en cada consulta.
+    """
 
-    def __init__(self) -> None:
-        self.history: List[str] = []
+    def __init__(self, history_limit: int = HISTORY_LIMIT) -> None:
+        self.history: Deque[str] = deque(maxlen=max(1, int(history_limit)))
         self.knowledge = QualiaKnowledge()
+        self.imprimir_count = 0
 
     def register(self, code: str) -> None:
         """Guarda el ``code`` ejecutado en la historia."""
         self.history.append(code)
+        if "imprimir" in code:
+            self.imprimir_count += 1
+
+    def load_history(self, entries: Iterable[str]) -> None:
+        """Restaura el historial respetando el límite del búfer."""
+        self.history.clear()
+        self.history.extend(str(entry) for entry in entries)
+
+    def clear(self) -> None:
+        """Vacía historial, contadores y conocimiento acumulado."""
+        self.history.clear()
+        self.knowledge = QualiaKnowledge()
+        self.imprimir_count = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Devuelve una instantánea serializable del estado."""
+        return {
+            "history": list(self.history),
+            "knowledge": self.knowledge.as_dict(),
+            "counters": {"imprimir": self.imprimir_count},
+        }
 
     def suggestions(self) -> List[str]:
         """Devuelve una lista de sugerencias basadas en el historial y el conocimiento."""
-        joined = "\n".join(self.history)
         sugerencias: List[str] = []
 
-        if "imprimir" not in joined:
+        if not self.imprimir_count:
             sugerencias.append("Agrega \"imprimir\" para depurar.")
 
         if any(len(nombre) <= 2 for nombre in self.knowledge.variable_names):
@@ -158,8 +197,15 @@ def _build_spirit(data: dict[str, Any] | None) -> QualiaSpirit:
     spirit = QualiaSpirit()
     if not data:
         return spirit
-    spirit.history = list(data.get("history", []))
+    history = list(data.get("history", []))
+    spirit.load_history(history)
     spirit.knowledge = QualiaKnowledge.from_dict(data.get("knowledge", {}))
+    counters = data.get("counters")
+    if isinstance(counters, dict) and "imprimir" in counters:
+        spirit.imprimir_count = int(counters["imprimir"])
+    else:
+        # Estados anteriores no guardaban contadores: se derivan una vez.
+        spirit.imprimir_count = sum(1 for code in history if "imprimir" in str(code))
     return spirit
 
 
@@ -245,21 +291,7 @@ def load_state() -> QualiaSpirit:
     return QualiaSpirit()
 
 
-def save_state(spirit: QualiaSpirit) -> None:
-    """Guarda el estado de ``spirit`` en la base de datos."""
-
-    if not _is_persistence_enabled():
-        LOGGER.debug("Base de datos de Qualia inactiva; se omite el guardado persistente.")
-        return
-
-    payload = json.dumps(
-        {
-            "history": spirit.history,
-            "knowledge": spirit.knowledge.as_dict(),
-        },
-        ensure_ascii=False,
-    )
-
+def _write_payload(payload: str) -> None:
     with database.get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
@@ -269,6 +301,92 @@ def save_state(spirit: QualiaSpirit) -> None:
         conn.commit()
 
 
+def save_state(spirit: QualiaSpirit) -> None:
+    """Guarda el estado de ``spirit`` en la base de datos."""
+
+    if not _is_persistence_enabled():
+        LOGGER.debug("Base de datos de Qualia inactiva; se omite el guardado persistente.")
+        return
+
+    with _STATE_LOCK:
+        payload = json.dumps(spirit.as_dict(), ensure_ascii=False)
+    _write_payload(payload)
+
+
+class _QualiaPersister:
+    """Escritor en segundo plano que agrupa guardados de estado.
+
+    ``schedule`` solo marca el estado como pendiente; un hilo demonio espera
+    ``SAVE_DEBOUNCE_SECONDS`` y persiste una única instantánea con todos los
+    cambios acumulados. ``flush`` fuerza la escritura síncrona pendiente.
+    """
+
+    def __init__(self, debounce: float = SAVE_DEBOUNCE_SECONDS) -> None:
+        self._debounce = debounce
+        self._pending: QualiaSpirit | None = None
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def schedule(self, spirit: QualiaSpirit) -> None:
+        with self._cond:
+            self._pending = spirit
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="qualia-persister", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def _take_pending(self) -> QualiaSpirit | None:
+        with self._cond:
+            spirit, self._pending = self._pending, None
+            return spirit
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+            # Ventana de agrupamiento: las ejecuciones recibidas mientras
+            # tanto se escriben en una sola operación.
+            time.sleep(self._debounce)
+            self.flush()
+
+    @contextmanager
+    def suspended(self) -> Iterator[None]:
+        """Descarta lo pendiente y bloquea las escrituras durante el bloque.
+
+        Espera a que termine un ``flush`` en curso, de modo que ninguna
+        instantánea anterior se escriba después de lo hecho dentro del bloque.
+        """
+        with self._write_lock:
+            self._take_pending()
+            yield
+
+    def flush(self) -> None:
+        """Escribe de inmediato el estado pendiente, si lo hay."""
+        with self._write_lock:
+            spirit = self._take_pending()
+            if spirit is None:
+                return
+            try:
+                save_state(spirit)
+            except Exception as exc:  # pragma: no cover - registro defensivo
+                LOGGER.warning("No se pudo persistir el estado de Qualia: %s", exc)
+
+
+_STATE_LOCK = threading.RLock()
+_PERSISTER = _QualiaPersister()
+atexit.register(_PERSISTER.flush)
+
+
+def flush_state() -> None:
+    """Persiste de forma síncrona cualquier cambio de Qualia aún pendiente."""
+
+    _PERSISTER.flush()
+
+
 _QUALIA_INSTANCE: QualiaSpirit | None = None
 _QUALIA_ENABLED: bool = True
 
@@ -339,50 +457,60 @@ def reset_state() -> dict[str, Any]:
         LOGGER.debug(
             "Base de datos de Qualia inactiva; solo se limpia el estado en memoria.",
         )
-        qualia.history.clear()
-        qualia.knowledge = QualiaKnowledge()
+        with _STATE_LOCK:
+            qualia.clear()
         return resultado
 
-    with database.get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM qualia_state")
-        conn.commit()
-        resultado["rows_deleted"] = cursor.rowcount > 0
-
-    legacy_state_file = _get_legacy_state_file()
-    if legacy_state_file and os.path.exists(legacy_state_file):
-        try:
-            os.remove(legacy_state_file)
-        except OSError as exc:  # pragma: no cover - casos poco frecuentes
-            LOGGER.warning(
-                "No se pudo eliminar el archivo de estado heredado %s: %s",
-                legacy_state_file,
-                exc,
-            )
-            resultado["legacy_error"] = str(exc)
-        else:
-            resultado["legacy_removed"] = True
-
-    qualia.history.clear()
-    qualia.knowledge = QualiaKnowledge()
+    with _PERSISTER.suspended():
+        with database.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM qualia_state")
+            conn.commit()
+            resultado["rows_deleted"] = cursor.rowcount > 0
+
+        legacy_state_file = _get_legacy_state_file()
+        if legacy_state_file and os.path.exists(legacy_state_file):
+            try:
+                os.remove(legacy_state_file)
+            except OSError as exc:  # pragma: no cover - casos poco frecuentes
+                LOGGER.warning(
+                    "No se pudo eliminar el archivo de estado heredado %s: %s",
+                    legacy_state_file,
+                    exc,
+                )
+                resultado["legacy_error"] = str(exc)
+            else:
+                resultado["legacy_removed"] = True
+
+        with _STATE_LOCK:
+            qualia.clear()
 
     return resultado
 
 
-def register_execution(execution: Union[str, list]) -> None:
-    """Registra una ejecución y persiste el estado actualizando el conocimiento."""
+def register_execution(execution: Union[str, list], ast: list | None = None) -> None:
+    """Registra una ejecución y programa la persistencia del conocimiento.
+
+    Si el llamador ya dispone del AST de ``execution`` puede pasarlo en
+    ``ast`` para evitar un nuevo análisis léxico y sintáctico. El guardado se
+    realiza en segundo plano; usa :func:`flush_state` para forzarlo.
+    """
     if isinstance(execution, str):
-        tokens = Lexer(execution).analizar_token()
-        ast = Parser(tokens).parsear()
         code = execution
+        if ast is None:
+            tokens = Lexer(execution).analizar_token()
+            ast = Parser(tokens).parsear()
     else:
         ast = execution
         code = str(execution)
 
     qualia = _get_qualia()
-    qualia.register(code)
-    qualia.knowledge.update_from_ast(ast)
-    save_state(qualia)
+    with _STATE_LOCK:
+        qualia.register(code)
+        qualia.knowledge.update_from_ast(ast)
+
+    if _is_persistence_enabled():
+        _PERSISTER.schedule(qualia)
 
 
 def get_suggestions() -> List[str]:
@@ -14,6 +14,7 @@ from .auditoria import ValidadorAuditoria
 from .import_seguro import ValidadorImportSeguro
 from .fs_access import ValidadorSistemaArchivos
 from .reflexion_segura import ValidadorProhibirReflexion
+from .cache import estadisticas_cache_veredictos, limpiar_cache_veredictos
 from ..cobra_config import auditoria_activa
 
 # Instancia por defecto reutilizable de la cadena de validación
@@ -66,6 +67,8 @@ __all__ = [
     "ValidadorSistemaArchivos",
     "ValidadorProhibirReflexion",
     "construir_cadena",
+    "estadisticas_cache_veredictos",
+    "limpiar_cache_veredictos",
 ]
 
 sys.modules["core.semantic_validators"] = sys.modules[__name__]
@@ -19,6 +19,8 @@ class ValidadorAuditoria(ValidadorBase):
     - ejecución/auditoría activa: ``emitir_side_effects=True`` (emite logs)
     """
 
+    despacho_unico = True
+
     def __init__(self, emitir_side_effects: bool = True) -> None:
         super().__init__()
         self.emitir_side_effects = emitir_side_effects
@@ -31,6 +33,12 @@ class ValidadorAuditoria(ValidadorBase):
             return
         logging.getLogger(__name__).debug(mensaje)
 
+    def huella_politica(self):
+        # Con side effects activos cada recorrido debe emitir sus registros.
+        if self.in_execution():
+            return None
+        return ("auditoria",)
+
     def in_execution(self) -> bool:
         """Indica si la auditoría debe emitir side effects en fase de ejecución."""
         return self.emitir_side_effects and self.mode == "execution"
@@ -0,0 +1,133 @@
+"""Caché de veredictos de validación por hash estructural de subárboles.
+
+Los módulos de biblioteca se ejecutan una y otra vez con el mismo AST. Como
+los validadores de la cadena por defecto son funciones puras del subárbol y
+de la política activa (metadatos de ``usar``, listas de primitivas), un
+subárbol que ya superó la validación con la misma política no necesita
+recorrerse de nuevo. Solo se almacenan veredictos favorables: los rechazos se
+recalculan siempre para conservar el mensaje de error original.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Hashable, Iterable
+
+from ..ast_nodes import NodoAST
+
+# Incrementar cuando cambie la semántica de algún validador incorporado.
+POLITICA_VERSION = 1
+MAX_VEREDICTOS = 4096
+
+_PRIMITIVOS = (str, int, float, bool, bytes, type(None))
+
+
+def hash_estructural(nodo: Any, tipos_excluidos: Iterable[str] = ()) -> str | None:
+    """Calcula un hash estable de la estructura y los valores de ``nodo``.
+
+    Devuelve ``None`` si el subárbol no admite caché: contiene ciclos, valores
+    sin representación estructural o nodos cuyo tipo figura en
+    ``tipos_excluidos`` (por ejemplo, aquellos cuyo veredicto depende del
+    estado del sistema de archivos).
+    """
+
+    excluidos = frozenset(tipos_excluidos)
+    digest = hashlib.blake2b(digest_size=20)
+    en_ruta: set[int] = set()
+    pila: list[tuple[bool, Any]] = [(False, nodo)]
+
+    while pila:
+        salida, valor = pila.pop()
+        if salida:
+            en_ruta.discard(valor)
+            digest.update(b")")
+            continue
+        if isinstance(valor, _PRIMITIVOS):
+            digest.update(f"{type(valor).__name__}:{valor!r};".encode("utf-8"))
+            continue
+        if isinstance(valor, Enum):
+            digest.update(f"enum:{type(valor).__name__}.{valor.name};".encode("utf-8"))
+            continue
+
+        identidad = id(valor)
+        if identidad in en_ruta:
+            return None
+        if isinstance(valor, (list, tuple)):
+            hijos = list(valor)
+            etiqueta = type(valor).__name__
+        elif isinstance(valor, dict):
+            hijos = [elem for par in valor.items() for elem in par]
+            etiqueta = "dict"
+        elif isinstance(valor, NodoAST) or type(valor).__name__ == "Token":
+            etiqueta = type(valor).__name__
+            if etiqueta in excluidos:
+                return None
+            hijos = [elem for par in vars(valor).items() for elem in par]
+        else:
+            return None
+
+        en_ruta.add(identidad)
+        digest.update(f"{etiqueta}(".encode("utf-8"))
+        pila.append((True, identidad))
+        pila.extend((False, hijo) for hijo in reversed(hijos))
+
+    return digest.hexdigest()
+
+
+class CacheVeredictos:
+    """Conjunto LRU acotado de pares ``(hash estructural, huella de política)``."""
+
+    def __init__(self, maximo: int = MAX_VEREDICTOS) -> None:
+        self.maximo = maximo
+        self._entradas: OrderedDict[tuple[str, Hashable], None] = OrderedDict()
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def contiene(self, clave: tuple[str, Hashable]) -> bool:
+        with self._lock:
+            if clave in self._entradas:
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return True
+            self.fallos += 1
+            return False
+
+    def registrar(self, clave: tuple[str, Hashable]) -> None:
+        with self._lock:
+            self._entradas[clave] = None
+            self._entradas.move_to_end(clave)
+            while len(self._entradas) > self.maximo:
+                self._entradas.popitem(last=False)
+
+    def limpiar(self) -> None:
+        with self._lock:
+            self._entradas.clear()
+            self.aciertos = 0
+            self.fallos = 0
+
+    def estadisticas(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entradas": len(self._entradas),
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+            }
+
+
+VEREDICTOS = CacheVeredictos()
+
+
+def limpiar_cache_veredictos() -> None:
+    """Vacía la caché global de veredictos."""
+
+    VEREDICTOS.limpiar()
+
+
+def estadisticas_cache_veredictos() -> dict[str, int]:
+    """Devuelve entradas, aciertos y fallos de la caché global."""
+
+    return VEREDICTOS.estadisticas()
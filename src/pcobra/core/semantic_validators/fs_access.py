@@ -18,6 +18,11 @@ class ValidadorSistemaArchivos(ValidadorBase):
         "compilar_y_cargar_crate",
     }
 
+    despacho_unico = True
+
+    def huella_politica(self):
+        return ("fs_access", frozenset(self.PROHIBIDAS))
+
     def visit_llamada_funcion(self, nodo: NodoLlamadaFuncion):
         if nodo.nombre in self.PROHIBIDAS:
             raise PrimitivaPeligrosaError(
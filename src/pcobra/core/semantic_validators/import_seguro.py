@@ -7,6 +7,13 @@ from .primitiva_peligrosa import PrimitivaPeligrosaError
 class ValidadorImportSeguro(ValidadorBase):
     """Valida que las instrucciones import sean seguras."""
 
+    despacho_unico = True
+    # El veredicto depende de la lista blanca y del sistema de archivos.
+    tipos_no_cacheables = frozenset({"NodoImport"})
+
+    def huella_politica(self):
+        return ("import_seguro",)
+
     def visit_import(self, nodo: NodoImport):
         from ..interpreter import _ruta_import_permitida
 
@@ -1,3 +1,6 @@
+import hashlib
+import json
+
 from .base import ValidadorBase
 from ..ast_nodes import NodoLlamadaFuncion, NodoHilo, NodoLlamadaMetodo
 from ..usar_symbol_policy import (
@@ -35,6 +38,8 @@ class ValidadorPrimitivaPeligrosa(ValidadorBase):
 
 
 
+    despacho_unico = True
+
     def __init__(self):
         super().__init__()
         self._simbolos_publicos_usar: set[tuple[str, str]] = set()
@@ -66,6 +71,17 @@ class ValidadorPrimitivaPeligrosa(ValidadorBase):
         self._simbolos_publicos_usar.add((modulo, nombre))
         self._metadata_simbolos_usar[nombre] = dict(metadata_validada)
 
+    def huella_politica(self):
+        metadata = json.dumps(
+            self._metadata_simbolos_usar, sort_keys=True, default=repr
+        )
+        return (
+            "primitiva_peligrosa",
+            frozenset(self.PRIMITIVAS_PELIGROSAS),
+            frozenset(self._simbolos_publicos_usar),
+            hashlib.sha256(metadata.encode("utf-8")).hexdigest(),
+        )
+
     def _es_wrapper_publico_permitido(self, nodo: NodoLlamadaFuncion) -> tuple[bool, str | None]:
         # Contrato de seguridad: No basta el nombre del símbolo.
         # Contrato de seguridad: Solo metadata canónica de `usar` + API pública sanitizada.
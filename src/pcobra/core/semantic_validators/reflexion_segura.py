@@ -19,6 +19,15 @@ class ValidadorProhibirReflexion(ValidadorBase):
 
     ATRIBUTOS_PROHIBIDOS = {"__dict__", "__class__", "__bases__", "__mro__"}
 
+    despacho_unico = True
+
+    def huella_politica(self):
+        return (
+            "reflexion",
+            frozenset(self.FUNCIONES_PROHIBIDAS),
+            frozenset(self.ATRIBUTOS_PROHIBIDOS),
+        )
+
     def visit_llamada_funcion(self, nodo: NodoLlamadaFuncion):
         if nodo.nombre in self.FUNCIONES_PROHIBIDAS:
             raise PrimitivaPeligrosaError(
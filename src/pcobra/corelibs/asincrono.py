@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import itertools
+import multiprocessing
+import os
+import pickle
 import random
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import asynccontextmanager, suppress
 import functools
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterable,
     AsyncIterator,
     Awaitable,
     Callable,
@@ -560,6 +569,136 @@ async def iterar_completadas(
             await asyncio.gather(*tareas, return_exceptions=True)
 
 
+_Trabajo = Callable[[], Awaitable[T] | Coroutine[Any, Any, T]]
+_FIN_TRABAJOS = object()
+
+
+async def mapear_en_flujo(
+    funciones: Iterable[_Trabajo[T]] | AsyncIterable[_Trabajo[T]],
+    limite: int,
+    *,
+    ordenado: bool = True,
+    timeout: float | None = None,
+    return_exceptions: bool = False,
+    ventana: int | None = None,
+) -> AsyncIterator[T | BaseException]:
+    """Ejecuta ``funciones`` con ``limite`` trabajadores y produce sus resultados.
+
+    A diferencia de crear una tarea por elemento, exactamente ``limite``
+    trabajadores de larga duración extraen las funciones de ``funciones`` (un
+    iterable normal o asíncrono, que se consume de forma perezosa), por lo que
+    la memoria depende del límite y no del número total de trabajos. Con
+    ``ordenado`` los resultados se producen en el orden de entrada; si no, a
+    medida que terminan. ``ventana`` acota cuántos trabajos pueden estar
+    iniciados sin que el consumidor haya recibido su resultado (por defecto el
+    doble de ``limite``), lo que aplica contrapresión cuando el consumidor es
+    lento. ``timeout`` limita la duración de cada trabajo y un vencimiento
+    cuenta como ``TimeoutError`` de ese elemento. Sin ``return_exceptions`` el
+    primer error cancela los trabajadores y se propaga; con él, las
+    excepciones se producen como resultados. Cerrar o cancelar el iterador
+    también cancela los trabajos en curso.
+    """
+
+    if limite < 1:
+        raise ValueError("limite debe ser un entero positivo")
+    if ventana is None:
+        ventana = 2 * limite
+    if ventana < limite:
+        raise ValueError("ventana no puede ser menor que limite")
+    if timeout is not None and timeout <= 0:
+        raise ValueError("timeout debe ser mayor que cero")
+
+    if isinstance(funciones, AsyncIterable):
+        fuente_async = funciones.__aiter__()
+        candado_fuente = asyncio.Lock()
+
+        async def _siguiente() -> Any:
+            # Los generadores asíncronos no admiten ``__anext__`` concurrentes.
+            async with candado_fuente:
+                try:
+                    return await fuente_async.__anext__()
+                except StopAsyncIteration:
+                    return _FIN_TRABAJOS
+
+    else:
+        fuente = iter(funciones)
+
+        async def _siguiente() -> Any:
+            return next(fuente, _FIN_TRABAJOS)
+
+    turnos = asyncio.Semaphore(ventana)
+    resultados: asyncio.Queue[tuple[int | None, Any, bool] | None] = asyncio.Queue()
+    contador = 0
+
+    async def _ejecutar(funcion: _Trabajo[T]) -> T:
+        awaitable = funcion()
+        if not (asyncio.iscoroutine(awaitable) or asyncio.isfuture(awaitable)):
+            raise TypeError("Se esperaba una corrutina o tarea de asyncio")
+        if timeout is None:
+            return await awaitable
+        return await asyncio.wait_for(awaitable, timeout)
+
+    async def _trabajador() -> None:
+        nonlocal contador
+        try:
+            while True:
+                await turnos.acquire()
+                try:
+                    funcion = await _siguiente()
+                except Exception as exc:
+                    # Un fallo de la fuente se propaga siempre al consumidor.
+                    await resultados.put((None, exc, True))
+                    return
+                if funcion is _FIN_TRABAJOS:
+                    turnos.release()
+                    return
+                indice = contador
+                contador += 1
+                try:
+                    valor = await _ejecutar(funcion)
+                except asyncio.CancelledError as exc:
+                    tarea = asyncio.current_task()
+                    if tarea is not None and tarea.cancelling():
+                        raise
+                    # El trabajo se canceló por su cuenta: es su resultado y
+                    # debe liberar su turno como cualquier otro error.
+                    await resultados.put((indice, exc, True))
+                except Exception as exc:
+                    await resultados.put((indice, exc, True))
+                else:
+                    await resultados.put((indice, valor, False))
+        finally:
+            resultados.put_nowait(None)
+
+    trabajadores = [asyncio.create_task(_trabajador()) for _ in range(limite)]
+    activos = len(trabajadores)
+    pendientes: dict[int, Any] = {}
+    siguiente = 0
+    try:
+        while activos:
+            mensaje = await resultados.get()
+            if mensaje is None:
+                activos -= 1
+                continue
+            indice, valor, es_error = mensaje
+            if es_error and (indice is None or not return_exceptions):
+                raise valor
+            if not ordenado:
+                turnos.release()
+                yield valor
+                continue
+            pendientes[indice] = valor
+            while siguiente in pendientes:
+                valor = pendientes.pop(siguiente)
+                siguiente += 1
+                turnos.release()
+                yield valor
+    finally:
+        for trabajador in trabajadores:
+            trabajador.cancel()
+        await asyncio.gather(*trabajadores, return_exceptions=True)
+
+
 async def mapear_concurrencia(
     funciones: Iterable[Callable[[], Awaitable[T] | Coroutine[Any, Any, T]]],
     limite: int,
@@ -569,57 +708,214 @@ async def mapear_concurrencia(
     """Ejecuta ``funciones`` respetando ``limite`` tareas simultáneas.
 
     Aplica un control explícito de concurrencia similar a los *worker pools* de
-    Go mediante :class:`asyncio.Semaphore`. Al igual que ``Promise.all`` se
-    preserva el orden de los resultados, pero es posible limitar cuántas
-    corrutinas corren a la vez. Cuando ``return_exceptions`` es ``False`` el
-    primer error detiene el resto de tareas; si vale ``True`` las excepciones se
-    devuelven en la posición que les corresponde. ``limite`` debe ser al menos
-    ``1``.
+    Go: ``limite`` trabajadores consumen ``funciones`` de forma perezosa (ver
+    :func:`mapear_en_flujo`), sin crear una tarea por elemento. Al igual que
+    ``Promise.all`` se preserva el orden de los resultados, pero es posible
+    limitar cuántas corrutinas corren a la vez. Cuando ``return_exceptions`` es
+    ``False`` el primer error detiene el resto de tareas; si vale ``True`` las
+    excepciones se devuelven en la posición que les corresponde. ``limite``
+    debe ser al menos ``1``.
     """
 
-    if limite < 1:
-        raise ValueError("limite debe ser un entero positivo")
+    return [
+        resultado
+        async for resultado in mapear_en_flujo(
+            funciones, limite, return_exceptions=return_exceptions
+        )
+    ]
 
-    lista_funciones = list(funciones)
-    if not lista_funciones:
-        return []
 
-    semaforo = asyncio.Semaphore(limite)
+# -- Ejecución en procesos ----------------------------------------------------
 
-    async def ejecutar(funcion: Callable[[], Awaitable[T] | Coroutine[Any, Any, T]]):
-        async with semaforo:
-            try:
-                awaitable = funcion()
-            except Exception as exc:
-                if isinstance(exc, asyncio.CancelledError):
-                    raise
-                if return_exceptions:
-                    return exc
-                raise
+_POOL_PROCESOS: ProcessPoolExecutor | None = None
+_POOL_LOCK = threading.Lock()
+_CONFIG_PROCESOS: dict[str, Any] = {"max_trabajadores": None, "contexto": None}
 
-            tarea = _asegurar_tarea(awaitable)
 
-            try:
-                return await tarea
-            except asyncio.CancelledError:
-                raise
-            except Exception as exc:
-                if return_exceptions:
-                    return exc
-                raise
+def configurar_procesos(
+    max_trabajadores: int | None = None, *, contexto: str | None = None
+) -> None:
+    """Ajusta el grupo de procesos compartido de :func:`ejecutar_en_proceso`.
+
+    ``max_trabajadores`` vale por defecto el número de CPU y ``contexto`` el
+    método de arranque de :mod:`multiprocessing` (``"fork"``, ``"spawn"`` o
+    ``"forkserver"``). El grupo actual se cierra y se recrea en el siguiente uso.
+    """
+
+    if max_trabajadores is not None and max_trabajadores < 1:
+        raise ValueError("max_trabajadores debe ser un entero positivo")
+    if contexto is not None and contexto not in multiprocessing.get_all_start_methods():
+        raise ValueError(f"contexto de multiprocessing no disponible: {contexto}")
+    cerrar_procesos()
+    _CONFIG_PROCESOS["max_trabajadores"] = max_trabajadores
+    _CONFIG_PROCESOS["contexto"] = contexto
 
-    tareas = [asyncio.create_task(ejecutar(funcion)) for funcion in lista_funciones]
 
+def cerrar_procesos(*, esperar: bool = True) -> None:
+    """Cierra el grupo de procesos compartido; se recrea en el siguiente uso."""
+
+    global _POOL_PROCESOS
+    with _POOL_LOCK:
+        pool, _POOL_PROCESOS = _POOL_PROCESOS, None
+    if pool is not None:
+        pool.shutdown(wait=esperar, cancel_futures=True)
+
+
+atexit.register(cerrar_procesos)
+
+
+def _pool_procesos() -> ProcessPoolExecutor:
+    global _POOL_PROCESOS
+    with _POOL_LOCK:
+        if _POOL_PROCESOS is None:
+            contexto = _CONFIG_PROCESOS["contexto"]
+            _POOL_PROCESOS = ProcessPoolExecutor(
+                max_workers=_CONFIG_PROCESOS["max_trabajadores"],
+                mp_context=(
+                    multiprocessing.get_context(contexto) if contexto else None
+                ),
+            )
+        return _POOL_PROCESOS
+
+
+def _trabajadores_procesos() -> int:
+    return _CONFIG_PROCESOS["max_trabajadores"] or os.cpu_count() or 1
+
+
+def _error_serializacion(descripcion: str, exc: BaseException) -> TypeError:
+    return TypeError(
+        f"{descripcion} no se puede enviar a otro proceso: las funciones deben "
+        "definirse a nivel de módulo (no lambdas ni funciones anidadas) y los "
+        f"argumentos y resultados deben ser serializables con pickle ({exc})"
+    )
+
+
+def _validar_serializable(objeto: Any, descripcion: str) -> None:
     try:
-        resultados = await asyncio.gather(*tareas, return_exceptions=return_exceptions)
-    except asyncio.CancelledError:
-        for tarea in tareas:
-            tarea.cancel()
+        pickle.dumps(objeto)
+    except (pickle.PicklingError, AttributeError, TypeError) as exc:
+        raise _error_serializacion(descripcion, exc) from None
+
+
+def _parte_no_serializable(
+    funcion: Callable[..., Any], args: tuple[Any, ...]
+) -> str | None:
+    # Solo se usa tras un fallo, para no serializar dos veces en el caso normal.
+    if isinstance(funcion, functools.partial):
+        partes = (
+            ("La función", funcion.func),
+            ("Los argumentos", (funcion.args, funcion.keywords, args)),
+        )
+    else:
+        partes = (("La función", funcion), ("Los argumentos", args))
+    for descripcion, objeto in partes:
+        try:
+            pickle.dumps(objeto)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return descripcion
+    return None
+
+
+def _descartar_pool(pool: ProcessPoolExecutor) -> None:
+    """Cierra ``pool`` solo si sigue siendo el grupo compartido vigente."""
+
+    global _POOL_PROCESOS
+    with _POOL_LOCK:
+        if _POOL_PROCESOS is not pool:
+            # Otro llamador ya lo sustituyó; el grupo nuevo está sano.
+            return
+        _POOL_PROCESOS = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _esperar_en_pool(funcion: Callable[..., T], *args: Any) -> T:
+    loop = asyncio.get_running_loop()
+    pool = _pool_procesos()
+    try:
+        return await loop.run_in_executor(pool, funcion, *args)
+    except BrokenProcessPool:
+        # Un trabajador murió: el grupo queda inservible y se descarta.
+        _descartar_pool(pool)
         raise
-    finally:
-        await asyncio.gather(*tareas, return_exceptions=True)
+    except (pickle.PicklingError, AttributeError, TypeError) as exc:
+        descripcion = _parte_no_serializable(funcion, args)
+        if descripcion is None:
+            if isinstance(exc, TypeError) or "pickle" not in str(exc):
+                raise
+            descripcion = "El trabajo"
+        raise _error_serializacion(descripcion, exc) from None
+
+
+async def ejecutar_en_proceso(
+    funcion: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """Ejecuta ``funcion`` en el grupo de procesos compartido.
+
+    Es el equivalente de :func:`ejecutar_en_hilo` para trabajo de CPU: evita el
+    GIL repartiendo el cálculo entre núcleos. Los argumentos se serializan una
+    sola vez, al enviarlos, y los que no pueden serializarse producen un
+    ``TypeError`` descriptivo. Puede combinarse con :func:`grupo_tareas` y
+    :func:`limitar_tiempo`: al cancelarse, el trabajo que aún no ha empezado se
+    retira del grupo; el que ya se ejecuta termina en su proceso y su resultado
+    se descarta.
+    """
+
+    if not callable(funcion):
+        raise TypeError("ejecutar_en_proceso() requiere un callable")
+    _validar_serializable(funcion, "La función")
+    if kwargs:
+        funcion = functools.partial(funcion, **kwargs)
+    return await _esperar_en_pool(funcion, *args)
+
 
-    return list(resultados)
+def _aplicar_lote(funcion: Callable[[Any], T], lote: list[Any]) -> list[T]:
+    return [funcion(elemento) for elemento in lote]
+
+
+async def mapear_en_procesos(
+    funcion: Callable[[Any], T],
+    elementos: Iterable[Any],
+    *,
+    tamano_lote: int | None = None,
+) -> list[T]:
+    """Aplica ``funcion`` a cada elemento en el grupo de procesos compartido.
+
+    Los elementos se envían en lotes de ``tamano_lote`` para amortizar la
+    serialización; por defecto se calcula para repartir unos cuatro lotes por
+    trabajador cuando ``elementos`` tiene longitud conocida, o 64 elementos
+    por lote en otro caso. ``elementos`` se consume de forma perezosa, con un
+    lote en ejecución por trabajador como máximo. El resultado
+    conserva el orden de entrada; el primer error cancela los lotes
+    pendientes y se propaga.
+    """
+
+    if not callable(funcion):
+        raise TypeError("mapear_en_procesos() requiere un callable")
+    _validar_serializable(funcion, "La función")
+    trabajadores = _trabajadores_procesos()
+    if tamano_lote is None:
+        try:
+            total = len(elementos)  # type: ignore[arg-type]
+        except TypeError:
+            tamano_lote = 64
+        else:
+            tamano_lote = max(1, -(-total // (trabajadores * 4)))
+    if tamano_lote < 1:
+        raise ValueError("tamano_lote debe ser un entero positivo")
+
+    iterador = iter(elementos)
+
+    def _lotes() -> Iterable[Callable[[], Awaitable[list[T]]]]:
+        while True:
+            lote = list(itertools.islice(iterador, tamano_lote))
+            if not lote:
+                return
+            yield functools.partial(_esperar_en_pool, _aplicar_lote, funcion, lote)
+
+    resultados: list[T] = []
+    async for parcial in mapear_en_flujo(_lotes(), trabajadores):
+        resultados.extend(parcial)
+    return resultados
 
 
 async def recolectar_resultados(
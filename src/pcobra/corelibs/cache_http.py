@@ -0,0 +1,275 @@
+"""Caché HTTP en disco para :mod:`pcobra.corelibs.red`.
+
+Guarda el cuerpo de las respuestas ``GET`` junto con sus validadores
+(``ETag`` y ``Last-Modified``) y la caducidad derivada de ``Cache-Control``
+o ``Expires``. Mientras una entrada está fresca se sirve sin tocar la red;
+después se revalida con una petición condicional y un ``304`` se resuelve con
+el cuerpo guardado. El tamaño total se acota expulsando las entradas usadas
+hace más tiempo.
+
+Cada entrada ocupa dos archivos: ``<clave>.cuerpo`` y ``<clave>.json``. Los
+metadatos se escriben al final y de forma atómica, de modo que varios
+procesos pueden compartir el directorio.
+"""
+
+from __future__ import annotations
+
+import email.utils
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping
+
+__all__ = ["CacheHTTP", "EntradaCache"]
+
+PathLike = str | os.PathLike[str]
+
+_MAX_BYTES_POR_DEFECTO = 64 * 1024 * 1024
+
+
+def _cabecera(cabeceras: Mapping[str, Any], nombre: str) -> str | None:
+    valor = cabeceras.get(nombre)
+    if valor is None:
+        valor = cabeceras.get(nombre.lower())
+    return None if valor is None else str(valor)
+
+
+def _directivas(cabeceras: Mapping[str, Any]) -> dict[str, str | None]:
+    directivas: dict[str, str | None] = {}
+    for parte in (_cabecera(cabeceras, "Cache-Control") or "").split(","):
+        nombre, _, valor = parte.strip().partition("=")
+        if nombre:
+            directivas[nombre.lower()] = valor.strip('"') if valor else None
+    return directivas
+
+
+def _fecha(valor: str | None) -> float | None:
+    if not valor:
+        return None
+    try:
+        return email.utils.parsedate_to_datetime(valor).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _vida_util(cabeceras: Mapping[str, Any], ahora: float) -> float | None:
+    """Segundos de frescura restantes o ``None`` si no deben almacenarse."""
+
+    directivas = _directivas(cabeceras)
+    if "no-store" in directivas:
+        return None
+    if "no-cache" in directivas:
+        return 0.0
+    max_age = directivas.get("max-age")
+    if max_age is not None:
+        try:
+            vida = float(max_age)
+        except ValueError:
+            vida = 0.0
+    else:
+        expira = _fecha(_cabecera(cabeceras, "Expires"))
+        if expira is None:
+            return 0.0
+        emitida = _fecha(_cabecera(cabeceras, "Date")) or ahora
+        vida = expira - emitida
+    try:
+        edad = float(_cabecera(cabeceras, "Age") or 0)
+    except ValueError:
+        edad = 0.0
+    return max(0.0, vida - edad)
+
+
+@dataclass(frozen=True)
+class EntradaCache:
+    """Respuesta almacenada en la caché."""
+
+    url: str
+    ruta_cuerpo: Path
+    caduca: float
+    etag: str | None = None
+    ultima_modificacion: str | None = None
+    codificacion: str | None = None
+
+    @property
+    def fresca(self) -> bool:
+        return time.time() < self.caduca
+
+    def cabeceras_condicionales(self) -> dict[str, str]:
+        """Cabeceras para revalidar la entrada con el servidor."""
+
+        cabeceras = {}
+        if self.etag:
+            cabeceras["If-None-Match"] = self.etag
+        if self.ultima_modificacion:
+            cabeceras["If-Modified-Since"] = self.ultima_modificacion
+        return cabeceras
+
+    def leer(self) -> bytes:
+        return self.ruta_cuerpo.read_bytes()
+
+    def texto(self) -> str:
+        return self.leer().decode(self.codificacion or "utf-8", errors="replace")
+
+
+class CacheHTTP:
+    """Caché HTTP en disco con expulsión LRU acotada por ``max_bytes``."""
+
+    def __init__(
+        self, directorio: PathLike, *, max_bytes: int = _MAX_BYTES_POR_DEFECTO
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes debe ser mayor que cero")
+        self.directorio = Path(directorio).expanduser()
+        self.directorio.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+
+    def _rutas(self, url: str) -> tuple[Path, Path]:
+        clave = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return (
+            self.directorio / f"{clave}.json",
+            self.directorio / f"{clave}.cuerpo",
+        )
+
+    def buscar(self, url: str) -> EntradaCache | None:
+        """Devuelve la entrada de ``url`` (fresca o no) o ``None``."""
+
+        ruta_meta, ruta_cuerpo = self._rutas(url)
+        try:
+            meta = json.loads(ruta_meta.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url or not ruta_cuerpo.exists():
+            return None
+        try:
+            # El mtime de los metadatos marca el último uso para la LRU.
+            os.utime(ruta_meta)
+        except OSError:
+            pass
+        return EntradaCache(
+            url=url,
+            ruta_cuerpo=ruta_cuerpo,
+            caduca=float(meta.get("caduca", 0.0)),
+            etag=meta.get("etag"),
+            ultima_modificacion=meta.get("ultima_modificacion"),
+            codificacion=meta.get("codificacion"),
+        )
+
+    def guardar(
+        self,
+        url: str,
+        cabeceras: Mapping[str, Any],
+        cuerpo: bytes,
+        codificacion: str | None = None,
+    ) -> EntradaCache | None:
+        """Almacena una respuesta ``200`` si sus cabeceras lo permiten."""
+
+        ahora = time.time()
+        vida = _vida_util(cabeceras, ahora)
+        etag = _cabecera(cabeceras, "ETag")
+        ultima = _cabecera(cabeceras, "Last-Modified")
+        sin_validadores = not etag and not ultima
+        if vida is None or (not vida and sin_validadores) or len(cuerpo) > self.max_bytes:
+            self.eliminar(url)
+            return None
+        ruta_meta, ruta_cuerpo = self._rutas(url)
+        entrada = EntradaCache(
+            url=url,
+            ruta_cuerpo=ruta_cuerpo,
+            caduca=ahora + vida,
+            etag=etag,
+            ultima_modificacion=ultima,
+            codificacion=codificacion,
+        )
+        with self._lock:
+            self._escribir(ruta_cuerpo, cuerpo)
+            self._escribir_meta(ruta_meta, entrada)
+            self._expulsar()
+        return entrada
+
+    def refrescar(
+        self, entrada: EntradaCache, cabeceras: Mapping[str, Any]
+    ) -> EntradaCache | None:
+        """Actualiza ``entrada`` tras un ``304 Not Modified``."""
+
+        ahora = time.time()
+        vida = _vida_util(cabeceras, ahora)
+        if vida is None:
+            self.eliminar(entrada.url)
+            return None
+        actualizada = EntradaCache(
+            url=entrada.url,
+            ruta_cuerpo=entrada.ruta_cuerpo,
+            caduca=ahora + vida,
+            etag=_cabecera(cabeceras, "ETag") or entrada.etag,
+            ultima_modificacion=(
+                _cabecera(cabeceras, "Last-Modified") or entrada.ultima_modificacion
+            ),
+            codificacion=entrada.codificacion,
+        )
+        with self._lock:
+            self._escribir_meta(self._rutas(entrada.url)[0], actualizada)
+        return actualizada
+
+    def eliminar(self, url: str) -> None:
+        for ruta in self._rutas(url):
+            ruta.unlink(missing_ok=True)
+
+    def limpiar(self) -> None:
+        """Elimina todas las entradas."""
+
+        with self._lock:
+            for ruta in self.directorio.iterdir():
+                if ruta.suffix in {".json", ".cuerpo"}:
+                    ruta.unlink(missing_ok=True)
+
+    def tamano(self) -> int:
+        """Bytes de cuerpo almacenados actualmente."""
+
+        return sum(ruta.stat().st_size for ruta in self.directorio.glob("*.cuerpo"))
+
+    # -- almacenamiento -----------------------------------------------------
+    def _escribir(self, destino: Path, datos: bytes) -> None:
+        descriptor, temporal = tempfile.mkstemp(dir=self.directorio, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as archivo:
+                archivo.write(datos)
+            os.replace(temporal, destino)
+        except BaseException:
+            Path(temporal).unlink(missing_ok=True)
+            raise
+
+    def _escribir_meta(self, ruta: Path, entrada: EntradaCache) -> None:
+        meta = {
+            "url": entrada.url,
+            "caduca": entrada.caduca,
+            "etag": entrada.etag,
+            "ultima_modificacion": entrada.ultima_modificacion,
+            "codificacion": entrada.codificacion,
+        }
+        self._escribir(ruta, json.dumps(meta).encode("utf-8"))
+
+    def _expulsar(self) -> None:
+        entradas = []
+        total = 0
+        for ruta_meta in self.directorio.glob("*.json"):
+            ruta_cuerpo = ruta_meta.with_suffix(".cuerpo")
+            try:
+                usado = ruta_meta.stat().st_mtime
+                tamano = ruta_cuerpo.stat().st_size
+            except OSError:
+                continue
+            entradas.append((usado, tamano, ruta_meta, ruta_cuerpo))
+            total += tamano
+        entradas.sort(key=lambda entrada: entrada[0])
+        for _usado, tamano, ruta_meta, ruta_cuerpo in entradas:
+            if total <= self.max_bytes:
+                break
+            ruta_meta.unlink(missing_ok=True)
+            ruta_cuerpo.unlink(missing_ok=True)
+            total -= tamano
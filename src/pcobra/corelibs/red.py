@@ -1,14 +1,30 @@
-"""Funciones para realizar peticiones de red básicas."""
+"""Funciones para realizar peticiones de red básicas.
+
+Las peticiones comparten clientes HTTP con conexiones persistentes: una
+``requests.Session`` para las funciones síncronas y un ``httpx.AsyncClient``
+por bucle de eventos para las asíncronas (con HTTP/2 si ``h2`` está
+instalado). Así, las peticiones sucesivas a un mismo host reutilizan la
+conexión TCP/TLS. La lista blanca de hosts se sigue validando en cada salto.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import http.cookiejar
+import importlib.util
 import os
+import threading
+import weakref
 from pathlib import Path
-from typing import Any, TYPE_CHECKING
+from typing import Any, AsyncIterator, Iterable, Mapping, TYPE_CHECKING
 import urllib.parse
 
 import requests
 
+from pcobra.corelibs.asincrono import reintentar_async
+from pcobra.corelibs.cache_http import CacheHTTP, EntradaCache
+
 try:  # pragma: no cover - depende de extras opcionales
     import httpx  # type: ignore[import-not-found]
 except ModuleNotFoundError as exc:  # pragma: no cover - entorno sin httpx
@@ -32,6 +48,45 @@ EQUIVALENCIAS_SEMANTICAS_RED: dict[str, str] = {
 }
 
 
+# Límites de los clientes compartidos; se ajustan con :func:`configurar_cliente`.
+_CONFIG_CLIENTE: dict[str, Any] = {
+    "max_conexiones": 100,
+    "max_por_host": 10,
+    "max_keepalive": 20,
+    "http2": None,
+}
+
+
+class _SesionBasica:
+    """Sustituto mínimo de ``requests.Session`` para entornos que no la ofrecen.
+
+    Delega en ``requests.get``/``requests.post``, sin reutilizar conexiones.
+    """
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        return requests.get(url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        return requests.post(url, **kwargs)
+
+    def mount(self, *_args: Any, **_kwargs: Any) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+_SesionHTTP: type = getattr(requests, "Session", None) or _SesionBasica
+_CLIENTES_LOCK = threading.Lock()
+_SESION: Any = None
+# Un cliente asíncrono solo puede usarse en el bucle que lo creó.
+_CLIENTES_ASYNC: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+    weakref.WeakKeyDictionary()
+)
+# Caché HTTP opcional para las peticiones GET; ver :func:`configurar_cache`.
+_CACHE: CacheHTTP | None = None
+
+
 def _require_httpx() -> "_httpx":
     """Devuelve el módulo :mod:`httpx` o lanza un error descriptivo."""
 
@@ -53,18 +108,221 @@ def _obtener_hosts_permitidos() -> set[str]:
     return hosts
 
 
+def _sin_cookies() -> http.cookiejar.CookiePolicy:
+    # Las peticiones eran independientes entre sí; el cliente compartido no
+    # debe arrastrar cookies de una llamada a otra.
+    return http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+
+
+def _usar_http2() -> bool:
+    http2 = _CONFIG_CLIENTE["http2"]
+    if http2 is None:
+        return importlib.util.find_spec("h2") is not None
+    return bool(http2)
+
+
+def configurar_cliente(
+    *,
+    max_conexiones: int | None = None,
+    max_por_host: int | None = None,
+    max_keepalive: int | None = None,
+    http2: bool | None = None,
+) -> None:
+    """Ajusta los límites de los clientes HTTP compartidos.
+
+    ``max_conexiones`` limita las conexiones simultáneas del cliente
+    asíncrono (y los hosts cuyo grupo conserva la sesión síncrona),
+    ``max_por_host`` las conexiones por host de la sesión síncrona y
+    ``max_keepalive`` las conexiones inactivas que se mantienen abiertas.
+    ``http2`` fuerza o desactiva HTTP/2 en el cliente asíncrono; por defecto
+    se activa si ``h2`` está instalado. Los clientes existentes se cierran y
+    se recrean con los nuevos valores en el siguiente uso.
+    """
+
+    nuevos = {
+        "max_conexiones": max_conexiones,
+        "max_por_host": max_por_host,
+        "max_keepalive": max_keepalive,
+    }
+    for nombre, valor in nuevos.items():
+        if valor is None:
+            continue
+        if valor < 1:
+            raise ValueError(f"{nombre} debe ser >= 1")
+        _CONFIG_CLIENTE[nombre] = int(valor)
+    if http2 is not None:
+        _CONFIG_CLIENTE["http2"] = http2
+    cerrar()
+
+
+def _sesion_http() -> Any:
+    """Devuelve la sesión síncrona compartida, creándola si hace falta."""
+
+    global _SESION
+    with _CLIENTES_LOCK:
+        if _SESION is None:
+            sesion = _SesionHTTP()
+            galletas = getattr(sesion, "cookies", None)
+            if galletas is not None:
+                galletas.set_policy(_sin_cookies())
+            adaptadores = getattr(requests, "adapters", None)
+            if adaptadores is not None:
+                sesion.mount(
+                    "https://",
+                    adaptadores.HTTPAdapter(
+                        pool_connections=_CONFIG_CLIENTE["max_conexiones"],
+                        pool_maxsize=_CONFIG_CLIENTE["max_por_host"],
+                    ),
+                )
+            _SESION = sesion
+        return _SESION
+
+
+def _cliente_async() -> Any:
+    """Devuelve el cliente asíncrono compartido del bucle de eventos actual."""
+
+    httpx_mod = _require_httpx()
+    bucle = asyncio.get_running_loop()
+    with _CLIENTES_LOCK:
+        cliente = _CLIENTES_ASYNC.get(bucle)
+        if cliente is not None:
+            return cliente
+        opciones: dict[str, Any] = {"follow_redirects": False, "timeout": 5.0}
+        limites = getattr(httpx_mod, "Limits", None)
+        if limites is not None:
+            opciones["limits"] = limites(
+                max_connections=_CONFIG_CLIENTE["max_conexiones"],
+                max_keepalive_connections=_CONFIG_CLIENTE["max_keepalive"],
+            )
+        if _usar_http2():
+            opciones["http2"] = True
+        cliente = httpx_mod.AsyncClient(**opciones)
+        galletas = getattr(getattr(cliente, "cookies", None), "jar", None)
+        if galletas is not None:
+            galletas.set_policy(_sin_cookies())
+        _CLIENTES_ASYNC[bucle] = cliente
+        return cliente
+
+
+def cerrar() -> None:
+    """Cierra los clientes HTTP compartidos y libera sus conexiones.
+
+    Los clientes se recrean de forma perezosa en la siguiente petición. Los
+    clientes asíncronos de bucles ya cerrados simplemente se descartan.
+    """
+
+    global _SESION
+    with _CLIENTES_LOCK:
+        sesion, _SESION = _SESION, None
+        clientes = list(_CLIENTES_ASYNC.items())
+        _CLIENTES_ASYNC.clear()
+    if sesion is not None:
+        sesion.close()
+    for bucle, cliente in clientes:
+        cerrar_cliente = getattr(cliente, "aclose", None)
+        if cerrar_cliente is None or bucle.is_closed():
+            continue
+        try:
+            actual = asyncio.get_running_loop()
+        except RuntimeError:
+            actual = None
+        if actual is bucle:
+            bucle.create_task(cerrar_cliente())
+        elif bucle.is_running():
+            asyncio.run_coroutine_threadsafe(cerrar_cliente(), bucle)
+        else:
+            bucle.run_until_complete(cerrar_cliente())
+
+
+async def cerrar_async() -> None:
+    """Cierra y olvida el cliente asíncrono del bucle de eventos actual."""
+
+    with _CLIENTES_LOCK:
+        cliente = _CLIENTES_ASYNC.pop(asyncio.get_running_loop(), None)
+    cerrar_cliente = getattr(cliente, "aclose", None)
+    if cerrar_cliente is not None:
+        await cerrar_cliente()
+
+
+atexit.register(cerrar)
+
+
+def configurar_cache(
+    directorio: str | os.PathLike[str] | None,
+    *,
+    max_bytes: int = 64 * 1024 * 1024,
+) -> CacheHTTP | None:
+    """Activa la caché HTTP en disco para las peticiones ``GET``.
+
+    Con un ``directorio``, :func:`obtener_url`, :func:`obtener_json`,
+    :func:`obtener_url_async` y :func:`obtener_muchos` sirven desde disco las
+    respuestas frescas según ``Cache-Control``/``Expires`` y revalidan las
+    caducadas con ``If-None-Match``/``If-Modified-Since``. ``max_bytes`` acota
+    el tamaño total expulsando las entradas menos usadas. ``None`` desactiva
+    la caché.
+    """
+
+    global _CACHE
+    _CACHE = None if directorio is None else CacheHTTP(directorio, max_bytes=max_bytes)
+    return _CACHE
+
+
+def _consultar_cache(url: str) -> tuple[EntradaCache | None, dict[str, Any]]:
+    """Devuelve la entrada de ``url`` y los argumentos extra de la petición."""
+
+    entrada = _CACHE.buscar(url) if _CACHE is not None else None
+    if entrada is None:
+        return None, {}
+    return entrada, {"headers": entrada.cabeceras_condicionales()}
+
+
+def _texto_cacheado(entrada: EntradaCache) -> str | None:
+    """Lee el cuerpo guardado o ``None`` si otro proceso ya lo expulsó."""
+
+    try:
+        return entrada.texto()
+    except OSError:
+        return None
+
+
+def _revalidada(entrada: EntradaCache, cabeceras: Any) -> str | None:
+    """Resuelve un ``304`` con el cuerpo guardado.
+
+    El cuerpo se lee antes de actualizar los metadatos, porque ``refrescar``
+    borra la entrada si la respuesta trae ``no-store``. Devuelve ``None`` si el
+    cuerpo ya no existe; el llamador repite entonces la petición sin caché.
+    """
+
+    texto = _texto_cacheado(entrada)
+    if _CACHE is not None:
+        if texto is None:
+            _CACHE.eliminar(entrada.url)
+        else:
+            _CACHE.refrescar(entrada, cabeceras)
+    return texto
+
+
+def _almacenar(url: str, cabeceras: Any, cuerpo: bytes, codificacion: str | None) -> None:
+    if _CACHE is not None:
+        _CACHE.guardar(url, cabeceras, cuerpo, codificacion)
+
+
 def _validar_esquema(url: str) -> None:
     if not url.lower().startswith("https://"):
         raise ValueError("Esquema de URL no soportado")
 
 
-def _leer_respuesta(resp: requests.Response) -> str:
+def _leer_cuerpo(resp: requests.Response) -> bytes:
     datos = bytearray()
     for chunk in resp.iter_content(chunk_size=8192):
         datos.extend(chunk)
         if len(datos) > _MAX_RESP_SIZE:
             raise ValueError("Respuesta demasiado grande")
-    return datos.decode(resp.encoding or "utf-8", errors="replace")
+    return bytes(datos)
+
+
+def _leer_respuesta(resp: requests.Response) -> str:
+    return _leer_cuerpo(resp).decode(resp.encoding or "utf-8", errors="replace")
 
 
 def _validar_host(url: str, hosts: set[str]) -> None:
@@ -90,17 +348,35 @@ def obtener_url(url: str, permitir_redirecciones: bool = False) -> str:
 
     Las redirecciones están deshabilitadas por defecto. Si se permiten,
     se siguen manualmente tras validar que cada salto permanezca en la lista
-    blanca de hosts autorizados.
+    blanca de hosts autorizados. Con la caché activada (:func:`configurar_cache`)
+    cada salto se sirve desde disco o se revalida con una petición condicional.
     """
     _validar_esquema(url)
     hosts = _obtener_hosts_permitidos()
     url_actual = url
     redirecciones_restantes = _MAX_REDIRECTS
+    sin_cache = False
     while True:
         _validar_host(url_actual, hosts)
-        resp = requests.get(
-            url_actual, timeout=5, allow_redirects=False, stream=True
+        entrada, extra = (None, {}) if sin_cache else _consultar_cache(url_actual)
+        sin_cache = False
+        if entrada is not None and entrada.fresca:
+            texto = _texto_cacheado(entrada)
+            if texto is not None:
+                return texto
+            entrada, extra = None, {}
+        resp = _sesion_http().get(
+            url_actual, timeout=5, allow_redirects=False, stream=True, **extra
         )
+        if entrada is not None and resp.status_code == 304:
+            try:
+                texto = _revalidada(entrada, resp.headers)
+            finally:
+                resp.close()
+            if texto is not None:
+                return texto
+            sin_cache = True
+            continue
         if permitir_redirecciones and 300 <= resp.status_code < 400:
             if redirecciones_restantes == 0:
                 resp.close()
@@ -117,7 +393,10 @@ def obtener_url(url: str, permitir_redirecciones: bool = False) -> str:
             resp.raise_for_status()
             _validar_esquema(resp.url)
             _validar_host(resp.url, hosts)
-            return _leer_respuesta(resp)
+            cuerpo = _leer_cuerpo(resp)
+            if resp.status_code == 200:
+                _almacenar(url_actual, resp.headers, cuerpo, resp.encoding)
+            return cuerpo.decode(resp.encoding or "utf-8", errors="replace")
         finally:
             resp.close()
 
@@ -135,7 +414,7 @@ def enviar_post(url: str, datos: dict, permitir_redirecciones: bool = False) ->
     redirecciones_restantes = _MAX_REDIRECTS
     while True:
         _validar_host(url_actual, hosts)
-        resp = requests.post(
+        resp = _sesion_http().post(
             url_actual,
             data=datos,
             timeout=5,
@@ -163,13 +442,13 @@ def enviar_post(url: str, datos: dict, permitir_redirecciones: bool = False) ->
             resp.close()
 
 
-async def _leer_respuesta_async(resp: "_httpx.Response") -> str:
+async def _leer_cuerpo_async(resp: "_httpx.Response") -> bytes:
     datos = bytearray()
     async for chunk in resp.aiter_bytes(chunk_size=8192):
         datos.extend(chunk)
         if len(datos) > _MAX_RESP_SIZE:
             raise ValueError("Respuesta demasiado grande")
-    return datos.decode(resp.encoding or "utf-8", errors="replace")
+    return bytes(datos)
 
 
 async def _descargar_a_archivo(resp: "_httpx.Response", destino: Path) -> Path:
@@ -195,28 +474,48 @@ async def _realizar_peticion_async(
     hosts = _obtener_hosts_permitidos()
     url_actual = url
     redirecciones_restantes = _MAX_REDIRECTS
-    httpx_mod = _require_httpx()
-    async with httpx_mod.AsyncClient(follow_redirects=False, timeout=5.0) as client:
-        while True:
-            _validar_host(url_actual, hosts)
-            request_args: dict[str, Any] = {"data": datos} if datos is not None else {}
-            async with client.stream(
-                metodo, url_actual, follow_redirects=False, **request_args
-            ) as resp:
-                if permitir_redirecciones and 300 <= resp.status_code < 400:
-                    if redirecciones_restantes == 0:
-                        raise ValueError("Demasiadas redirecciones")
-                    destino_header = resp.headers.get("Location")
-                    url_actual = _resolver_redireccion(url_actual, destino_header, hosts)
-                    redirecciones_restantes -= 1
-                    continue
-                resp.raise_for_status()
-                url_final = str(resp.url)
-                _validar_esquema(url_final)
-                _validar_host(url_final, hosts)
-                if destino is not None:
-                    return await _descargar_a_archivo(resp, destino)
-                return await _leer_respuesta_async(resp)
+    client = _cliente_async()
+    usar_cache = metodo == "GET" and destino is None
+    sin_cache = False
+    while True:
+        _validar_host(url_actual, hosts)
+        entrada, request_args = (
+            _consultar_cache(url_actual) if usar_cache and not sin_cache else (None, {})
+        )
+        sin_cache = False
+        if entrada is not None and entrada.fresca:
+            texto = _texto_cacheado(entrada)
+            if texto is not None:
+                return texto
+            entrada, request_args = None, {}
+        if datos is not None:
+            request_args["data"] = datos
+        async with client.stream(
+            metodo, url_actual, follow_redirects=False, **request_args
+        ) as resp:
+            if entrada is not None and resp.status_code == 304:
+                texto = _revalidada(entrada, resp.headers)
+                if texto is not None:
+                    return texto
+                sin_cache = True
+                continue
+            if permitir_redirecciones and 300 <= resp.status_code < 400:
+                if redirecciones_restantes == 0:
+                    raise ValueError("Demasiadas redirecciones")
+                destino_header = resp.headers.get("Location")
+                url_actual = _resolver_redireccion(url_actual, destino_header, hosts)
+                redirecciones_restantes -= 1
+                continue
+            resp.raise_for_status()
+            url_final = str(resp.url)
+            _validar_esquema(url_final)
+            _validar_host(url_final, hosts)
+            if destino is not None:
+                return await _descargar_a_archivo(resp, destino)
+            cuerpo = await _leer_cuerpo_async(resp)
+            if usar_cache and resp.status_code == 200:
+                _almacenar(url_actual, resp.headers, cuerpo, resp.encoding)
+            return cuerpo.decode(resp.encoding or "utf-8", errors="replace")
 
 
 async def obtener_url_async(
@@ -278,6 +577,194 @@ async def descargar_archivo(
     return resultado
 
 
+class _LimitadorHosts:
+    """Espacia las peticiones a cada host según ``peticiones_por_segundo``."""
+
+    def __init__(self, peticiones_por_segundo: float | None) -> None:
+        if peticiones_por_segundo is not None and peticiones_por_segundo <= 0:
+            raise ValueError("peticiones_por_segundo debe ser mayor que cero")
+        self._intervalo = (
+            1.0 / peticiones_por_segundo if peticiones_por_segundo else 0.0
+        )
+        self._siguiente: dict[str, float] = {}
+
+    async def esperar(self, url: str) -> None:
+        if not self._intervalo:
+            return
+        host = (urllib.parse.urlparse(url).hostname or "").lower()
+        bucle = asyncio.get_running_loop()
+        ahora = bucle.time()
+        # Se reserva el turno antes de dormir para que las tareas concurrentes
+        # del mismo host queden en fila sin necesidad de un candado.
+        turno = max(ahora, self._siguiente.get(host, ahora))
+        self._siguiente[host] = turno + self._intervalo
+        if turno > ahora:
+            await asyncio.sleep(turno - ahora)
+
+
+def _excepciones_reintentables() -> tuple[type[BaseException], ...]:
+    if httpx is None:
+        return (OSError,)
+    return (httpx.TransportError, OSError)
+
+
+def _peticiones_concurrentes(
+    trabajos: Iterable[tuple[str, Path | None]],
+    *,
+    concurrencia: int,
+    peticiones_por_segundo: float | None,
+    permitir_redirecciones: bool,
+    crear_padres: bool = True,
+    **reintentos: Any,
+) -> AsyncIterator[dict[str, Any]]:
+    # Los argumentos se validan al llamar, no al empezar a iterar.
+    if concurrencia < 1:
+        raise ValueError("concurrencia debe ser un entero positivo")
+    limitador = _LimitadorHosts(peticiones_por_segundo)
+    if reintentos.get("excepciones") is None:
+        reintentos["excepciones"] = _excepciones_reintentables()
+    return _producir_resultados(
+        iter(trabajos),
+        concurrencia,
+        limitador,
+        permitir_redirecciones,
+        crear_padres,
+        reintentos,
+    )
+
+
+async def _producir_resultados(
+    pendientes: Iterable[tuple[str, Path | None]],
+    concurrencia: int,
+    limitador: _LimitadorHosts,
+    permitir_redirecciones: bool,
+    crear_padres: bool,
+    reintentos: dict[str, Any],
+) -> AsyncIterator[dict[str, Any]]:
+    resultados: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+    async def _intento(url: str, destino: Path | None) -> str | Path:
+        await limitador.esperar(url)
+        return await _realizar_peticion_async(
+            "GET", url, permitir_redirecciones=permitir_redirecciones, destino=destino
+        )
+
+    async def _ejecutar(url: str, destino: Path | None) -> dict[str, Any]:
+        if destino is not None and crear_padres:
+            destino.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            valor = await reintentar_async(
+                lambda: _intento(url, destino), **reintentos
+            )
+        except Exception as exc:
+            if destino is not None and destino.exists():
+                destino.unlink()
+            return {"url": url, "estado": "rechazada", "resultado": None, "excepcion": exc}
+        return {"url": url, "estado": "cumplida", "resultado": valor, "excepcion": None}
+
+    async def _trabajador() -> None:
+        # Las URLs se consumen de forma perezosa: nunca hay más de
+        # ``concurrencia`` peticiones en vuelo ni una tarea por URL.
+        for url, destino in pendientes:
+            await resultados.put(await _ejecutar(url, destino))
+
+    trabajadores = [asyncio.ensure_future(_trabajador()) for _ in range(concurrencia)]
+    activos = len(trabajadores)
+    for trabajador in trabajadores:
+        trabajador.add_done_callback(lambda _t: resultados.put_nowait({}))
+    try:
+        while activos:
+            resultado = await resultados.get()
+            if not resultado:
+                activos -= 1
+                continue
+            yield resultado
+        for trabajador in trabajadores:
+            trabajador.result()
+    finally:
+        for trabajador in trabajadores:
+            trabajador.cancel()
+        await asyncio.gather(*trabajadores, return_exceptions=True)
+
+
+def obtener_muchos(
+    urls: Iterable[str],
+    *,
+    concurrencia: int = 10,
+    peticiones_por_segundo: float | None = None,
+    intentos: int = 1,
+    excepciones: type[BaseException] | tuple[type[BaseException], ...] | None = None,
+    retardo_inicial: float = 0.1,
+    factor_backoff: float = 2.0,
+    max_retardo: float | None = None,
+    jitter: Any = None,
+    permitir_redirecciones: bool = False,
+) -> AsyncIterator[dict[str, Any]]:
+    """Obtiene muchas URLs ``https://`` en paralelo y las produce al completarse.
+
+    Devuelve un iterador asíncrono de diccionarios con ``url``, ``estado``
+    (``"cumplida"`` o ``"rechazada"``), ``resultado`` y ``excepcion``, en el
+    orden en que terminan. Como mucho hay ``concurrencia`` peticiones en vuelo,
+    todas sobre el cliente compartido del bucle, y ``peticiones_por_segundo``
+    limita el ritmo por host. Los errores de transporte se reintentan con la
+    semántica de :func:`pcobra.corelibs.asincrono.reintentar_async`
+    (``intentos``, ``excepciones``, ``retardo_inicial``...). Cada URL y cada
+    redirección se validan contra la lista blanca como en
+    :func:`obtener_url_async`.
+    """
+
+    return _peticiones_concurrentes(
+        ((url, None) for url in urls),
+        concurrencia=concurrencia,
+        peticiones_por_segundo=peticiones_por_segundo,
+        permitir_redirecciones=permitir_redirecciones,
+        intentos=intentos,
+        excepciones=excepciones,
+        retardo_inicial=retardo_inicial,
+        factor_backoff=factor_backoff,
+        max_retardo=max_retardo,
+        jitter=jitter,
+    )
+
+
+def descargar_muchos(
+    destinos: Mapping[str, str | os.PathLike[str]]
+    | Iterable[tuple[str, str | os.PathLike[str]]],
+    *,
+    concurrencia: int = 10,
+    peticiones_por_segundo: float | None = None,
+    intentos: int = 1,
+    excepciones: type[BaseException] | tuple[type[BaseException], ...] | None = None,
+    retardo_inicial: float = 0.1,
+    factor_backoff: float = 2.0,
+    max_retardo: float | None = None,
+    jitter: Any = None,
+    permitir_redirecciones: bool = False,
+    crear_padres: bool = True,
+) -> AsyncIterator[dict[str, Any]]:
+    """Descarga pares ``(url, destino)`` en paralelo escribiendo a disco por bloques.
+
+    Acepta los mismos controles que :func:`obtener_muchos`; el ``resultado`` de
+    cada entrada cumplida es la :class:`pathlib.Path` escrita. Si una descarga
+    falla, el archivo parcial se elimina como en :func:`descargar_archivo`.
+    """
+
+    pares = destinos.items() if isinstance(destinos, Mapping) else destinos
+    return _peticiones_concurrentes(
+        ((url, Path(destino)) for url, destino in pares),
+        concurrencia=concurrencia,
+        peticiones_por_segundo=peticiones_por_segundo,
+        permitir_redirecciones=permitir_redirecciones,
+        crear_padres=crear_padres,
+        intentos=intentos,
+        excepciones=excepciones,
+        retardo_inicial=retardo_inicial,
+        factor_backoff=factor_backoff,
+        max_retardo=max_retardo,
+        jitter=jitter,
+    )
+
+
 async def obtener_url_texto(url: str, permitir_redirecciones: bool = False) -> str:
     """Alias estable en español para obtener contenido web asíncrono."""
     try:
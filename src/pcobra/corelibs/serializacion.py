@@ -1,4 +1,10 @@
-"""Utilidades de serialización JSON y CSV para las corelibs de Cobra."""
+"""Utilidades de serialización JSON y CSV para las corelibs de Cobra.
+
+La decodificación JSON y la codificación compacta usan el backend más rápido
+disponible (``orjson``, ``msgspec`` o :mod:`json`, ver
+:mod:`pcobra.corelibs.serializadores`) sin cambiar los resultados: ante
+cualquier documento que el backend rechace se recurre a :mod:`json`.
+"""
 
 from __future__ import annotations
 
@@ -8,6 +14,8 @@ import os
 from pathlib import Path
 from typing import Any, Iterable, Mapping
 
+from pcobra.corelibs.serializadores import backend_json
+
 __all__ = [
     "codificar_json",
     "decodificar_json",
@@ -42,14 +50,27 @@ def _validar_delimitador(delimitador: str) -> str:
 
 
 def codificar_json(
-    objeto: Any, *, ordenar: bool = False, indentar: int | None = None
+    objeto: Any,
+    *,
+    ordenar: bool = False,
+    indentar: int | None = None,
+    compacto: bool = False,
 ) -> str:
     """Convierte ``objeto`` a texto JSON UTF-8 amigable.
 
     ``ordenar`` controla el orden alfabético de claves y ``indentar`` permite
-    producir una salida legible cuando se proporciona un entero.
+    producir una salida legible cuando se proporciona un entero. Con
+    ``compacto=True`` se omiten los espacios tras ``,`` y ``:`` y se usa el
+    backend JSON más rápido disponible.
     """
 
+    if compacto:
+        if indentar is not None:
+            raise ValueError("compacto e indentar no pueden combinarse")
+        try:
+            return backend_json().codificar(objeto, ordenar).decode("utf-8")
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"No se pudo codificar JSON: {exc}") from exc
     try:
         return json.dumps(
             objeto, ensure_ascii=False, sort_keys=ordenar, indent=indentar
@@ -63,8 +84,22 @@ def decodificar_json(texto: str) -> Any:
 
     if not isinstance(texto, str):
         raise TypeError("texto debe ser una cadena JSON")
+    return _decodificar(texto)
+
+
+def _decodificar(datos: str | bytes) -> Any:
+    backend = backend_json()
+    if backend.nombre != "json":
+        try:
+            return backend.decodificar(datos)
+        except ValueError:
+            # ``json`` acepta algunos documentos que otros backends rechazan
+            # (``NaN``, enteros enormes) y da mensajes de error con posición.
+            pass
+    if isinstance(datos, bytes):
+        datos = datos.decode("utf-8")
     try:
-        return json.loads(texto)
+        return json.loads(datos)
     except json.JSONDecodeError as exc:
         raise ValueError(
             f"JSON inválido en línea {exc.lineno}, columna {exc.colno}: {exc.msg}"
@@ -74,7 +109,7 @@ def decodificar_json(texto: str) -> Any:
 def leer_json(ruta: PathLike) -> Any:
     """Lee y decodifica un archivo JSON desde ``ruta``."""
 
-    return decodificar_json(_validar_ruta(ruta).read_text(encoding="utf-8"))
+    return _decodificar(_validar_ruta(ruta).read_bytes())
 
 
 def escribir_json(ruta: PathLike, objeto: Any, *, indentar: int | None = 2) -> None:
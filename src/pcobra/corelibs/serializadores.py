@@ -0,0 +1,442 @@
+"""Backends de serialización intercambiables para :mod:`pcobra.corelibs.serializacion`.
+
+JSON se codifica y decodifica con ``orjson`` o ``msgspec`` cuando están
+instalados y con :mod:`json` de la biblioteca estándar en caso contrario; se
+pueden registrar backends adicionales con :func:`registrar_backend_json`.
+El módulo añade MessagePack (``msgpack`` o ``msgspec``), NDJSON en flujo y
+:func:`comparar_backends`, que mide el rendimiento de cada backend sobre
+cargas representativas (``scripts/benchmarks/serializacion_bench.py``).
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import math
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
+
+__all__ = [
+    "BackendJSON",
+    "backend_json",
+    "backends_json",
+    "configurar_backend_json",
+    "registrar_backend_json",
+    "codificar_msgpack",
+    "decodificar_msgpack",
+    "codificar_ndjson",
+    "decodificar_ndjson",
+    "escribir_ndjson",
+    "iterar_ndjson",
+    "comparar_backends",
+]
+
+PathLike = str | os.PathLike[str]
+
+_LINEAS_POR_ESCRITURA = 1024
+# ``orjson`` y ``msgspec`` convierten en ``float`` los enteros de más de 64
+# bits; los documentos con secuencias de dígitos así de largas se decodifican
+# con :mod:`json` para conservar la precisión.
+_DIGITOS_LARGOS = re.compile(r"\d{19}")
+_DIGITOS_LARGOS_BYTES = re.compile(rb"\d{19}")
+
+
+@dataclass(frozen=True)
+class BackendJSON:
+    """Par codificador/decodificador JSON.
+
+    ``codificar(objeto, ordenar)`` devuelve JSON compacto en UTF-8 y
+    ``decodificar`` acepta ``bytes`` o ``str``. Ambos lanzan ``TypeError`` o
+    ``ValueError`` ante datos no soportados.
+    """
+
+    nombre: str
+    codificar: Callable[[Any, bool], bytes]
+    decodificar: Callable[[bytes | str], Any]
+
+
+def _backend_estandar() -> BackendJSON:
+    def codificar(objeto: Any, ordenar: bool) -> bytes:
+        return json.dumps(
+            objeto, ensure_ascii=False, sort_keys=ordenar, separators=(",", ":")
+        ).encode("utf-8")
+
+    return BackendJSON("json", codificar, json.loads)
+
+
+def _contiene_no_finitos(objeto: Any) -> bool:
+    """Indica si ``objeto`` contiene ``NaN`` o infinitos en cualquier nivel."""
+
+    pila = [objeto]
+    while pila:
+        actual = pila.pop()
+        if isinstance(actual, float):
+            if not math.isfinite(actual):
+                return True
+        elif isinstance(actual, dict):
+            pila.extend(actual.keys())
+            pila.extend(actual.values())
+        elif isinstance(actual, (list, tuple)):
+            pila.extend(actual)
+    return False
+
+
+def _con_no_finitos_estandar(
+    codificar: Callable[[Any, bool], bytes], estandar: BackendJSON
+) -> Callable[[Any, bool], bytes]:
+    # ``orjson`` y ``msgspec`` escriben ``NaN`` e infinitos como ``null``;
+    # solo se recorre el objeto cuando la salida contiene algún ``null``.
+    def codificar_fiel(objeto: Any, ordenar: bool) -> bytes:
+        datos = codificar(objeto, ordenar)
+        if b"null" in datos and _contiene_no_finitos(objeto):
+            return estandar.codificar(objeto, ordenar)
+        return datos
+
+    return codificar_fiel
+
+
+def _sin_enteros_largos(
+    decodificar: Callable[[bytes | str], Any],
+) -> Callable[[bytes | str], Any]:
+    def decodificar_seguro(datos: bytes | str) -> Any:
+        patron = _DIGITOS_LARGOS if isinstance(datos, str) else _DIGITOS_LARGOS_BYTES
+        if patron.search(datos):
+            return json.loads(datos)
+        return decodificar(datos)
+
+    return decodificar_seguro
+
+
+def _backend_orjson() -> BackendJSON:
+    orjson = importlib.import_module("orjson")
+    estandar = _backend_estandar()
+
+    def codificar(objeto: Any, ordenar: bool) -> bytes:
+        opciones = orjson.OPT_NON_STR_KEYS
+        if ordenar:
+            opciones |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(objeto, option=opciones)
+        except TypeError:
+            # Enteros de más de 64 bits y tipos que solo ``json`` acepta.
+            return estandar.codificar(objeto, ordenar)
+
+    return BackendJSON(
+        "orjson",
+        _con_no_finitos_estandar(codificar, estandar),
+        _sin_enteros_largos(orjson.loads),
+    )
+
+
+def _backend_msgspec() -> BackendJSON:
+    msgspec_json = importlib.import_module("msgspec.json")
+    estandar = _backend_estandar()
+
+    def codificar(objeto: Any, ordenar: bool) -> bytes:
+        try:
+            if ordenar:
+                return msgspec_json.encode(objeto, order="sorted")
+            return msgspec_json.encode(objeto)
+        except TypeError:
+            return estandar.codificar(objeto, ordenar)
+
+    return BackendJSON(
+        "msgspec",
+        _con_no_finitos_estandar(codificar, estandar),
+        _sin_enteros_largos(msgspec_json.decode),
+    )
+
+
+# Orden de preferencia: el primero disponible se usa por defecto.
+_FABRICAS_JSON: dict[str, Callable[[], BackendJSON]] = {
+    "orjson": _backend_orjson,
+    "msgspec": _backend_msgspec,
+    "json": _backend_estandar,
+}
+_BACKENDS_CARGADOS: dict[str, BackendJSON] = {}
+_BACKEND_ELEGIDO: str | None = None
+_LOCK = threading.Lock()
+
+
+def _cargar(nombre: str) -> BackendJSON | None:
+    with _LOCK:
+        backend = _BACKENDS_CARGADOS.get(nombre)
+        if backend is None:
+            try:
+                backend = _FABRICAS_JSON[nombre]()
+            except ImportError:
+                return None
+            _BACKENDS_CARGADOS[nombre] = backend
+        return backend
+
+
+def backends_json() -> tuple[str, ...]:
+    """Devuelve los backends JSON disponibles en orden de preferencia."""
+
+    return tuple(nombre for nombre in _FABRICAS_JSON if _cargar(nombre) is not None)
+
+
+def backend_json(nombre: str | None = None) -> BackendJSON:
+    """Devuelve el backend ``nombre`` o el configurado o preferido si es ``None``."""
+
+    nombre = nombre or _BACKEND_ELEGIDO
+    if nombre is None:
+        for candidato in _FABRICAS_JSON:
+            backend = _cargar(candidato)
+            if backend is not None:
+                return backend
+        raise RuntimeError("No hay ningún backend JSON disponible")
+    if nombre not in _FABRICAS_JSON:
+        raise ValueError(f"Backend JSON desconocido: {nombre!r}")
+    backend = _cargar(nombre)
+    if backend is None:
+        raise ModuleNotFoundError(
+            f"El backend JSON '{nombre}' no está instalado. "
+            f"Instálalo ejecutando 'pip install {nombre}'."
+        )
+    return backend
+
+
+def configurar_backend_json(nombre: str | None) -> None:
+    """Fija el backend JSON por defecto; ``None`` vuelve a la preferencia automática."""
+
+    global _BACKEND_ELEGIDO
+    if nombre is not None:
+        backend_json(nombre)
+    _BACKEND_ELEGIDO = nombre
+
+
+def registrar_backend_json(
+    nombre: str,
+    codificar: Callable[[Any, bool], bytes],
+    decodificar: Callable[[bytes | str], Any],
+    *,
+    preferente: bool = False,
+) -> None:
+    """Registra un backend JSON adicional.
+
+    Con ``preferente=True`` pasa a ser la primera opción de la preferencia
+    automática; si no, se añade al final.
+    """
+
+    global _FABRICAS_JSON
+    if not nombre:
+        raise ValueError("nombre no puede estar vacío")
+    backend = BackendJSON(nombre, codificar, decodificar)
+    with _LOCK:
+        fabricas = {k: v for k, v in _FABRICAS_JSON.items() if k != nombre}
+        if preferente:
+            fabricas = {nombre: lambda: backend, **fabricas}
+        else:
+            fabricas[nombre] = lambda: backend
+        _FABRICAS_JSON = fabricas
+        _BACKENDS_CARGADOS.pop(nombre, None)
+
+
+# -- MessagePack ---------------------------------------------------------------
+
+
+def _msgpack() -> tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    try:
+        msgpack = importlib.import_module("msgpack")
+    except ModuleNotFoundError:
+        pass
+    else:
+        return (
+            lambda objeto: msgpack.packb(objeto, use_bin_type=True),
+            lambda datos: msgpack.unpackb(datos, raw=False, strict_map_key=False),
+        )
+    try:
+        msgspec_msgpack = importlib.import_module("msgspec.msgpack")
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            "MessagePack requiere el paquete opcional 'msgpack' o 'msgspec'. "
+            "Instálalo ejecutando 'pip install msgpack'."
+        ) from None
+    return msgspec_msgpack.encode, msgspec_msgpack.decode
+
+
+def codificar_msgpack(objeto: Any) -> bytes:
+    """Codifica ``objeto`` como MessagePack."""
+
+    codificar, _decodificar = _msgpack()
+    try:
+        return codificar(objeto)
+    except (TypeError, ValueError, OverflowError) as exc:
+        raise ValueError(f"No se pudo codificar MessagePack: {exc}") from exc
+
+
+def decodificar_msgpack(datos: bytes) -> Any:
+    """Decodifica un documento MessagePack."""
+
+    _codificar, decodificar = _msgpack()
+    try:
+        return decodificar(datos)
+    except Exception as exc:  # msgpack lanza varias excepciones propias
+        raise ValueError(f"MessagePack inválido: {exc}") from None
+
+
+# -- NDJSON --------------------------------------------------------------------
+
+
+def codificar_ndjson(
+    objetos: Iterable[Any], *, backend: str | None = None
+) -> Iterator[bytes]:
+    """Produce una línea NDJSON (terminada en ``\\n``) por cada objeto."""
+
+    codificar = backend_json(backend).codificar
+    for objeto in objetos:
+        try:
+            yield codificar(objeto, False) + b"\n"
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"No se pudo codificar JSON: {exc}") from exc
+
+
+def decodificar_ndjson(
+    lineas: Iterable[bytes | str], *, backend: str | None = None
+) -> Iterator[Any]:
+    """Decodifica perezosamente líneas NDJSON, ignorando las vacías."""
+
+    decodificar = backend_json(backend).decodificar
+    for numero, linea in enumerate(lineas, start=1):
+        if not linea.strip():
+            continue
+        try:
+            yield decodificar(linea)
+        except ValueError as exc:
+            raise ValueError(f"JSON inválido en la línea {numero}: {exc}") from None
+
+
+def _ruta(ruta: PathLike) -> Path:
+    texto = os.fspath(ruta)
+    if not isinstance(texto, str) or texto == "":
+        raise ValueError("ruta debe ser una ruta de texto no vacía")
+    return Path(texto)
+
+
+def escribir_ndjson(
+    destino: PathLike | BinaryIO,
+    objetos: Iterable[Any],
+    *,
+    backend: str | None = None,
+) -> int:
+    """Escribe ``objetos`` como NDJSON en una ruta o archivo binario.
+
+    Los objetos se consumen y escriben por lotes, sin reunir el documento en
+    memoria. Devuelve el número de líneas escritas.
+    """
+
+    if hasattr(destino, "write"):
+        return _escribir_lineas(destino, codificar_ndjson(objetos, backend=backend))
+    with _ruta(destino).open("wb") as archivo:
+        return _escribir_lineas(archivo, codificar_ndjson(objetos, backend=backend))
+
+
+def _escribir_lineas(archivo: BinaryIO, lineas: Iterator[bytes]) -> int:
+    total = 0
+    lote: list[bytes] = []
+    for linea in lineas:
+        lote.append(linea)
+        if len(lote) >= _LINEAS_POR_ESCRITURA:
+            archivo.writelines(lote)
+            total += len(lote)
+            lote.clear()
+    archivo.writelines(lote)
+    return total + len(lote)
+
+
+def iterar_ndjson(
+    origen: PathLike | BinaryIO, *, backend: str | None = None
+) -> Iterator[Any]:
+    """Recorre perezosamente los objetos de un NDJSON en una ruta o archivo binario."""
+
+    if hasattr(origen, "read"):
+        yield from decodificar_ndjson(origen, backend=backend)
+        return
+    with _ruta(origen).open("rb") as archivo:
+        yield from decodificar_ndjson(archivo, backend=backend)
+
+
+# -- Comparativa ---------------------------------------------------------------
+
+
+def _cargas_representativas(tamano: int) -> dict[str, Any]:
+    return {
+        "registros": [
+            {
+                "id": indice,
+                "nombre": f"usuario-{indice}",
+                "activo": indice % 3 == 0,
+                "saldo": indice * 1.25,
+                "etiquetas": ["cobra", "datos", str(indice % 7)],
+                "perfil": {"pais": "ES", "idioma": "es", "nivel": indice % 5},
+            }
+            for indice in range(tamano)
+        ],
+        "numeros": [math.sin(indice) * 1000 for indice in range(tamano * 10)],
+        "texto": {
+            f"clave_{indice}": "año ñandú café 🐍 " * 4 for indice in range(tamano)
+        },
+    }
+
+
+def _medir(funcion: Callable[[], Any], repeticiones: int) -> float:
+    mejor = math.inf
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def comparar_backends(
+    *, tamano: int = 1000, repeticiones: int = 5
+) -> list[dict[str, Any]]:
+    """Mide el rendimiento de codificación y decodificación de cada backend.
+
+    Recorre los backends JSON disponibles y MessagePack sobre cargas de
+    ``tamano`` elementos (registros heterogéneos, números y texto Unicode) y
+    devuelve una fila por carga y backend con el tamaño producido y los MB/s
+    del mejor de ``repeticiones`` intentos.
+    """
+
+    if tamano < 1 or repeticiones < 1:
+        raise ValueError("tamano y repeticiones deben ser enteros positivos")
+
+    formatos: list[tuple[str, Callable[[Any], bytes], Callable[[bytes], Any]]] = []
+    for nombre in backends_json():
+        backend = backend_json(nombre)
+        formatos.append(
+            (
+                nombre,
+                lambda objeto, _b=backend: _b.codificar(objeto, False),
+                backend.decodificar,
+            )
+        )
+    try:
+        formatos.append(("msgpack", *_msgpack()))
+    except ModuleNotFoundError:
+        pass
+
+    filas = []
+    for carga, objeto in _cargas_representativas(tamano).items():
+        for nombre, codificar, decodificar in formatos:
+            datos = codificar(objeto)
+            megas = len(datos) / 1_000_000
+            filas.append(
+                {
+                    "carga": carga,
+                    "backend": nombre,
+                    "bytes": len(datos),
+                    "codificar_mb_s": megas
+                    / _medir(lambda: codificar(objeto), repeticiones),
+                    "decodificar_mb_s": megas
+                    / _medir(lambda: decodificar(datos), repeticiones),
+                }
+            )
+    return filas
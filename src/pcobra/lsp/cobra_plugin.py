@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+from pathlib import Path
 
 try:
     from pylsp import hookimpl, lsp  # type: ignore[import-not-found]
@@ -24,12 +26,23 @@ except ModuleNotFoundError:  # pragma: no cover - dependencia opcional
         class CompletionItemKind:
             Keyword = 14
             Function = 3
+            Method = 2
+            Variable = 6
+            Class = 7
+
+        class SymbolKind:
+            Class = 5
+            Method = 6
+            Function = 12
+            Variable = 13
 
     lsp = _DummyLSP()  # type: ignore[assignment]
 from pcobra.standard_library import __all__ as STD_FUNCS
 from pcobra.cobra.core import Lexer, LexerError
 from pcobra.cobra.core import Parser, ParserError
 from pcobra.cobra.cli.services.format_service import format_code_with_black
+from pcobra.lsp.diagnostics import DiagnosticsScheduler
+from pcobra.lsp.workspace_index import SimboloIndexado, WorkspaceIndex
 
 # Palabras reservadas más comunes de Cobra
 KEYWORDS = [
@@ -109,6 +122,122 @@ def pylsp_settings():
     return {"plugins": {"cobra": {"enabled": True}}}
 
 
+_INDICES: dict[str, WorkspaceIndex] = {}
+_INDICES_LOCK = threading.Lock()
+
+# Segundos durante los que se agrupan las escrituras del índice en disco.
+GUARDADO_DEBOUNCE_SECONDS = 2.0
+_GUARDADOS: dict[WorkspaceIndex, threading.Timer] = {}
+
+
+def _sincronizar_indice(indice: WorkspaceIndex) -> None:
+    try:
+        indice.sincronizar()
+        indice.guardar()
+    except Exception:  # pragma: no cover - registro defensivo
+        logging.exception("No se pudo sincronizar el índice de %s", indice.root)
+
+
+def _guardar_indice(indice: WorkspaceIndex) -> None:
+    with _INDICES_LOCK:
+        _GUARDADOS.pop(indice, None)
+    try:
+        indice.guardar()
+    except Exception:  # pragma: no cover - registro defensivo
+        logging.exception("No se pudo guardar el índice de %s", indice.root)
+
+
+def _programar_guardado(indice: WorkspaceIndex) -> None:
+    """Persiste ``indice`` en diferido, agrupando las escrituras cercanas."""
+    with _INDICES_LOCK:
+        if indice in _GUARDADOS:
+            return
+        temporizador = threading.Timer(
+            GUARDADO_DEBOUNCE_SECONDS, _guardar_indice, args=(indice,)
+        )
+        temporizador.daemon = True
+        _GUARDADOS[indice] = temporizador
+    temporizador.start()
+
+
+def guardar_indices_pendientes() -> None:
+    """Escribe ya los índices con un guardado diferido pendiente."""
+    with _INDICES_LOCK:
+        pendientes = list(_GUARDADOS.items())
+        _GUARDADOS.clear()
+    for indice, temporizador in pendientes:
+        temporizador.cancel()
+        _guardar_indice(indice)
+
+
+def _obtener_indice(workspace) -> WorkspaceIndex | None:
+    """Devuelve el índice del workspace, creándolo la primera vez.
+
+    El índice persistido se carga de inmediato y la sincronización con el
+    disco se realiza en segundo plano para no retrasar la primera petición.
+    """
+    root = getattr(workspace, "root_path", None)
+    if not root:
+        return None
+    with _INDICES_LOCK:
+        indice = _INDICES.get(root)
+        if indice is None:
+            indice = WorkspaceIndex(root)
+            indice.cargar()
+            _INDICES[root] = indice
+            threading.Thread(
+                target=_sincronizar_indice,
+                args=(indice,),
+                name="cobra-lsp-index",
+                daemon=True,
+            ).start()
+    return indice
+
+
+_KINDS_COMPLETADO = {
+    "funcion": "Function",
+    "clase": "Class",
+    "variable": "Variable",
+    "metodo": "Method",
+}
+
+
+def _kind(familia, tipo: str):
+    return getattr(familia, _KINDS_COMPLETADO.get(tipo, "Variable"))
+
+
+def _ubicacion(simbolo: SimboloIndexado) -> dict:
+    return {
+        "uri": Path(simbolo.ruta).as_uri(),
+        "range": {
+            "start": {"line": simbolo.linea, "character": simbolo.columna},
+            "end": {
+                "line": simbolo.linea,
+                "character": simbolo.columna + len(simbolo.nombre),
+            },
+        },
+    }
+
+
+def _simbolo_lsp(simbolo: SimboloIndexado) -> dict:
+    item = {
+        "name": simbolo.nombre,
+        "kind": _kind(lsp.SymbolKind, simbolo.tipo),
+        "location": _ubicacion(simbolo),
+    }
+    if simbolo.contenedor:
+        item["containerName"] = simbolo.contenedor
+    return item
+
+
+def _palabra_en(document, position) -> str:
+    line = document.lines[position["line"]]
+    col = position["character"]
+    antes = re.search(r"\w*$", line[:col])
+    despues = re.match(r"\w*", line[col:])
+    return (antes.group(0) if antes else "") + (despues.group(0) if despues else "")
+
+
 @hookimpl
 def pylsp_completions(config, workspace, document, position):
     """Devuelve sugerencias de autocompletado para Cobra."""
@@ -135,13 +264,90 @@ def pylsp_completions(config, workspace, document, position):
                     "detail": "Función estándar Cobra",
                 }
             )
+    indice = _obtener_indice(workspace)
+    if indice is not None and prefix:
+        vistos = {item["label"] for item in items}
+        for simbolo in indice.completar(prefix):
+            if simbolo.nombre in vistos:
+                continue
+            vistos.add(simbolo.nombre)
+            items.append(
+                {
+                    "label": simbolo.nombre,
+                    "kind": _kind(lsp.CompletionItemKind, simbolo.tipo),
+                    "detail": f"{simbolo.tipo} en {Path(simbolo.ruta).name}",
+                }
+            )
     return items or None
 
 
 @hookimpl
-def pylsp_diagnostics(config, workspace, document, **_args):
-    """Valida el documento y reporta errores de sintaxis."""
-    codigo = document.source
+def pylsp_definitions(config, workspace, document, position):
+    """Resuelve la declaración de un símbolo usando el índice del workspace."""
+    indice = _obtener_indice(workspace)
+    nombre = _palabra_en(document, position)
+    if indice is None or not nombre:
+        return []
+    return [_ubicacion(simbolo) for simbolo in indice.definiciones(nombre)]
+
+
+@hookimpl
+def pylsp_document_symbols(config, workspace, document):
+    """Lista los símbolos declarados en el documento actual."""
+    indice = _obtener_indice(workspace)
+    if indice is None:
+        return []
+    ruta = document.path
+    indice.actualizar(ruta, document.source)
+    return [_simbolo_lsp(simbolo) for simbolo in indice.simbolos_de(ruta)]
+
+
+def buscar_simbolos_workspace(workspace, query: str) -> list[dict]:
+    """Resuelve una consulta ``workspace/symbol`` sobre el índice."""
+    indice = _obtener_indice(workspace)
+    if indice is None:
+        return []
+    return [_simbolo_lsp(simbolo) for simbolo in indice.buscar(query)]
+
+
+@hookimpl
+def pylsp_dispatchers(config, workspace):
+    """Registra los métodos LSP que ``pylsp`` no enruta a ningún hook."""
+
+    def workspace_symbol(params):
+        return buscar_simbolos_workspace(workspace, (params or {}).get("query", ""))
+
+    return {"workspace/symbol": workspace_symbol}
+
+
+@hookimpl
+def pylsp_shutdown(config, workspace):
+    """Persiste los índices pendientes antes de que el servidor termine."""
+    guardar_indices_pendientes()
+
+
+def _reindexar_documento(workspace, document) -> None:
+    indice = _obtener_indice(workspace)
+    if indice is None:
+        return
+    indice.actualizar(document.path, document.source)
+    _programar_guardado(indice)
+
+
+@hookimpl
+def pylsp_document_did_open(config, workspace, document):
+    """Incorpora el documento abierto al índice del workspace."""
+    _reindexar_documento(workspace, document)
+
+
+@hookimpl
+def pylsp_document_did_save(config, workspace, document):
+    """Actualiza el índice con la versión guardada del documento."""
+    _reindexar_documento(workspace, document)
+
+
+def analizar_codigo(codigo: str) -> list[dict]:
+    """Ejecuta lexer, parser y linter sobre ``codigo`` y devuelve diagnósticos."""
     diagnostics = []
     parser: Parser | None = None
     try:
@@ -178,10 +384,52 @@ def pylsp_diagnostics(config, workspace, document, **_args):
             }
         )
 
-    diagnostics.extend(lint_lines(document.lines))
+    diagnostics.extend(lint_lines(codigo.splitlines()))
     return diagnostics
 
 
+# Documentos con más líneas se analizan en segundo plano.
+SYNC_LINE_LIMIT = 400
+
+_SCHEDULER: DiagnosticsScheduler | None = None
+
+
+def _obtener_programador() -> DiagnosticsScheduler:
+    """Crea de forma diferida el planificador de diagnósticos compartido."""
+    global _SCHEDULER
+    if _SCHEDULER is None:
+        _SCHEDULER = DiagnosticsScheduler(analizar_codigo)
+    return _SCHEDULER
+
+
+def _publicador(workspace):
+    def publicar(uri, diagnostics, version):
+        workspace.publish_diagnostics(uri, diagnostics, doc_version=version)
+
+    return publicar
+
+
+@hookimpl
+def pylsp_diagnostics(config, workspace, document, **_args):
+    """Valida el documento y reporta errores de sintaxis.
+
+    Los documentos pequeños se analizan en línea; los grandes se delegan al
+    planificador, que publica el resultado cuando termina y mientras tanto
+    devuelve los diagnósticos de la última versión analizada.
+    """
+    codigo = document.source
+    uri = getattr(document, "uri", None) or getattr(document, "path", "")
+    version = getattr(document, "version", None)
+    scheduler = _obtener_programador()
+
+    if len(document.lines) <= SYNC_LINE_LIMIT or not hasattr(
+        workspace, "publish_diagnostics"
+    ):
+        return scheduler.analizar_ahora(uri, version, codigo)
+
+    return scheduler.programar(uri, version, codigo, _publicador(workspace))
+
+
 @hookimpl
 def pylsp_format_document(config, workspace, document):
     """Formatea el archivo actual utilizando el formateador de Cobra."""
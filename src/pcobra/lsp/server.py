@@ -46,6 +46,12 @@ class CobraLSPServer(PythonLSPServer):
         super().__init__(rx, tx, check_parent_process)
         self.config.plugin_manager.register(cobra_plugin, name="cobra")
 
+    def capabilities(self):
+        """Anuncia ``workspace/symbol``, atendido por ``pylsp_dispatchers``."""
+        capacidades = super().capabilities()
+        capacidades["workspaceSymbolProvider"] = True
+        return capacidades
+
 
 def main() -> None:
     """Arranca el servidor de lenguaje con el plugin registrado."""
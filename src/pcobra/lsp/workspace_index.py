@@ -0,0 +1,436 @@
+"""Índice persistente de símbolos del workspace para el plugin LSP de Cobra.
+
+Cada archivo ``.co``/``.cobra`` se analiza una sola vez por contenido: sus
+declaraciones de primer nivel se registran en un :class:`Ambito` semántico
+(funciones, clases y variables, con los métodos de cada clase en un ámbito
+hijo) y se guardan junto al hash del contenido. Los cambios de un documento
+solo reindexan ese archivo y el índice completo se persiste en disco para
+que un reinicio del servidor no obligue a volver a parsear el proyecto.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from pcobra.cobra.core import Lexer, Parser
+from pcobra.cobra.core.ast_nodes import (
+    NodoAsignacion,
+    NodoClase,
+    NodoFuncion,
+    NodoUsar,
+)
+from pcobra.cobra.core.lexer import TipoToken
+from pcobra.cobra.semantico.tabla import Ambito
+
+LOGGER = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+COBRA_EXTENSIONS = {".co", ".cobra"}
+IGNORED_DIRS = {
+    ".git",
+    ".hg",
+    ".svn",
+    "__pycache__",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".ruff_cache",
+    ".venv",
+    "venv",
+    "node_modules",
+    "build",
+    "dist",
+}
+_DECLARADORES = {TipoToken.FUNC, TipoToken.CLASE, TipoToken.METODO, TipoToken.VAR}
+_ASIGNADORES = {TipoToken.ASIGNAR, TipoToken.ASIGNAR_INFERENCIA}
+
+
+def default_index_dir() -> Path:
+    """Directorio donde se guardan los índices persistidos."""
+
+    return Path(
+        os.environ.get("COBRA_LSP_INDEX_DIR", str(Path.home() / ".cobra" / "lsp"))
+    )
+
+
+def hash_contenido(source: str) -> str:
+    """Devuelve el hash del contenido usado como clave de cada archivo."""
+
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class SimboloIndexado:
+    """Símbolo declarado en un archivo del workspace."""
+
+    nombre: str
+    tipo: str
+    ruta: str
+    linea: int
+    columna: int
+    contenedor: str | None = None
+
+
+@dataclass
+class ArchivoIndexado:
+    """Entrada del índice para un archivo concreto."""
+
+    ruta: str
+    hash: str
+    mtime_ns: int
+    size: int
+    simbolos: list[SimboloIndexado]
+    usar: list[str]
+
+    def as_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["simbolos"] = [asdict(simbolo) for simbolo in self.simbolos]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ArchivoIndexado":
+        return cls(
+            ruta=str(data["ruta"]),
+            hash=str(data["hash"]),
+            mtime_ns=int(data.get("mtime_ns", 0)),
+            size=int(data.get("size", -1)),
+            simbolos=[SimboloIndexado(**item) for item in data.get("simbolos", [])],
+            usar=[str(modulo) for modulo in data.get("usar", [])],
+        )
+
+
+def _posiciones_declaracion(tokens: Iterable[Any]) -> dict[str, list[tuple[int, int]]]:
+    """Localiza, en orden, las posiciones donde se declara cada identificador."""
+
+    posiciones: dict[str, list[tuple[int, int]]] = {}
+    lista = list(tokens)
+    for idx, token in enumerate(lista[:-1]):
+        siguiente = lista[idx + 1]
+        if token.tipo in _DECLARADORES and siguiente.tipo == TipoToken.IDENTIFICADOR:
+            objetivo = siguiente
+        elif token.tipo == TipoToken.IDENTIFICADOR and siguiente.tipo in _ASIGNADORES:
+            objetivo = token
+        else:
+            continue
+        posiciones.setdefault(str(objetivo.valor), []).append(
+            ((objetivo.linea or 1) - 1, (objetivo.columna or 1) - 1)
+        )
+    return posiciones
+
+
+def construir_ambito(ast: Iterable[Any]) -> tuple[Ambito, dict[str, Ambito], list[str]]:
+    """Construye la tabla de símbolos de primer nivel de un módulo.
+
+    Returns:
+        El ámbito global, los ámbitos de cada clase y los módulos de ``usar``.
+    """
+
+    global_scope = Ambito()
+    clases: dict[str, Ambito] = {}
+    usar: list[str] = []
+
+    def declarar(ambito: Ambito, nombre: Any, tipo: str) -> None:
+        if isinstance(nombre, str) and nombre and not ambito.resolver_local(nombre):
+            ambito.declarar(nombre, tipo)
+
+    for nodo in ast:
+        if isinstance(nodo, NodoFuncion):
+            declarar(global_scope, nodo.nombre, "funcion")
+        elif isinstance(nodo, NodoClase):
+            declarar(global_scope, nodo.nombre, "clase")
+            ambito_clase = clases.setdefault(nodo.nombre, Ambito(global_scope))
+            for metodo in nodo.metodos:
+                declarar(ambito_clase, getattr(metodo, "nombre", None), "funcion")
+        elif isinstance(nodo, NodoAsignacion):
+            declarar(
+                global_scope, getattr(nodo, "identificador", nodo.variable), "variable"
+            )
+        elif isinstance(nodo, NodoUsar) and isinstance(nodo.modulo, str):
+            usar.append(nodo.modulo)
+    return global_scope, clases, usar
+
+
+def indexar_fuente(ruta: str, source: str) -> tuple[list[SimboloIndexado], list[str]]:
+    """Analiza ``source`` y devuelve sus símbolos y los módulos que usa."""
+
+    tokens = Lexer(source).tokenizar()
+    ast = Parser(tokens).parsear()
+    global_scope, clases, usar = construir_ambito(ast)
+    posiciones = _posiciones_declaracion(tokens)
+    usados: dict[str, int] = {}
+
+    def ubicar(nombre: str) -> tuple[int, int]:
+        candidatas = posiciones.get(nombre, [])
+        indice = usados.get(nombre, 0)
+        usados[nombre] = indice + 1
+        if indice < len(candidatas):
+            return candidatas[indice]
+        return candidatas[0] if candidatas else (0, 0)
+
+    simbolos: list[SimboloIndexado] = []
+    for simbolo in global_scope.simbolos.values():
+        linea, columna = ubicar(simbolo.nombre)
+        simbolos.append(
+            SimboloIndexado(simbolo.nombre, simbolo.tipo, ruta, linea, columna)
+        )
+        ambito_clase = clases.get(simbolo.nombre) if simbolo.tipo == "clase" else None
+        for metodo in (ambito_clase.simbolos.values() if ambito_clase else ()):
+            linea, columna = ubicar(metodo.nombre)
+            simbolos.append(
+                SimboloIndexado(
+                    metodo.nombre, "metodo", ruta, linea, columna, simbolo.nombre
+                )
+            )
+    return simbolos, usar
+
+
+def _stat_si_coincide(ruta: str, source: str) -> os.stat_result | None:
+    """Devuelve el ``stat`` de ``ruta`` solo si su contenido es ``source``."""
+
+    datos = source.encode("utf-8")
+    try:
+        stat = os.stat(ruta)
+        if stat.st_size != len(datos):
+            return None
+        contenido = Path(ruta).read_bytes()
+    except OSError:
+        return None
+    return stat if contenido == datos else None
+
+
+class WorkspaceIndex:
+    """Índice incremental de símbolos de un workspace Cobra.
+
+    Args:
+        root: Raíz del workspace.
+        index_path: Archivo JSON de persistencia; ``None`` usa
+            :func:`default_index_dir`.
+    """
+
+    def __init__(self, root: str | os.PathLike[str], index_path: Path | None = None) -> None:
+        self.root = Path(root).resolve()
+        if index_path is None:
+            clave = hashlib.sha256(str(self.root).encode("utf-8")).hexdigest()[:16]
+            index_path = default_index_dir() / f"{clave}.json"
+        self.index_path = Path(index_path)
+        self._archivos: dict[str, ArchivoIndexado] = {}
+        self._por_nombre: dict[str, list[SimboloIndexado]] = {}
+        self._nombres: list[str] = []
+        self._lock = threading.RLock()
+        self._sucio = False
+
+    # Construcción -------------------------------------------------------
+    def iter_archivos(self) -> Iterator[Path]:
+        """Recorre los archivos Cobra podando directorios ignorados."""
+
+        for directorio, subdirs, archivos in os.walk(self.root):
+            subdirs[:] = [d for d in subdirs if d not in IGNORED_DIRS]
+            for nombre in archivos:
+                if os.path.splitext(nombre)[1] in COBRA_EXTENSIONS:
+                    yield Path(directorio) / nombre
+
+    def cargar(self) -> bool:
+        """Carga el índice persistido; devuelve ``False`` si no es utilizable."""
+
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if data.get("version") != INDEX_VERSION or data.get("root") != str(self.root):
+            return False
+        with self._lock:
+            self._archivos = {
+                item["ruta"]: ArchivoIndexado.from_dict(item)
+                for item in data.get("archivos", [])
+            }
+            self._reconstruir_busqueda()
+        return True
+
+    def guardar(self) -> None:
+        """Persiste el índice si hubo cambios desde la última escritura."""
+
+        with self._lock:
+            if not self._sucio:
+                return
+            data = {
+                "version": INDEX_VERSION,
+                "root": str(self.root),
+                "archivos": [entrada.as_dict() for entrada in self._archivos.values()],
+            }
+            self._sucio = False
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        temporal = self.index_path.with_suffix(".tmp")
+        temporal.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(temporal, self.index_path)
+
+    def sincronizar(self) -> int:
+        """Alinea el índice con el disco y devuelve cuántos archivos reindexó.
+
+        Los archivos cuya fecha y tamaño coinciden con el índice se aceptan sin
+        leerlos; el resto se rehashea y solo se vuelve a parsear si el
+        contenido cambió.
+        """
+
+        vistos: set[str] = set()
+        reindexados = 0
+        for path in self.iter_archivos():
+            ruta = str(path)
+            vistos.add(ruta)
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entrada = self._archivos.get(ruta)
+            if (
+                entrada is not None
+                and entrada.mtime_ns == stat.st_mtime_ns
+                and entrada.size == stat.st_size
+            ):
+                continue
+            try:
+                source = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+            if self.actualizar(ruta, source, stat=stat):
+                reindexados += 1
+        with self._lock:
+            for ruta in set(self._archivos) - vistos:
+                self._reemplazar(ruta, None)
+        return reindexados
+
+    def actualizar(self, ruta: str, source: str, *, stat: os.stat_result | None = None) -> bool:
+        """Reindexa ``ruta`` si su contenido cambió; devuelve si hubo cambio.
+
+        Sin ``stat`` se asume que ``source`` viene del editor: la marca del
+        disco solo se registra si coincide con él, de modo que un buffer sin
+        guardar no oculte a :meth:`sincronizar` los cambios del archivo.
+        """
+
+        digest = hash_contenido(source)
+        if stat is None:
+            stat = _stat_si_coincide(ruta, source)
+        mtime_ns = stat.st_mtime_ns if stat is not None else 0
+        size = stat.st_size if stat is not None else -1
+
+        with self._lock:
+            entrada = self._archivos.get(ruta)
+            if entrada is not None and entrada.hash == digest:
+                if (entrada.mtime_ns, entrada.size) != (mtime_ns, size):
+                    entrada.mtime_ns, entrada.size = mtime_ns, size
+                    self._sucio = True
+                return False
+
+        try:
+            simbolos, usar = indexar_fuente(ruta, source)
+        except Exception as exc:  # documentos a medio escribir
+            LOGGER.debug("No se pudo indexar %s: %s", ruta, exc)
+            if entrada is not None:
+                return False
+            simbolos, usar = [], []
+
+        with self._lock:
+            self._reemplazar(
+                ruta, ArchivoIndexado(ruta, digest, mtime_ns, size, simbolos, usar)
+            )
+        return True
+
+    def eliminar(self, ruta: str) -> None:
+        """Retira ``ruta`` del índice."""
+
+        with self._lock:
+            if ruta in self._archivos:
+                self._reemplazar(ruta, None)
+
+    def _reconstruir_busqueda(self) -> None:
+        self._por_nombre = {}
+        self._nombres = []
+        for entrada in self._archivos.values():
+            self._agregar_busqueda(entrada)
+
+    def _agregar_busqueda(self, entrada: ArchivoIndexado) -> None:
+        for simbolo in entrada.simbolos:
+            existentes = self._por_nombre.get(simbolo.nombre)
+            if existentes is None:
+                existentes = self._por_nombre[simbolo.nombre] = []
+                bisect.insort(self._nombres, simbolo.nombre)
+            existentes.append(simbolo)
+
+    def _retirar_busqueda(self, entrada: ArchivoIndexado) -> None:
+        for nombre in {simbolo.nombre for simbolo in entrada.simbolos}:
+            restantes = [
+                s for s in self._por_nombre.get(nombre, ()) if s.ruta != entrada.ruta
+            ]
+            if restantes:
+                self._por_nombre[nombre] = restantes
+                continue
+            self._por_nombre.pop(nombre, None)
+            posicion = bisect.bisect_left(self._nombres, nombre)
+            if posicion < len(self._nombres) and self._nombres[posicion] == nombre:
+                del self._nombres[posicion]
+
+    def _reemplazar(self, ruta: str, nueva: ArchivoIndexado | None) -> None:
+        anterior = self._archivos.pop(ruta, None)
+        if anterior is not None:
+            self._retirar_busqueda(anterior)
+        if nueva is not None:
+            self._archivos[ruta] = nueva
+            self._agregar_busqueda(nueva)
+        self._sucio = True
+
+    # Consultas ----------------------------------------------------------
+    def completar(self, prefijo: str, limite: int = 200) -> list[SimboloIndexado]:
+        """Devuelve símbolos de primer nivel cuyo nombre empieza por ``prefijo``."""
+
+        resultado: list[SimboloIndexado] = []
+        with self._lock:
+            nombres = self._nombres
+            posicion = bisect.bisect_left(nombres, prefijo)
+            while posicion < len(nombres) and len(resultado) < limite:
+                nombre = nombres[posicion]
+                if not nombre.startswith(prefijo):
+                    break
+                resultado.extend(
+                    s for s in self._por_nombre[nombre] if s.contenedor is None
+                )
+                posicion += 1
+        return resultado[:limite]
+
+    def definiciones(self, nombre: str) -> list[SimboloIndexado]:
+        """Devuelve las declaraciones conocidas de ``nombre``."""
+
+        with self._lock:
+            return list(self._por_nombre.get(nombre, ()))
+
+    def buscar(self, consulta: str, limite: int = 200) -> list[SimboloIndexado]:
+        """Búsqueda de símbolos del workspace por subcadena (sin mayúsculas)."""
+
+        consulta = consulta.lower()
+        resultado: list[SimboloIndexado] = []
+        with self._lock:
+            for nombre in self._nombres:
+                if consulta in nombre.lower():
+                    resultado.extend(self._por_nombre[nombre])
+                    if len(resultado) >= limite:
+                        break
+        return resultado[:limite]
+
+    def simbolos_de(self, ruta: str) -> list[SimboloIndexado]:
+        """Devuelve los símbolos indexados de un archivo."""
+
+        with self._lock:
+            entrada = self._archivos.get(ruta)
+            return list(entrada.simbolos) if entrada else []
+
+    def modulos_usados(self, ruta: str) -> list[str]:
+        """Devuelve los módulos importados con ``usar`` en ``ruta``."""
+
+        with self._lock:
+            entrada = self._archivos.get(ruta)
+            return list(entrada.usar) if entrada else []
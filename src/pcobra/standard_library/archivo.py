@@ -93,6 +93,10 @@ PUBLIC_API_ARCHIVO: tuple[str, ...] = (
     "eliminar",
     "leer_lineas",
     "anexar",
+    "iterar_lineas",
+    "leer_bloques",
+    "mapear_memoria",
+    "abrir_anexador",
 )
 
 
@@ -114,6 +118,30 @@ def leer_lineas(*args, **kwargs):
     return _archivo.leer_lineas(*args, **kwargs)
 
 
+def iterar_lineas(*args, **kwargs):
+    """Recorre las líneas de un archivo sin cargarlo entero en memoria."""
+
+    return _archivo.iterar_lineas(*args, **kwargs)
+
+
+def leer_bloques(*args, **kwargs):
+    """Recorre un archivo en bloques de tamaño fijo."""
+
+    return _archivo.leer_bloques(*args, **kwargs)
+
+
+def mapear_memoria(*args, **kwargs):
+    """Devuelve una vista de solo lectura del archivo proyectada en memoria."""
+
+    return _archivo.mapear_memoria(*args, **kwargs)
+
+
+def abrir_anexador(*args, **kwargs):
+    """Abre un archivo para agregar texto con escrituras agrupadas."""
+
+    return _archivo.abrir_anexador(*args, **kwargs)
+
+
 def _validar_superficie_publica_archivo() -> None:
     if tuple(__all__) != PUBLIC_API_ARCHIVO:
         raise RuntimeError(
@@ -0,0 +1,414 @@
+"""Consultas diferidas sobre las tablas de :mod:`pcobra.standard_library.datos`.
+
+Encadenar ``seleccionar_columnas``, ``filtrar``, ``mutar_columna``,
+``ordenar_tabla`` y ``tomar`` materializa una tabla intermedia completa en
+cada paso. :class:`ConsultaPerezosa` solo registra las operaciones y, al
+llamar a :meth:`ConsultaPerezosa.recolectar`, optimiza el plan y lo ejecuta
+en una sola pasada:
+
+* los filtros se adelantan a ordenaciones, selecciones y mutaciones que no
+  afectan a las columnas que leen, y los que quedan al principio se aplican
+  directamente en el lector;
+* solo se leen de la fuente las columnas que el plan necesita;
+* las operaciones fila a fila consecutivas se fusionan en una única función
+  por fila y ``tomar`` deja de leer la fuente en cuanto tiene suficientes
+  filas.
+
+Los filtros y mutaciones son funciones opacas; para que puedan moverse o
+recortar columnas hay que declarar qué columnas leen con ``columnas=``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence
+
+from pcobra.standard_library import datos as _datos
+from pcobra.standard_library.columnar import TablaColumnar
+
+Registro = dict[str, Any]
+
+__all__ = ["ConsultaPerezosa", "consultar", "consultar_csv", "consultar_parquet"]
+
+
+@dataclass(frozen=True)
+class _Operacion:
+    tipo: str
+    columnas: tuple[str, ...] | None = None
+    funcion: Callable[[Registro], Any] | None = None
+    destino: str | None = None
+    ascendente: tuple[bool, ...] = ()
+    cantidad: int = 0
+    crear_si_no_existe: bool = True
+
+    def lee(self) -> set[str] | None:
+        """Columnas que lee la operación o ``None`` si no se conocen."""
+
+        if self.tipo == "tomar":
+            return set()
+        if self.columnas is None:
+            return None
+        columnas = set(self.columnas)
+        if self.tipo == "mutar" and not self.crear_si_no_existe:
+            columnas.add(self.destino)
+        return columnas
+
+    def describir(self) -> str:
+        if self.tipo == "seleccionar":
+            return f"seleccionar {list(self.columnas or ())}"
+        if self.tipo == "filtrar":
+            return f"filtrar lee={_formatear(self.lee())}"
+        if self.tipo == "mutar":
+            return f"mutar {self.destino} lee={_formatear(self.lee())}"
+        if self.tipo == "ordenar":
+            return f"ordenar {list(self.columnas or ())} ascendente={list(self.ascendente)}"
+        return f"tomar {self.cantidad}"
+
+
+def _formatear(columnas: set[str] | None) -> str:
+    return "?" if columnas is None else str(sorted(columnas))
+
+
+def _condicion_segura(condicion: Callable[[Registro], Any]) -> Callable[[Registro], bool]:
+    def evaluar(fila: Registro) -> bool:
+        try:
+            return bool(condicion(fila))
+        except Exception as exc:  # pragma: no cover - errores usuario
+            raise ValueError(f"La condición de filtrado falló: {exc}") from exc
+
+    return evaluar
+
+
+# ---------------------------------------------------------------------------
+# Fuentes
+# ---------------------------------------------------------------------------
+
+
+class _FuenteTabla:
+    def __init__(self, tabla: Iterable[Registro] | Mapping[str, Sequence[Any]]):
+        self.tabla = tabla
+
+    def describir(self) -> str:
+        tipo = "columnar" if isinstance(self.tabla, TablaColumnar) else "filas"
+        return f"tabla en memoria ({tipo})"
+
+    def filas(self, columnas: list[str] | None, filtros: list[Callable]) -> Iterator[Registro]:
+        tabla = self.tabla
+        if isinstance(tabla, TablaColumnar):
+            if columnas is not None:
+                tabla = tabla.seleccionar([c for c in columnas if c in tabla])
+            origen: Iterable[Registro] = tabla.filas()
+        elif isinstance(tabla, Mapping) or callable(getattr(tabla, "to_dict", None)):
+            origen = _datos._materializar_tabla(tabla)
+        else:
+            origen = tabla
+        for fila in origen:
+            if not isinstance(fila, Mapping):
+                raise TypeError("Las filas deben ser diccionarios")
+            if columnas is not None:
+                registro = {c: fila[c] for c in columnas if c in fila}
+            else:
+                registro = dict(fila)
+            if all(filtro(registro) for filtro in filtros):
+                yield registro
+
+
+class _FuenteCsv:
+    def __init__(self, ruta: str | Path, opciones: Mapping[str, Any]):
+        self.ruta = Path(ruta)
+        self.opciones = dict(opciones)
+
+    def describir(self) -> str:
+        return f"csv {self.ruta.name}"
+
+    def filas(self, columnas: list[str] | None, filtros: list[Callable]) -> Iterator[Registro]:
+        filtro = None
+        if filtros:
+            filtro = lambda fila: all(f(fila) for f in filtros)  # noqa: E731
+        lotes = _datos.leer_csv_por_lotes(
+            self.ruta, columnas=columnas, filtro=filtro, **self.opciones
+        )
+        return chain.from_iterable(lotes)
+
+
+class _FuenteParquet:
+    def __init__(self, ruta: str | Path, opciones: Mapping[str, Any]):
+        self.ruta = Path(ruta)
+        self.opciones = dict(opciones)
+
+    def describir(self) -> str:
+        return f"parquet {self.ruta.name}"
+
+    def filas(self, columnas: list[str] | None, filtros: list[Callable]) -> Iterator[Registro]:
+        for fila in _datos.leer_parquet(self.ruta, columnas=columnas, **self.opciones):
+            if all(filtro(fila) for filtro in filtros):
+                yield fila
+
+
+# ---------------------------------------------------------------------------
+# Optimización
+# ---------------------------------------------------------------------------
+
+
+def _puede_adelantarse(filtro: _Operacion, previa: _Operacion) -> bool:
+    """Indica si ``filtro`` puede ejecutarse antes que ``previa``."""
+
+    if previa.tipo == "ordenar":
+        return True
+    lee = filtro.lee()
+    if lee is None:
+        return False
+    if previa.tipo == "seleccionar":
+        return lee <= set(previa.columnas or ())
+    if previa.tipo == "mutar":
+        return previa.destino not in lee
+    return False
+
+
+def _adelantar_filtros(operaciones: Sequence[_Operacion]) -> list[_Operacion]:
+    plan: list[_Operacion] = []
+    for operacion in operaciones:
+        posicion = len(plan)
+        if operacion.tipo == "filtrar":
+            while posicion > 0 and _puede_adelantarse(operacion, plan[posicion - 1]):
+                posicion -= 1
+        plan.insert(posicion, operacion)
+    return plan
+
+
+def _columnas_necesarias(operaciones: Sequence[_Operacion]) -> set[str] | None:
+    """Columnas de la fuente que el plan necesita (``None`` si todas)."""
+
+    necesarias: set[str] | None = None
+    for operacion in reversed(operaciones):
+        if operacion.tipo == "seleccionar":
+            necesarias = set(operacion.columnas or ())
+            continue
+        if operacion.tipo == "mutar" and necesarias is not None:
+            necesarias.discard(operacion.destino)
+        lee = operacion.lee()
+        if lee is None:
+            necesarias = None
+        elif necesarias is not None:
+            necesarias |= lee
+    return necesarias
+
+
+@dataclass
+class _Plan:
+    columnas_fuente: list[str] | None
+    filtros_fuente: list[_Operacion]
+    operaciones: list[_Operacion]
+
+
+def _optimizar(operaciones: Sequence[_Operacion]) -> _Plan:
+    plan = _adelantar_filtros(operaciones)
+    filtros_fuente: list[_Operacion] = []
+    while plan and plan[0].tipo == "filtrar":
+        filtros_fuente.append(plan.pop(0))
+    necesarias = _columnas_necesarias(filtros_fuente + plan)
+    return _Plan(
+        sorted(necesarias) if necesarias is not None else None,
+        filtros_fuente,
+        plan,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Ejecución
+# ---------------------------------------------------------------------------
+
+
+def _paso_fila(operacion: _Operacion) -> Callable[[Registro], Registro | None]:
+    if operacion.tipo == "filtrar":
+        condicion = _condicion_segura(operacion.funcion)
+        return lambda fila: fila if condicion(fila) else None
+    if operacion.tipo == "mutar":
+        destino = operacion.destino
+        transformacion = operacion.funcion
+        crear = operacion.crear_si_no_existe
+
+        def mutar(fila: Registro) -> Registro:
+            if not crear and destino not in fila:
+                raise KeyError(destino)
+            fila[destino] = transformacion(fila)
+            return fila
+
+        return mutar
+    columnas = operacion.columnas or ()
+
+    def seleccionar(fila: Registro) -> Registro:
+        seleccion = {}
+        for columna in columnas:
+            if columna not in fila:
+                raise KeyError(columna)
+            seleccion[columna] = fila[columna]
+        return seleccion
+
+    return seleccionar
+
+
+def _fusionar(filas: Iterator[Registro], etapa: Sequence[_Operacion]) -> Iterator[Registro]:
+    """Aplica ``etapa`` fila a fila en una sola pasada."""
+
+    if not etapa:
+        return filas
+    pasos = [_paso_fila(operacion) for operacion in etapa]
+
+    def generar() -> Iterator[Registro]:
+        for fila in filas:
+            for paso in pasos:
+                fila = paso(fila)
+                if fila is None:
+                    break
+            else:
+                yield fila
+
+    return generar()
+
+
+def _ordenar(filas: Iterable[Registro], operacion: _Operacion) -> list[Registro]:
+    lista = list(filas)
+    for columna, asc in reversed(list(zip(operacion.columnas or (), operacion.ascendente))):
+        lista.sort(key=lambda fila: (fila.get(columna) is None, fila.get(columna)), reverse=not asc)
+    return lista
+
+
+class ConsultaPerezosa:
+    """Plan de transformaciones que se ejecuta solo al recolectarlo.
+
+    Cada método devuelve una consulta nueva, por lo que un plan parcial puede
+    reutilizarse como base de varias consultas.
+    """
+
+    def __init__(self, fuente: Any, operaciones: Sequence[_Operacion] = ()):
+        self._fuente = fuente
+        self._operaciones = tuple(operaciones)
+
+    def _con(self, operacion: _Operacion) -> "ConsultaPerezosa":
+        return ConsultaPerezosa(self._fuente, self._operaciones + (operacion,))
+
+    def seleccionar(self, columnas: Sequence[str]) -> "ConsultaPerezosa":
+        return self._con(_Operacion("seleccionar", columnas=tuple(columnas)))
+
+    def filtrar(
+        self,
+        condicion: Callable[[Registro], bool],
+        *,
+        columnas: Sequence[str] | None = None,
+    ) -> "ConsultaPerezosa":
+        """Conserva las filas que cumplen ``condicion``.
+
+        ``columnas`` declara las columnas que lee la condición y permite
+        adelantar el filtro hasta el lector.
+        """
+
+        if not callable(condicion):
+            raise TypeError("condicion debe ser callable")
+        return self._con(
+            _Operacion(
+                "filtrar",
+                columnas=tuple(columnas) if columnas is not None else None,
+                funcion=condicion,
+            )
+        )
+
+    def mutar(
+        self,
+        columna: str,
+        transformacion: Callable[[Registro], Any],
+        *,
+        columnas: Sequence[str] | None = None,
+        crear_si_no_existe: bool = True,
+    ) -> "ConsultaPerezosa":
+        if not callable(transformacion):
+            raise TypeError("transformacion debe ser callable")
+        return self._con(
+            _Operacion(
+                "mutar",
+                columnas=tuple(columnas) if columnas is not None else None,
+                funcion=transformacion,
+                destino=columna,
+                crear_si_no_existe=crear_si_no_existe,
+            )
+        )
+
+    def ordenar(
+        self, por: Sequence[str], ascendente: bool | Sequence[bool] = True
+    ) -> "ConsultaPerezosa":
+        ordenes = [ascendente] * len(por) if isinstance(ascendente, bool) else list(ascendente)
+        if len(ordenes) != len(por):
+            raise ValueError("La lista de orden debe coincidir con las columnas")
+        return self._con(
+            _Operacion("ordenar", columnas=tuple(por), ascendente=tuple(ordenes))
+        )
+
+    def tomar(self, cantidad: int) -> "ConsultaPerezosa":
+        if cantidad < 0:
+            raise ValueError("cantidad debe ser >= 0")
+        return self._con(_Operacion("tomar", cantidad=cantidad))
+
+    def explicar(self) -> str:
+        """Describe el plan optimizado que ejecutaría :meth:`recolectar`."""
+
+        plan = _optimizar(self._operaciones)
+        lineas = [f"fuente: {self._fuente.describir()}"]
+        if plan.columnas_fuente is not None:
+            lineas.append(f"  columnas leídas: {plan.columnas_fuente}")
+        for filtro in plan.filtros_fuente:
+            lineas.append(f"  filtro en lectura: lee={_formatear(filtro.lee())}")
+        etapa: list[str] = []
+        for operacion in plan.operaciones:
+            if operacion.tipo in {"filtrar", "mutar", "seleccionar"}:
+                etapa.append(operacion.describir())
+                continue
+            if etapa:
+                lineas.append("por fila: " + " -> ".join(etapa))
+                etapa = []
+            lineas.append(operacion.describir())
+        if etapa:
+            lineas.append("por fila: " + " -> ".join(etapa))
+        return "\n".join(lineas)
+
+    def __iter__(self) -> Iterator[Registro]:
+        plan = _optimizar(self._operaciones)
+        filtros = [_condicion_segura(filtro.funcion) for filtro in plan.filtros_fuente]
+        filas: Iterator[Registro] = iter(self._fuente.filas(plan.columnas_fuente, filtros))
+        etapa: list[_Operacion] = []
+        for operacion in plan.operaciones:
+            if operacion.tipo in {"filtrar", "mutar", "seleccionar"}:
+                etapa.append(operacion)
+                continue
+            filas = _fusionar(filas, etapa)
+            etapa = []
+            if operacion.tipo == "tomar":
+                filas = islice(filas, operacion.cantidad)
+            else:
+                filas = iter(_ordenar(filas, operacion))
+        return _fusionar(filas, etapa)
+
+    def recolectar(self, *, columnar: bool = False) -> list[Registro] | TablaColumnar:
+        """Ejecuta el plan y devuelve la tabla resultante."""
+
+        filas = list(self)
+        return TablaColumnar.desde_filas(filas) if columnar else filas
+
+
+def consultar(tabla: Iterable[Registro] | Mapping[str, Sequence[Any]]) -> ConsultaPerezosa:
+    """Inicia una consulta diferida sobre una tabla en memoria."""
+
+    return ConsultaPerezosa(_FuenteTabla(tabla))
+
+
+def consultar_csv(ruta: str | Path, **opciones: Any) -> ConsultaPerezosa:
+    """Inicia una consulta diferida que lee ``ruta`` con :func:`leer_csv_por_lotes`."""
+
+    return ConsultaPerezosa(_FuenteCsv(ruta, opciones))
+
+
+def consultar_parquet(ruta: str | Path, **opciones: Any) -> ConsultaPerezosa:
+    """Inicia una consulta diferida que lee ``ruta`` con :func:`leer_parquet`."""
+
+    return ConsultaPerezosa(_FuenteParquet(ruta, opciones))
@@ -11,18 +11,37 @@ firma pública para que el código existente continúe funcionando.
 from __future__ import annotations
 
 import builtins
+import functools
+import heapq
 import importlib.util
 import csv
 import json
 import math
+import multiprocessing
+import os
 import statistics
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import suppress
-from itertools import groupby
+from operator import itemgetter
+from itertools import chain, groupby, islice
 from pathlib import Path
 from typing import Any, Callable, Iterable, Iterator, Mapping, MutableMapping, Sequence, Sized, TYPE_CHECKING
 
 from pcobra._stubs.compat import import_optional_module
+from pcobra.standard_library.columnar import (
+    NUMPY_DISPONIBLE,
+    TablaColumnar,
+    a_lista,
+    como_numpy,
+    tomar_posiciones,
+)
+from pcobra.standard_library.estadistica import (
+    TAMANO_BLOQUE,
+    CovarianzaIncremental,
+    EstadisticasColumna,
+    ResumenNumerico,
+)
 
 np = import_optional_module("numpy", safe_stub=True)
 
@@ -112,6 +131,8 @@ def _materializar_tabla(
 ) -> Tabla:
     if isinstance(datos, list):
         return [dict(fila) for fila in datos]
+    if isinstance(datos, TablaColumnar):
+        return datos.a_filas()
     if isinstance(datos, Mapping):
         columnas = {clave: list(valor) for clave, valor in datos.items()}
         longitudes = {len(valores) for valores in columnas.values()}
@@ -142,6 +163,79 @@ def _materializar_tabla(
     raise TypeError("Formato de datos no soportado")
 
 
+def _conserva_columnar(funcion: Callable[..., Any]) -> Callable[..., Any]:
+    """Devuelve una :class:`TablaColumnar` cuando la tabla de entrada lo era."""
+
+    @functools.wraps(funcion)
+    def envoltura(tabla: Any, *args: Any, **kwargs: Any) -> Any:
+        resultado = funcion(tabla, *args, **kwargs)
+        if isinstance(tabla, TablaColumnar) and isinstance(resultado, list):
+            return TablaColumnar.desde_filas(resultado)
+        return resultado
+
+    return envoltura
+
+
+def _a_columnar(datos: Any) -> TablaColumnar:
+    if isinstance(datos, TablaColumnar):
+        return datos
+    if isinstance(datos, list):
+        return TablaColumnar.desde_filas(datos)
+    return TablaColumnar.desde_filas(_materializar_tabla(datos))
+
+
+def _columna_o_nulos(tabla: TablaColumnar, columna: str) -> list[Any]:
+    if columna in tabla:
+        return a_lista(tabla.almacenamiento(columna))
+    return [None] * len(tabla)
+
+
+def _es_ndarray(valor: Any) -> bool:
+    return NUMPY_DISPONIBLE and isinstance(valor, np.ndarray)
+
+
+def _numeros_columnar(tabla: TablaColumnar, columna: str) -> Any:
+    """Valores numéricos de ``columna``; arreglo NumPy si ya está tipada."""
+
+    if columna not in tabla:
+        return []
+    almacenamiento = tabla.almacenamiento(columna)
+    arreglo = como_numpy(almacenamiento, omitir_nulos=True)
+    if arreglo is not None:
+        return arreglo.astype(np.float64, copy=False)
+    return [float(valor) for valor in a_lista(almacenamiento) if _es_numero(valor)]
+
+
+def _columnas_numericas_columnar(tabla: TablaColumnar) -> list[str]:
+    numericas = []
+    for columna in tabla.columnas:
+        almacenamiento = tabla.almacenamiento(columna)
+        if como_numpy(almacenamiento, omitir_nulos=True) is not None:
+            if len(almacenamiento) - getattr(almacenamiento, "null_count", 0):
+                numericas.append(columna)
+        elif any(_es_numero(valor) for valor in a_lista(almacenamiento)):
+            numericas.append(columna)
+    return numericas
+
+
+def _pares_columnar(tabla: TablaColumnar, columna_a: str, columna_b: str) -> tuple[Any, Any]:
+    """Valores de dos columnas en las filas donde ambos son numéricos."""
+
+    if columna_a in tabla and columna_b in tabla:
+        arreglo_a = como_numpy(tabla.almacenamiento(columna_a))
+        arreglo_b = como_numpy(tabla.almacenamiento(columna_b))
+        if arreglo_a is not None and arreglo_b is not None:
+            return arreglo_a.astype(np.float64, copy=False), arreglo_b.astype(np.float64, copy=False)
+    pares = [
+        (float(valor_a), float(valor_b))
+        for valor_a, valor_b in zip(
+            _columna_o_nulos(tabla, columna_a), _columna_o_nulos(tabla, columna_b)
+        )
+        if _es_numero(valor_a) and _es_numero(valor_b)
+    ]
+    return [par[0] for par in pares], [par[1] for par in pares]
+
+
 def _modulo_disponible(nombre: str) -> bool:
     """Comprueba si un módulo opcional está disponible."""
 
@@ -187,14 +281,13 @@ def _pares_columnas(tabla: Tabla, columna_a: str, columna_b: str) -> list[tuple[
     return pares
 
 
-def _valores_numericos(tabla: Tabla, columna: str) -> list[float]:
-    return [float(valor) for valor in _valores_columna(tabla, columna, solo_numeros=True)]
-
+def _pares_listas(tabla: Tabla, columna_a: str, columna_b: str) -> tuple[list[float], list[float]]:
+    pares = _pares_columnas(tabla, columna_a, columna_b)
+    return [par[0] for par in pares], [par[1] for par in pares]
 
-def _percentil_lineal(valores: Sequence[float], percentil: float) -> float:
-    """Calcula percentiles con interpolación lineal estable entre NumPy 2.x."""
 
-    return float(np.percentile(valores, percentil, method="linear"))
+def _valores_numericos(tabla: Tabla, columna: str) -> list[float]:
+    return [float(valor) for valor in _valores_columna(tabla, columna, solo_numeros=True)]
 
 
 def _valores_numericos_alineados(tabla: Tabla, columnas: Sequence[str]) -> list[list[float]]:
@@ -235,6 +328,8 @@ def _calcular_covarianza(valores_a: Sequence[float], valores_b: Sequence[float])
     n = len(valores_a)
     if n < 2:
         return 0.0
+    if _es_ndarray(valores_a) and _es_ndarray(valores_b) and len(valores_b) == n:
+        return float(np.dot(valores_a - valores_a.mean(), valores_b - valores_b.mean()) / (n - 1))
     media_a = sum(valores_a) / n
     media_b = sum(valores_b) / n
     acumulado = sum((a - media_a) * (b - media_b) for a, b in zip(valores_a, valores_b))
@@ -250,7 +345,11 @@ def _calcular_pearson(valores_a: Sequence[float], valores_b: Sequence[float]) ->
     return covarianza / (desviacion_a * desviacion_b)
 
 
-def _rango_promedio(valores: Sequence[float]) -> list[float]:
+def _rango_promedio(valores: Sequence[float]) -> Any:
+    if _es_ndarray(valores):
+        _unicos, inversos, conteos = np.unique(valores, return_inverse=True, return_counts=True)
+        finales = np.cumsum(conteos)
+        return ((finales - conteos + 1 + finales) / 2.0)[inversos.reshape(-1)]
     pares = sorted((valor, indice) for indice, valor in enumerate(valores))
     rangos = [0.0] * len(valores)
     posicion = 0
@@ -266,6 +365,185 @@ def _rango_promedio(valores: Sequence[float]) -> list[float]:
     return rangos
 
 
+# ---------------------------------------------------------------------------
+# Rutas columnares
+# ---------------------------------------------------------------------------
+
+
+def _codigos_grupo(tabla: TablaColumnar, por: Sequence[str]) -> tuple[Any, list[tuple[Any, ...]]]:
+    """Asigna a cada fila el índice de su grupo en orden de primera aparición."""
+
+    longitud_tabla = len(tabla)
+    if len(por) == 1 and por[0] in tabla:
+        almacenamiento = como_numpy(tabla.almacenamiento(por[0]))
+        if almacenamiento is not None:
+            unicos, primeros, inversos = np.unique(
+                almacenamiento, return_index=True, return_inverse=True
+            )
+            orden = np.argsort(primeros, kind="stable")
+            rango = np.empty_like(orden)
+            rango[orden] = np.arange(len(orden))
+            claves_grupo = [(valor,) for valor in unicos[orden].tolist()]
+            return rango[inversos.reshape(-1)], claves_grupo
+
+    columnas_clave = [_columna_o_nulos(tabla, columna) for columna in por]
+    tuplas = zip(*columnas_clave) if columnas_clave else (() for _ in range(longitud_tabla))
+    indices: dict[tuple[Any, ...], int] = {}
+    claves_grupo = []
+    codigos = []
+    for clave in tuplas:
+        codigo = indices.get(clave)
+        if codigo is None:
+            codigo = indices[clave] = len(claves_grupo)
+            claves_grupo.append(clave)
+        codigos.append(codigo)
+    if NUMPY_DISPONIBLE:
+        return np.asarray(codigos, dtype=np.int64), claves_grupo
+    return codigos, claves_grupo
+
+
+def _agregar_vectorizado(nombre: str, valores: Any, codigos: Any, grupos: int) -> list[Any] | None:
+    """Agrega una columna tipada por grupo con NumPy o devuelve ``None``."""
+
+    valores = como_numpy(valores)
+    if valores is None or not _es_ndarray(codigos):
+        return None
+    if nombre in {"count", "conteo", "len"}:
+        return np.bincount(codigos, minlength=grupos).tolist()
+    if nombre in {"mean", "promedio", "avg"}:
+        sumas = np.bincount(codigos, weights=valores.astype(np.float64), minlength=grupos)
+        return (sumas / np.bincount(codigos, minlength=grupos)).tolist()
+    if nombre in {"sum", "suma"}:
+        if valores.dtype.kind == "f":
+            return np.bincount(codigos, weights=valores, minlength=grupos).tolist()
+        sumas = np.zeros(grupos, dtype=np.int64)
+        np.add.at(sumas, codigos, valores)
+        return sumas.tolist()
+    if nombre in {"max", "min"}:
+        inicial = valores[np.unique(codigos, return_index=True)[1]]
+        acumulado = inicial.copy()
+        getattr(np, "maximum" if nombre == "max" else "minimum").at(acumulado, codigos, valores)
+        return acumulado.tolist()
+    return None
+
+
+def _agrupar_columnar(
+    tabla: TablaColumnar,
+    por: Sequence[str],
+    agregaciones: Mapping[str, str | Sequence[str]],
+) -> TablaColumnar:
+    codigos, claves_grupo = _codigos_grupo(tabla, por)
+    grupos = len(claves_grupo)
+    salida: dict[str, list[Any]] = {
+        columna: [clave[posicion] for clave in claves_grupo]
+        for posicion, columna in enumerate(por)
+    }
+    lista_codigos = a_lista(codigos)
+    for columna, agg in agregaciones.items():
+        nombres = [str(agg)] if isinstance(agg, str) or not isinstance(agg, Sequence) else list(agg)
+        valores = tabla.almacenamiento(columna) if columna in tabla else None
+        por_grupo: list[list[Any]] | None = None
+        for nombre in nombres:
+            resultado = (
+                _agregar_vectorizado(nombre, valores, codigos, grupos)
+                if valores is not None
+                else None
+            )
+            if resultado is None:
+                if por_grupo is None:
+                    por_grupo = [[] for _ in range(grupos)]
+                    fuente = a_lista(valores) if valores is not None else [None] * len(tabla)
+                    for codigo, valor in zip(lista_codigos, fuente):
+                        por_grupo[codigo].append(valor)
+                resultado = [_aplicar_agregacion(nombre, grupo) for grupo in por_grupo]
+            salida[f"{columna}_{nombre}"] = resultado
+    return TablaColumnar(salida)
+
+
+def _ordenar_columnar(
+    tabla: TablaColumnar, por: Sequence[str], ordenes: Sequence[bool]
+) -> TablaColumnar:
+    indices: Any = list(range(len(tabla)))
+    for columna, asc in reversed(list(zip(por, ordenes))):
+        almacenamiento = como_numpy(tabla.almacenamiento(columna)) if columna in tabla else None
+        if almacenamiento is not None:
+            actuales = np.asarray(indices, dtype=np.int64)
+            valores = almacenamiento[actuales]
+            orden = np.argsort(valores if asc else -valores, kind="stable")
+            indices = actuales[orden].tolist()
+            continue
+        valores = _columna_o_nulos(tabla, columna)
+        indices.sort(key=lambda i: (valores[i] is None, valores[i]), reverse=not asc)
+    return tabla.tomar_indices(indices)
+
+
+def _combinar_columnar(
+    izquierda: TablaColumnar,
+    derecha: TablaColumnar,
+    clave_izquierda: Any,
+    clave_derecha: Any,
+    tipo: str,
+) -> TablaColumnar:
+    indice_derecho: dict[Any, list[int]] = defaultdict(list)
+    for posicion, clave in enumerate(_columna_o_nulos(derecha, clave_derecha)):
+        indice_derecho[clave].append(posicion)
+
+    pos_izquierda: list[int] = []
+    pos_derecha: list[int] = []
+    emparejadas: set[Any] = set()
+    for posicion, clave in enumerate(_columna_o_nulos(izquierda, clave_izquierda)):
+        coincidencias = indice_derecho.get(clave)
+        if coincidencias:
+            pos_izquierda.extend([posicion] * len(coincidencias))
+            pos_derecha.extend(coincidencias)
+            emparejadas.add(clave)
+        elif tipo in {"left", "outer"}:
+            pos_izquierda.append(posicion)
+            pos_derecha.append(-1)
+    if tipo == "outer":
+        for clave, posiciones in indice_derecho.items():
+            if clave in emparejadas:
+                continue
+            pos_izquierda.extend([-1] * len(posiciones))
+            pos_derecha.extend(posiciones)
+
+    salida: dict[str, Any] = {}
+    compartidas: dict[str, list[Any] | None] = {}
+    for columna in izquierda.columnas:
+        if columna in derecha:
+            compartidas[columna] = None
+            continue
+        salida[columna] = tomar_posiciones(izquierda.almacenamiento(columna), pos_izquierda)
+    for columna in compartidas:
+        valores_izq = a_lista(izquierda.almacenamiento(columna))
+        valores_der = a_lista(derecha.almacenamiento(columna))
+        combinados: list[Any] = []
+        conflictos: list[Any] = []
+        hay_conflicto = False
+        for i, j in zip(pos_izquierda, pos_derecha):
+            if i < 0:
+                combinados.append(valores_der[j])
+                conflictos.append(None)
+            elif j >= 0 and valores_izq[i] != valores_der[j]:
+                combinados.append(valores_izq[i])
+                conflictos.append(valores_der[j])
+                hay_conflicto = True
+            else:
+                combinados.append(valores_izq[i] if j < 0 else valores_der[j])
+                conflictos.append(None)
+        salida[columna] = combinados
+        compartidas[columna] = conflictos if hay_conflicto else None
+    orden = list(izquierda.columnas)
+    for columna in derecha.columnas:
+        if columna not in compartidas:
+            salida[columna] = tomar_posiciones(derecha.almacenamiento(columna), pos_derecha)
+            orden.append(columna)
+        elif compartidas[columna] is not None:
+            salida[f"{columna}_derecha"] = compartidas[columna]
+            orden.append(f"{columna}_derecha")
+    return TablaColumnar({columna: salida[columna] for columna in orden})
+
+
 # ---------------------------------------------------------------------------
 # Lectura y escritura
 # ---------------------------------------------------------------------------
@@ -294,6 +572,184 @@ def leer_csv(
         raise ValueError(f"No fue posible leer el CSV: {exc}") from exc
 
 
+# Tipos reconocidos por :func:`inferir_esquema`.
+_TIPOS_ESQUEMA = ("entero", "decimal", "booleano", "texto")
+
+
+def _tipo_de_valor(valor: Any) -> str | None:
+    if valor is None:
+        return None
+    if isinstance(valor, bool):
+        return "booleano"
+    if isinstance(valor, int):
+        return "entero"
+    if isinstance(valor, float):
+        return "decimal"
+    return "texto"
+
+
+def _unificar_tipos(actual: str | None, nuevo: str | None) -> str | None:
+    if actual is None or actual == nuevo:
+        return nuevo if actual is None else actual
+    if nuevo is None:
+        return actual
+    if {actual, nuevo} == {"entero", "decimal"}:
+        return "decimal"
+    return "texto"
+
+
+def inferir_esquema(filas: Iterable[Mapping[str, str | None]]) -> dict[str, str | None]:
+    """Infiere el tipo de cada columna a partir de filas de texto sin convertir.
+
+    Devuelve ``entero``, ``decimal``, ``booleano`` o ``texto`` por columna, o
+    ``None`` si la muestra solo contenía valores vacíos.
+    """
+
+    esquema: dict[str, str | None] = {}
+    for fila in filas:
+        for columna, valor in fila.items():
+            esquema[columna] = _unificar_tipos(
+                esquema.get(columna), _tipo_de_valor(_convertir_valor_crudo(valor))
+            )
+    return esquema
+
+
+def _convertidor_tipado(tipo: str | None) -> Callable[[str | None], Any]:
+    """Devuelve un conversor especializado para ``tipo``.
+
+    Los valores que no encajan en el tipo inferido se convierten con la regla
+    general de :func:`leer_csv`.
+    """
+
+    if tipo is None:
+        return _convertir_valor_crudo
+    if tipo not in _TIPOS_ESQUEMA:
+        raise ValueError(f"Tipo de esquema desconocido: {tipo}")
+
+    def convertir(valor: str | None) -> Any:
+        if valor is None:
+            return None
+        texto = valor.strip()
+        if texto == "":
+            return None
+        try:
+            if tipo == "entero":
+                return int(texto)
+            if tipo == "decimal":
+                return float(texto)
+        except ValueError:
+            return _convertir_valor_crudo(texto)
+        if tipo == "booleano":
+            minusculas = texto.lower()
+            if minusculas in {"true", "false"}:
+                return minusculas == "true"
+            return _convertir_valor_crudo(texto)
+        return texto
+
+    return convertir
+
+
+def _emitir_lote(lote: Tabla, columnar: bool) -> Tabla | TablaColumnar:
+    return TablaColumnar.desde_filas(lote) if columnar else lote
+
+
+def leer_csv_por_lotes(
+    ruta: str | Path,
+    *,
+    tamano_lote: int = 10_000,
+    separador: str = ",",
+    encoding: str = "utf-8",
+    muestra_esquema: int = 1_000,
+    esquema: Mapping[str, str | None] | None = None,
+    columnas: Sequence[str] | None = None,
+    filtro: Callable[[Registro], bool] | None = None,
+    columnar: bool = False,
+) -> Iterator[Tabla | TablaColumnar]:
+    """Lee un CSV en lotes de como máximo ``tamano_lote`` filas.
+
+    El esquema se infiere sobre las primeras ``muestra_esquema`` filas (o se
+    toma de ``esquema``) y el resto del archivo se convierte con un conversor
+    fijo por columna. Solo un lote permanece en memoria a la vez; con
+    ``columnas`` se descartan las demás columnas al leer, ``filtro`` descarta
+    filas antes de acumularlas en el lote y con ``columnar`` cada lote se
+    entrega como :class:`TablaColumnar`.
+    """
+
+    if tamano_lote < 1:
+        raise ValueError("tamano_lote debe ser >= 1")
+    try:
+        with Path(ruta).open("r", encoding=encoding, newline="") as archivo:
+            lector = csv.DictReader(archivo, delimiter=separador, strict=True)
+            nombres = lector.fieldnames or []
+            if columnas is not None:
+                faltantes = [columna for columna in columnas if columna not in nombres]
+                if faltantes:
+                    raise KeyError(faltantes[0])
+            seleccion = list(columnas) if columnas is not None else list(nombres)
+
+            def validar(fila: dict[str, Any]) -> dict[str, Any]:
+                if None in fila or len(fila) != len(nombres):
+                    raise ValueError("No fue posible leer el CSV: formato inválido")
+                return fila
+
+            muestra = [validar(fila) for fila in islice(lector, max(0, muestra_esquema))]
+            tipos = dict(esquema) if esquema is not None else inferir_esquema(
+                {columna: fila[columna] for columna in seleccion} for fila in muestra
+            )
+            convertidores = [
+                (columna, _convertidor_tipado(tipos.get(columna))) for columna in seleccion
+            ]
+
+            lote: Tabla = []
+            for fila in chain(muestra, (validar(fila) for fila in lector)):
+                registro = {columna: convertir(fila[columna]) for columna, convertir in convertidores}
+                if filtro is not None and not filtro(registro):
+                    continue
+                lote.append(registro)
+                if len(lote) >= tamano_lote:
+                    yield _emitir_lote(lote, columnar)
+                    lote = []
+            if lote:
+                yield _emitir_lote(lote, columnar)
+    except (csv.Error, OSError, UnicodeDecodeError) as exc:
+        raise ValueError(f"No fue posible leer el CSV: {exc}") from exc
+
+
+def leer_json_por_lotes(
+    ruta: str | Path,
+    *,
+    tamano_lote: int = 10_000,
+    encoding: str = "utf-8",
+    columnar: bool = False,
+) -> Iterator[Tabla | TablaColumnar]:
+    """Lee un archivo JSON Lines en lotes sin cargarlo completo en memoria."""
+
+    if tamano_lote < 1:
+        raise ValueError("tamano_lote debe ser >= 1")
+    try:
+        with Path(ruta).open("r", encoding=encoding) as archivo:
+            lote: Tabla = []
+            for numero, linea in enumerate(archivo, start=1):
+                if not linea.strip():
+                    continue
+                try:
+                    registro = json.loads(linea)
+                except json.JSONDecodeError as exc:
+                    raise ValueError(f"No fue posible leer el JSON: línea {numero}: {exc}") from exc
+                if not isinstance(registro, Mapping):
+                    raise ValueError(
+                        f"No fue posible leer el JSON: línea {numero}: las filas deben ser objetos"
+                    )
+                lote.append(dict(registro))
+                if len(lote) >= tamano_lote:
+                    yield _emitir_lote(lote, columnar)
+                    lote = []
+            if lote:
+                yield _emitir_lote(lote, columnar)
+    except (OSError, UnicodeDecodeError) as exc:
+        raise ValueError(f"No fue posible leer el JSON: {exc}") from exc
+
+
 def escribir_csv(
     datos: Iterable[Registro] | Mapping[str, Sequence[Any]] | "DataFrame",
     ruta: str | Path,
@@ -480,27 +936,69 @@ def _asegurar_pyarrow(accion: str) -> tuple[Any, Any]:
     return pa, (feather, pq)
 
 
+def _a_tabla_arrow(pa: Any, datos: Any) -> Any:
+    """Convierte ``datos`` en ``pyarrow.Table`` evitando filas intermedias."""
+
+    if isinstance(datos, pa.Table):
+        return datos
+    if isinstance(datos, TablaColumnar):
+        return datos.a_arrow()
+    return pa.Table.from_pylist(_materializar_tabla(datos))
+
+
+def _desde_tabla_arrow(tabla: Any, columnar: bool) -> Tabla | TablaColumnar:
+    if columnar:
+        return TablaColumnar.desde_arrow(tabla)
+    return tabla.to_pylist()
+
+
 def escribir_parquet(
     datos: Iterable[Registro] | Mapping[str, Sequence[Any]] | "DataFrame",
     ruta: str | Path,
     *,
     engine: str | None = None,
+    filas_por_grupo: int | None = None,
 ) -> None:
+    """Escribe ``datos`` en Parquet.
+
+    Una :class:`TablaColumnar` se entrega a Arrow columna a columna, sin
+    materializar filas. ``filas_por_grupo`` fija el tamaño de los grupos de
+    filas, que es la granularidad con la que ``leer_parquet`` puede omitir
+    datos al filtrar.
+    """
+
     pa, (_, pq) = _asegurar_pyarrow("escribir el archivo Parquet")
-    tabla = _materializar_tabla(datos)
+    tabla = _a_tabla_arrow(pa, datos)
     ruta = Path(ruta)
     ruta.parent.mkdir(parents=True, exist_ok=True)
-    pq.write_table(pa.Table.from_pylist(tabla), ruta)
+    pq.write_table(tabla, ruta, row_group_size=filas_por_grupo)
 
 
 def leer_parquet(
     ruta: str | Path,
     *,
     engine: str | None = None,
-) -> Tabla:
+    columnas: Sequence[str] | None = None,
+    filtros: Sequence[Any] | None = None,
+    columnar: bool = False,
+) -> Tabla | TablaColumnar:
+    """Lee un archivo Parquet.
+
+    ``columnas`` limita las columnas leídas del disco. ``filtros`` usa la
+    notación de ``pyarrow.parquet`` (``[("edad", ">=", 18)]`` o una lista de
+    conjunciones): los grupos de filas cuyas estadísticas descartan el filtro
+    no se leen y el resto se filtra fila a fila. Con ``columnar=True`` se
+    devuelve una :class:`TablaColumnar` que reutiliza los búferes de Arrow sin
+    crear objetos Python por fila.
+    """
+
     _pa, (_feather, pq) = _asegurar_pyarrow("leer el archivo Parquet")
-    tabla = pq.read_table(Path(ruta))
-    return [dict(fila) for fila in tabla.to_pylist()]
+    tabla = pq.read_table(
+        Path(ruta),
+        columns=list(columnas) if columnas is not None else None,
+        filters=list(filtros) if filtros else None,
+    )
+    return _desde_tabla_arrow(tabla, columnar)
 
 
 def escribir_feather(
@@ -510,16 +1008,31 @@ def escribir_feather(
     compression: str | None = None,
 ) -> None:
     pa, (feather, _) = _asegurar_pyarrow("escribir el archivo Feather")
-    tabla = _materializar_tabla(datos)
+    tabla = _a_tabla_arrow(pa, datos)
     ruta = Path(ruta)
     ruta.parent.mkdir(parents=True, exist_ok=True)
-    feather.write_feather(pa.Table.from_pylist(tabla), ruta, compression=compression)
+    feather.write_feather(tabla, ruta, compression=compression)
 
 
-def leer_feather(ruta: str | Path) -> Tabla:
+def leer_feather(
+    ruta: str | Path,
+    *,
+    columnas: Sequence[str] | None = None,
+    columnar: bool = False,
+) -> Tabla | TablaColumnar:
+    """Lee un archivo Feather.
+
+    El archivo se proyecta en memoria, de modo que con ``columnar=True`` y sin
+    compresión las columnas se leen sin copiar del disco.
+    """
+
     _pa, (feather, _pq) = _asegurar_pyarrow("leer el archivo Feather")
-    tabla = feather.read_table(Path(ruta))
-    return [dict(fila) for fila in tabla.to_pylist()]
+    tabla = feather.read_table(
+        Path(ruta),
+        columns=list(columnas) if columnas is not None else None,
+        memory_map=True,
+    )
+    return _desde_tabla_arrow(tabla, columnar)
 
 
 # ---------------------------------------------------------------------------
@@ -528,6 +1041,8 @@ def leer_feather(ruta: str | Path) -> Tabla:
 
 
 def a_listas(tabla: Iterable[Registro]) -> dict[str, list[Any]]:
+    if isinstance(tabla, TablaColumnar):
+        return tabla.a_listas()
     filas = _materializar_tabla(tabla)
     columnas = _columnas(filas)
     resultado: dict[str, list[Any]] = {columna: [] for columna in columnas}
@@ -537,7 +1052,9 @@ def a_listas(tabla: Iterable[Registro]) -> dict[str, list[Any]]:
     return resultado
 
 
-def de_listas(columnas: Mapping[str, Sequence[Any]]) -> Tabla:
+def de_listas(columnas: Mapping[str, Sequence[Any]], *, columnar: bool = False) -> Tabla:
+    if columnar:
+        return TablaColumnar(columnas)
     longitudes = {len(valores) for valores in columnas.values()}
     if len(longitudes) > 1:
         raise ValueError("Todas las columnas deben tener la misma longitud")
@@ -549,6 +1066,7 @@ def de_listas(columnas: Mapping[str, Sequence[Any]]) -> Tabla:
     ]
 
 
+@_conserva_columnar
 def agregar(tabla: Iterable[Registro], fila: Registro) -> Tabla:
     """Agrega ``fila`` a ``tabla`` devolviendo una nueva tabla materializada."""
 
@@ -644,6 +1162,10 @@ def elemento(coleccion: Any, indice: int) -> Any:
 
 
 def seleccionar_columnas(tabla: Iterable[Registro], columnas: Sequence[str]) -> Tabla:
+    if isinstance(tabla, TablaColumnar):
+        if not len(tabla):
+            return TablaColumnar()
+        return tabla.seleccionar(columnas)
     filas = _materializar_tabla(tabla)
     resultado: Tabla = []
     for fila in filas:
@@ -657,6 +1179,14 @@ def seleccionar_columnas(tabla: Iterable[Registro], columnas: Sequence[str]) ->
 
 
 def filtrar(tabla: Iterable[Any], condicion: Callable[[Any], bool]) -> list[Any]:
+    if isinstance(tabla, TablaColumnar):
+        mascara: list[bool] = []
+        for fila in tabla.filas():
+            try:
+                mascara.append(bool(condicion(fila)))
+            except Exception as exc:  # pragma: no cover - errores usuario
+                raise ValueError(f"La condición de filtrado falló: {exc}") from exc
+        return tabla.filtrar_mascara(mascara)
     try:
         filas = _materializar_tabla(tabla)
     except TypeError:
@@ -680,6 +1210,10 @@ def mutar_columna(
     *,
     crear_si_no_existe: bool = True,
 ) -> Tabla:
+    if isinstance(tabla, TablaColumnar):
+        if not crear_si_no_existe and columna not in tabla and len(tabla):
+            raise KeyError(columna)
+        return tabla.con_columna(columna, [transformacion(fila) for fila in tabla.filas()])
     filas = _materializar_tabla(tabla)
     resultado: Tabla = []
     for fila in filas:
@@ -691,6 +1225,7 @@ def mutar_columna(
     return resultado
 
 
+@_conserva_columnar
 def separar_columna(
     tabla: Iterable[Registro],
     columna: str,
@@ -724,6 +1259,7 @@ def separar_columna(
     return resultado
 
 
+@_conserva_columnar
 def unir_columnas(
     tabla: Iterable[Registro],
     columnas: Sequence[str],
@@ -763,8 +1299,23 @@ def agrupar_y_resumir(
     *,
     por: Sequence[str],
     agregaciones: Mapping[str, str | Sequence[str]],
+    procesos: int | None = None,
 ) -> Tabla:
+    """Agrupa ``tabla`` por ``por`` y resume cada columna de ``agregaciones``.
+
+    Los grupos se devuelven en el orden de su primera aparición. Con
+    ``procesos`` mayor que 1 las tablas grandes se reparten en fragmentos
+    contiguos que se resumen en paralelo y cuyos parciales se fusionan; las
+    sumas en coma flotante pueden diferir en los últimos decimales por el
+    orden de acumulación.
+    """
+
+    if isinstance(tabla, TablaColumnar):
+        return _agrupar_columnar(tabla, por, agregaciones)
     filas = _materializar_tabla(tabla)
+    efectivos = _procesos_efectivos(procesos, len(filas))
+    if efectivos:
+        return _agrupar_en_paralelo(filas, por, agregaciones, efectivos)
     grupos: dict[tuple[Any, ...], dict[str, list[Any]]] = {}
     orden_claves: list[tuple[Any, ...]] = []
     for fila in filas:
@@ -792,6 +1343,336 @@ def agrupar_y_resumir(
     return resultado
 
 
+# Agregaciones que se calculan por partes y se fusionan después.
+_PARCIALES_POR_AGREGACION = {
+    "sum": ("sum",),
+    "suma": ("sum",),
+    "count": ("count",),
+    "conteo": ("count",),
+    "len": ("count",),
+    "mean": ("sum", "count"),
+    "promedio": ("sum", "count"),
+    "avg": ("sum", "count"),
+    "max": ("max",),
+    "min": ("min",),
+}
+
+
+def _agregaciones_parciales(
+    agregaciones: Mapping[str, str | Sequence[str]],
+) -> dict[str, list[str]]:
+    parciales: dict[str, list[str]] = {}
+    for columna, agg in agregaciones.items():
+        nombres = [agg] if isinstance(agg, str) else list(agg)
+        necesarias = parciales.setdefault(columna, [])
+        for nombre in nombres:
+            if nombre not in _PARCIALES_POR_AGREGACION:
+                raise ValueError(f"Agregación desconocida: {nombre}")
+            for parcial in _PARCIALES_POR_AGREGACION[nombre]:
+                if parcial not in necesarias:
+                    necesarias.append(parcial)
+    return parciales
+
+
+def _fusionar_parcial(nombre: str, actual: Any, nuevo: Any) -> Any:
+    if actual is None:
+        return nuevo
+    if nuevo is None:
+        return actual
+    if nombre in {"sum", "count"}:
+        return actual + nuevo
+    return getattr(builtins, nombre)(actual, nuevo)
+
+
+class _AcumuladorGrupos:
+    """Fusiona resultados parciales de :func:`agrupar_y_resumir` por grupo."""
+
+    def __init__(self, por: Sequence[str], agregaciones: Mapping[str, str | Sequence[str]]):
+        self.por = list(por)
+        self.agregaciones = agregaciones
+        self.parciales = _agregaciones_parciales(agregaciones)
+        self.grupos: dict[tuple[Any, ...], dict[str, Any]] = {}
+
+    def agregar_lote(self, lote: Iterable[Registro]) -> None:
+        self.fusionar(agrupar_y_resumir(lote, por=self.por, agregaciones=self.parciales))
+
+    def fusionar(self, filas: Iterable[Registro]) -> None:
+        for fila in filas:
+            clave = tuple(fila.get(columna) for columna in self.por)
+            destino = self.grupos.get(clave)
+            if destino is None:
+                self.grupos[clave] = {
+                    columna: valor for columna, valor in fila.items() if columna not in self.por
+                }
+                continue
+            for columna, necesarias in self.parciales.items():
+                for nombre in necesarias:
+                    campo = f"{columna}_{nombre}"
+                    destino[campo] = _fusionar_parcial(nombre, destino.get(campo), fila.get(campo))
+
+    def resultado(self) -> Tabla:
+        salida: Tabla = []
+        for clave, parciales in self.grupos.items():
+            fila: Registro = dict(zip(self.por, clave))
+            for columna, agg in self.agregaciones.items():
+                for nombre in [agg] if isinstance(agg, str) else list(agg):
+                    partes = _PARCIALES_POR_AGREGACION[nombre]
+                    if partes == ("sum", "count"):
+                        suma = parciales.get(f"{columna}_sum")
+                        conteo = parciales.get(f"{columna}_count")
+                        valor = float(suma) / conteo if conteo else None
+                    else:
+                        valor = parciales.get(f"{columna}_{partes[0]}")
+                    fila[f"{columna}_{nombre}"] = valor
+            salida.append(fila)
+        return salida
+
+
+def filtrar_lotes(
+    lotes: Iterable[Iterable[Any]], condicion: Callable[[Any], bool]
+) -> Iterator[list[Any]]:
+    """Aplica :func:`filtrar` a cada lote conforme se va leyendo."""
+
+    for lote in lotes:
+        yield filtrar(lote, condicion)
+
+
+def mapear_lotes(
+    lotes: Iterable[Iterable[Any]], transformacion: Callable[[Any], Any]
+) -> Iterator[list[Any]]:
+    """Aplica :func:`mapear` a cada lote conforme se va leyendo."""
+
+    for lote in lotes:
+        yield mapear(lote, transformacion)
+
+
+def agrupar_y_resumir_por_lotes(
+    lotes: Iterable[Iterable[Registro]],
+    *,
+    por: Sequence[str],
+    agregaciones: Mapping[str, str | Sequence[str]],
+) -> Tabla:
+    """Equivalente incremental de :func:`agrupar_y_resumir`.
+
+    Cada lote se resume por separado y los parciales (suma, conteo, mínimo y
+    máximo) se fusionan, por lo que la memoria depende del número de grupos
+    y no del tamaño total de la entrada. El orden de los grupos es el de su
+    primera aparición.
+    """
+
+    acumulador = _AcumuladorGrupos(por, agregaciones)
+    for lote in lotes:
+        acumulador.agregar_lote(lote)
+    return acumulador.resultado()
+
+
+# ---------------------------------------------------------------------------
+# Ejecución en paralelo
+# ---------------------------------------------------------------------------
+
+# Por debajo de este número de filas el coste de repartir los datos entre
+# procesos supera al del cálculo secuencial.
+_FILAS_MINIMAS_PARALELO = 50_000
+
+
+# Entradas de las operaciones en curso. Con el método ``fork`` los procesos
+# hijos las heredan en memoria en lugar de recibirlas serializadas.
+_ENTRADAS_HEREDADAS: dict[int, list[Any]] = {}
+# Método de arranque de los procesos; ``None`` usa el de la plataforma.
+_CONTEXTO_PROCESOS: str | None = None
+
+
+def configurar_paralelismo(*, contexto: str | None = None) -> None:
+    """Elige el método de arranque de los procesos de las operaciones paralelas.
+
+    ``contexto`` es ``"spawn"``, ``"forkserver"`` o ``"fork"``; ``None``
+    restablece el predeterminado de la plataforma. ``fork`` evita serializar
+    los fragmentos, pero no es seguro en macOS ni en procesos con hilos.
+    """
+
+    global _CONTEXTO_PROCESOS
+    if contexto is not None and contexto not in multiprocessing.get_all_start_methods():
+        raise ValueError(f"Método de arranque no disponible: {contexto!r}")
+    _CONTEXTO_PROCESOS = contexto
+
+
+def _procesos_efectivos(procesos: int | None, filas: int) -> int:
+    """Procesos a usar; 0 indica que la operación se ejecuta en serie."""
+
+    if procesos is None or filas < _FILAS_MINIMAS_PARALELO:
+        return 0
+    efectivos = min(int(procesos), os.cpu_count() or 1)
+    return efectivos if efectivos > 1 else 0
+
+
+def _mapear_en_procesos(
+    funcion: Callable[..., Any], entradas: list[Any], procesos: int, *argumentos: Any
+) -> list[Any]:
+    """Aplica ``funcion(entrada, *argumentos)`` a cada entrada en un grupo de procesos."""
+
+    metodo = _CONTEXTO_PROCESOS or multiprocessing.get_start_method(allow_none=True)
+    contexto = multiprocessing.get_context(_CONTEXTO_PROCESOS) if _CONTEXTO_PROCESOS else None
+    if metodo != "fork":
+        with ProcessPoolExecutor(max_workers=procesos, mp_context=contexto) as ejecutor:
+            futuros = [ejecutor.submit(funcion, entrada, *argumentos) for entrada in entradas]
+            return [futuro.result() for futuro in futuros]
+    ficha = id(entradas)
+    _ENTRADAS_HEREDADAS[ficha] = entradas
+    try:
+        with ProcessPoolExecutor(max_workers=procesos, mp_context=contexto) as ejecutor:
+            futuros = [
+                ejecutor.submit(_ejecutar_heredada, funcion, ficha, indice, argumentos)
+                for indice in range(len(entradas))
+            ]
+            return [futuro.result() for futuro in futuros]
+    finally:
+        del _ENTRADAS_HEREDADAS[ficha]
+
+
+def _ejecutar_heredada(
+    funcion: Callable[..., Any], ficha: int, indice: int, argumentos: tuple[Any, ...]
+) -> Any:
+    return funcion(_ENTRADAS_HEREDADAS[ficha][indice], *argumentos)
+
+
+def _resumir_fragmento(
+    filas: Tabla, por: Sequence[str], parciales: Mapping[str, Sequence[str]]
+) -> Tabla:
+    return agrupar_y_resumir(filas, por=por, agregaciones=parciales)
+
+
+def _agrupar_en_paralelo(
+    filas: Tabla,
+    por: Sequence[str],
+    agregaciones: Mapping[str, str | Sequence[str]],
+    procesos: int,
+) -> Tabla:
+    # Los fragmentos son contiguos y se fusionan en orden, así que cada grupo
+    # conserva la posición de su primera aparición.
+    acumulador = _AcumuladorGrupos(por, agregaciones)
+    tamano = -(-len(filas) // procesos)
+    fragmentos = [filas[inicio : inicio + tamano] for inicio in range(0, len(filas), tamano)]
+    for parcial in _mapear_en_procesos(
+        _resumir_fragmento, fragmentos, procesos, acumulador.por, acumulador.parciales
+    ):
+        acumulador.fusionar(parcial)
+    return acumulador.resultado()
+
+
+def _combinar_filas(
+    izquierda: Sequence[Registro],
+    derecha: Sequence[Registro],
+    clave_izquierda: Any,
+    clave_derecha: Any,
+    tipo: str,
+    columnas_izquierda: Sequence[str],
+    columnas_derecha: Sequence[str],
+) -> tuple[list[tuple[int, Registro]], list[tuple[int, Registro]]]:
+    """Une ``izquierda`` con ``derecha`` por hash de la clave.
+
+    Devuelve las filas guiadas por la izquierda, cada una con el índice de su
+    fila izquierda, y (en uniones ``outer``) las filas derechas sin pareja con
+    el índice de la primera fila derecha de su clave.
+    """
+
+    indice_derecho: dict[Any, list[int]] = defaultdict(list)
+    for posicion, fila in enumerate(derecha):
+        indice_derecho[fila.get(clave_derecha)].append(posicion)
+
+    cuerpo: list[tuple[int, Registro]] = []
+    emparejadas: set[Any] = set()
+    for posicion, fila_izquierda in enumerate(izquierda):
+        clave = fila_izquierda.get(clave_izquierda)
+        coincidencias = indice_derecho.get(clave)
+        if coincidencias:
+            for indice in coincidencias:
+                combinada = dict(fila_izquierda)
+                for columna, valor in derecha[indice].items():
+                    if columna in combinada and combinada[columna] != valor:
+                        combinada[f"{columna}_derecha"] = valor
+                    else:
+                        combinada[columna] = valor
+                cuerpo.append((posicion, combinada))
+            emparejadas.add(clave)
+        elif tipo in {"left", "outer"}:
+            combinada = dict(fila_izquierda)
+            for columna in columnas_derecha:
+                if columna not in combinada:
+                    combinada[columna] = None
+            cuerpo.append((posicion, combinada))
+
+    cola: list[tuple[int, Registro]] = []
+    if tipo == "outer":
+        vacia = dict.fromkeys(columnas_izquierda)
+        for clave, posiciones in indice_derecho.items():
+            if clave in emparejadas:
+                continue
+            for indice in posiciones:
+                combinada = dict(vacia)
+                combinada.update(derecha[indice])
+                cola.append((posiciones[0], combinada))
+    return cuerpo, cola
+
+
+def _combinar_particion(
+    particion: tuple[tuple[list[int], Tabla], tuple[list[int], Tabla]],
+    *argumentos: Any,
+) -> tuple[list[tuple[int, Registro]], list[tuple[int, Registro]]]:
+    (posiciones_izquierda, izquierda), (posiciones_derecha, derecha) = particion
+    cuerpo, cola = _combinar_filas(izquierda, derecha, *argumentos)
+    return (
+        [(posiciones_izquierda[indice], fila) for indice, fila in cuerpo],
+        [(posiciones_derecha[indice], fila) for indice, fila in cola],
+    )
+
+
+def _particionar_por_clave(
+    tabla: Tabla, clave: Any, particiones: int
+) -> list[tuple[list[int], Tabla]]:
+    destinos: list[tuple[list[int], Tabla]] = [([], []) for _ in range(particiones)]
+    for posicion, fila in enumerate(tabla):
+        posiciones, filas = destinos[hash(fila.get(clave)) % particiones]
+        posiciones.append(posicion)
+        filas.append(fila)
+    return destinos
+
+
+def _combinar_en_paralelo(
+    tabla_izquierda: Tabla,
+    tabla_derecha: Tabla,
+    clave_izquierda: Any,
+    clave_derecha: Any,
+    tipo: str,
+    columnas_izquierda: Sequence[str],
+    columnas_derecha: Sequence[str],
+    procesos: int,
+) -> Tabla:
+    # Las claves iguales caen en la misma partición, de modo que cada proceso
+    # resuelve su parte de forma independiente. Las posiciones originales
+    # permiten intercalar los resultados en el orden de la unión secuencial.
+    particiones = list(
+        zip(
+            _particionar_por_clave(tabla_izquierda, clave_izquierda, procesos),
+            _particionar_por_clave(tabla_derecha, clave_derecha, procesos),
+        )
+    )
+    partes = _mapear_en_procesos(
+        _combinar_particion,
+        particiones,
+        procesos,
+        clave_izquierda,
+        clave_derecha,
+        tipo,
+        columnas_izquierda,
+        columnas_derecha,
+    )
+    orden = itemgetter(0)
+    cuerpo = heapq.merge(*(parte[0] for parte in partes), key=orden)
+    cola = heapq.merge(*(parte[1] for parte in partes), key=orden)
+    return [fila for _, fila in chain(cuerpo, cola)]
+
+
+@_conserva_columnar
 def tabla_cruzada(
     tabla: Iterable[Registro],
     filas: str,
@@ -853,6 +1734,7 @@ def tabla_cruzada(
     return resultado
 
 
+@_conserva_columnar
 def pivotar_ancho(
     tabla: Iterable[Registro],
     *,
@@ -889,6 +1771,7 @@ def pivotar_ancho(
     return salida
 
 
+@_conserva_columnar
 def pivotar_largo(
     tabla: Iterable[Registro],
     *,
@@ -920,13 +1803,15 @@ def ordenar_tabla(
     por: Sequence[str],
     ascendente: bool | Sequence[bool] = True,
 ) -> Tabla:
-    filas = _materializar_tabla(tabla)
     if isinstance(ascendente, bool):
         ordenes = [ascendente] * len(por)
     else:
         ordenes = list(ascendente)
     if len(ordenes) != len(por):
         raise ValueError("La lista de orden debe coincidir con las columnas")
+    if isinstance(tabla, TablaColumnar):
+        return _ordenar_columnar(tabla, por, ordenes)
+    filas = _materializar_tabla(tabla)
 
     resultado = _copiar_tabla(filas)
     for columna, asc in reversed(list(zip(por, ordenes))):
@@ -940,9 +1825,16 @@ def combinar_tablas(
     *,
     claves: Mapping[str, str] | Sequence[str] | tuple[str, str],
     tipo: str = "inner",
+    procesos: int | None = None,
 ) -> Tabla:
-    tabla_izquierda = _materializar_tabla(izquierda)
-    tabla_derecha = _materializar_tabla(derecha)
+    """Une ``izquierda`` y ``derecha`` por igualdad de clave.
+
+    Las filas siguen el orden de la tabla izquierda; en uniones ``outer`` las
+    filas derechas sin pareja se añaden al final en el orden de aparición de
+    su clave. Con ``procesos`` mayor que 1 las tablas grandes se reparten por
+    hash de la clave entre un grupo de procesos y los resultados se
+    intercalan conservando ese mismo orden.
+    """
 
     if isinstance(claves, Mapping):
         clave_izquierda = claves.get("izquierda")
@@ -952,45 +1844,25 @@ def combinar_tablas(
     else:
         raise ValueError("Debes proporcionar las claves de unión")
 
-    indice_derecho: dict[Any, list[Registro]] = defaultdict(list)
-    for fila in tabla_derecha:
-        indice_derecho[fila.get(clave_derecha)].append(fila)
-
-    resultado: Tabla = []
-    coincidencias_derecha: Counter[Any] = Counter()
-
-    for fila_izquierda in tabla_izquierda:
-        clave = fila_izquierda.get(clave_izquierda)
-        coincidencias = indice_derecho.get(clave)
-        if coincidencias:
-            for fila_derecha in coincidencias:
-                combinada = dict(fila_izquierda)
-                for columna, valor in fila_derecha.items():
-                    if columna in combinada and combinada[columna] != valor:
-                        combinada[f"{columna}_derecha"] = valor
-                    else:
-                        combinada[columna] = valor
-                resultado.append(combinada)
-            coincidencias_derecha[clave] += len(coincidencias)
-        elif tipo in {"left", "outer"}:
-            combinada = dict(fila_izquierda)
-            for columna in _columnas(tabla_derecha):
-                if columna not in combinada:
-                    combinada[columna] = None
-            resultado.append(combinada)
-
-    if tipo == "outer":
-        for clave, filas_derecha in indice_derecho.items():
-            if coincidencias_derecha[clave]:
-                continue
-            for fila_derecha in filas_derecha:
-                combinada = {columna: None for columna in _columnas(tabla_izquierda)}
-                combinada.update(fila_derecha)
-                resultado.append(combinada)
+    if isinstance(izquierda, TablaColumnar) or isinstance(derecha, TablaColumnar):
+        return _combinar_columnar(
+            _a_columnar(izquierda), _a_columnar(derecha), clave_izquierda, clave_derecha, tipo
+        )
+    tabla_izquierda = _materializar_tabla(izquierda)
+    tabla_derecha = _materializar_tabla(derecha)
+    # Las columnas de relleno se calculan una sola vez por tabla.
+    columnas_derecha = _columnas(tabla_derecha) if tipo in {"left", "outer"} else []
+    columnas_izquierda = _columnas(tabla_izquierda) if tipo == "outer" else []
+    argumentos = (clave_izquierda, clave_derecha, tipo, columnas_izquierda, columnas_derecha)
 
-    return resultado
+    efectivos = _procesos_efectivos(procesos, len(tabla_izquierda) + len(tabla_derecha))
+    if efectivos:
+        return _combinar_en_paralelo(tabla_izquierda, tabla_derecha, *argumentos, efectivos)
+    cuerpo, cola = _combinar_filas(tabla_izquierda, tabla_derecha, *argumentos)
+    return [fila for _, fila in chain(cuerpo, cola)]
 
 
+@_conserva_columnar
 def rellenar_nulos(
     tabla: Iterable[Registro],
     reemplazos: Mapping[str, Any] | Any,
@@ -1010,6 +1882,7 @@ def rellenar_nulos(
     return resultado
 
 
+@_conserva_columnar
 def desplegar_tabla(
     tabla: Iterable[Registro],
     *,
@@ -1033,6 +1906,7 @@ def desplegar_tabla(
     return resultado
 
 
+@_conserva_columnar
 def pivotar_tabla(
     tabla: Iterable[Registro],
     *,
@@ -1089,30 +1963,148 @@ def pivotar_tabla(
 # ---------------------------------------------------------------------------
 
 
-def describir(datos: Iterable[Registro]) -> dict[str, dict[str, float]]:
+def _registros(datos: Any) -> Iterator[Mapping[str, Any]]:
+    """Recorre las filas de ``datos`` sin copiarlas."""
+
+    if (
+        isinstance(datos, (Mapping, TablaColumnar))
+        or callable(getattr(datos, "to_dict", None))
+        or not isinstance(datos, Iterable)
+    ):
+        yield from _materializar_tabla(datos)
+        return
+    for fila in datos:
+        if not isinstance(fila, Mapping):
+            raise TypeError("Las filas deben ser diccionarios")
+        yield fila
+
+
+def _acumular_columnas(
+    datos: Any,
+    columnas: Sequence[str] | None,
+    exacto: bool,
+    estado: dict[str, EstadisticasColumna | None] | None = None,
+) -> dict[str, EstadisticasColumna | None]:
+    """Acumula en una sola pasada las estadísticas de cada columna numérica.
+
+    ``estado`` conserva las columnas en orden de primera aparición (con
+    ``None`` mientras no hayan mostrado valores numéricos) y permite seguir
+    acumulando lote a lote.
+    """
+
+    estado = {} if estado is None else estado
+    if isinstance(datos, TablaColumnar):
+        for columna in columnas if columnas is not None else datos.columnas:
+            valores = _numeros_columnar(datos, columna)
+            actual = estado.setdefault(columna, None)
+            if len(valores):
+                if actual is None:
+                    actual = estado[columna] = EstadisticasColumna(exacto=exacto)
+                actual.agregar_bloque(valores)
+        return estado
+    if columnas is not None:
+        for columna in columnas:
+            estado.setdefault(columna, None)
+    for fila in _registros(datos):
+        for columna, valor in fila.items():
+            actual = estado.get(columna, _MISSING)
+            if actual is _MISSING:
+                if columnas is not None:
+                    continue
+                actual = estado[columna] = None
+            if not _es_numero(valor):
+                continue
+            if actual is None:
+                actual = estado[columna] = EstadisticasColumna(exacto=exacto)
+            actual.agregar(float(valor))
+    return estado
+
+
+def _describir_estado(estado: Mapping[str, EstadisticasColumna | None]) -> dict[str, dict[str, float]]:
+    return {
+        columna: estadisticas.describir()
+        for columna, estadisticas in estado.items()
+        if estadisticas is not None
+    }
+
+
+def describir(datos: Iterable[Registro], *, exacto: bool = True) -> dict[str, dict[str, float]]:
+    """Conteo, media, desviación, extremos y cuartiles de cada columna numérica.
+
+    Los datos se recorren una sola vez. Con ``exacto=False`` los cuartiles se
+    estiman con un boceto de memoria acotada
+    (:class:`~pcobra.standard_library.estadistica.BocetoCuantiles`).
+    """
+
+    return _describir_estado(_acumular_columnas(datos, None, exacto))
+
+
+def describir_por_lotes(
+    lotes: Iterable[Iterable[Registro]], *, exacto: bool = True
+) -> dict[str, dict[str, float]]:
+    """Equivalente incremental de :func:`describir` para lotes en streaming."""
+
+    estado: dict[str, EstadisticasColumna | None] = {}
+    for lote in lotes:
+        _acumular_columnas(lote, None, exacto, estado)
+    return _describir_estado(estado)
+
+
+def _preparar_estadistica(
+    datos: Any, columnas: Sequence[str] | None
+) -> tuple[Tabla | TablaColumnar, list[str]]:
+    if isinstance(datos, TablaColumnar):
+        objetivo = list(columnas) if columnas is not None else _columnas_numericas_columnar(datos)
+        return datos, objetivo
     tabla = _materializar_tabla(datos)
-    resultado: dict[str, dict[str, float]] = {}
-    for columna in _columnas_numericas(tabla):
-        valores = [float(valor) for valor in _valores_columna(tabla, columna, solo_numeros=True)]
-        if not valores:
-            continue
-        media = sum(valores) / len(valores)
-        if len(valores) > 1:
-            varianza = sum((valor - media) ** 2 for valor in valores) / (len(valores) - 1)
-            desviacion = math.sqrt(varianza)
-        else:
-            desviacion = 0.0
-        resultado[columna] = {
-            "count": float(len(valores)),
-            "mean": media,
-            "std": desviacion,
-            "min": min(valores),
-            "25%": _percentil_lineal(valores, 25),
-            "50%": _percentil_lineal(valores, 50),
-            "75%": _percentil_lineal(valores, 75),
-            "max": max(valores),
-        }
-    return resultado
+    objetivo = list(columnas) if columnas is not None else _columnas_numericas(tabla)
+    return tabla, objetivo
+
+
+def _pares(tabla: Tabla | TablaColumnar, columna_a: str, columna_b: str) -> tuple[Any, Any]:
+    if isinstance(tabla, TablaColumnar):
+        return _pares_columnar(tabla, columna_a, columna_b)
+    return _pares_listas(tabla, columna_a, columna_b)
+
+
+def _comomentos(
+    tabla: Tabla | TablaColumnar, columnas: Sequence[str]
+) -> dict[tuple[int, int], CovarianzaIncremental]:
+    """Co-momentos de cada par de columnas ``(i, j)`` con ``i <= j``.
+
+    Cada par usa solo las filas en las que ambos valores son numéricos. Las
+    tablas de filas se recorren una única vez para todos los pares.
+    """
+
+    comomentos = {
+        (i, j): CovarianzaIncremental()
+        for i in range(len(columnas))
+        for j in range(i, len(columnas))
+    }
+    if isinstance(tabla, TablaColumnar):
+        for (i, j), acumulador in comomentos.items():
+            acumulador.agregar_bloque(*_pares_columnar(tabla, columnas[i], columnas[j]))
+        return comomentos
+    por_fila = [
+        [comomentos[(i, j)] for j in range(i, len(columnas))] for i in range(len(columnas))
+    ]
+    for fila in tabla:
+        numeros = []
+        for indice, columna in enumerate(columnas):
+            valor = fila.get(columna)
+            if _es_numero(valor):
+                numeros.append((indice, float(valor)))
+        for posicion, (i, x) in enumerate(numeros):
+            acumuladores = por_fila[i]
+            for j, y in numeros[posicion:]:
+                acumuladores[j - i].agregar(x, y)
+    return comomentos
+
+
+def _comomento(
+    comomentos: Mapping[tuple[int, int], CovarianzaIncremental], i: int, j: int
+) -> CovarianzaIncremental:
+    return comomentos[(i, j) if i <= j else (j, i)]
 
 
 def correlacion_pearson(
@@ -1120,31 +2112,30 @@ def correlacion_pearson(
     *,
     columnas: Sequence[str] | None = None,
 ) -> dict[str, dict[str, float]]:
-    tabla = _materializar_tabla(datos)
-    columnas_objetivo = list(columnas) if columnas is not None else _columnas_numericas(tabla)
+    tabla, columnas_objetivo = _preparar_estadistica(datos, columnas)
     if not columnas_objetivo:
         raise ValueError("No hay columnas numéricas para calcular la correlación")
 
-    disponibles = {col for fila in tabla for col in fila.keys()}
+    if isinstance(tabla, TablaColumnar):
+        disponibles = set(tabla.columnas)
+    else:
+        disponibles = {col for fila in tabla for col in fila.keys()}
     for columna in columnas_objetivo:
         if columna not in disponibles:
             raise KeyError(columna)
 
+    comomentos = _comomentos(tabla, columnas_objetivo)
     resultado: dict[str, dict[str, float]] = {}
     algun_valor = False
-    for columna_a in columnas_objetivo:
+    for i, columna_a in enumerate(columnas_objetivo):
         resultado[columna_a] = {}
-        for columna_b in columnas_objetivo:
-            pares = _pares_columnas(tabla, columna_a, columna_b)
-            if not pares:
+        for j, columna_b in enumerate(columnas_objetivo):
+            acumulador = _comomento(comomentos, i, j)
+            if not acumulador.conteo:
                 valor = 0.0
             else:
-                valores_a = [par[0] for par in pares]
-                valores_b = [par[1] for par in pares]
-                valor = _calcular_pearson(valores_a, valores_b)
+                valor = 1.0 if columna_a == columna_b else acumulador.correlacion
                 algun_valor = True
-            if columna_a == columna_b and pares:
-                valor = 1.0
             resultado[columna_a][columna_b] = valor
     if not algun_valor:
         raise ValueError("No hay suficientes datos numéricos para correlación")
@@ -1156,28 +2147,34 @@ def correlacion_spearman(
     *,
     columnas: Sequence[str] | None = None,
 ) -> dict[str, dict[str, float]]:
-    tabla = _materializar_tabla(datos)
-    columnas_objetivo = list(columnas) if columnas is not None else _columnas_numericas(tabla)
+    tabla, columnas_objetivo = _preparar_estadistica(datos, columnas)
     if not columnas_objetivo:
         raise ValueError("No hay columnas numéricas para calcular la correlación")
 
+    # La correlación es simétrica: cada par se calcula una sola vez.
+    por_par: dict[tuple[str, str], float | None] = {}
     resultado: dict[str, dict[str, float]] = {}
     algun_valor = False
     for columna_a in columnas_objetivo:
         resultado[columna_a] = {}
         for columna_b in columnas_objetivo:
-            pares = _pares_columnas(tabla, columna_a, columna_b)
-            if not pares:
+            clave = (columna_b, columna_a)
+            if clave in por_par:
+                valor = por_par[clave]
+            else:
+                valores_a, valores_b = _pares(tabla, columna_a, columna_b)
+                valor = None
+                if len(valores_a):
+                    rangos_a = _rango_promedio(valores_a)
+                    rangos_b = _rango_promedio(valores_b)
+                    valor = _calcular_pearson(rangos_a, rangos_b)
+                por_par[(columna_a, columna_b)] = valor
+            if valor is None:
                 valor = 0.0
             else:
-                valores_a = [par[0] for par in pares]
-                valores_b = [par[1] for par in pares]
-                rangos_a = _rango_promedio(valores_a)
-                rangos_b = _rango_promedio(valores_b)
-                valor = _calcular_pearson(rangos_a, rangos_b)
                 algun_valor = True
-            if columna_a == columna_b and pares:
-                valor = 1.0
+                if columna_a == columna_b:
+                    valor = 1.0
             resultado[columna_a][columna_b] = valor
     if not algun_valor:
         raise ValueError("No hay suficientes datos numéricos para correlación")
@@ -1189,30 +2186,32 @@ def matriz_covarianza(
     *,
     columnas: Sequence[str] | None = None,
 ) -> dict[str, dict[str, float]]:
-    tabla = _materializar_tabla(datos)
-    columnas_objetivo = list(columnas) if columnas is not None else _columnas_numericas(tabla)
+    tabla, columnas_objetivo = _preparar_estadistica(datos, columnas)
     if not columnas_objetivo:
         raise ValueError("No hay columnas numéricas para calcular la covarianza")
 
+    if isinstance(tabla, TablaColumnar):
+        obtener_valores = functools.partial(_numeros_columnar, tabla)
+    else:
+        obtener_valores = functools.partial(_valores_numericos, tabla)
+    comomentos = _comomentos(tabla, columnas_objetivo)
     resultado: dict[str, dict[str, float]] = {}
     algun_valor = False
-    for columna_a in columnas_objetivo:
+    for i, columna_a in enumerate(columnas_objetivo):
         resultado[columna_a] = {}
-        for columna_b in columnas_objetivo:
-            pares = _pares_columnas(tabla, columna_a, columna_b)
-            if not pares:
-                valores_a = _valores_numericos(tabla, columna_a)
-                valores_b = _valores_numericos(tabla, columna_b)
-                if not valores_a or not valores_b:
+        for j, columna_b in enumerate(columnas_objetivo):
+            acumulador = _comomento(comomentos, i, j)
+            if acumulador.conteo:
+                valor = acumulador.covarianza
+                algun_valor = True
+            else:
+                valores_a = obtener_valores(columna_a)
+                valores_b = obtener_valores(columna_b)
+                if not len(valores_a) or not len(valores_b):
                     valor = 0.0
                 else:
-                    valor = _calcular_covarianza(valores_a, valores_b)
+                    valor = _calcular_covarianza(list(valores_a), list(valores_b))
                     algun_valor = True
-            else:
-                valores_a = [par[0] for par in pares]
-                valores_b = [par[1] for par in pares]
-                valor = _calcular_covarianza(valores_a, valores_b)
-                algun_valor = True
             resultado[columna_a][columna_b] = valor
     if not algun_valor:
         raise ValueError("No hay suficientes datos numéricos para covarianza")
@@ -1224,63 +2223,158 @@ def calcular_percentiles(
     *,
     columnas: Sequence[str] | None = None,
     percentiles: Sequence[int] = (25, 50, 75),
+    exacto: bool = True,
 ) -> dict[str, dict[str, float]]:
+    """Percentiles por columna numérica con interpolación lineal.
+
+    Todos los percentiles de una columna salen de una única ordenación; con
+    ``exacto=False`` se estiman con un boceto de memoria acotada.
+    """
+
     if not percentiles:
         raise ValueError("Debes proporcionar al menos un percentil")
     if any(percentil < 0 or percentil > 100 for percentil in percentiles):
         raise ValueError("Los percentiles deben estar entre 0 y 100")
 
-    tabla = _materializar_tabla(datos)
-    columnas_objetivo = list(columnas) if columnas is not None else _columnas_numericas(tabla)
+    estado = _acumular_columnas(datos, columnas, exacto)
     resultado: dict[str, dict[str, float]] = {}
-    for columna in columnas_objetivo:
-        valores = _valores_numericos(tabla, columna)
-        if not valores:
+    for columna, estadisticas in estado.items():
+        if estadisticas is None:
             continue
-        resultado[columna] = {}
-        for percentil in percentiles:
-            resultado[columna][f"p{percentil}"] = _percentil_lineal(valores, percentil)
+        valores = estadisticas.percentiles(percentiles)
+        resultado[columna] = {
+            f"p{percentil}": valor for percentil, valor in zip(percentiles, valores)
+        }
     return resultado
 
 
-def resumen_rapido(datos: Iterable[Registro]) -> list[dict[str, Any]]:
-    tabla = _materializar_tabla(datos)
-    resumen: list[dict[str, Any]] = []
-    for columna in _columnas(tabla):
-        valores = [fila.get(columna) for fila in tabla]
-        no_nulos = [valor for valor in valores if valor is not None]
+class _ColumnaRapida:
+    """Estado de :func:`resumen_rapido` para una columna."""
+
+    __slots__ = (
+        "no_nulos",
+        "ejemplo",
+        "numeros",
+        "solo_numeros",
+        "solo_fechas",
+        "minimo",
+        "maximo",
+        "_pendientes",
+    )
+
+    def __init__(self) -> None:
+        self.no_nulos = 0
+        self.ejemplo: Any = None
+        self.numeros = ResumenNumerico()
+        self.solo_numeros = True
+        self.solo_fechas = True
+        self.minimo: Any = _MISSING
+        self.maximo: Any = _MISSING
+        self._pendientes: list[Any] = []
+
+    def agregar(self, valor: Any) -> None:
+        if valor is None:
+            return
+        if not self.no_nulos:
+            self.ejemplo = valor
+        self.no_nulos += 1
+        if _es_numero(valor):
+            self.solo_fechas = False
+            if self.solo_numeros:
+                # Los números se acumulan por bloques; el mínimo bruto se
+                # actualiza al volcarlos.
+                self._pendientes.append(valor)
+                if len(self._pendientes) >= TAMANO_BLOQUE:
+                    self._volcar()
+                return
+        else:
+            if self.solo_numeros:
+                # Volcar antes conserva el orden de comparación del mínimo.
+                self._volcar()
+                self.solo_numeros = False
+            if self.solo_fechas and not hasattr(valor, "isoformat"):
+                self.solo_fechas = False
+        if self.minimo is _MISSING or valor < self.minimo:
+            self.minimo = valor
+        if self.solo_fechas and (self.maximo is _MISSING or valor > self.maximo):
+            self.maximo = valor
+
+    def _volcar(self) -> None:
+        if not self._pendientes:
+            return
+        bloque = self._pendientes
+        self._pendientes = []
+        menor = min(bloque)
+        if self.minimo is _MISSING or menor < self.minimo:
+            self.minimo = menor
+        if NUMPY_DISPONIBLE:
+            self.numeros.agregar_bloque(np.asarray(bloque, dtype=np.float64))
+        else:
+            self.numeros.agregar_bloque([float(valor) for valor in bloque])
+
+    def agregar_arreglo(self, valores: Any) -> None:
+        if not len(valores):
+            return
+        if not self.no_nulos:
+            self.ejemplo = valores[0].item()
+        self.no_nulos += len(valores)
+        self.numeros.agregar_bloque(valores.astype(np.float64, copy=False))
+
+    def registro(self, columna: str, total: int) -> dict[str, Any]:
+        self._volcar()
+        ejemplo = self.ejemplo
         registro: dict[str, Any] = {
             "columna": columna,
-            "conteo": len(valores),
-            "nulos": len(valores) - len(no_nulos),
+            "conteo": total,
+            "nulos": total - self.no_nulos,
+            "ejemplo": ejemplo.isoformat() if hasattr(ejemplo, "isoformat") else ejemplo,
         }
-        if no_nulos:
-            ejemplo = no_nulos[0]
-            if hasattr(ejemplo, "isoformat"):
-                registro["ejemplo"] = ejemplo.isoformat()
-            else:
-                registro["ejemplo"] = ejemplo
+        if not self.no_nulos:
+            return registro
+        if self.solo_numeros:
+            registro["media"] = self.numeros.media
+            registro["min"] = self.numeros.minimo
+            registro["max"] = self.numeros.maximo
+        elif self.solo_fechas:
+            registro["min"] = self.minimo.isoformat()
+            registro["max"] = self.maximo.isoformat()
         else:
-            registro["ejemplo"] = None
-
-        if no_nulos and all(_es_numero(valor) for valor in no_nulos):
-            numeros = [float(valor) for valor in no_nulos]
-            registro["media"] = sum(numeros) / len(numeros)
-            registro["min"] = min(numeros)
-            registro["max"] = max(numeros)
-        elif no_nulos and all(hasattr(valor, "isoformat") for valor in no_nulos):
-            ordenadas = sorted(no_nulos)
-            registro["min"] = ordenadas[0].isoformat()
-            registro["max"] = ordenadas[-1].isoformat()
-        elif no_nulos:
-            registro["min"] = str(min(no_nulos))
-        resumen.append(registro)
-    return resumen
+            registro["min"] = str(self.minimo)
+        return registro
+
+
+def resumen_rapido(datos: Iterable[Registro]) -> list[dict[str, Any]]:
+    """Conteo, nulos, ejemplo y rango de cada columna en una sola pasada."""
+
+    columnas: dict[str, _ColumnaRapida] = {}
+    total = 0
+    if isinstance(datos, TablaColumnar):
+        total = len(datos)
+        for columna in datos.columnas:
+            estado = columnas[columna] = _ColumnaRapida()
+            almacenamiento = datos.almacenamiento(columna)
+            arreglo = como_numpy(almacenamiento)
+            if arreglo is not None:
+                estado.agregar_arreglo(arreglo)
+                continue
+            for valor in a_lista(almacenamiento):
+                estado.agregar(valor)
+    else:
+        for fila in _registros(datos):
+            total += 1
+            for columna, valor in fila.items():
+                estado = columnas.get(columna)
+                if estado is None:
+                    estado = columnas[columna] = _ColumnaRapida()
+                estado.agregar(valor)
+    return [estado.registro(columna, total) for columna, estado in columnas.items()]
 
 
 def invertir_tabla(tabla: Iterable[Registro]) -> Tabla:
     """Devuelve una copia de ``tabla`` en orden inverso."""
 
+    if isinstance(tabla, TablaColumnar):
+        return tabla[::-1]
     materializada = _materializar_tabla(tabla)
     return list(reversed(materializada))
 
@@ -1290,5 +2384,7 @@ def tomar(tabla: Iterable[Registro], cantidad: int) -> Tabla:
 
     if cantidad < 0:
         raise ValueError("cantidad debe ser >= 0")
+    if isinstance(tabla, TablaColumnar):
+        return tabla[:cantidad]
     materializada = _materializar_tabla(tabla)
     return materializada[:cantidad]
@@ -0,0 +1,374 @@
+"""Acumuladores estadísticos de una sola pasada para :mod:`pcobra.standard_library.datos`.
+
+Cada acumulador recibe valores uno a uno (``agregar``) o por bloques
+(``agregar_bloque``, con ruta NumPy cuando el bloque es un arreglo) y puede
+combinarse con otro construido sobre una partición distinta mediante
+``fusionar``. El resultado equivale al de recorrer la unión de los datos, salvo
+redondeo y, en :class:`BocetoCuantiles` aproximado, el error del boceto.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from typing import Any, Iterable, Sequence
+
+from pcobra._stubs.compat import import_optional_module
+from pcobra.standard_library.columnar import NUMPY_DISPONIBLE
+
+np = import_optional_module("numpy", safe_stub=True)
+
+__all__ = [
+    "ResumenNumerico",
+    "BocetoCuantiles",
+    "CovarianzaIncremental",
+    "EstadisticasColumna",
+]
+
+# Valores que :class:`EstadisticasColumna` agrupa antes de procesarlos como un
+# bloque (vectorizado cuando NumPy está disponible).
+TAMANO_BLOQUE = 4096
+
+
+def _es_arreglo(valores: Any) -> bool:
+    return NUMPY_DISPONIBLE and isinstance(valores, np.ndarray)
+
+
+def percentiles_ordenados(ordenados: Sequence[float], percentiles: Sequence[float]) -> list[float]:
+    """Percentiles con interpolación lineal sobre valores ya ordenados."""
+
+    ultimo = len(ordenados) - 1
+    resultado = []
+    for percentil in percentiles:
+        posicion = ultimo * (percentil / 100.0)
+        inferior = math.floor(posicion)
+        superior = min(inferior + 1, ultimo)
+        fraccion = posicion - inferior
+        valor = ordenados[inferior]
+        resultado.append(float(valor + (ordenados[superior] - valor) * fraccion))
+    return resultado
+
+
+class ResumenNumerico:
+    """Conteo, media y varianza (Welford) junto con mínimo y máximo."""
+
+    __slots__ = ("conteo", "media", "_m2", "minimo", "maximo")
+
+    def __init__(self) -> None:
+        self.conteo = 0
+        self.media = 0.0
+        self._m2 = 0.0
+        self.minimo: float | None = None
+        self.maximo: float | None = None
+
+    def agregar(self, valor: float) -> None:
+        self.conteo += 1
+        delta = valor - self.media
+        self.media += delta / self.conteo
+        self._m2 += delta * (valor - self.media)
+        if self.minimo is None or valor < self.minimo:
+            self.minimo = valor
+        if self.maximo is None or valor > self.maximo:
+            self.maximo = valor
+
+    def agregar_bloque(self, valores: Iterable[float]) -> None:
+        if not _es_arreglo(valores):
+            for valor in valores:
+                self.agregar(float(valor))
+            return
+        if not valores.size:
+            return
+        bloque = ResumenNumerico()
+        bloque.conteo = int(valores.size)
+        bloque.media = float(valores.mean())
+        bloque._m2 = float(np.square(valores - bloque.media).sum())
+        bloque.minimo = float(valores.min())
+        bloque.maximo = float(valores.max())
+        self.fusionar(bloque)
+
+    def fusionar(self, otro: "ResumenNumerico") -> "ResumenNumerico":
+        """Incorpora ``otro`` (fórmula de Chan et al.) y devuelve ``self``."""
+
+        if not otro.conteo:
+            return self
+        if not self.conteo:
+            self.conteo, self.media, self._m2 = otro.conteo, otro.media, otro._m2
+            self.minimo, self.maximo = otro.minimo, otro.maximo
+            return self
+        total = self.conteo + otro.conteo
+        delta = otro.media - self.media
+        self._m2 += otro._m2 + delta * delta * self.conteo * otro.conteo / total
+        self.media += delta * otro.conteo / total
+        self.conteo = total
+        self.minimo = min(self.minimo, otro.minimo)  # type: ignore[type-var]
+        self.maximo = max(self.maximo, otro.maximo)  # type: ignore[type-var]
+        return self
+
+    @property
+    def varianza(self) -> float:
+        """Varianza muestral (``ddof=1``); 0 con menos de dos valores."""
+
+        return self._m2 / (self.conteo - 1) if self.conteo > 1 else 0.0
+
+    @property
+    def desviacion(self) -> float:
+        return math.sqrt(self.varianza)
+
+
+class BocetoCuantiles:
+    """Boceto de cuantiles fusionable.
+
+    En modo exacto conserva todos los valores y los percentiles coinciden con
+    ``numpy.percentile(..., method="linear")``. En modo aproximado cada nivel
+    guarda como mucho ``capacidad`` valores; al llenarse se ordena y se
+    promueve uno de cada dos al nivel siguiente con el doble de peso
+    (compactación tipo KLL). La memoria crece como ``capacidad * log(n)`` y el
+    error de rango es del orden de ``log(n) / capacidad``.
+    """
+
+    __slots__ = ("exacto", "capacidad", "conteo", "_niveles", "_turnos", "_bloques")
+
+    def __init__(self, *, exacto: bool = False, capacidad: int = 256) -> None:
+        if capacidad < 2:
+            raise ValueError("capacidad debe ser >= 2")
+        self.exacto = exacto
+        self.capacidad = capacidad
+        self.conteo = 0
+        self._niveles: list[list[float]] = [[]]
+        self._turnos: list[int] = [0]
+        self._bloques: list[Any] = []
+
+    def agregar(self, valor: float) -> None:
+        self.conteo += 1
+        self._niveles[0].append(valor)
+        if not self.exacto and len(self._niveles[0]) >= self.capacidad:
+            self._compactar()
+
+    def agregar_bloque(self, valores: Iterable[float]) -> None:
+        if _es_arreglo(valores):
+            if self.exacto:
+                self.conteo += int(valores.size)
+                self._bloques.append(valores)
+                return
+            valores = valores.tolist()
+        antes = len(self._niveles[0])
+        self._niveles[0].extend(float(valor) for valor in valores)
+        self.conteo += len(self._niveles[0]) - antes
+        if not self.exacto:
+            self._compactar()
+
+    def fusionar(self, otro: "BocetoCuantiles") -> "BocetoCuantiles":
+        if otro.exacto != self.exacto:
+            raise ValueError("No se pueden fusionar bocetos exactos y aproximados")
+        while len(self._niveles) < len(otro._niveles):
+            self._niveles.append([])
+            self._turnos.append(0)
+        for nivel, valores in enumerate(otro._niveles):
+            self._niveles[nivel].extend(valores)
+        self._bloques.extend(otro._bloques)
+        self.conteo += otro.conteo
+        if not self.exacto:
+            self._compactar()
+        return self
+
+    def _compactar(self) -> None:
+        nivel = 0
+        while nivel < len(self._niveles):
+            valores = self._niveles[nivel]
+            if len(valores) < self.capacidad:
+                nivel += 1
+                continue
+            valores.sort()
+            resto = [valores.pop()] if len(valores) % 2 else []
+            # Alternar el desplazamiento evita sesgar el boceto hacia arriba o
+            # hacia abajo de forma sistemática.
+            promovidos = valores[self._turnos[nivel] :: 2]
+            self._turnos[nivel] ^= 1
+            if nivel + 1 == len(self._niveles):
+                self._niveles.append([])
+                self._turnos.append(0)
+            self._niveles[nivel + 1].extend(promovidos)
+            self._niveles[nivel] = resto
+            nivel += 1
+
+    def percentiles(self, percentiles: Sequence[float]) -> list[float]:
+        """Devuelve los ``percentiles`` (0-100) en el mismo orden."""
+
+        if not self.conteo:
+            raise ValueError("El boceto no contiene valores")
+        if self.exacto:
+            return self._percentiles_exactos(percentiles)
+        pares = sorted(
+            (valor, 1 << nivel)
+            for nivel, valores in enumerate(self._niveles)
+            for valor in valores
+        )
+        # Cada valor representa ``peso`` rangos consecutivos; se le asigna el
+        # rango central para interpolar como en el caso exacto.
+        posiciones = []
+        acumulado = 0
+        for _valor, peso in pares:
+            posiciones.append(acumulado + (peso - 1) / 2)
+            acumulado += peso
+        valores = [valor for valor, _peso in pares]
+        resultado = []
+        for percentil in percentiles:
+            rango = (acumulado - 1) * (percentil / 100.0)
+            derecha = bisect_right(posiciones, rango)
+            if derecha == 0:
+                resultado.append(float(valores[0]))
+            elif derecha == len(valores):
+                resultado.append(float(valores[-1]))
+            else:
+                inicio, fin = posiciones[derecha - 1], posiciones[derecha]
+                fraccion = (rango - inicio) / (fin - inicio)
+                anterior = valores[derecha - 1]
+                resultado.append(float(anterior + (valores[derecha] - anterior) * fraccion))
+        return resultado
+
+    def _percentiles_exactos(self, percentiles: Sequence[float]) -> list[float]:
+        if self._bloques:
+            todos = np.concatenate([*self._bloques, np.asarray(self._niveles[0], dtype=np.float64)])
+            return [float(valor) for valor in np.percentile(todos, list(percentiles), method="linear")]
+        return percentiles_ordenados(sorted(self._niveles[0]), percentiles)
+
+    def percentil(self, percentil: float) -> float:
+        return self.percentiles([percentil])[0]
+
+
+class CovarianzaIncremental:
+    """Co-momento de dos variables: covarianza y correlación de Pearson."""
+
+    __slots__ = ("conteo", "media_x", "media_y", "_cxy", "_m2x", "_m2y")
+
+    def __init__(self) -> None:
+        self.conteo = 0
+        self.media_x = self.media_y = 0.0
+        self._cxy = self._m2x = self._m2y = 0.0
+
+    def agregar(self, x: float, y: float) -> None:
+        self.conteo += 1
+        delta_x = x - self.media_x
+        delta_y = y - self.media_y
+        self.media_x += delta_x / self.conteo
+        self.media_y += delta_y / self.conteo
+        self._cxy += delta_x * (y - self.media_y)
+        self._m2x += delta_x * (x - self.media_x)
+        self._m2y += delta_y * (y - self.media_y)
+
+    def agregar_bloque(self, xs: Iterable[float], ys: Iterable[float]) -> None:
+        if not (_es_arreglo(xs) and _es_arreglo(ys)):
+            for x, y in zip(xs, ys):
+                self.agregar(float(x), float(y))
+            return
+        if not xs.size:
+            return
+        bloque = CovarianzaIncremental()
+        bloque.conteo = int(xs.size)
+        bloque.media_x = float(xs.mean())
+        bloque.media_y = float(ys.mean())
+        centrado_x = xs - bloque.media_x
+        centrado_y = ys - bloque.media_y
+        bloque._cxy = float(np.dot(centrado_x, centrado_y))
+        bloque._m2x = float(np.dot(centrado_x, centrado_x))
+        bloque._m2y = float(np.dot(centrado_y, centrado_y))
+        self.fusionar(bloque)
+
+    def fusionar(self, otro: "CovarianzaIncremental") -> "CovarianzaIncremental":
+        if not otro.conteo:
+            return self
+        if not self.conteo:
+            self.conteo, self.media_x, self.media_y = otro.conteo, otro.media_x, otro.media_y
+            self._cxy, self._m2x, self._m2y = otro._cxy, otro._m2x, otro._m2y
+            return self
+        total = self.conteo + otro.conteo
+        factor = self.conteo * otro.conteo / total
+        delta_x = otro.media_x - self.media_x
+        delta_y = otro.media_y - self.media_y
+        self._cxy += otro._cxy + delta_x * delta_y * factor
+        self._m2x += otro._m2x + delta_x * delta_x * factor
+        self._m2y += otro._m2y + delta_y * delta_y * factor
+        self.media_x += delta_x * otro.conteo / total
+        self.media_y += delta_y * otro.conteo / total
+        self.conteo = total
+        return self
+
+    @property
+    def covarianza(self) -> float:
+        return self._cxy / (self.conteo - 1) if self.conteo > 1 else 0.0
+
+    @property
+    def correlacion(self) -> float:
+        if self._m2x <= 0 or self._m2y <= 0:
+            return 0.0
+        return self._cxy / math.sqrt(self._m2x * self._m2y)
+
+
+class EstadisticasColumna:
+    """Resumen numérico y boceto de cuantiles de una columna.
+
+    Los valores sueltos se agrupan en bloques de :data:`TAMANO_BLOQUE` antes
+    de entregarse a los acumuladores, de modo que el coste por valor es el de
+    añadirlo a una lista.
+    """
+
+    __slots__ = ("resumen", "cuantiles", "_pendientes")
+
+    def __init__(self, *, exacto: bool = True, capacidad: int = 256) -> None:
+        self.resumen = ResumenNumerico()
+        self.cuantiles = BocetoCuantiles(exacto=exacto, capacidad=capacidad)
+        self._pendientes: list[float] = []
+
+    def agregar(self, valor: float) -> None:
+        self._pendientes.append(valor)
+        if len(self._pendientes) >= TAMANO_BLOQUE:
+            self._volcar()
+
+    def agregar_bloque(self, valores: Iterable[float]) -> None:
+        self._volcar()
+        if not _es_arreglo(valores):
+            valores = [float(valor) for valor in valores]
+        self.resumen.agregar_bloque(valores)
+        self.cuantiles.agregar_bloque(valores)
+
+    def _volcar(self) -> None:
+        if not self._pendientes:
+            return
+        bloque: Any = self._pendientes
+        self._pendientes = []
+        if NUMPY_DISPONIBLE:
+            bloque = np.asarray(bloque, dtype=np.float64)
+        self.resumen.agregar_bloque(bloque)
+        self.cuantiles.agregar_bloque(bloque)
+
+    def fusionar(self, otro: "EstadisticasColumna") -> "EstadisticasColumna":
+        self._volcar()
+        otro._volcar()
+        self.resumen.fusionar(otro.resumen)
+        self.cuantiles.fusionar(otro.cuantiles)
+        return self
+
+    @property
+    def conteo(self) -> int:
+        return self.resumen.conteo + len(self._pendientes)
+
+    def percentiles(self, percentiles: Sequence[float]) -> list[float]:
+        self._volcar()
+        return self.cuantiles.percentiles(percentiles)
+
+    def describir(self) -> dict[str, float]:
+        """Métricas de :func:`pcobra.standard_library.datos.describir`."""
+
+        self._volcar()
+        resumen = self.resumen
+        cuartil_1, mediana, cuartil_3 = self.cuantiles.percentiles((25, 50, 75))
+        return {
+            "count": float(resumen.conteo),
+            "mean": resumen.media,
+            "std": resumen.desviacion,
+            "min": float(resumen.minimo),  # type: ignore[arg-type]
+            "25%": cuartil_1,
+            "50%": mediana,
+            "75%": cuartil_3,
+            "max": float(resumen.maximo),  # type: ignore[arg-type]
+        }
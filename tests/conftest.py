@@ -307,6 +307,15 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(getattr(pytest.mark, nombre_marca))
 
 
+@pytest.fixture(autouse=True)
+def _aislar_indice_imports(tmp_path_factory, monkeypatch):
+    """Impide que los índices de imports se escriban en ``~/.cobra``."""
+
+    if not os.environ.get("COBRA_IMPORT_INDEX_DIR"):
+        directorio = tmp_path_factory.getbasetemp() / "import-index"
+        monkeypatch.setenv("COBRA_IMPORT_INDEX_DIR", str(directorio))
+
+
 @pytest.fixture
 def ruta_ejemplos() -> Path:
     """Devuelve el directorio donde se guardan los programas ``.cobra`` de prueba."""
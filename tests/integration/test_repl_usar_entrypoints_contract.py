@@ -1125,6 +1125,8 @@ def test_repl_contract_pipeline_completo_por_modulo_canonico(monkeypatch, tmp_pa
             interp.contextos[-1].values[symbol]("co", "cobra")
         elif modulo == "regex" and symbol == "reemplazar":
             interp.contextos[-1].values[symbol]("co", "Co", "cobra")
+        elif modulo == "regex" and symbol == "compilar":
+            interp.contextos[-1].values[symbol]("co")
         elif modulo == "registro" and symbol in {"debug", "info", "aviso", "error"}:
             interp.contextos[-1].values[symbol]("mensaje")
         elif modulo == "ruta" and symbol == "unir":
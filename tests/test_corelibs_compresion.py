@@ -1,9 +1,23 @@
+import io
+import shutil
+import subprocess
+import tarfile
 from pathlib import Path
-from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 import pytest
 
-from pcobra.corelibs.compresion import crear_zip, extraer_zip, listar_zip
+from pcobra.corelibs.compresion import (
+    comprimir_bytes,
+    crear_tar,
+    crear_zip,
+    descomprimir_bytes,
+    descomprimir_flujo,
+    extraer_tar,
+    extraer_zip,
+    formatos_disponibles,
+    listar_zip,
+)
 
 
 def test_crear_listar_y_extraer_zip(tmp_path: Path) -> None:
@@ -22,7 +36,9 @@ def test_crear_listar_y_extraer_zip(tmp_path: Path) -> None:
     destino = tmp_path / "extraido"
     rutas = extraer_zip(destino_zip, destino)
 
-    assert sorted(Path(ruta).relative_to(destino).as_posix() for ruta in rutas) == nombres
+    assert (
+        sorted(Path(ruta).relative_to(destino).as_posix() for ruta in rutas) == nombres
+    )
     assert (destino / "docs" / "uno.txt").read_text(encoding="utf-8") == "uno"
     assert (destino / "docs" / "dos.txt").read_text(encoding="utf-8") == "dos"
 
@@ -60,3 +76,154 @@ def test_extraer_zip_rechaza_path_traversal(tmp_path: Path, nombre: str) -> None
         extraer_zip(origen, tmp_path / "destino")
 
     assert not (tmp_path / "escape.txt").exists()
+
+
+def _arbol_de_prueba(base: Path) -> list[str]:
+    nombres = []
+    for indice in range(12):
+        ruta = base / "datos" / f"parte_{indice:02d}.txt"
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        ruta.write_bytes((f"linea {indice}\n" * (500 + indice)).encode())
+        nombres.append(f"datos/parte_{indice:02d}.txt")
+    return nombres
+
+
+@pytest.mark.parametrize("hilos", [1, 4])
+def test_crear_zip_en_paralelo_conserva_orden_y_contenido(
+    tmp_path: Path, hilos: int
+) -> None:
+    esperados = _arbol_de_prueba(tmp_path / "entrada")
+    destino_zip = tmp_path / "datos.zip"
+
+    nombres = crear_zip(
+        destino_zip,
+        tmp_path / "entrada" / "datos",
+        base=tmp_path / "entrada",
+        hilos=hilos,
+    )
+
+    assert nombres == esperados
+    with ZipFile(destino_zip) as archivo_zip:
+        assert archivo_zip.testzip() is None
+        assert archivo_zip.namelist() == esperados
+        assert {info.compress_type for info in archivo_zip.infolist()} == {ZIP_DEFLATED}
+
+    rutas = extraer_zip(destino_zip, tmp_path / "salida", hilos=hilos)
+    assert [
+        Path(r).relative_to(tmp_path / "salida").as_posix() for r in rutas
+    ] == esperados
+    for nombre in esperados:
+        assert (tmp_path / "salida" / nombre).read_bytes() == (
+            tmp_path / "entrada" / nombre
+        ).read_bytes()
+
+
+@pytest.mark.parametrize("nivel", [0, 6])
+def test_crear_zip_en_paralelo_es_identico_y_valido_para_unzip(
+    tmp_path: Path, nivel: int
+) -> None:
+    _arbol_de_prueba(tmp_path / "entrada")
+    secuencial = tmp_path / "secuencial.zip"
+    paralelo = tmp_path / "paralelo.zip"
+
+    crear_zip(secuencial, tmp_path / "entrada", nivel=nivel, hilos=1)
+    crear_zip(paralelo, tmp_path / "entrada", nivel=nivel, hilos=4)
+
+    assert paralelo.read_bytes() == secuencial.read_bytes()
+    unzip = shutil.which("unzip")
+    if unzip is None:
+        pytest.skip("unzip no está instalado")
+    resultado = subprocess.run(
+        [unzip, "-t", str(paralelo)], capture_output=True, text=True, check=False
+    )
+    assert resultado.returncode == 0, resultado.stdout + resultado.stderr
+
+
+def test_crear_zip_nivel_cero_almacena_sin_comprimir(tmp_path: Path) -> None:
+    _arbol_de_prueba(tmp_path / "entrada")
+    destino_zip = tmp_path / "datos.zip"
+
+    crear_zip(destino_zip, tmp_path / "entrada", nivel=0, hilos=2)
+
+    with ZipFile(destino_zip) as archivo_zip:
+        assert {info.compress_type for info in archivo_zip.infolist()} == {ZIP_STORED}
+        assert archivo_zip.testzip() is None
+    with pytest.raises(ValueError):
+        crear_zip(destino_zip, tmp_path / "entrada", nivel=10)
+
+
+def test_extraer_zip_valida_todo_antes_de_escribir(tmp_path: Path) -> None:
+    zip_malicioso = tmp_path / "malicioso.zip"
+    with ZipFile(zip_malicioso, "w") as archivo_zip:
+        archivo_zip.writestr("bueno.txt", "ok")
+        archivo_zip.writestr("../fuera.txt", "no")
+
+    with pytest.raises(ValueError):
+        extraer_zip(zip_malicioso, tmp_path / "destino", hilos=4)
+
+    assert not (tmp_path / "destino" / "bueno.txt").exists()
+    assert not (tmp_path / "fuera.txt").exists()
+
+
+@pytest.mark.parametrize("formato", formatos_disponibles())
+def test_comprimir_bytes_y_flujos_ida_y_vuelta(formato: str) -> None:
+    datos = b"cobra " * 10_000
+
+    comprimido = comprimir_bytes(datos, formato)
+
+    assert len(comprimido) < len(datos)
+    assert descomprimir_bytes(comprimido, formato) == datos
+    destino = io.BytesIO()
+    assert descomprimir_flujo(io.BytesIO(comprimido), destino, formato) == len(datos)
+    assert destino.getvalue() == datos
+
+
+def test_formato_desconocido_o_no_instalado() -> None:
+    assert {"gzip", "bz2", "xz"} <= set(formatos_disponibles())
+    with pytest.raises(ValueError):
+        comprimir_bytes(b"x", "rar")
+    for formato in {"zstd", "lz4"} - set(formatos_disponibles()):
+        with pytest.raises(ModuleNotFoundError, match="pip install"):
+            comprimir_bytes(b"x", formato)
+
+
+@pytest.mark.parametrize("compresion", ["gzip", "xz", None])
+def test_crear_y_extraer_tar(tmp_path: Path, compresion: str | None) -> None:
+    esperados = _arbol_de_prueba(tmp_path / "entrada")
+    destino_tar = tmp_path / "datos.tar"
+
+    nombres = crear_tar(
+        destino_tar,
+        tmp_path / "entrada" / "datos",
+        base=tmp_path / "entrada",
+        compresion=compresion,
+    )
+
+    assert nombres == esperados
+    rutas = extraer_tar(destino_tar, tmp_path / "salida", compresion=compresion)
+    assert [
+        Path(r).relative_to(tmp_path / "salida").as_posix() for r in rutas
+    ] == esperados
+    assert (tmp_path / "salida" / esperados[3]).read_bytes() == (
+        tmp_path / "entrada" / esperados[3]
+    ).read_bytes()
+
+
+def test_extraer_tar_rechaza_traversal_y_enlaces(tmp_path: Path) -> None:
+    for nombre, tipo in (
+        ("../fuera.txt", tarfile.REGTYPE),
+        ("enlace", tarfile.SYMTYPE),
+    ):
+        tar_malicioso = tmp_path / "malicioso.tar.gz"
+        with tarfile.open(tar_malicioso, "w:gz") as archivo_tar:
+            info = tarfile.TarInfo(nombre)
+            info.type = tipo
+            info.linkname = "/etc/passwd" if tipo == tarfile.SYMTYPE else ""
+            info.size = 0
+            archivo_tar.addfile(info, io.BytesIO(b""))
+
+        with pytest.raises(ValueError):
+            extraer_tar(tar_malicioso, tmp_path / "destino")
+
+    assert not (tmp_path / "fuera.txt").exists()
+    assert not (tmp_path / "destino" / "enlace").exists()
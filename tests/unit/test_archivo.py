@@ -82,3 +82,60 @@ def test_archivo_existe_solo_acepta_str(monkeypatch, tmp_path):
     monkeypatch.setenv("COBRA_IO_BASE_DIR", str(tmp_path))
     (tmp_path / "README.md").write_text("ok", encoding="utf-8")
     assert archivo.existe(Path("README.md")) is False
+
+
+def test_archivo_lectura_en_flujo(tmp_path, monkeypatch):
+    monkeypatch.setenv("COBRA_IO_BASE_DIR", str(tmp_path))
+    (tmp_path / "grande.txt").write_text("uno\r\ndos\ntres", encoding="utf-8")
+
+    lineas = archivo.iterar_lineas("grande.txt")
+    assert next(lineas) == "uno"
+    assert list(lineas) == ["dos", "tres"]
+    assert list(archivo.leer_bloques("grande.txt", 4, binario=True)) == [
+        b"uno\r",
+        b"\ndos",
+        b"\ntre",
+        b"s",
+    ]
+
+    with archivo.mapear_memoria("grande.txt") as vista:
+        assert len(vista) == 13
+        assert vista[0:3] == b"uno"
+        assert vista.buscar("dos") == 5
+        assert list(vista.buscar_todas(b"\n")) == [4, 8]
+        assert vista.texto(9) == "tres"
+    assert vista.cerrada
+
+    (tmp_path / "vacio.txt").write_bytes(b"")
+    with archivo.mapear_memoria("vacio.txt") as vista:
+        assert len(vista) == 0
+        assert vista.buscar("x") == -1
+
+
+def test_archivo_anexador_agrupa_escrituras(tmp_path, monkeypatch):
+    monkeypatch.setenv("COBRA_IO_BASE_DIR", str(tmp_path))
+    anexador = archivo.abrir_anexador("log.txt", tamano_buffer=10)
+    anexador.escribir("abc")
+    assert (tmp_path / "log.txt").read_text(encoding="utf-8") == ""
+    anexador.escribir("defghij")
+    assert (tmp_path / "log.txt").read_text(encoding="utf-8") == "abcdefghij"
+    anexador.escribir("k")
+    anexador.cerrar()
+    assert (tmp_path / "log.txt").read_text(encoding="utf-8") == "abcdefghijk"
+    with pytest.raises(ValueError):
+        anexador.escribir("l")
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        archivo.iterar_lineas,
+        archivo.leer_bloques,
+        archivo.mapear_memoria,
+        archivo.abrir_anexador,
+    ],
+)
+def test_archivo_flujo_respeta_sandbox(monkeypatch, tmp_path, func):
+    monkeypatch.setenv("COBRA_IO_BASE_DIR", str(tmp_path))
+    with pytest.raises(ValueError):
+        func("../escape.txt")
@@ -1,4 +1,6 @@
 import json
+import threading
+import time
 
 import pytest
 
@@ -432,3 +434,105 @@ def test_detecta_conflicto_entre_dependencias_transitivas_y_explica_cadenas(tmp_
         in message
     )
     assert not (tmp_path / "cobra.lock").exists()
+
+
+def _grafo_en_cache(tmp_path):
+    """Proyecto con dos niveles transitivos servidos desde la caché."""
+
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    grafo = {
+        "dep-a": {"hoja-1": "1.0.0", "hoja-2": "1.0.0"},
+        "dep-b": {"hoja-2": "1.0.0", "hoja-3": "1.0.0"},
+        "dep-c": {},
+        "hoja-1": {},
+        "hoja-2": {"raiz-final": "1.0.0"},
+        "hoja-3": {},
+        "raiz-final": {},
+    }
+    for name, dependencies in grafo.items():
+        package = _package(
+            tmp_path, name=name, version="1.0.0", dependencies=dependencies
+        )
+        (cache / f"{name}-1.0.0.co").write_bytes(package.read_bytes())
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "cobra.toml").write_text(
+        '[dependencies]\ndep-c = "1.0.0"\ndep-a = "1.0.0"\ndep-b = "1.0.0"\n',
+        encoding="utf-8",
+    )
+    (project / "main.cobra").write_text(
+        "usar dep-a.api\nusar dep-b.api\nusar dep-c.api\n", encoding="utf-8"
+    )
+    return project, cache
+
+
+class _ResolverConcurrente:
+    """Envuelve un ``CobraHubResolver`` y mide las resoluciones simultáneas."""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.lock = threading.Lock()
+        self.en_vuelo = 0
+        self.maximo = 0
+        self.orden = []
+
+    def resolve(self, name, version, **kwargs):
+        with self.lock:
+            self.en_vuelo += 1
+            self.maximo = max(self.maximo, self.en_vuelo)
+        try:
+            time.sleep(0.05)
+            return self.inner.resolve(name, version, **kwargs)
+        finally:
+            with self.lock:
+                self.en_vuelo -= 1
+                self.orden.append(name)
+
+
+def test_resolucion_por_niveles_concurrente_genera_el_mismo_lock(tmp_path):
+    project, cache = _grafo_en_cache(tmp_path)
+
+    serial = resolve_project_dependencies(
+        project, resolver=CobraHubResolver(cache_dir=cache), max_workers=1
+    )
+    lock_serial = (project / "cobra.lock").read_text(encoding="utf-8")
+    (project / "cobra.lock").unlink()
+
+    resolver = _ResolverConcurrente(CobraHubResolver(cache_dir=cache))
+    paralelo = resolve_project_dependencies(project, resolver=resolver, max_workers=4)
+
+    assert (project / "cobra.lock").read_text(encoding="utf-8") == lock_serial
+    assert list(paralelo.resolved) == list(serial.resolved) == [
+        "dep-a",
+        "dep-b",
+        "dep-c",
+        "hoja-1",
+        "hoja-2",
+        "hoja-3",
+        "raiz-final",
+    ]
+    assert paralelo.dependency_chains == serial.dependency_chains
+    assert resolver.maximo == 3
+    assert sorted(resolver.orden) == sorted(serial.resolved)
+
+
+def test_resolucion_concurrente_conserva_el_primer_error_del_orden_secuencial(tmp_path):
+    project, cache = _grafo_en_cache(tmp_path)
+    (cache / "dep-c-1.0.0.co").unlink()
+    (cache / "hoja-3-1.0.0.co").unlink()
+
+    with pytest.raises(CobraInstallerError) as serial:
+        resolve_project_dependencies(
+            project, resolver=CobraHubResolver(cache_dir=cache), max_workers=1
+        )
+    with pytest.raises(CobraInstallerError) as paralelo:
+        resolve_project_dependencies(
+            project, resolver=CobraHubResolver(cache_dir=cache), max_workers=4
+        )
+
+    assert "dep-c" in str(serial.value)
+    assert str(paralelo.value) == str(serial.value)
+    assert not (project / "cobra.lock").exists()
+    with pytest.raises(ValueError):
+        resolve_project_dependencies(project, max_workers=0)
@@ -904,9 +904,9 @@ def test_red_funcs(monkeypatch):
     mock_resp_post.iter_content.return_value = [b"ok"]
     mock_resp_post.raise_for_status.return_value = None
     with patch(
-        "pcobra.corelibs.red.requests.get", return_value=mock_resp_get
+        "pcobra.corelibs.red._SesionHTTP.get", return_value=mock_resp_get
     ) as mock_get, patch(
-        "pcobra.corelibs.red.requests.post", return_value=mock_resp_post
+        "pcobra.corelibs.red._SesionHTTP.post", return_value=mock_resp_post
     ) as mock_post:
         assert core.obtener_url("https://x") == "ok"
         assert core.enviar_post("https://x", {"a": 1}) == "ok"
@@ -920,7 +920,7 @@ def test_red_funcs(monkeypatch):
 
 def test_red_obtener_url_rechaza_esquema_no_http(monkeypatch):
     monkeypatch.setenv("COBRA_HOST_WHITELIST", "example.com")
-    with patch("pcobra.corelibs.red.requests.get") as mock_get:
+    with patch("pcobra.corelibs.red._SesionHTTP.get") as mock_get:
         with pytest.raises(ValueError):
             core.obtener_url("ftp://ejemplo.com")
         mock_get.assert_not_called()
@@ -928,7 +928,7 @@ def test_red_obtener_url_rechaza_esquema_no_http(monkeypatch):
 
 def test_red_obtener_url_rechaza_otro_esquema(monkeypatch):
     monkeypatch.setenv("COBRA_HOST_WHITELIST", "example.com")
-    with patch("pcobra.corelibs.red.requests.get") as mock_get:
+    with patch("pcobra.corelibs.red._SesionHTTP.get") as mock_get:
         with pytest.raises(ValueError):
             core.obtener_url("file:///tmp/archivo.txt")
         mock_get.assert_not_called()
@@ -936,7 +936,7 @@ def test_red_obtener_url_rechaza_otro_esquema(monkeypatch):
 
 def test_red_enviar_post_rechaza_esquema_no_http(monkeypatch):
     monkeypatch.setenv("COBRA_HOST_WHITELIST", "example.com")
-    with patch("pcobra.corelibs.red.requests.post") as mock_post:
+    with patch("pcobra.corelibs.red._SesionHTTP.post") as mock_post:
         with pytest.raises(ValueError):
             core.enviar_post("ftp://ejemplo.com", {"a": 1})
         mock_post.assert_not_called()
@@ -944,7 +944,7 @@ def test_red_enviar_post_rechaza_esquema_no_http(monkeypatch):
 
 def test_red_enviar_post_rechaza_otro_esquema(monkeypatch):
     monkeypatch.setenv("COBRA_HOST_WHITELIST", "example.com")
-    with patch("pcobra.corelibs.red.requests.post") as mock_post:
+    with patch("pcobra.corelibs.red._SesionHTTP.post") as mock_post:
         with pytest.raises(ValueError):
             core.enviar_post("file:///tmp/archivo.txt", {"a": 1})
         mock_post.assert_not_called()
@@ -955,7 +955,7 @@ def test_red_host_whitelist_permite(monkeypatch):
     mock_resp = MagicMock(url="https://example.com", encoding="utf-8")
     mock_resp.iter_content.return_value = [b"ok"]
     mock_resp.raise_for_status.return_value = None
-    with patch("pcobra.corelibs.red.requests.get", return_value=mock_resp) as mock_get:
+    with patch("pcobra.corelibs.red._SesionHTTP.get", return_value=mock_resp) as mock_get:
         assert core.obtener_url("https://example.com") == "ok"
         mock_get.assert_called_once_with(
             "https://example.com", timeout=5, allow_redirects=False, stream=True
@@ -964,7 +964,7 @@ def test_red_host_whitelist_permite(monkeypatch):
 
 def test_red_host_whitelist_rechaza(monkeypatch):
     monkeypatch.setenv("COBRA_HOST_WHITELIST", "example.com")
-    with patch("pcobra.corelibs.red.requests.get") as mock_get:
+    with patch("pcobra.corelibs.red._SesionHTTP.get") as mock_get:
         with pytest.raises(ValueError):
             core.obtener_url("https://otro.com")
         mock_get.assert_not_called()
@@ -976,7 +976,7 @@ def test_red_obtener_url_redireccion_fuera_whitelist(monkeypatch):
     mock_resp.status_code = 302
     mock_resp.headers = {"location": "https://otro.com"}
     mock_resp.raise_for_status.return_value = None
-    with patch("pcobra.corelibs.red.requests.get", return_value=mock_resp):
+    with patch("pcobra.corelibs.red._SesionHTTP.get", return_value=mock_resp):
         with pytest.raises(ValueError):
             core.obtener_url("https://example.com", permitir_redirecciones=True)
 
@@ -987,7 +987,7 @@ def test_red_enviar_post_redireccion_fuera_whitelist(monkeypatch):
     mock_resp.status_code = 302
     mock_resp.headers = {"location": "https://otro.com"}
     mock_resp.raise_for_status.return_value = None
-    with patch("pcobra.corelibs.red.requests.post", return_value=mock_resp):
+    with patch("pcobra.corelibs.red._SesionHTTP.post", return_value=mock_resp):
         with pytest.raises(ValueError):
             core.enviar_post(
                 "https://example.com", {"a": 1}, permitir_redirecciones=True
@@ -999,7 +999,7 @@ def test_red_obtener_url_respuesta_muy_grande(monkeypatch):
     grande = MagicMock(url="https://example.com", encoding="utf-8")
     grande.iter_content.return_value = [b"a" * (1024 * 1024 + 1)]
     grande.raise_for_status.return_value = None
-    with patch("pcobra.corelibs.red.requests.get", return_value=grande):
+    with patch("pcobra.corelibs.red._SesionHTTP.get", return_value=grande):
         with pytest.raises(ValueError):
             core.obtener_url("https://example.com")
     grande.close.assert_called_once()
@@ -1010,7 +1010,7 @@ def test_red_enviar_post_respuesta_muy_grande(monkeypatch):
     grande = MagicMock(url="https://example.com", encoding="utf-8")
     grande.iter_content.return_value = [b"a" * (1024 * 1024 + 1)]
     grande.raise_for_status.return_value = None
-    with patch("pcobra.corelibs.red.requests.post", return_value=grande):
+    with patch("pcobra.corelibs.red._SesionHTTP.post", return_value=grande):
         with pytest.raises(ValueError):
             core.enviar_post("https://example.com", {"a": 1})
     grande.close.assert_called_once()
@@ -254,6 +254,100 @@ async def test_mapear_concurrencia_return_exceptions():
     assert resultados[1] == "ok"
 
 
+@pytest.mark.asyncio
+async def test_mapear_concurrencia_trabajo_cancelado_no_bloquea():
+    async def cancelada():
+        futuro = asyncio.get_running_loop().create_future()
+        futuro.cancel()
+        await futuro
+
+    def ok(valor):
+        async def tarea():
+            await asyncio.sleep(0)
+            return valor
+
+        return tarea
+
+    funciones = [ok(0), cancelada, *(ok(i) for i in range(1, 7))]
+    resultados = await asyncio.wait_for(
+        asincrono.mapear_concurrencia(funciones, limite=2, return_exceptions=True),
+        2,
+    )
+
+    assert resultados[0] == 0
+    assert isinstance(resultados[1], asyncio.CancelledError)
+    assert resultados[2:] == list(range(1, 7))
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(
+            asincrono.mapear_concurrencia(
+                [ok(0), cancelada, *(ok(i) for i in range(1, 7))], limite=2
+            ),
+            2,
+        )
+
+
+@pytest.mark.asyncio
+async def test_mapear_en_flujo_no_crea_una_tarea_por_trabajo():
+    consumidos = 0
+    tareas_vivas = 0
+
+    def trabajos():
+        nonlocal consumidos
+        for indice in range(1_000_000):
+            consumidos += 1
+
+            async def tarea(valor=indice):
+                return valor * 2
+
+            yield tarea
+
+    flujo = asincrono.mapear_en_flujo(trabajos(), 4)
+    resultados = []
+    async for valor in flujo:
+        resultados.append(valor)
+        tareas_vivas = max(tareas_vivas, len(asyncio.all_tasks()))
+        if len(resultados) == 50:
+            break
+    await flujo.aclose()
+
+    assert resultados == [i * 2 for i in range(50)]
+    # Contrapresión: solo se extrae la ventana por delante del consumidor.
+    assert consumidos <= 50 + 8 + 4
+    assert tareas_vivas <= 4 + 1
+
+
+@pytest.mark.asyncio
+async def test_mapear_en_flujo_desordenado_timeout_y_fuente_async():
+    def construir(espera, valor):
+        async def tarea():
+            await asyncio.sleep(espera)
+            return valor
+
+        return tarea
+
+    async def fuente():
+        yield construir(0.05, "lento")
+        yield construir(0.0, "rapido")
+        yield construir(1.0, "vencido")
+
+    resultados = [
+        r
+        async for r in asincrono.mapear_en_flujo(
+            fuente(), 3, ordenado=False, timeout=0.2, return_exceptions=True
+        )
+    ]
+
+    assert resultados[:2] == ["rapido", "lento"]
+    assert isinstance(resultados[2], TimeoutError)
+
+    with pytest.raises(TimeoutError):
+        async for _ in asincrono.mapear_en_flujo(
+            [construir(1.0, "x"), construir(0.0, "y")], 2, timeout=0.05
+        ):
+            pass
+
+
 @pytest.mark.asyncio
 async def test_recolectar_resultados_reporta_estados():
     cancelada = asyncio.Event()
@@ -0,0 +1,96 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import pcobra.corelibs.asincrono as asincrono
+
+
+@pytest.fixture(autouse=True)
+def _grupo_procesos():
+    asincrono.configurar_procesos(2)
+    yield
+    asincrono.cerrar_procesos()
+    asincrono.configurar_procesos(None)
+
+
+def _cuadrado(valor):
+    return valor * valor
+
+
+def _nombre_tipo(objeto):
+    return type(objeto).__name__
+
+
+class _ContadorSerializacion:
+    serializaciones = 0
+
+    def __reduce__(self):
+        type(self).serializaciones += 1
+        return (_ContadorSerializacion, ())
+
+
+@pytest.mark.asyncio
+async def test_ejecutar_en_proceso_y_mapear_en_procesos():
+    assert await asincrono.ejecutar_en_proceso(pow, 2, 10) == 1024
+    assert await asincrono.ejecutar_en_proceso(int, "ff", base=16) == 255
+
+    resultados = await asincrono.mapear_en_procesos(
+        _cuadrado, (i for i in range(-20, 20)), tamano_lote=7
+    )
+    assert resultados == [i * i for i in range(-20, 20)]
+
+
+@pytest.mark.asyncio
+async def test_valida_serializacion_con_errores_claros():
+    with pytest.raises(TypeError, match="no se puede enviar a otro proceso"):
+        await asincrono.ejecutar_en_proceso(lambda: 1)
+    with pytest.raises(TypeError, match="Los argumentos"):
+        await asincrono.ejecutar_en_proceso(_cuadrado, threading.Lock())
+    with pytest.raises(TypeError, match="La función"):
+        await asincrono.mapear_en_procesos(lambda x: x, [1, 2])
+
+
+@pytest.mark.asyncio
+async def test_integracion_con_grupo_tareas_y_limitar_tiempo():
+    async with asincrono.grupo_tareas() as grupo:
+        primera = grupo.create_task(asincrono.ejecutar_en_proceso(_cuadrado, 3))
+        segunda = grupo.create_task(asincrono.mapear_en_procesos(_cuadrado, [1, 2]))
+    assert primera.result() == 9
+    assert segunda.result() == [1, 4]
+
+    with pytest.raises(asyncio.TimeoutError):
+        async with asincrono.limitar_tiempo(0.05):
+            await asincrono.ejecutar_en_proceso(time.sleep, 0.5)
+
+
+@pytest.mark.asyncio
+async def test_argumentos_se_serializan_una_sola_vez():
+    _ContadorSerializacion.serializaciones = 0
+
+    resultado = await asincrono.ejecutar_en_proceso(
+        _nombre_tipo, _ContadorSerializacion()
+    )
+
+    assert resultado == "_ContadorSerializacion"
+    assert _ContadorSerializacion.serializaciones == 1
+
+
+@pytest.mark.asyncio
+async def test_grupo_roto_no_cierra_el_grupo_que_lo_sustituyo():
+    tarea = asyncio.create_task(asincrono.ejecutar_en_proceso(os._exit, 1))
+    await asyncio.sleep(0)
+    roto = asincrono._POOL_PROCESOS
+    asincrono._POOL_PROCESOS = None
+    nuevo = asincrono._pool_procesos()
+
+    try:
+        with pytest.raises(BrokenProcessPool):
+            await tarea
+        assert asincrono._POOL_PROCESOS is nuevo
+        assert await asincrono.ejecutar_en_proceso(pow, 2, 3) == 8
+    finally:
+        roto.shutdown(wait=False, cancel_futures=True)
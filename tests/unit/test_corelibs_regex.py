@@ -44,4 +44,54 @@ def test_all_solo_expone_api_publica_canonica() -> None:
         "reemplazar",
         "dividir",
         "encontrar_todos",
+        "compilar",
     ]
+
+
+def test_cache_de_patrones_registra_aciertos() -> None:
+    regex.limpiar_cache()
+    regex.buscar(r"\d+", "a1")
+    regex.buscar(r"\d+", "b2")
+    regex.coincidir(r"\d+", "3c")
+    estadisticas = regex.estadisticas_cache()
+    assert estadisticas["fallos"] == 1
+    assert estadisticas["aciertos"] == 2
+    assert estadisticas["tamano"] == 1
+
+
+def test_compilar_devuelve_patron_reutilizable() -> None:
+    patron = regex.compilar(r"(\w+)@(\w+)", flags=re.IGNORECASE)
+    assert patron.buscar("correo: ana@cobra") == "ana@cobra"
+    assert patron.coincidir("x") is None
+    assert patron.reemplazar(r"\2", "ana@cobra") == "cobra"
+    assert patron.encontrar_todos("a@b c@d") == [("a", "b"), ("c", "d")]
+    assert regex.buscar(patron, "ana@cobra") == "ana@cobra"
+    with pytest.raises(ValueError):
+        regex.buscar(patron, "texto", flags=re.IGNORECASE)
+    with pytest.raises(ValueError, match="patrón de expresión regular inválido"):
+        regex.compilar("[")
+
+
+def test_variantes_por_lotes_son_perezosas(tmp_path, monkeypatch) -> None:
+    consumidas = []
+
+    def lineas():
+        for linea in ["ERROR uno", "ok", "ERROR dos"]:
+            consumidas.append(linea)
+            yield linea
+
+    filtradas = regex.filtrar_lineas("^ERROR", lineas())
+    assert consumidas == []
+    assert next(filtradas) == "ERROR uno"
+    assert consumidas == ["ERROR uno"]
+    assert list(filtradas) == ["ERROR dos"]
+    assert list(regex.compilar("ok").filtrar(["ok", "no"], invertir=True)) == ["no"]
+
+    monkeypatch.setenv("COBRA_IO_BASE_DIR", str(tmp_path))
+    (tmp_path / "app.log").write_text("inicio\nERROR disco\r\nfin\nERROR red", encoding="utf-8")
+    assert list(regex.buscar_en_archivo("ERROR", "app.log")) == [
+        (2, "ERROR disco"),
+        (4, "ERROR red"),
+    ]
+    with pytest.raises(ValueError):
+        list(regex.buscar_en_archivo("ERROR", "../fuera.log"))
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import os
+
+from pcobra.cobra.hub.import_index import ImportIndex, scan_cobra_imports
+from pcobra.cobra.hub.resolver import detect_cobra_imports
+
+
+def _indice(tmp_path, root):
+    return ImportIndex(root, index_path=tmp_path / "indice.json")
+
+
+def test_scan_cobra_imports_extrae_usar_e_import():
+    texto = 'usar dep.mod\n  import "otra"\nimprimir("usar x.y")\n'
+
+    assert scan_cobra_imports(texto) == ("dep.mod", "otra")
+
+
+def test_indice_solo_relee_archivos_modificados(tmp_path):
+    root = tmp_path / "proyecto"
+    root.mkdir()
+    (root / "a.co").write_text("usar dep.mod\n", encoding="utf-8")
+    (root / "b.cobra").write_text('import "otra"\n', encoding="utf-8")
+
+    indice = _indice(tmp_path, root)
+    assert indice.modules() == {"dep.mod", "otra"}
+    assert indice.rescanned == 2
+
+    nuevo = _indice(tmp_path, root)
+    assert nuevo.modules() == {"dep.mod", "otra"}
+    assert nuevo.rescanned == 0
+
+    (root / "b.cobra").write_text('import "cambiada"\n', encoding="utf-8")
+    assert nuevo.modules() == {"dep.mod", "cambiada"}
+    assert nuevo.rescanned == 1
+
+    (root / "a.co").unlink()
+    assert nuevo.modules() == {"cambiada"}
+
+
+def test_indice_reutiliza_imports_si_solo_cambia_el_mtime(tmp_path, monkeypatch):
+    root = tmp_path / "proyecto"
+    root.mkdir()
+    fuente = root / "a.co"
+    fuente.write_text("usar dep.mod\n", encoding="utf-8")
+    indice = _indice(tmp_path, root)
+    indice.scan()
+
+    stat = fuente.stat()
+    os.utime(fuente, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    llamadas = []
+    monkeypatch.setattr(
+        "pcobra.cobra.hub.import_index.scan_cobra_imports",
+        lambda texto: llamadas.append(texto) or (),
+    )
+
+    assert indice.modules() == {"dep.mod"}
+    assert indice.rescanned == 1
+    assert llamadas == []
+
+
+def test_indice_poda_directorios_ignorados(tmp_path):
+    root = tmp_path / "proyecto"
+    (root / ".git" / "objetos").mkdir(parents=True)
+    (root / ".git" / "objetos" / "x.co").write_text("usar git.mod\n", encoding="utf-8")
+    (root / "src").mkdir()
+    (root / "src" / "main.co").write_text("usar dep.mod\n", encoding="utf-8")
+
+    entradas = _indice(tmp_path, root).scan()
+
+    assert [ruta.name for ruta in entradas] == ["main.co"]
+
+
+def test_indice_corrupto_se_recalcula(tmp_path):
+    root = tmp_path / "proyecto"
+    root.mkdir()
+    (root / "a.co").write_text("usar dep.mod\n", encoding="utf-8")
+    (tmp_path / "indice.json").write_text("{no es json", encoding="utf-8")
+
+    assert _indice(tmp_path, root).modules() == {"dep.mod"}
+
+
+def test_detect_cobra_imports_usa_el_indice_por_defecto(tmp_path, monkeypatch):
+    monkeypatch.setenv("COBRA_IMPORT_INDEX_DIR", str(tmp_path / "indices"))
+    root = tmp_path / "proyecto"
+    root.mkdir()
+    (root / "main.co").write_text(
+        'usar dep.mod\nimport "./local.co"\n', encoding="utf-8"
+    )
+
+    assert detect_cobra_imports(root) == {"dep"}
+    assert len(list((tmp_path / "indices").glob("*.json"))) == 1
+
+
+def test_directorio_de_indices_poda_los_menos_usados(tmp_path, monkeypatch):
+    indices = tmp_path / "indices"
+    monkeypatch.setenv("COBRA_IMPORT_INDEX_DIR", str(indices))
+    monkeypatch.setattr("pcobra.cobra.hub.import_index.MAX_INDEXES", 2)
+    proyectos = []
+    for numero in range(3):
+        root = tmp_path / f"proyecto{numero}"
+        root.mkdir()
+        (root / "main.co").write_text("usar dep.mod\n", encoding="utf-8")
+        proyectos.append(ImportIndex(root))
+    for marca, indice in enumerate(proyectos[:2]):
+        indice.scan()
+        os.utime(indice.index_path, ns=(marca * 10**9, marca * 10**9))
+    proyectos[0].scan()  # sin cambios: solo renueva su uso
+
+    proyectos[2].scan()
+
+    assert sorted(indices.glob("*.json")) == sorted(
+        [proyectos[0].index_path, proyectos[2].index_path]
+    )
+
+
+def test_ruta_explicita_no_poda_su_directorio(tmp_path, monkeypatch):
+    monkeypatch.setattr("pcobra.cobra.hub.import_index.MAX_INDEXES", 0)
+    ajeno = tmp_path / "ajeno.json"
+    ajeno.write_text("{}", encoding="utf-8")
+    root = tmp_path / "proyecto"
+    root.mkdir()
+    (root / "a.co").write_text("usar dep.mod\n", encoding="utf-8")
+
+    _indice(tmp_path, root).scan()
+
+    assert ajeno.exists()
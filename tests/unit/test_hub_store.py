@@ -0,0 +1,140 @@
+import hashlib
+import os
+
+import pytest
+
+from pcobra.cobra.hub import store as store_module
+from pcobra.cobra.hub.store import ContentAddressedStore
+from pcobra.cobra_installer.cache import CobraInstallerCache
+
+
+def _write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return hashlib.sha256(content).hexdigest()
+
+
+def test_add_deduplica_por_contenido_y_busca_sin_hashear(tmp_path, monkeypatch):
+    store = ContentAddressedStore(tmp_path / "store")
+    digest = _write(tmp_path / "a.co", b"contenido")
+
+    primero = store.add("dep", "1.0.0", tmp_path / "a.co", expected_sha256=digest)
+    segundo = store.add("otro", "2.0.0", tmp_path / "a.co")
+
+    assert primero.path == segundo.path == store.blob_path(digest)
+    assert primero.path.read_bytes() == b"contenido"
+    assert store.size() == len(b"contenido")
+
+    def _prohibido(_path):
+        raise AssertionError("no debe volver a hashear")
+
+    monkeypatch.setattr(store_module, "sha256_file", _prohibido)
+    encontrado = store.get("dep", "1.0.0", expected_sha256=f"sha256:{digest}")
+    assert encontrado is not None and encontrado.sha256 == digest
+    assert store.get("dep", "1.0.0", expected_sha256="0" * 64) is None
+    assert store.get("dep", "9.9.9") is None
+
+
+def test_add_rechaza_hash_inesperado_sin_dejar_temporales(tmp_path):
+    store = ContentAddressedStore(tmp_path / "store")
+    _write(tmp_path / "a.co", b"contenido")
+
+    with pytest.raises(ValueError, match="Hash inválido"):
+        store.add("dep", "1.0.0", tmp_path / "a.co", expected_sha256="0" * 64)
+
+    assert not list(store.blobs_dir.rglob("*.tmp"))
+    assert store.get("dep", "1.0.0") is None
+
+
+def test_get_verificado_descarta_blobs_corruptos(tmp_path):
+    store = ContentAddressedStore(tmp_path / "store")
+    _write(tmp_path / "a.co", b"contenido")
+    guardado = store.add("dep", "1.0.0", tmp_path / "a.co")
+    os.chmod(guardado.path, 0o644)
+    guardado.path.write_bytes(b"CONTENIDO")
+
+    assert store.get("dep", "1.0.0", verify=True) is None
+    assert not guardado.path.exists()
+
+
+def test_install_enlaza_de_forma_atomica_y_digest_usa_el_indice(tmp_path, monkeypatch):
+    store = ContentAddressedStore(tmp_path / "store")
+    digest = _write(tmp_path / "a.co", b"contenido")
+    guardado = store.add("dep", "1.0.0", tmp_path / "a.co")
+
+    destino = store.install(digest, tmp_path / "proyecto" / "dep-1.0.0.co")
+
+    assert destino.read_bytes() == b"contenido"
+    assert os.path.samefile(destino, guardado.path)
+    assert [p.name for p in destino.parent.iterdir()] == ["dep-1.0.0.co"]
+    monkeypatch.setattr(store_module, "sha256_file", lambda _p: "no-usado")
+    assert store.digest(destino) == digest
+
+
+def test_digest_se_recalcula_si_el_archivo_cambia(tmp_path):
+    store = ContentAddressedStore(tmp_path / "store")
+    ruta = tmp_path / "externo.co"
+    primero = _write(ruta, b"uno")
+    assert store.digest(ruta) == primero
+
+    segundo = _write(ruta, b"dos-distinto")
+
+    assert store.digest(ruta) == segundo
+
+
+def test_gc_expulsa_lo_usado_hace_mas_tiempo(tmp_path):
+    store = ContentAddressedStore(tmp_path / "store")
+    for indice, nombre in enumerate(("viejo", "medio", "nuevo")):
+        _write(tmp_path / f"{nombre}.co", nombre.encode() * 100)
+        store.add(nombre, "1.0.0", tmp_path / f"{nombre}.co")
+    store.get("viejo", "1.0.0")  # vuelve a ser el más reciente
+
+    expulsados = store.gc(1000)
+
+    assert [artefacto.name for artefacto in expulsados] == ["medio"]
+    assert not expulsados[0].path.exists()
+    assert store.get("viejo", "1.0.0") is not None
+    assert store.get("nuevo", "1.0.0") is not None
+    assert store.size() <= 1000
+
+
+def test_cache_instalador_reutiliza_el_almacen(tmp_path):
+    hub_cache = tmp_path / "hub"
+    digest = _write(tmp_path / "source.co", b"paquete")
+    cache = CobraInstallerCache(hub_cache_dir=hub_cache)
+
+    entry = cache.put("dep", "1.2.3", tmp_path / "source.co", expected_sha256=digest)
+    entry.path.unlink()
+    restaurado = cache.get("dep", "1.2.3", expected_sha256=digest)
+
+    assert restaurado is not None
+    assert restaurado.path == entry.path
+    assert restaurado.path.read_bytes() == b"paquete"
+    assert cache.clear("dep") == 1
+    assert cache.get("dep", "1.2.3") is None
+
+
+def test_cache_instalador_aplica_presupuesto(tmp_path, monkeypatch):
+    monkeypatch.setenv("COBRA_INSTALLER_CACHE_MAX_BYTES", "150")
+    cache = CobraInstallerCache(hub_cache_dir=tmp_path / "hub")
+    for nombre in ("dep-a", "dep-b"):
+        _write(tmp_path / f"{nombre}.co", nombre.encode() * 25)
+        cache.put(nombre, "1.0.0", tmp_path / f"{nombre}.co")
+
+    assert not (cache.cache_dir / "dep-a-1.0.0.co").exists()
+    assert (cache.cache_dir / "dep-b-1.0.0.co").exists()
+    assert cache.store.size() <= 150
+
+
+def test_cache_instalador_conserva_artefacto_mayor_que_el_presupuesto(tmp_path):
+    cache = CobraInstallerCache(hub_cache_dir=tmp_path / "hub", max_bytes=100)
+    _write(tmp_path / "previo.co", b"p" * 50)
+    cache.put("previo", "1.0.0", tmp_path / "previo.co")
+    digest = _write(tmp_path / "grande.co", b"g" * 500)
+
+    entry = cache.put("grande", "1.0.0", tmp_path / "grande.co", expected_sha256=digest)
+
+    assert entry.path.read_bytes() == b"g" * 500
+    assert cache.get("grande", "1.0.0", expected_sha256=digest) is not None
+    assert not (cache.cache_dir / "previo-1.0.0.co").exists()
+    assert cache.store.get("previo", "1.0.0") is None
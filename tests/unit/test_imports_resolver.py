@@ -8,6 +8,9 @@ from pcobra.cobra.imports.resolver import (
     CobraImportResolver,
     HybridModuleSpec,
     ImportResolutionError,
+    ResolutionCacheInfo,
+    clear_resolution_cache,
+    resolution_cache_info,
 )
 
 
@@ -465,3 +468,104 @@ def test_resolver_expone_estabilidad_de_orden_en_major():
         "hybrid",
     )
     assert CobraImportResolver.resolution_source_order_stability == "major"
+
+
+def test_resolve_reutiliza_candidatos_cacheados(monkeypatch):
+    clear_resolution_cache()
+    llamadas = []
+    original = CobraImportResolver._collect_candidates
+
+    def contar(self, name):
+        llamadas.append(name)
+        return original(self, name)
+
+    monkeypatch.setattr(CobraImportResolver, "_collect_candidates", contar)
+
+    primero = CobraImportResolver().resolve("json")
+    segundo = CobraImportResolver().resolve("json")
+
+    assert primero.import_path == segundo.import_path == "json"
+    assert llamadas == ["json"]
+    assert resolution_cache_info() == ResolutionCacheInfo(hits=1, misses=1, size=1)
+
+
+def test_cache_resolucion_se_invalida_al_cambiar_archivos(tmp_path):
+    clear_resolution_cache()
+    resolver = CobraImportResolver(project_root=tmp_path)
+
+    with pytest.raises(ImportResolutionError, match="IMP-NOT-FOUND-001"):
+        resolver.resolve("utilidades.fechas")
+
+    modulo = tmp_path / "utilidades" / "fechas.co"
+    modulo.parent.mkdir()
+    modulo.write_text("usar algo")
+    assert resolver.resolve("utilidades.fechas").file_path == str(modulo.resolve())
+
+    modulo.unlink()
+    (tmp_path / "utilidades" / "fechas.cobra").write_text("usar algo")
+    result = resolver.resolve("utilidades.fechas")
+
+    assert result.file_path == str((tmp_path / "utilidades" / "fechas.cobra").resolve())
+    assert resolution_cache_info().hits == 0
+
+
+def test_cache_resolucion_mantiene_avisos_de_colision(tmp_path):
+    (tmp_path / "datos.co").write_text("usar algo")
+    resolver = CobraImportResolver(project_root=tmp_path, collision_policy="warn")
+
+    for _ in range(2):
+        with pytest.warns(UserWarning, match="Colisión de import"):
+            assert resolver.resolve("datos").source == "stdlib"
+
+    estricto = CobraImportResolver(project_root=tmp_path, strict_ambiguous_imports=True)
+    with pytest.raises(ImportResolutionError, match="IMP-COLLISION-001"):
+        estricto.resolve("datos")
+
+
+def test_cache_resolucion_desactivable():
+    clear_resolution_cache()
+    resolver = CobraImportResolver(use_cache=False)
+
+    resolver.resolve("json")
+    resolver.resolve("json")
+
+    assert resolution_cache_info() == ResolutionCacheInfo(hits=0, misses=0, size=0)
+
+
+def test_cache_resolucion_detecta_cambios_en_modulos_python(tmp_path, monkeypatch):
+    import importlib
+
+    clear_resolution_cache()
+    proyecto = tmp_path / "proyecto"
+    proyecto.mkdir()
+    (proyecto / "zzmod_cache.co").write_text("usar algo")
+    rutas_python = tmp_path / "py"
+    rutas_python.mkdir()
+    monkeypatch.syspath_prepend(str(rutas_python))
+
+    def fuentes():
+        importlib.invalidate_caches()
+        resolver = CobraImportResolver(project_root=proyecto, collision_policy="warn")
+        return [c.source for c in resolver._cached_candidates("zzmod_cache")]
+
+    assert fuentes() == ["project"]
+
+    modulo = rutas_python / "zzmod_cache.py"
+    modulo.write_text("VALOR = 1\n")
+    assert fuentes() == ["project", "python_bridge"]
+
+    modulo.unlink()
+    assert fuentes() == ["project"]
+    assert resolution_cache_info().hits == 0
+
+
+def test_huella_de_configuracion_incluye_valores_de_modulos(monkeypatch):
+    import pcobra.cobra.imports.resolver as resolver_module
+
+    mapa = {"modulos": {"util": {"python": "a.py"}}}
+    monkeypatch.setattr(resolver_module, "get_toml_map", lambda: mapa)
+    antes = CobraImportResolver().config_fingerprint
+
+    mapa["modulos"]["util"] = {"python": "b.py"}
+
+    assert CobraImportResolver().config_fingerprint != antes
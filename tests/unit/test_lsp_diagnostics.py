@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import threading
+
+from pcobra.lsp import cobra_plugin
+from pcobra.lsp.diagnostics import DiagnosticsScheduler
+
+
+class _Recolector:
+    def __init__(self) -> None:
+        self.publicados: list[tuple[str, list, object]] = []
+        self.evento = threading.Event()
+
+    def __call__(self, uri, diagnosticos, version) -> None:
+        self.publicados.append((uri, diagnosticos, version))
+        self.evento.set()
+
+
+def test_programar_agrupa_versiones_y_publica_solo_la_ultima():
+    analizados: list[str] = []
+
+    def analizar(source: str) -> list[dict]:
+        analizados.append(source)
+        return [{"message": source}]
+
+    scheduler = DiagnosticsScheduler(analizar, debounce=0.05)
+    recolector = _Recolector()
+    try:
+        for version in range(1, 6):
+            scheduler.programar("file:///a.co", version, f"v{version}", recolector)
+        assert recolector.evento.wait(2)
+    finally:
+        scheduler.cerrar()
+
+    assert analizados == ["v5"]
+    assert recolector.publicados == [("file:///a.co", [{"message": "v5"}], 5)]
+
+
+def test_resultado_obsoleto_no_se_publica():
+    liberar = threading.Event()
+    iniciado = threading.Event()
+
+    def analizar(source: str) -> list[dict]:
+        if source == "lento":
+            iniciado.set()
+            liberar.wait(2)
+        return [{"message": source}]
+
+    scheduler = DiagnosticsScheduler(analizar, debounce=0)
+    recolector = _Recolector()
+    try:
+        scheduler.programar("doc", 1, "lento", recolector)
+        assert iniciado.wait(2)
+        scheduler.programar("doc", 2, "rapido", recolector)
+        liberar.set()
+        assert recolector.evento.wait(2)
+    finally:
+        scheduler.cerrar()
+
+    assert [version for _, _, version in recolector.publicados] == [2]
+
+
+def test_cache_por_contenido_evita_reanalizar():
+    llamadas: list[str] = []
+
+    def analizar(source: str) -> list[dict]:
+        llamadas.append(source)
+        return []
+
+    scheduler = DiagnosticsScheduler(analizar)
+    try:
+        scheduler.analizar_ahora("doc", 1, "imprimir(1)")
+        scheduler.analizar_ahora("doc", 1, "imprimir(1)")
+        assert scheduler.programar("doc", 1, "imprimir(1)", lambda *a: None) == []
+    finally:
+        scheduler.cerrar()
+
+    assert llamadas == ["imprimir(1)"]
+
+
+def test_pylsp_diagnostics_documento_pequeno_es_sincrono(monkeypatch):
+    class _Documento:
+        uri = "file:///demo.co"
+        version = 1
+        source = "x = 1   \n"
+        lines = source.splitlines(True)
+
+    monkeypatch.setattr(
+        cobra_plugin, "_SCHEDULER", DiagnosticsScheduler(cobra_plugin.analizar_codigo)
+    )
+
+    diagnostics = cobra_plugin.pylsp_diagnostics(None, object(), _Documento())
+
+    mensajes = [d["message"] for d in diagnostics]
+    assert mensajes == ["Espacios en blanco al final de la línea"]
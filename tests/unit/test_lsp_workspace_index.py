@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from io import BytesIO
+
+import pytest
+
+from pcobra.lsp import cobra_plugin
+from pcobra.lsp.workspace_index import WorkspaceIndex
+
+FUENTE = """func suma(a, b):
+    retorno a + b
+fin
+clase Perro:
+    metodo ladrar(self):
+        imprimir(1)
+    fin
+fin
+var total = suma(1, 2)
+usar "numero"
+"""
+
+
+def _crear_indice(tmp_path):
+    proyecto = tmp_path / "proyecto"
+    proyecto.mkdir()
+    (proyecto / "main.co").write_text(FUENTE, encoding="utf-8")
+    ignorado = proyecto / ".git"
+    ignorado.mkdir()
+    (ignorado / "basura.co").write_text("func oculta():\n    pasar\nfin\n", encoding="utf-8")
+    return proyecto, WorkspaceIndex(proyecto, index_path=tmp_path / "indice.json")
+
+
+def test_indexa_simbolos_con_posicion(tmp_path):
+    proyecto, indice = _crear_indice(tmp_path)
+
+    assert indice.sincronizar() == 1
+
+    ruta = str(proyecto / "main.co")
+    simbolos = {(s.nombre, s.tipo, s.contenedor): (s.linea, s.columna) for s in indice.simbolos_de(ruta)}
+    assert simbolos[("suma", "funcion", None)] == (0, 5)
+    assert simbolos[("Perro", "clase", None)] == (3, 6)
+    assert simbolos[("ladrar", "metodo", "Perro")] == (4, 11)
+    assert simbolos[("total", "variable", None)] == (8, 4)
+    assert indice.modulos_usados(ruta) == ["numero"]
+    assert indice.definiciones("oculta") == []
+
+
+def test_completar_por_prefijo_excluye_metodos(tmp_path):
+    _, indice = _crear_indice(tmp_path)
+    indice.sincronizar()
+
+    assert [s.nombre for s in indice.completar("su")] == ["suma"]
+    assert indice.completar("lad") == []
+    assert [s.nombre for s in indice.buscar("LADR")] == ["ladrar"]
+
+
+def test_actualizacion_incremental_por_hash(tmp_path):
+    proyecto, indice = _crear_indice(tmp_path)
+    indice.sincronizar()
+    ruta = str(proyecto / "main.co")
+
+    assert indice.actualizar(ruta, FUENTE) is False
+    assert indice.actualizar(ruta, "func resta(a, b):\n    retorno a - b\nfin\n") is True
+    assert indice.definiciones("suma") == []
+    assert [s.nombre for s in indice.completar("res")] == ["resta"]
+
+
+def test_persistencia_evita_reparsear(tmp_path, monkeypatch):
+    proyecto, indice = _crear_indice(tmp_path)
+    indice.sincronizar()
+    indice.guardar()
+
+    restaurado = WorkspaceIndex(proyecto, index_path=tmp_path / "indice.json")
+    assert restaurado.cargar() is True
+
+    def _falla(*_args, **_kwargs):
+        raise AssertionError("no debe reparsear archivos sin cambios")
+
+    monkeypatch.setattr("pcobra.lsp.workspace_index.indexar_fuente", _falla)
+    assert restaurado.sincronizar() == 0
+    assert [s.nombre for s in restaurado.completar("Pe")] == ["Perro"]
+
+
+def test_plugin_resuelve_definicion(tmp_path, monkeypatch):
+    proyecto, indice = _crear_indice(tmp_path)
+    indice.sincronizar()
+    monkeypatch.setattr(cobra_plugin, "_INDICES", {str(proyecto): indice})
+
+    class _Workspace:
+        root_path = str(proyecto)
+
+    class _Documento:
+        path = str(proyecto / "main.co")
+        source = FUENTE
+        lines = FUENTE.splitlines(True)
+
+    ubicaciones = cobra_plugin.pylsp_definitions(
+        None, _Workspace(), _Documento(), {"line": 8, "character": 14}
+    )
+
+    assert ubicaciones == [
+        {
+            "uri": (proyecto / "main.co").as_uri(),
+            "range": {
+                "start": {"line": 0, "character": 5},
+                "end": {"line": 0, "character": 9},
+            },
+        }
+    ]
+
+
+class _WorkspaceDe:
+    def __init__(self, proyecto):
+        self.root_path = str(proyecto)
+
+
+class _DocumentoDe:
+    def __init__(self, ruta, source):
+        self.path = str(ruta)
+        self.source = source
+        self.lines = source.splitlines(True)
+
+
+def test_workspace_symbol_se_atiende_por_el_dispatcher(tmp_path, monkeypatch):
+    pytest.importorskip("pylsp")
+    from pylsp import PYLSP, hookspecs
+    from pylsp.config.config import PluginManager
+    from pylsp.python_lsp import PythonLSPServer
+
+    proyecto, indice = _crear_indice(tmp_path)
+    indice.sincronizar()
+    monkeypatch.setattr(cobra_plugin, "_INDICES", {str(proyecto): indice})
+    gestor = PluginManager(PYLSP)
+    gestor.add_hookspecs(hookspecs)
+    gestor.register(cobra_plugin, name="cobra")
+    servidor = PythonLSPServer(BytesIO(), BytesIO())
+    servidor._dispatchers = gestor.hook.pylsp_dispatchers(
+        config=None, workspace=_WorkspaceDe(proyecto)
+    )
+
+    simbolos = servidor["workspace/symbol"]({"query": "LADR"})
+
+    assert [(s["name"], s.get("containerName")) for s in simbolos] == [
+        ("ladrar", "Perro")
+    ]
+
+
+def test_guardado_del_indice_se_agrupa_hasta_el_cierre(tmp_path, monkeypatch):
+    proyecto, indice = _crear_indice(tmp_path)
+    monkeypatch.setattr(cobra_plugin, "_INDICES", {str(proyecto): indice})
+    monkeypatch.setattr(cobra_plugin, "_GUARDADOS", {})
+    monkeypatch.setattr(cobra_plugin, "GUARDADO_DEBOUNCE_SECONDS", 60.0)
+    workspace = _WorkspaceDe(proyecto)
+    ruta = proyecto / "main.co"
+
+    for _ in range(3):
+        cobra_plugin.pylsp_document_did_save(
+            None, workspace, _DocumentoDe(ruta, FUENTE)
+        )
+
+    assert not indice.index_path.exists()
+    assert list(cobra_plugin._GUARDADOS) == [indice]
+
+    cobra_plugin.pylsp_shutdown(None, workspace)
+
+    assert indice.index_path.exists()
+    assert cobra_plugin._GUARDADOS == {}
+
+
+def test_buffer_sin_guardar_no_registra_la_marca_del_disco(tmp_path, monkeypatch):
+    proyecto, indice = _crear_indice(tmp_path)
+    monkeypatch.setattr(cobra_plugin, "_INDICES", {str(proyecto): indice})
+    ruta = proyecto / "main.co"
+    borrador = "func borrador():\n    retorno 1\nfin\n"
+
+    cobra_plugin.pylsp_document_symbols(
+        None, _WorkspaceDe(proyecto), _DocumentoDe(ruta, borrador)
+    )
+    assert [s.nombre for s in indice.completar("bor")] == ["borrador"]
+
+    # El disco aún tiene FUENTE: la sincronización debe volver a leerlo.
+    assert indice.sincronizar() == 1
+    assert indice.completar("bor") == []
+    assert [s.nombre for s in indice.completar("su")] == ["suma"]
@@ -0,0 +1,126 @@
+import threading
+
+import pytest
+
+from core.ast_nodes import NodoAsignacion, NodoFuncion, NodoHilo, NodoIdentificador, NodoLlamadaFuncion, NodoValor
+from core.interpreter import InterpretadorCobra
+from core.planificador import ColaHilosLlenaError, PlanificadorHilos, TareaHilo
+
+
+@pytest.mark.timeout(5)
+def test_planificador_limita_trabajadores_y_registra_metricas():
+    planificador = PlanificadorHilos(max_trabajadores=2, max_en_cola=100)
+    activos = []
+    maximo = []
+    lock = threading.Lock()
+    liberar = threading.Event()
+
+    def tarea(i):
+        with lock:
+            activos.append(i)
+            maximo.append(len(activos))
+        liberar.wait(1)
+        with lock:
+            activos.remove(i)
+        return i * 2
+
+    tareas = [planificador.enviar(tarea, i) for i in range(10)]
+    liberar.set()
+    assert [t.resultado(timeout=2) for t in tareas] == [i * 2 for i in range(10)]
+    assert max(maximo) <= 2
+    metricas = planificador.metricas()
+    assert metricas["completadas"] == 10
+    assert metricas["en_cola"] == 0
+    assert metricas["en_ejecucion"] == 0
+    assert metricas["trabajadores"] == 2
+    planificador.cerrar()
+
+
+@pytest.mark.timeout(5)
+def test_planificador_aplica_contrapresion_cuando_la_cola_esta_llena():
+    planificador = PlanificadorHilos(max_trabajadores=1, max_en_cola=1)
+    liberar = threading.Event()
+    primera = planificador.enviar(liberar.wait, 2)
+    # Deja que el trabajador retire la primera tarea de la cola.
+    while planificador.metricas()["en_ejecucion"] == 0:
+        pass
+    planificador.enviar(lambda: None)
+    with pytest.raises(ColaHilosLlenaError):
+        planificador.enviar(lambda: None, timeout=0.05)
+    liberar.set()
+    primera.join(2)
+    assert planificador.esperar_todas(timeout=2)
+    planificador.cerrar()
+
+
+@pytest.mark.timeout(5)
+def test_tarea_propaga_errores_por_su_manejador(monkeypatch):
+    monkeypatch.setattr(threading, "excepthook", lambda _args: None)
+    planificador = PlanificadorHilos(max_trabajadores=1)
+
+    def falla():
+        raise ValueError("boom")
+
+    tarea = planificador.enviar(falla)
+    tarea.join(2)
+    assert isinstance(tarea.excepcion(), ValueError)
+    with pytest.raises(ValueError):
+        tarea.resultado()
+    assert planificador.metricas()["fallidas"] == 1
+    planificador.cerrar()
+
+
+@pytest.mark.timeout(5)
+def test_errores_de_tareas_se_notifican_por_excepthook(monkeypatch):
+    notificados = []
+    monkeypatch.setattr(threading, "excepthook", notificados.append)
+    planificador = PlanificadorHilos(max_trabajadores=1)
+
+    def falla():
+        raise ValueError("boom")
+
+    planificador.enviar(falla).join(2)
+
+    assert [type(args.exc_value) for args in notificados] == [ValueError]
+    assert notificados[0].thread.name.startswith("cobra-hilo")
+    planificador.cerrar()
+
+
+@pytest.mark.timeout(5)
+def test_trabajador_que_espera_a_su_hija_no_se_bloquea():
+    planificador = PlanificadorHilos(max_trabajadores=1, max_en_cola=10)
+
+    def padre():
+        hija = planificador.enviar(lambda: "hija")
+        return hija.resultado(timeout=2)
+
+    assert planificador.enviar(padre).resultado(timeout=3) == "hija"
+    planificador.cerrar()
+
+
+@pytest.mark.timeout(5)
+def test_hilo_usa_planificador_con_marcos_propios():
+    interp = InterpretadorCobra()
+    interp._planificador = PlanificadorHilos(max_trabajadores=4)
+    interp.ejecutar_asignacion(NodoAsignacion('base', NodoValor(1), declaracion=True))
+    funcion = NodoFuncion(
+        'trabajo',
+        ['n'],
+        [NodoAsignacion('local', NodoIdentificador('n'), declaracion=True)],
+    )
+    interp.ejecutar_funcion(funcion)
+
+    tareas = [
+        interp.ejecutar_hilo(NodoHilo(NodoLlamadaFuncion('trabajo', [NodoValor(i)])))
+        for i in range(50)
+    ]
+    for tarea in tareas:
+        assert isinstance(tarea, TareaHilo)
+        assert tarea.excepcion(timeout=2) is None
+
+    assert len(interp.contextos) == 1
+    assert len(interp.mem_contextos) == 1
+    assert interp._call_depth == 0
+    assert 'local' not in interp.variables
+    assert interp._planificador.metricas()["completadas"] == 50
+    interp._planificador.cerrar()
@@ -1373,3 +1373,61 @@ def test_usar_anidado_mantiene_raiz_autorizada_estable_con_current_file(
     assert (modulo_dir / "b.co").resolve() in rutas_cargadas
     assert (modulo_dir / "c.co").resolve() in rutas_cargadas
     assert all(ruta.is_relative_to(proyecto.resolve()) for ruta in rutas_cargadas)
+
+
+def _proyecto_con_modulos(tmp_path, **modulos):
+    proyecto = tmp_path / "app"
+    proyecto.mkdir()
+    (proyecto / "cobra.toml").write_text("[proyecto]\n", encoding="utf-8")
+    principal = proyecto / "main.co"
+    principal.write_text("", encoding="utf-8")
+    for nombre, codigo in modulos.items():
+        (proyecto / f"{nombre}.co").write_text(codigo, encoding="utf-8")
+    return proyecto, principal
+
+
+def test_cache_global_usar_se_invalida_al_cambiar_el_modulo(tmp_path):
+    proyecto, principal = _proyecto_con_modulos(tmp_path, fechas="var hoy = 13\n")
+
+    primero = usar_modulo("fechas", project_root=proyecto, current_file=principal)
+    repetido = usar_modulo("fechas", project_root=proyecto, current_file=principal)
+    (proyecto / "fechas.co").write_text("var hoy = 140\n", encoding="utf-8")
+    cambiado = usar_modulo("fechas", project_root=proyecto, current_file=principal)
+
+    assert repetido is primero
+    assert primero["hoy"] == 13
+    assert cambiado["hoy"] == 140
+
+
+def test_cache_global_usar_se_invalida_al_cambiar_una_dependencia(tmp_path):
+    proyecto, principal = _proyecto_con_modulos(
+        tmp_path,
+        base="var valor = 1\n",
+        fachada='usar "base"\nvar propio = 2\n',
+    )
+
+    primero = usar_modulo("fachada", project_root=proyecto, current_file=principal)
+    (proyecto / "base.co").write_text("var valor = 10\n", encoding="utf-8")
+    segundo = usar_modulo("fachada", project_root=proyecto, current_file=principal)
+
+    assert segundo is not primero
+    assert usar_modulo("base", project_root=proyecto, current_file=principal)[
+        "valor"
+    ] == 10
+
+
+def test_interpretes_nuevos_reutilizan_ast_sin_compartir_estado(tmp_path):
+    from pcobra.core import import_utils
+
+    proyecto, principal = _proyecto_con_modulos(tmp_path, contador="var total = 1\n")
+    import_utils.limpiar_cache_ast_modulos()
+
+    interp_a = InterpretadorCobra(safe_mode=False, main_file=principal)
+    interp_a.ejecutar_usar(SimpleNamespace(modulo="contador"))
+    interp_a.variables["total"] = 99
+    interp_b = InterpretadorCobra(safe_mode=False, main_file=principal)
+    interp_b.ejecutar_usar(SimpleNamespace(modulo="contador"))
+
+    estadisticas = import_utils.estadisticas_cache_ast_modulos()
+    assert (estadisticas.aciertos, estadisticas.fallos) == (1, 1)
+    assert interp_b.variables["total"] == 1
@@ -2,6 +2,7 @@ import importlib
 import json
 import sqlite3
 import sys
+import threading
 from pathlib import Path
 
 import pytest
@@ -101,6 +102,7 @@ def _install_parser_stub(module, monkeypatch: pytest.MonkeyPatch) -> None:
 def test_qualia_state_persistence(tmp_path, monkeypatch):
     module, _ = _reload_qualia(tmp_path, monkeypatch)
     module.register_execution("var x = 1")
+    module.flush_state()
 
     with module.database.get_connection() as conn:
         row = conn.execute("SELECT payload FROM qualia_state WHERE id = 1").fetchone()
@@ -122,6 +124,7 @@ def test_qualia_generates_suggestions(tmp_path, monkeypatch):
 def test_knowledge_persistence(tmp_path, monkeypatch):
     module, _ = _reload_qualia(tmp_path, monkeypatch)
     module.register_execution("imprimir(1)")
+    module.flush_state()
 
     with module.database.get_connection() as conn:
         row = conn.execute("SELECT payload FROM qualia_state WHERE id = 1").fetchone()
@@ -145,6 +148,75 @@ def test_sugerencia_pandas_matplotlib(tmp_path, monkeypatch):
     assert any("matplotlib" in s for s in sugs)
 
 
+def test_history_is_bounded_but_counters_keep_growing(tmp_path, monkeypatch):
+    module, _ = _reload_qualia(tmp_path, monkeypatch)
+    spirit = module.QualiaSpirit(history_limit=3)
+    for i in range(10):
+        spirit.register(f"imprimir({i})")
+
+    assert list(spirit.history) == ["imprimir(7)", "imprimir(8)", "imprimir(9)"]
+    assert spirit.imprimir_count == 10
+    assert not any("imprimir" in s for s in spirit.suggestions())
+
+
+def test_register_execution_reuses_caller_ast(tmp_path, monkeypatch):
+    module, _ = _reload_qualia(tmp_path, monkeypatch)
+
+    class FailingParser:
+        def __init__(self, *_args) -> None:
+            raise AssertionError("no debe volver a parsear")
+
+    monkeypatch.setattr(module, "Parser", FailingParser)
+    nodo = type("NodoAsignacion", (), {})()
+    nodo.nombre = "x"
+
+    module.register_execution("var x = 1", ast=[nodo])
+
+    snapshot = module.get_knowledge_snapshot()
+    assert snapshot["node_counts"]["NodoAsignacion"] == 1
+
+
+def test_reset_state_waits_for_running_flush(tmp_path, monkeypatch):
+    module, _ = _reload_qualia(tmp_path, monkeypatch)
+    monkeypatch.setattr(module, "_is_persistence_enabled", lambda: True)
+    original_write = module._write_payload
+    writing = threading.Event()
+    release = threading.Event()
+
+    def slow_write(payload):
+        writing.set()
+        assert release.wait(5)
+        original_write(payload)
+
+    monkeypatch.setattr(module, "_write_payload", slow_write)
+    module.register_execution("var x = 1")
+    flusher = threading.Thread(target=module.flush_state)
+    flusher.start()
+    assert writing.wait(5)
+
+    resetter = threading.Thread(target=module.reset_state)
+    resetter.start()
+    resetter.join(0.2)
+    assert resetter.is_alive()
+
+    release.set()
+    flusher.join(5)
+    resetter.join(5)
+
+    with module.database.get_connection() as conn:
+        row = conn.execute("SELECT payload FROM qualia_state WHERE id = 1").fetchone()
+    assert row is None
+    assert list(module._get_qualia().history) == []
+
+
+def test_build_spirit_derives_counters_from_legacy_payload(tmp_path, monkeypatch):
+    module, _ = _reload_qualia(tmp_path, monkeypatch)
+    spirit = module._build_spirit({"history": ["imprimir(1)", "x = 2"]})
+
+    assert spirit.imprimir_count == 1
+    assert spirit.as_dict()["counters"] == {"imprimir": 1}
+
+
 def test_qualia_rejects_outside_home(tmp_path, monkeypatch):
     home = _configure_env(tmp_path, monkeypatch)
     monkeypatch.setenv("QUALIA_STATE_PATH", "/etc/passwd")
@@ -242,6 +314,7 @@ def test_migration_followed_by_persistence(tmp_path, monkeypatch):
 
     module, _ = _reload_qualia(tmp_path, monkeypatch)
     module.register_execution("var nuevo = 1")
+    module.flush_state()
 
     with module.database.get_connection() as conn:
         payload = conn.execute(
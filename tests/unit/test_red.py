@@ -6,7 +6,7 @@ from pcobra.corelibs import red as red_module
 
 def test_obtener_url_sin_whitelist(monkeypatch):
     monkeypatch.delenv("COBRA_HOST_WHITELIST", raising=False)
-    with patch("pcobra.corelibs.red.requests.get") as mock_get:
+    with patch("pcobra.corelibs.red._SesionHTTP.get") as mock_get:
         with pytest.raises(ValueError):
             core.obtener_url("https://example.com")
         mock_get.assert_not_called()
@@ -14,7 +14,7 @@ def test_obtener_url_sin_whitelist(monkeypatch):
 
 def test_obtener_url_whitelist_vacia(monkeypatch):
     monkeypatch.setenv("COBRA_HOST_WHITELIST", "")
-    with patch("pcobra.corelibs.red.requests.get") as mock_get:
+    with patch("pcobra.corelibs.red._SesionHTTP.get") as mock_get:
         with pytest.raises(ValueError):
             core.obtener_url("https://example.com")
         mock_get.assert_not_called()
@@ -27,7 +27,7 @@ def test_obtener_url_redireccion_http(monkeypatch):
         headers={"Location": "http://example.com"},
         close=MagicMock(),
     )
-    with patch("pcobra.corelibs.red.requests.get", return_value=mock_resp) as mock_get:
+    with patch("pcobra.corelibs.red._SesionHTTP.get", return_value=mock_resp) as mock_get:
         with pytest.raises(ValueError):
             core.obtener_url("https://example.com", permitir_redirecciones=True)
         mock_get.assert_called_once_with(
@@ -42,7 +42,7 @@ def test_obtener_url_whitelist_insensible_mayusculas(monkeypatch):
     mock_resp.raise_for_status.return_value = None
     mock_resp.status_code = 200
     mock_resp.headers = {}
-    with patch("pcobra.corelibs.red.requests.get", return_value=mock_resp) as mock_get:
+    with patch("pcobra.corelibs.red._SesionHTTP.get", return_value=mock_resp) as mock_get:
         assert core.obtener_url("https://EXAMPLE.com") == "ok"
         mock_get.assert_called_once_with(
             "https://EXAMPLE.com", timeout=5, allow_redirects=False, stream=True
@@ -59,7 +59,7 @@ def test_obtener_url_redireccion_fuera_whitelist(monkeypatch):
     segunda_resp = MagicMock()
     segunda_resp.close = MagicMock()
     with patch(
-        "pcobra.corelibs.red.requests.get",
+        "pcobra.corelibs.red._SesionHTTP.get",
         side_effect=[primer_resp, segunda_resp],
     ) as mock_get:
         with pytest.raises(ValueError):
@@ -84,7 +84,7 @@ def test_obtener_url_redireccion_permitida(monkeypatch):
     segunda_resp.raise_for_status.return_value = None
     segunda_resp.close = MagicMock()
     with patch(
-        "pcobra.corelibs.red.requests.get",
+        "pcobra.corelibs.red._SesionHTTP.get",
         side_effect=[primer_resp, segunda_resp],
     ) as mock_get:
         resultado = core.obtener_url(
@@ -117,7 +117,7 @@ def test_enviar_post_redireccion_fuera_whitelist(monkeypatch):
     segunda_resp = MagicMock()
     segunda_resp.close = MagicMock()
     with patch(
-        "pcobra.corelibs.red.requests.post",
+        "pcobra.corelibs.red._SesionHTTP.post",
         side_effect=[primer_resp, segunda_resp],
     ) as mock_post:
         with pytest.raises(ValueError):
@@ -144,7 +144,7 @@ def test_enviar_post_redireccion_permitida(monkeypatch):
     segunda_resp.raise_for_status.return_value = None
     segunda_resp.close = MagicMock()
     with patch(
-        "pcobra.corelibs.red.requests.post",
+        "pcobra.corelibs.red._SesionHTTP.post",
         side_effect=[primer_resp, segunda_resp],
     ) as mock_post:
         respuesta = core.enviar_post(
@@ -179,7 +179,7 @@ def test_enviar_post_demasiadas_redirecciones(monkeypatch):
         close=MagicMock(),
     )
     with patch(
-        "pcobra.corelibs.red.requests.post",
+        "pcobra.corelibs.red._SesionHTTP.post",
         return_value=respuesta_redir,
     ) as mock_post:
         with pytest.raises(ValueError, match="Demasiadas redirecciones"):
@@ -0,0 +1,157 @@
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import pcobra.corelibs.red as red
+from pcobra.corelibs.cache_http import CacheHTTP
+
+
+class _Respuesta:
+    def __init__(self, url, estado, cabeceras, cuerpo=b""):
+        self.url = url
+        self.status_code = estado
+        self.headers = cabeceras
+        self.encoding = "utf-8"
+        self._cuerpo = cuerpo
+
+    def raise_for_status(self):
+        return None
+
+    def iter_content(self, chunk_size=8192):
+        yield self._cuerpo
+
+    async def aiter_bytes(self, chunk_size=8192):
+        yield self._cuerpo
+
+    def close(self):
+        return None
+
+
+class _Servidor:
+    """Sustituto local de un servidor HTTP con validadores condicionales."""
+
+    def __init__(self, cache_control="max-age=60"):
+        self.version = 1
+        self.cache_control = cache_control
+        self.peticiones = []
+
+    def responder(self, url, headers=None):
+        headers = headers or {}
+        self.peticiones.append(headers)
+        etag = f'"v{self.version}"'
+        cabeceras = {"ETag": etag, "Cache-Control": self.cache_control}
+        if headers.get("If-None-Match") == etag:
+            return _Respuesta(url, 304, cabeceras)
+        return _Respuesta(url, 200, cabeceras, f"version {self.version}".encode())
+
+    # Interfaz de requests.Session.get
+    def get(self, url, **kwargs):
+        return self.responder(url, kwargs.get("headers"))
+
+    # Interfaz de httpx.AsyncClient.stream
+    def stream(self, method, url, **kwargs):
+        servidor = self
+
+        class _Contexto:
+            async def __aenter__(self):
+                return servidor.responder(url, kwargs.get("headers"))
+
+            async def __aexit__(self, exc_type, exc, tb):
+                return False
+
+        return _Contexto()
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("COBRA_HOST_WHITELIST", "example.com")
+    red.cerrar()
+    yield red.configurar_cache(tmp_path / "http")
+    red.configurar_cache(None)
+    red.cerrar()
+
+
+def test_obtener_url_sirve_fresco_y_revalida(cache):
+    servidor = _Servidor()
+    with patch("pcobra.corelibs.red._SesionHTTP.get", side_effect=servidor.get):
+        assert red.obtener_url("https://example.com/a") == "version 1"
+        assert red.obtener_url("https://example.com/a") == "version 1"
+        assert len(servidor.peticiones) == 1
+
+        # Caducada: se revalida y el 304 se sirve desde disco.
+        entrada = cache.buscar("https://example.com/a")
+        cache.refrescar(entrada, {"Cache-Control": "no-cache"})
+        assert red.obtener_url("https://example.com/a") == "version 1"
+        assert servidor.peticiones[-1] == {"If-None-Match": '"v1"'}
+
+        servidor.version = 2
+        cache.refrescar(cache.buscar("https://example.com/a"), {"Cache-Control": "no-cache"})
+        assert red.obtener_url("https://example.com/a") == "version 2"
+        assert red.obtener_url("https://example.com/a") == "version 2"
+        assert len(servidor.peticiones) == 3
+
+
+def test_no_store_no_se_almacena(cache):
+    servidor = _Servidor(cache_control="no-store")
+    with patch("pcobra.corelibs.red._SesionHTTP.get", side_effect=servidor.get):
+        red.obtener_url("https://example.com/a")
+        red.obtener_url("https://example.com/a")
+    assert len(servidor.peticiones) == 2
+    assert cache.buscar("https://example.com/a") is None
+
+
+def test_revalidacion_304_con_no_store_usa_el_cuerpo_guardado(cache):
+    servidor = _Servidor(cache_control="no-cache")
+    with patch("pcobra.corelibs.red._SesionHTTP.get", side_effect=servidor.get):
+        assert red.obtener_url("https://example.com/a") == "version 1"
+        servidor.cache_control = "no-store"
+        assert red.obtener_url("https://example.com/a") == "version 1"
+    assert servidor.peticiones[-1] == {"If-None-Match": '"v1"'}
+    assert cache.buscar("https://example.com/a") is None
+
+
+def test_cuerpo_expulsado_se_descarga_sin_condiciones(cache, monkeypatch):
+    servidor = _Servidor(cache_control="no-cache")
+    buscar = cache.buscar
+
+    def buscar_y_expulsar(url):
+        # Otro proceso expulsa el cuerpo entre ``buscar`` y la lectura.
+        entrada = buscar(url)
+        if entrada is not None:
+            entrada.ruta_cuerpo.unlink()
+        return entrada
+
+    with patch("pcobra.corelibs.red._SesionHTTP.get", side_effect=servidor.get):
+        assert red.obtener_url("https://example.com/a") == "version 1"
+        monkeypatch.setattr(cache, "buscar", buscar_y_expulsar)
+        assert red.obtener_url("https://example.com/a") == "version 1"
+    assert servidor.peticiones == [{}, {"If-None-Match": '"v1"'}, {}]
+
+
+@pytest.mark.asyncio
+async def test_obtener_url_async_usa_la_cache(cache, monkeypatch):
+    servidor = _Servidor(cache_control="no-cache")
+    if red.httpx is None:
+        monkeypatch.setattr(red, "httpx", SimpleNamespace())
+    monkeypatch.setattr(red.httpx, "AsyncClient", lambda **_kw: servidor, raising=False)
+
+    assert await red.obtener_url_async("https://example.com/b") == "version 1"
+    assert await red.obtener_url_async("https://example.com/b") == "version 1"
+    assert servidor.peticiones == [{}, {"If-None-Match": '"v1"'}]
+
+
+def test_cache_expulsa_lo_menos_usado(tmp_path):
+    cache = CacheHTTP(tmp_path, max_bytes=25)
+    cabeceras = {"Cache-Control": "max-age=60"}
+    cache.guardar("https://example.com/1", cabeceras, b"x" * 10)
+    cache.guardar("https://example.com/2", cabeceras, b"y" * 10)
+    antiguo = time.time() - 100
+    os.utime(tmp_path / cache._rutas("https://example.com/2")[0].name, (antiguo, antiguo))
+    cache.guardar("https://example.com/3", cabeceras, b"z" * 10)
+
+    assert cache.buscar("https://example.com/2") is None
+    assert cache.buscar("https://example.com/1").leer() == b"x" * 10
+    assert cache.tamano() == 20
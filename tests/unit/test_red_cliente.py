@@ -0,0 +1,216 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import pcobra.corelibs.red as red
+
+
+@pytest.fixture(autouse=True)
+def _clientes_limpios():
+    red.cerrar()
+    yield
+    red.cerrar()
+
+
+def _respuesta(texto=b"ok"):
+    resp = MagicMock(url="https://example.com", encoding="utf-8")
+    resp.iter_content.return_value = [texto]
+    resp.raise_for_status.return_value = None
+    resp.status_code = 200
+    resp.headers = {}
+    return resp
+
+
+def test_obtener_url_reutiliza_la_sesion(monkeypatch):
+    monkeypatch.setenv("COBRA_HOST_WHITELIST", "example.com")
+    with patch(
+        "pcobra.corelibs.red._SesionHTTP.get", return_value=_respuesta()
+    ) as mock_get:
+        sesion = red._sesion_http()
+        assert red.obtener_url("https://example.com") == "ok"
+        assert red.obtener_url("https://example.com/otra") == "ok"
+        assert red._sesion_http() is sesion
+        assert mock_get.call_count == 2
+
+    red.cerrar()
+    assert red._SESION is None
+    assert red._sesion_http() is not sesion
+
+
+def test_configurar_cliente_valida_limites():
+    with pytest.raises(ValueError):
+        red.configurar_cliente(max_por_host=0)
+
+
+class _Stream:
+    def __init__(self, response):
+        self._response = response
+
+    async def __aenter__(self):
+        return self._response
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class _Respuesta:
+    status_code = 200
+    headers: dict = {}
+    encoding = "utf-8"
+    url = "https://example.com"
+
+    def raise_for_status(self):
+        return None
+
+    async def aiter_bytes(self, chunk_size=8192):
+        yield b"hola"
+
+
+class _Cliente:
+    def __init__(self):
+        self.peticiones = 0
+        self.cerrado = False
+
+    def stream(self, method, url, **kwargs):
+        self.peticiones += 1
+        return _Stream(_Respuesta())
+
+    async def aclose(self):
+        self.cerrado = True
+
+
+@pytest.mark.asyncio
+async def test_cliente_async_compartido_por_bucle(monkeypatch):
+    monkeypatch.setenv("COBRA_HOST_WHITELIST", "example.com")
+    creados = []
+
+    def _crear(**opciones):
+        creados.append(opciones)
+        return _Cliente()
+
+    if red.httpx is None:
+        monkeypatch.setattr(red, "httpx", SimpleNamespace())
+    monkeypatch.setattr(red.httpx, "AsyncClient", _crear, raising=False)
+
+    assert await red.obtener_url_async("https://example.com") == "hola"
+    assert await red.enviar_post_async("https://example.com", {"a": 1}) == "hola"
+
+    assert len(creados) == 1
+    assert creados[0]["follow_redirects"] is False
+    cliente = red._cliente_async()
+    assert cliente.peticiones == 2
+
+    await red.cerrar_async()
+    assert cliente.cerrado
+    assert red._cliente_async() is not cliente
+
+
+class _RespuestaLenta(_Respuesta):
+    def __init__(self, url, cuerpo):
+        self.url = url
+        self._cuerpo = cuerpo
+
+    async def aiter_bytes(self, chunk_size=8192):
+        yield self._cuerpo
+
+
+class _ClienteConcurrente:
+    def __init__(self, fallos=None):
+        self.en_vuelo = 0
+        self.maximo = 0
+        self.llamadas = []
+        self._fallos = dict(fallos or {})
+
+    def stream(self, method, url, **kwargs):
+        cliente = self
+
+        class _Contexto:
+            async def __aenter__(self):
+                cliente.llamadas.append(url)
+                if cliente._fallos.get(url):
+                    cliente._fallos[url] -= 1
+                    raise OSError("conexión reiniciada")
+                cliente.en_vuelo += 1
+                cliente.maximo = max(cliente.maximo, cliente.en_vuelo)
+                await asyncio.sleep(0.01)
+                return _RespuestaLenta(url, url.rsplit("/", 1)[-1].encode())
+
+            async def __aexit__(self, exc_type, exc, tb):
+                cliente.en_vuelo -= 1
+                return False
+
+        return _Contexto()
+
+
+def _instalar(monkeypatch, cliente):
+    monkeypatch.setenv("COBRA_HOST_WHITELIST", "example.com")
+    if red.httpx is None:
+        monkeypatch.setattr(red, "httpx", SimpleNamespace())
+    monkeypatch.setattr(red.httpx, "AsyncClient", lambda **_kw: cliente, raising=False)
+
+
+@pytest.mark.asyncio
+async def test_obtener_muchos_limita_concurrencia_y_valida_hosts(monkeypatch):
+    cliente = _ClienteConcurrente()
+    _instalar(monkeypatch, cliente)
+    urls = [f"https://example.com/{i}" for i in range(8)] + ["https://otro.com/x"]
+
+    resultados = [r async for r in red.obtener_muchos(urls, concurrencia=3)]
+
+    cumplidas = {r["url"]: r["resultado"] for r in resultados if r["estado"] == "cumplida"}
+    assert cumplidas == {f"https://example.com/{i}": str(i) for i in range(8)}
+    rechazada = next(r for r in resultados if r["estado"] == "rechazada")
+    assert rechazada["url"] == "https://otro.com/x"
+    assert isinstance(rechazada["excepcion"], ValueError)
+    assert "https://otro.com/x" not in cliente.llamadas
+    assert cliente.maximo == 3
+
+
+@pytest.mark.asyncio
+async def test_obtener_muchos_reintenta_y_espacia_por_host(monkeypatch):
+    cliente = _ClienteConcurrente(fallos={"https://example.com/a": 1})
+    _instalar(monkeypatch, cliente)
+    bucle = asyncio.get_running_loop()
+    inicio = bucle.time()
+
+    resultados = [
+        r
+        async for r in red.obtener_muchos(
+            ["https://example.com/a", "https://example.com/b", "https://example.com/c"],
+            peticiones_por_segundo=20,
+            intentos=2,
+            retardo_inicial=0,
+        )
+    ]
+
+    assert all(r["estado"] == "cumplida" for r in resultados)
+    assert cliente.llamadas.count("https://example.com/a") == 2
+    # Cuatro intentos al mismo host a 20 por segundo ocupan al menos 0.15 s.
+    assert bucle.time() - inicio >= 0.14
+
+
+@pytest.mark.asyncio
+async def test_descargar_muchos_escribe_y_limpia_fallos(monkeypatch, tmp_path):
+    cliente = _ClienteConcurrente(fallos={"https://example.com/mal": 5})
+    _instalar(monkeypatch, cliente)
+
+    resultados = {
+        r["url"]: r
+        async for r in red.descargar_muchos(
+            {
+                "https://example.com/bien": tmp_path / "sub" / "bien.txt",
+                "https://example.com/mal": tmp_path / "mal.txt",
+            }
+        )
+    }
+
+    assert resultados["https://example.com/bien"]["resultado"].read_bytes() == b"bien"
+    assert resultados["https://example.com/mal"]["estado"] == "rechazada"
+    assert not (tmp_path / "mal.txt").exists()
+
+
+def test_obtener_muchos_valida_concurrencia():
+    with pytest.raises(ValueError):
+        red.obtener_muchos(["https://example.com"], concurrencia=0)
@@ -0,0 +1,145 @@
+import io
+import json
+
+import pytest
+
+import pcobra.corelibs.serializacion as serializacion
+import pcobra.corelibs.serializadores as serializadores
+from pcobra.cobra.benchmarks.serializacion_bench import formatear_tabla, main
+
+
+@pytest.fixture(autouse=True)
+def _backend_automatico():
+    serializadores.configurar_backend_json(None)
+    yield
+    serializadores.configurar_backend_json(None)
+
+
+DOCUMENTO = {"b": [1, 2.5, None, True], "a": {"ñ": "café 🐍"}, "c": 2**70}
+
+
+@pytest.mark.parametrize("nombre", serializadores.backends_json())
+def test_backends_producen_el_mismo_json(nombre):
+    backend = serializadores.backend_json(nombre)
+
+    codificado = backend.codificar(DOCUMENTO, True)
+
+    assert (
+        codificado
+        == json.dumps(
+            DOCUMENTO, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+        ).encode()
+    )
+    assert json.loads(codificado) == DOCUMENTO
+    assert backend.decodificar(b'{"x": [1, 2]}') == {"x": [1, 2]}
+
+
+@pytest.mark.parametrize("nombre", serializadores.backends_json())
+@pytest.mark.parametrize(
+    "objeto",
+    [
+        float("nan"),
+        {"a": float("inf")},
+        [1.5, float("-inf"), None],
+        {"anidado": ({"x": [float("nan")]},)},
+    ],
+)
+def test_no_finitos_se_codifican_como_json(nombre, objeto):
+    serializadores.configurar_backend_json(nombre)
+    esperado = json.dumps(objeto, ensure_ascii=False, separators=(",", ":"))
+
+    assert serializacion.codificar_json(objeto, compacto=True) == esperado
+    assert list(serializadores.codificar_ndjson([objeto], backend=nombre)) == [
+        esperado.encode() + b"\n"
+    ]
+
+
+def test_json_estandar_siempre_disponible_y_errores_claros():
+    assert serializadores.backends_json()[-1] == "json"
+    with pytest.raises(ValueError):
+        serializadores.backend_json("inexistente")
+
+
+def test_registrar_backend_preferente():
+    llamadas = []
+
+    def codificar(objeto, ordenar):
+        llamadas.append(objeto)
+        return json.dumps(objeto, separators=(",", ":")).encode()
+
+    serializadores.registrar_backend_json(
+        "propio", codificar, json.loads, preferente=True
+    )
+    try:
+        assert serializadores.backends_json()[0] == "propio"
+        assert serializacion.codificar_json([1], compacto=True) == "[1]"
+        assert llamadas == [[1]]
+    finally:
+        serializadores._FABRICAS_JSON.pop("propio")
+
+
+def test_codificar_json_compacto_y_formato_por_defecto_intacto():
+    assert serializacion.codificar_json({"a": 1}) == '{"a": 1}'
+    assert (
+        serializacion.codificar_json({"b": 1, "a": [1]}, ordenar=True, compacto=True)
+        == '{"a":[1],"b":1}'
+    )
+    with pytest.raises(ValueError):
+        serializacion.codificar_json({"a": 1}, compacto=True, indentar=2)
+    with pytest.raises(ValueError):
+        serializacion.codificar_json({"a": object()}, compacto=True)
+
+
+def test_decodificar_json_conserva_semantica_de_json():
+    assert serializacion.decodificar_json('{"n": 123456789012345678901234}') == {
+        "n": 123456789012345678901234
+    }
+    resultado = serializacion.decodificar_json("[NaN]")
+    assert resultado[0] != resultado[0]
+    with pytest.raises(ValueError, match="línea 1, columna"):
+        serializacion.decodificar_json("{no-es-json")
+
+
+def test_msgpack_ida_y_vuelta():
+    datos = serializadores.codificar_msgpack({"a": [1, "dos", b"\x00"], 3: None})
+
+    assert serializadores.decodificar_msgpack(datos) == {
+        "a": [1, "dos", b"\x00"],
+        3: None,
+    }
+    with pytest.raises(ValueError):
+        serializadores.decodificar_msgpack(b"\xc1")
+
+
+def test_ndjson_en_flujo(tmp_path):
+    ruta = tmp_path / "eventos.ndjson"
+    objetos = ({"i": i, "par": i % 2 == 0} for i in range(2500))
+
+    assert serializadores.escribir_ndjson(ruta, objetos) == 2500
+
+    lineas = ruta.read_bytes().splitlines()
+    assert len(lineas) == 2500
+    assert json.loads(lineas[3]) == {"i": 3, "par": False}
+    leidos = serializadores.iterar_ndjson(ruta)
+    assert next(leidos) == {"i": 0, "par": True}
+    assert sum(1 for _ in leidos) == 2499
+
+    buffer = io.BytesIO(b'{"a": 1}\n\n[2]\n')
+    assert list(serializadores.iterar_ndjson(buffer)) == [{"a": 1}, [2]]
+    with pytest.raises(ValueError, match="línea 2"):
+        list(serializadores.decodificar_ndjson(["1", "{", "3"]))
+
+
+def test_comparativa_de_backends(tmp_path, capsys):
+    filas = serializadores.comparar_backends(tamano=10, repeticiones=1)
+
+    backends = {fila["backend"] for fila in filas}
+    assert set(serializadores.backends_json()) <= backends
+    assert {fila["carga"] for fila in filas} == {"registros", "numeros", "texto"}
+    assert all(fila["codificar_mb_s"] > 0 for fila in filas)
+    assert "backend" in formatear_tabla(filas)
+
+    salida = tmp_path / "bench.json"
+    assert main(["--tamano", "5", "--repeticiones", "1", "--output", str(salida)]) == 0
+    assert json.loads(salida.read_text(encoding="utf-8"))
+    assert "MB/s" in capsys.readouterr().out
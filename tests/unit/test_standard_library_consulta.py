@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import pytest
+
+from pcobra.standard_library import datos
+from pcobra.standard_library.columnar import TablaColumnar
+from pcobra.standard_library.consulta import consultar, consultar_csv
+
+
+def _tabla() -> list[dict[str, object]]:
+    return [
+        {"id": i, "grupo": "abc"[i % 3], "valor": (i * 7) % 11, "nota": f"n{i}"}
+        for i in range(30)
+    ]
+
+
+def _cadena_ansiosa(tabla):
+    paso = datos.mutar_columna(tabla, "doble", lambda fila: fila["valor"] * 2)
+    paso = datos.filtrar(paso, lambda fila: fila["grupo"] != "b")
+    paso = datos.ordenar_tabla(paso, por=["valor", "id"], ascendente=[False, True])
+    paso = datos.seleccionar_columnas(paso, ["id", "doble", "valor"])
+    paso = datos.filtrar(paso, lambda fila: fila["valor"] > 2)
+    return datos.tomar(paso, 5)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_consulta_equivale_a_la_cadena_ansiosa(columnar):
+    tabla = _tabla()
+    fuente = TablaColumnar.desde_filas(tabla) if columnar else tabla
+
+    consulta = (
+        consultar(fuente)
+        .mutar("doble", lambda fila: fila["valor"] * 2, columnas=["valor"])
+        .filtrar(lambda fila: fila["grupo"] != "b", columnas=["grupo"])
+        .ordenar(["valor", "id"], ascendente=[False, True])
+        .seleccionar(["id", "doble", "valor"])
+        .filtrar(lambda fila: fila["valor"] > 2, columnas=["valor"])
+        .tomar(5)
+    )
+
+    assert consulta.recolectar() == _cadena_ansiosa(tabla)
+    assert isinstance(consulta.recolectar(columnar=True), TablaColumnar)
+
+
+def test_optimizador_adelanta_filtros_y_recorta_columnas():
+    consulta = (
+        consultar(_tabla())
+        .ordenar(["id"])
+        .mutar("doble", lambda fila: fila["valor"] * 2, columnas=["valor"])
+        .filtrar(lambda fila: fila["grupo"] == "a", columnas=["grupo"])
+        .seleccionar(["id", "doble"])
+    )
+
+    plan = consulta.explicar().splitlines()
+
+    assert plan[1] == "  columnas leídas: ['grupo', 'id', 'valor']"
+    assert plan[2] == "  filtro en lectura: lee=['grupo']"
+    assert plan[3].startswith("ordenar")
+    assert plan[4] == "por fila: mutar doble lee=['valor'] -> seleccionar ['id', 'doble']"
+
+
+def test_filtro_sin_columnas_declaradas_no_se_mueve_ni_recorta():
+    consulta = (
+        consultar(_tabla())
+        .mutar("doble", lambda fila: fila["valor"] * 2)
+        .filtrar(lambda fila: fila["doble"] > 10)
+        .seleccionar(["id"])
+    )
+
+    plan = consulta.explicar()
+
+    assert "columnas leídas" not in plan
+    assert "filtro en lectura" not in plan
+    assert consulta.recolectar() == [
+        {"id": fila["id"]} for fila in _tabla() if fila["valor"] * 2 > 10
+    ]
+
+
+def test_tomar_deja_de_leer_la_fuente():
+    leidas = []
+
+    def fuente():
+        for fila in _tabla():
+            leidas.append(fila["id"])
+            yield fila
+
+    resultado = consultar(fuente()).filtrar(lambda fila: fila["id"] % 2 == 0).tomar(3).recolectar()
+
+    assert [fila["id"] for fila in resultado] == [0, 2, 4]
+    assert leidas == [0, 1, 2, 3, 4]
+
+
+def test_consulta_csv_empuja_columnas_y_filtros_al_lector(tmp_path, monkeypatch):
+    ruta = tmp_path / "datos.csv"
+    datos.escribir_csv(_tabla(), ruta)
+    llamadas = []
+    original = datos.leer_csv_por_lotes
+
+    def espia(*args, **kwargs):
+        llamadas.append(kwargs)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(datos, "leer_csv_por_lotes", espia)
+
+    resultado = (
+        consultar_csv(ruta, tamano_lote=4)
+        .filtrar(lambda fila: fila["valor"] >= 5, columnas=["valor"])
+        .seleccionar(["id", "valor"])
+        .recolectar()
+    )
+
+    assert resultado == [{"id": f["id"], "valor": f["valor"]} for f in _tabla() if f["valor"] >= 5]
+    assert llamadas[0]["columnas"] == ["id", "valor"]
+    assert llamadas[0]["filtro"] is not None
+
+
+def test_consulta_conserva_errores_de_la_cadena_ansiosa():
+    with pytest.raises(KeyError):
+        consultar(_tabla()).seleccionar(["falta"]).recolectar()
+    with pytest.raises(ValueError, match="La condición de filtrado falló"):
+        consultar(_tabla()).filtrar(lambda fila: fila["falta"]).recolectar()
+    with pytest.raises(ValueError):
+        consultar(_tabla()).tomar(-1)
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import pytest
+
+from pcobra.standard_library import datos
+from pcobra.standard_library.columnar import TablaColumnar
+
+
+def _ventas() -> list[dict[str, object]]:
+    return [
+        {"region": "norte", "producto": "a", "unidades": 3, "precio": 2.5},
+        {"region": "sur", "producto": "b", "unidades": 1, "precio": 4.0},
+        {"region": "norte", "producto": "b", "unidades": 7, "precio": 1.5},
+        {"region": "este", "producto": "a", "unidades": 2, "precio": None},
+        {"region": "sur", "producto": "a", "unidades": 5, "precio": 3.0},
+    ]
+
+
+def test_tabla_columnar_conserva_tipos_y_filas():
+    filas = _ventas()
+    tabla = TablaColumnar.desde_filas(filas)
+
+    assert len(tabla) == 5
+    assert tabla.columnas == ["region", "producto", "unidades", "precio"]
+    assert tabla == filas
+    assert tabla[0] == filas[0]
+    assert all(type(valor) is int for valor in tabla.columna("unidades"))
+    assert datos.a_listas(tabla)["precio"] == [2.5, 4.0, 1.5, None, 3.0]
+
+
+def test_transformaciones_devuelven_tabla_columnar():
+    filas = _ventas()
+    tabla = TablaColumnar.desde_filas(filas)
+
+    filtrada = datos.filtrar(tabla, lambda fila: fila["unidades"] > 2)
+    assert isinstance(filtrada, TablaColumnar)
+    assert filtrada == datos.filtrar(filas, lambda fila: fila["unidades"] > 2)
+
+    seleccion = datos.seleccionar_columnas(tabla, ["region", "unidades"])
+    assert seleccion == datos.seleccionar_columnas(filas, ["region", "unidades"])
+
+    mutada = datos.mutar_columna(tabla, "total", lambda fila: fila["unidades"] * 2)
+    assert mutada == datos.mutar_columna(filas, "total", lambda fila: fila["unidades"] * 2)
+
+    assert datos.tomar(tabla, 2) == filas[:2]
+    assert datos.invertir_tabla(tabla) == list(reversed(filas))
+
+    rellena = datos.rellenar_nulos(tabla, {"precio": 0.0})
+    assert isinstance(rellena, TablaColumnar)
+    assert rellena == datos.rellenar_nulos(filas, {"precio": 0.0})
+
+
+@pytest.mark.parametrize(
+    "por, ascendente",
+    [(["unidades"], True), (["unidades"], False), (["region", "precio"], [True, False])],
+)
+def test_ordenar_columnar_equivale_a_filas(por, ascendente):
+    filas = _ventas()
+    tabla = TablaColumnar.desde_filas(filas)
+
+    resultado = datos.ordenar_tabla(tabla, por=por, ascendente=ascendente)
+
+    assert isinstance(resultado, TablaColumnar)
+    assert resultado == datos.ordenar_tabla(filas, por=por, ascendente=ascendente)
+
+
+@pytest.mark.parametrize("por", [["region"], ["unidades"], ["region", "producto"]])
+def test_agrupar_columnar_equivale_a_filas(por):
+    filas = _ventas()
+    agregaciones = {"unidades": ["sum", "mean", "max", "min", "count"], "precio": "mean"}
+
+    resultado = datos.agrupar_y_resumir(
+        TablaColumnar.desde_filas(filas), por=por, agregaciones=agregaciones
+    )
+
+    assert resultado == datos.agrupar_y_resumir(filas, por=por, agregaciones=agregaciones)
+
+
+@pytest.mark.parametrize("tipo", ["inner", "left", "outer"])
+def test_combinar_columnar_equivale_a_filas(tipo):
+    clientes = [
+        {"id": 1, "nombre": "Ana", "region": "norte"},
+        {"id": 2, "nombre": "Luis", "region": "sur"},
+        {"id": 5, "nombre": "Eva", "region": "sur"},
+    ]
+    pedidos = [
+        {"cliente": 1, "monto": 10.0, "region": "norte"},
+        {"cliente": 1, "monto": 5.0, "region": "oeste"},
+        {"cliente": 3, "monto": 7.5, "region": "este"},
+    ]
+    claves = {"izquierda": "id", "derecha": "cliente"}
+    esperado = datos.combinar_tablas(clientes, pedidos, claves=claves, tipo=tipo)
+    columnas = {columna for fila in esperado for columna in fila}
+
+    resultado = datos.combinar_tablas(
+        TablaColumnar.desde_filas(clientes), pedidos, claves=claves, tipo=tipo
+    )
+
+    assert isinstance(resultado, TablaColumnar)
+    assert set(resultado.columnas) == columnas
+    assert resultado == [{columna: fila.get(columna) for columna in resultado.columnas} for fila in esperado]
+
+
+def test_estadisticas_sobre_columnas():
+    filas = _ventas()
+    tabla = TablaColumnar.desde_filas(filas)
+
+    descripcion = datos.describir(tabla)
+    esperado = datos.describir(filas)
+    assert descripcion.keys() == esperado.keys()
+    for columna, metricas in esperado.items():
+        assert descripcion[columna] == pytest.approx(metricas)
+
+    percentiles = datos.calcular_percentiles(tabla, percentiles=(10, 90))
+    for columna, valores in datos.calcular_percentiles(filas, percentiles=(10, 90)).items():
+        assert percentiles[columna] == pytest.approx(valores)
+
+
+def test_de_listas_puede_construir_tabla_columnar():
+    tabla = datos.de_listas({"a": [1, 2], "b": ["x", None]}, columnar=True)
+
+    assert isinstance(tabla, TablaColumnar)
+    assert tabla == [{"a": 1, "b": "x"}, {"a": 2, "b": None}]
+
+
+def test_parquet_columnar_reutiliza_columnas_arrow(tmp_path):
+    pytest.importorskip("pyarrow")
+    filas = _ventas()
+    ruta = tmp_path / "ventas.parquet"
+    datos.escribir_parquet(TablaColumnar.desde_filas(filas), ruta)
+
+    tabla = datos.leer_parquet(ruta, columnar=True)
+
+    assert isinstance(tabla, TablaColumnar)
+    assert type(tabla.almacenamiento("region")).__module__.startswith("pyarrow")
+    assert tabla == filas
+    assert datos.ordenar_tabla(tabla, por=["unidades"]) == datos.ordenar_tabla(
+        filas, por=["unidades"]
+    )
+    for funcion in (datos.correlacion_pearson, datos.correlacion_spearman, datos.matriz_covarianza):
+        esperado = funcion(filas)
+        resultado = funcion(tabla)
+        assert resultado.keys() == esperado.keys()
+        for columna, valores in esperado.items():
+            assert resultado[columna] == pytest.approx(valores)
+    assert datos.describir(tabla)["precio"] == pytest.approx(datos.describir(filas)["precio"])
+
+
+def test_parquet_proyecta_y_filtra_grupos_de_filas(tmp_path):
+    pytest.importorskip("pyarrow")
+    filas = [{"id": indice, "grupo": "ab"[indice % 2]} for indice in range(50)]
+    ruta = tmp_path / "ids.parquet"
+    datos.escribir_parquet(filas, ruta, filas_por_grupo=10)
+
+    resultado = datos.leer_parquet(ruta, columnas=["id"], filtros=[("id", ">=", 45)])
+
+    assert resultado == [{"id": indice} for indice in range(45, 50)]
+
+
+def test_feather_columnar_con_proyeccion(tmp_path):
+    pytest.importorskip("pyarrow")
+    filas = _ventas()
+    ruta = tmp_path / "ventas.feather"
+    datos.escribir_feather(filas, ruta)
+
+    tabla = datos.leer_feather(ruta, columnas=["region", "precio"], columnar=True)
+
+    assert tabla.columnas == ["region", "precio"]
+    assert tabla == datos.seleccionar_columnas(filas, ["region", "precio"])
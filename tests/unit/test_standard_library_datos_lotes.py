@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from pcobra.standard_library import datos
+from pcobra.standard_library.columnar import TablaColumnar
+
+
+def _escribir_csv(ruta, filas):
+    ruta.write_text("\n".join(filas) + "\n", encoding="utf-8")
+    return ruta
+
+
+def test_inferir_esquema_unifica_tipos():
+    esquema = datos.inferir_esquema(
+        [
+            {"a": "1", "b": "2", "c": "true", "d": "", "e": "x"},
+            {"a": "3", "b": "2.5", "c": "false", "d": " ", "e": "4"},
+        ]
+    )
+
+    assert esquema == {"a": "entero", "b": "decimal", "c": "booleano", "d": None, "e": "texto"}
+
+
+def test_leer_csv_por_lotes_respeta_tamano_y_esquema(tmp_path):
+    filas = ["id,monto,activo,nombre"] + [f"{i},{i}.5,true,n{i}" for i in range(7)]
+    ruta = _escribir_csv(tmp_path / "datos.csv", filas)
+
+    lotes = list(datos.leer_csv_por_lotes(ruta, tamano_lote=3, muestra_esquema=2))
+
+    assert [len(lote) for lote in lotes] == [3, 3, 1]
+    planos = [fila for lote in lotes for fila in lote]
+    assert planos == datos.leer_csv(ruta)
+    assert all(type(fila["monto"]) is float for fila in planos)
+
+
+def test_leer_csv_por_lotes_convierte_segun_esquema_y_proyecta(tmp_path):
+    ruta = _escribir_csv(tmp_path / "datos.csv", ["a,b,c", "1.5,x,1", "2,y,2", "3,z,oops"])
+
+    lotes = list(
+        datos.leer_csv_por_lotes(ruta, muestra_esquema=1, columnas=["c", "a"], columnar=True)
+    )
+
+    assert len(lotes) == 1
+    assert isinstance(lotes[0], TablaColumnar)
+    assert lotes[0] == [{"c": 1, "a": 1.5}, {"c": 2, "a": 2.0}, {"c": "oops", "a": 3.0}]
+    with pytest.raises(KeyError):
+        list(datos.leer_csv_por_lotes(ruta, columnas=["falta"]))
+
+
+def test_leer_csv_por_lotes_rechaza_filas_invalidas(tmp_path):
+    ruta = _escribir_csv(tmp_path / "roto.csv", ["a,b", "1,2", "3,4,5"])
+
+    with pytest.raises(ValueError, match="formato inválido"):
+        list(datos.leer_csv_por_lotes(ruta, tamano_lote=1))
+
+
+def test_leer_json_por_lotes(tmp_path):
+    ruta = tmp_path / "datos.jsonl"
+    ruta.write_text(
+        "\n".join(json.dumps({"id": i, "par": i % 2 == 0}) for i in range(5)) + "\n\n",
+        encoding="utf-8",
+    )
+
+    lotes = list(datos.leer_json_por_lotes(ruta, tamano_lote=2))
+
+    assert [len(lote) for lote in lotes] == [2, 2, 1]
+    assert [fila for lote in lotes for fila in lote] == datos.leer_json(ruta, lineas=True)
+
+    (tmp_path / "malo.jsonl").write_text('{"a": 1}\n[1, 2]\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="línea 2"):
+        list(datos.leer_json_por_lotes(tmp_path / "malo.jsonl"))
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_consumo_incremental_equivale_a_tabla_completa(tmp_path, columnar):
+    filas = ["grupo,valor,peso"] + [
+        f"{'abc'[i % 3]},{i},{'' if i % 4 == 0 else i / 2}" for i in range(20)
+    ]
+    ruta = _escribir_csv(tmp_path / "datos.csv", filas)
+    tabla = datos.leer_csv(ruta)
+    agregaciones = {"valor": ["sum", "count", "max", "min"], "peso": ["mean", "sum"]}
+
+    lotes = datos.leer_csv_por_lotes(ruta, tamano_lote=6, columnar=columnar)
+    filtrados = datos.filtrar_lotes(lotes, lambda fila: fila["valor"] % 5 != 0)
+    resultado = datos.agrupar_y_resumir_por_lotes(filtrados, por=["grupo"], agregaciones=agregaciones)
+
+    esperado = datos.agrupar_y_resumir(
+        datos.filtrar(tabla, lambda fila: fila["valor"] % 5 != 0),
+        por=["grupo"],
+        agregaciones=agregaciones,
+    )
+    assert [fila["grupo"] for fila in resultado] == [fila["grupo"] for fila in esperado]
+    for obtenido, referencia in zip(resultado, esperado):
+        assert obtenido == pytest.approx(referencia)
+
+
+def test_mapear_lotes_y_agregacion_desconocida():
+    lotes = [[{"a": 1}], [{"a": 2}]]
+
+    assert list(datos.mapear_lotes(lotes, lambda fila: fila["a"] * 10)) == [[10], [20]]
+    with pytest.raises(ValueError, match="Agregación desconocida"):
+        datos.agrupar_y_resumir_por_lotes(lotes, por=["a"], agregaciones={"a": "mediana"})
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from pcobra.standard_library import datos
+
+
+@pytest.fixture
+def paralelo_siempre(monkeypatch):
+    monkeypatch.setattr(datos, "_FILAS_MINIMAS_PARALELO", 1)
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+
+
+def _pedidos() -> list[dict[str, object]]:
+    return [
+        {"cliente": indice % 37, "region": "nsoe"[indice % 4], "monto": float(indice % 11)}
+        for indice in range(600)
+    ]
+
+
+def _clientes() -> list[dict[str, object]]:
+    return [
+        {"cliente": indice, "region": "nsoe"[indice % 3], "nombre": f"c{indice}"}
+        for indice in range(0, 50, 2)
+    ]
+
+
+@pytest.mark.parametrize("tipo", ["inner", "left", "outer"])
+def test_combinar_en_paralelo_conserva_el_orden(paralelo_siempre, tipo):
+    claves = ("cliente", "cliente")
+    esperado = datos.combinar_tablas(_pedidos(), _clientes(), claves=claves, tipo=tipo)
+
+    resultado = datos.combinar_tablas(
+        _pedidos(), _clientes(), claves=claves, tipo=tipo, procesos=3
+    )
+
+    assert resultado == esperado
+
+
+def test_agrupar_en_paralelo_fusiona_parciales(paralelo_siempre):
+    agregaciones = {"monto": ["sum", "mean", "max", "min", "count"]}
+    esperado = datos.agrupar_y_resumir(_pedidos(), por=["region", "cliente"], agregaciones=agregaciones)
+
+    resultado = datos.agrupar_y_resumir(
+        _pedidos(), por=["region", "cliente"], agregaciones=agregaciones, procesos=3
+    )
+
+    assert [fila["cliente"] for fila in resultado] == [fila["cliente"] for fila in esperado]
+    for fila, fila_esperada in zip(resultado, esperado):
+        assert fila == pytest.approx(fila_esperada)
+
+
+def test_procesos_en_tablas_pequenas_no_crea_grupo(monkeypatch):
+    def fallar(*_args, **_kwargs):
+        raise AssertionError("no debería usarse el grupo de procesos")
+
+    monkeypatch.setattr(datos, "_mapear_en_procesos", fallar)
+
+    resultado = datos.agrupar_y_resumir(
+        _pedidos(), por=["region"], agregaciones={"monto": "sum"}, procesos=4
+    )
+
+    assert [fila["region"] for fila in resultado] == ["n", "s", "o", "e"]
+
+
+def test_configurar_paralelismo_usa_el_contexto_elegido(paralelo_siempre, monkeypatch):
+    monkeypatch.setattr(datos, "_CONTEXTO_PROCESOS", None)
+    esperado = datos.agrupar_y_resumir(_pedidos(), por=["region"], agregaciones={"monto": "sum"})
+
+    datos.configurar_paralelismo(contexto="spawn")
+    resultado = datos.agrupar_y_resumir(
+        _pedidos(), por=["region"], agregaciones={"monto": "sum"}, procesos=2
+    )
+
+    assert resultado == pytest.approx(esperado)
+    with pytest.raises(ValueError):
+        datos.configurar_paralelismo(contexto="inexistente")
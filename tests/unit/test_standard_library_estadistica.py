@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import random
+import statistics
+
+import pytest
+
+from pcobra.standard_library import datos
+from pcobra.standard_library.estadistica import (
+    BocetoCuantiles,
+    CovarianzaIncremental,
+    EstadisticasColumna,
+    ResumenNumerico,
+)
+
+
+def _valores(cantidad: int, semilla: int = 7) -> list[float]:
+    generador = random.Random(semilla)
+    return [generador.gauss(10, 3) for _ in range(cantidad)]
+
+
+def test_resumen_numerico_fusiona_particiones():
+    valores = _valores(1_000)
+    izquierda, derecha = ResumenNumerico(), ResumenNumerico()
+    for valor in valores[:300]:
+        izquierda.agregar(valor)
+    derecha.agregar_bloque(valores[300:])
+
+    total = izquierda.fusionar(derecha)
+
+    assert total.conteo == 1_000
+    assert total.media == pytest.approx(statistics.fmean(valores))
+    assert total.varianza == pytest.approx(statistics.variance(valores))
+    assert (total.minimo, total.maximo) == (min(valores), max(valores))
+
+
+def test_boceto_exacto_y_aproximado():
+    valores = _valores(20_000)
+    ordenados = sorted(valores)
+    exacto = EstadisticasColumna(exacto=True)
+    partes = [BocetoCuantiles(capacidad=128) for _ in range(4)]
+    for indice, valor in enumerate(valores):
+        exacto.agregar(valor)
+        partes[indice % 4].agregar(valor)
+    aproximado = partes[0]
+    for parte in partes[1:]:
+        aproximado.fusionar(parte)
+
+    mediana_exacta = exacto.percentiles([50])[0]
+    assert mediana_exacta == pytest.approx(statistics.median(valores))
+    assert aproximado.conteo == len(valores)
+    for percentil, estimado in zip((10, 50, 90), aproximado.percentiles((10, 50, 90))):
+        rango = sum(1 for valor in ordenados if valor <= estimado) / len(valores)
+        assert rango == pytest.approx(percentil / 100, abs=0.03)
+
+
+def test_covarianza_incremental_equivale_a_la_directa():
+    xs = _valores(500, semilla=1)
+    ys = [2 * x + ruido for x, ruido in zip(xs, _valores(500, semilla=2))]
+    primera, segunda = CovarianzaIncremental(), CovarianzaIncremental()
+    for x, y in zip(xs[:200], ys[:200]):
+        primera.agregar(x, y)
+    segunda.agregar_bloque(xs[200:], ys[200:])
+
+    total = primera.fusionar(segunda)
+
+    assert total.covarianza == pytest.approx(statistics.covariance(xs, ys))
+    assert total.correlacion == pytest.approx(statistics.correlation(xs, ys))
+
+
+def test_describir_por_lotes_equivale_a_describir():
+    filas = [
+        {"x": valor, "y": None if indice % 5 == 0 else indice, "texto": "a"}
+        for indice, valor in enumerate(_valores(2_000))
+    ]
+    lotes = [filas[inicio : inicio + 300] for inicio in range(0, len(filas), 300)]
+
+    por_lotes = datos.describir_por_lotes(lotes)
+    completo = datos.describir(filas)
+
+    assert list(por_lotes) == list(completo) == ["x", "y"]
+    for columna, metricas in completo.items():
+        assert por_lotes[columna] == pytest.approx(metricas)
+    aproximado = datos.calcular_percentiles(filas, columnas=["x"], exacto=False)
+    assert aproximado["x"]["p50"] == pytest.approx(completo["x"]["50%"], rel=0.05)
@@ -58,3 +58,83 @@ def test_valida_cada_nodo_una_sola_vez(monkeypatch):
     interp.ejecutar_ast([nodo])
 
     assert contador == 1
+
+
+def _cadena_contadora(cacheable=True):
+    from core.semantic_validators.base import ValidadorBase
+
+    visitas = []
+
+    class Contador(ValidadorBase):
+        despacho_unico = True
+
+        def __init__(self, nombre):
+            super().__init__()
+            self.nombre = nombre
+
+        def huella_politica(self):
+            return ("contador", self.nombre) if cacheable else None
+
+        def visit_valor(self, nodo):
+            visitas.append(self.nombre)
+            self.generic_visit(nodo)
+
+    primero = Contador("a")
+    primero.set_siguiente(Contador("b")).set_siguiente(Contador("c"))
+    return primero, visitas
+
+
+def test_cadena_combinada_visita_cada_nodo_una_vez():
+    from core.ast_nodes import NodoAsignacion, NodoValor
+    from core.semantic_validators import limpiar_cache_veredictos
+
+    limpiar_cache_veredictos()
+    cadena, visitas = _cadena_contadora(cacheable=False)
+    NodoAsignacion("x", NodoValor(1)).aceptar(cadena)
+
+    assert sorted(visitas) == ["a", "b", "c"]
+
+
+def test_veredicto_favorable_se_reutiliza_por_estructura():
+    from core.ast_nodes import NodoAsignacion, NodoValor
+    from core.semantic_validators import (
+        estadisticas_cache_veredictos,
+        limpiar_cache_veredictos,
+    )
+
+    limpiar_cache_veredictos()
+    cadena, visitas = _cadena_contadora()
+    NodoAsignacion("x", NodoValor(1)).aceptar(cadena)
+    NodoAsignacion("x", NodoValor(1)).aceptar(cadena)
+    NodoAsignacion("x", NodoValor(2)).aceptar(cadena)
+
+    assert len(visitas) == 6
+    assert estadisticas_cache_veredictos()["aciertos"] == 1
+
+
+def test_rechazos_e_imports_no_se_cachean():
+    import pytest
+
+    from core.ast_nodes import NodoImport, NodoLlamadaFuncion
+    from core.semantic_validators import (
+        PrimitivaPeligrosaError,
+        ValidadorImportSeguro,
+        ValidadorPrimitivaPeligrosa,
+        estadisticas_cache_veredictos,
+        limpiar_cache_veredictos,
+    )
+
+    limpiar_cache_veredictos()
+    cadena = ValidadorPrimitivaPeligrosa()
+    for _ in range(2):
+        with pytest.raises(PrimitivaPeligrosaError):
+            NodoLlamadaFuncion("leer_archivo", []).aceptar(cadena)
+
+    llamadas = []
+    validador_import = ValidadorImportSeguro()
+    validador_import.visit_import = lambda nodo: llamadas.append(nodo.ruta)
+    for _ in range(2):
+        NodoImport("modulo.co").aceptar(validador_import)
+
+    assert llamadas == ["modulo.co", "modulo.co"]
+    assert estadisticas_cache_veredictos()["entradas"] == 0